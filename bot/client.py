@@ -25,12 +25,13 @@ except Exception as e:
     print(f"DEBUG: bot.error_handler failed: {e}")
 
 try:
-    from services.scheduler import start_scheduler
+    from services.scheduler import start_scheduler, start_smart_event_reminders
 
     print("DEBUG: services.scheduler imported")
 except Exception as e:
     print(f"DEBUG: services.scheduler failed: {e}")
     start_scheduler = None
+    start_smart_event_reminders = None
 
 try:
     from utils.data_manager import DataManager
@@ -74,6 +75,8 @@ try:
 except ImportError:
     ERROR_LOGGING_AVAILABLE = False
 
+from utils.member_index import member_index
+
 logger = setup_logger("bot_client")
 
 
@@ -103,6 +106,8 @@ class RowBot(commands.Bot):
         self.data_manager = None
         self.sheets = None
         self.start_time = None  # Will be set when bot is ready
+        self.dashboard_server = None
+        self.cog_load_report = ""  # Per-cog startup timings
 
         self.startup_completed = False
         self.startup_time = time.time()
@@ -170,6 +175,9 @@ class RowBot(commands.Bot):
             if MONITORING_AVAILABLE:
                 await notify_startup_milestone("Error handling configured")
 
+            # Shared Sheets manager; no network I/O until after on_ready
+            await self._initialize_sheets_manager()
+
             print("DEBUG: Loading cogs...")
             if MONITORING_AVAILABLE:
                 await notify_startup_milestone("Loading bot modules...", "🔄")
@@ -192,9 +200,11 @@ class RowBot(commands.Bot):
                 await notify_startup_milestone("Starting scheduler...", "⚙️")
 
             try:
-                from services.scheduler import Scheduler
-                self.scheduler = Scheduler(self)
-                await self.scheduler.start()
+                # Arms exact-deadline reminder timers; registering the
+                # scheduler's own on_ready would replace RowBot.on_ready
+                if start_smart_event_reminders is None:
+                    raise RuntimeError("services.scheduler failed to import")
+                start_smart_event_reminders(self)
                 if MONITORING_AVAILABLE:
                     await notify_startup_milestone("Scheduler started", "✅")
             except Exception as e:
@@ -202,19 +212,6 @@ class RowBot(commands.Bot):
                 if MONITORING_AVAILABLE:
                     await notify_startup_milestone("Scheduler failed", "❌")
 
-            # Initialize Google Sheets with clean architecture
-            print("DEBUG: Initializing Google Sheets integration...")
-            if MONITORING_AVAILABLE:
-                await notify_startup_milestone("Initializing Google Sheets...", "📊")
-
-            await self._initialize_sheets_manager()
-
-            if MONITORING_AVAILABLE:
-                if hasattr(self, 'sheets') and self.sheets and self.sheets.is_connected():
-                    await notify_startup_milestone("Google Sheets connected", "✅")
-                else:
-                    await notify_startup_milestone("Google Sheets disabled", "⚠️")
-
             # Initialize DataManager
             print("DEBUG: Initializing DataManager...")
             if MONITORING_AVAILABLE:
@@ -250,49 +247,22 @@ class RowBot(commands.Bot):
             raise
 
     async def _initialize_sheets_manager(self):
-        """Initialize Google Sheets integration with clean architecture."""
-        print("DEBUG: Initializing Google Sheets manager...")
+        """
+        Attach the shared Google Sheets manager without connecting.
+
+        The connection is opened in the background after on_ready
+        (sheets.shared), so startup never waits on Google's API; sheets
+        work submitted before then queues behind the connect.
+        """
+        print("DEBUG: Attaching shared Google Sheets manager...")
 
         try:
             # Clean import from sheets directory
-            from sheets import SheetsManager
-
-            # Initialize sheets manager
-            self.sheets = SheetsManager()
-
-            # Test connection and provide detailed feedback
-            if self.sheets.is_connected():
-                logger.info("✅ Google Sheets integration initialized successfully")
-                if self.sheets.spreadsheet:
-                    logger.info(f"📊 Spreadsheet URL: {self.sheets.spreadsheet.url}")
-                    logger.info(f"📊 Spreadsheet ID: {self.sheets.spreadsheet.id}")
-
-                    # Test basic operations
-                    try:
-                        worksheets = [ws.title for ws in self.sheets.spreadsheet.worksheets()]
-                        logger.info(f"📋 Available worksheets: {', '.join(worksheets)}")
-                    except Exception as e:
-                        logger.warning(f"⚠️ Could not list worksheets: {e}")
-                else:
-                    logger.warning("⚠️ Sheets manager connected but no spreadsheet available")
-
-            else:
-                logger.error("❌ Google Sheets integration failed to initialize")
-                if hasattr(self.sheets, 'get_connection_status'):
-                    status = self.sheets.get_connection_status()
-                    logger.error(f"Connection status: {status}")
+            from sheets import get_sheets_manager, shared_sheets
 
-                    if not status.get("client_initialized", False):
-                        logger.error("❌ Check GOOGLE_SHEETS_CREDENTIALS environment variable")
-                    if not status.get("spreadsheet_connected", False):
-                        logger.error("❌ Check GOOGLE_SHEETS_ID environment variable (optional)")
-                    if status.get("last_error"):
-                        logger.error(f"❌ Last error: {status['last_error']}")
-
-                # Still attach the manager for graceful degradation
-                logger.info("📋 Sheets manager attached but not connected (graceful degradation)")
-
-            print("DEBUG: Sheets manager initialization completed")
+            self.sheets = get_sheets_manager()
+            shared_sheets.hold()  # Sheets work before the connect waits for it
+            logger.info("📋 Google Sheets manager attached (connects in background after ready)")
 
         except ImportError as e:
             logger.error(f"❌ Failed to import SheetsManager: {e}")
@@ -306,10 +276,33 @@ class RowBot(commands.Bot):
             self.sheets = None
             print("DEBUG: Sheets manager setup failed")
 
+    async def _connect_sheets_in_background(self):
+        """Open the shared Sheets connection and report the result."""
+        from sheets import shared_sheets
+
+        task = shared_sheets.start()
+        if task is None:
+            return
+
+        connected = await task
+        if connected and self.sheets.spreadsheet:
+            logger.info(f"📊 Spreadsheet URL: {self.sheets.spreadsheet.url}")
+        elif not connected:
+            status = self.sheets.get_connection_info()
+            logger.error(f"❌ Google Sheets integration failed to initialize: {status}")
+            logger.error("❌ Check GOOGLE_SHEETS_CREDENTIALS / GOOGLE_SHEETS_ID environment variables")
+
+        if MONITORING_AVAILABLE:
+            if connected:
+                await notify_startup_milestone("Google Sheets connected", "✅")
+            else:
+                await notify_startup_milestone("Google Sheets disabled", "⚠️")
 
     async def _load_cogs(self):
         """
-        Load cogs in proper dependency order to avoid failures.
+        Load cogs along their dependency graph, concurrently where possible.
+
+        Dependencies are declared in bot.cog_loader.COG_DEPENDENCIES.
 
         Returns:
             tuple: (loaded_cogs, failed_cogs) where:
@@ -318,141 +311,19 @@ class RowBot(commands.Bot):
         """
         print("DEBUG: _load_cogs() called")
 
-        # TIER 1: Foundation cogs (no dependencies)
-        tier_1_cogs = [
-            "utils.health_monitor",  # Health monitoring - no dependencies
-            "cogs.user.profile",  # IGN management - needed by most others
-            "cogs.user.commands",  # Basic user commands - minimal dependencies
-        ]
-
-        # TIER 2: Core functionality (depends on Tier 1)
-        tier_2_cogs = [
-            "cogs.events.manager",  # Event system - needs profile for IGNs
-            "cogs.admin.actions",  # Basic admin commands - standalone
-            "cogs.admin.attendance",  # Attendance tracking - needs admin roles
-            "cogs.admin.exporter",  # Data export - needs events data
-        ]
-
-        # TIER 3: Extended functionality (depends on Tier 1 & 2)
-        tier_3_cogs = [
-            "cogs.events.results",  # Win/loss tracking - needs manager
-            "services.smart_notifications",  # Notification system - needs events
-            "cogs.interactions.buttons",  # UI buttons - needs event manager
-            "cogs.interactions.dropdowns",  # UI dropdowns - needs event manager
-            "cogs.interactions.mention_handler",  # Mention handler - needs event manager
-        ]
-
-        # TIER 4: Advanced features (depends on previous tiers)
-        tier_4_cogs = [
-            "cogs.admin.owner_actions",  # Owner commands - needs all data systems
-            "cogs.admin.sheets_test",  # Google Sheets testing - optional
-        ]
-
-        # TIER 5: Optional/experimental (can fail without breaking core)
-        tier_5_cogs = [
-            "cogs.admin.sheet_formatter",  # Sheets formatting - optional
-        ]
-
-        # Load all tiers in order
-        all_tiers = [
-            ("Foundation", tier_1_cogs),
-            ("Core Functionality", tier_2_cogs),
-            ("Extended Features", tier_3_cogs),
-            ("Advanced Features", tier_4_cogs),
-            ("Optional Features", tier_5_cogs),
-        ]
-
-        loaded_cogs = []
-        failed_cogs = []
-
-        for tier_name, cogs in all_tiers:
-            print(f"DEBUG: Loading {tier_name} cogs...")
-            logger.info(f"Loading {tier_name} cogs ({len(cogs)} cogs)")
-
-            tier_loaded = 0
-            tier_failed = 0
-
-            for cog in cogs:
-                print(f"DEBUG: Loading {cog}...")
-                try:
-                    await self.load_extension(cog)
-                    logger.info(f"✅ Loaded {cog}")
-                    print(f"DEBUG: Successfully loaded {cog}")
-                    loaded_cogs.append(cog)
-                    tier_loaded += 1
-
-                    # Small delay between cogs to prevent rate limiting
-                    await asyncio.sleep(0.1)
-
-                except Exception as e:
-                    logger.error(f"❌ Failed to load {cog}: {e}")
-                    print(f"DEBUG: Failed to load {cog}: {e}")
-
-                    # For debugging, print full traceback
-                    import traceback
+        from bot.cog_loader import CogLoader
 
-                    traceback.print_exc()
+        loader = CogLoader(self)
+        loaded_cogs, failed_cogs = await loader.load_all()
+        self.cog_load_report = loader.report()
 
-                    failed_cogs.append((cog, str(e)))
-                    tier_failed += 1
-
-                    # Critical cogs that should stop loading if they fail
-                    critical_cogs = [
-                        "cogs.user.profile",
-                        "cogs.events.manager",
-                        "cogs.admin.actions",
-                    ]
-
-                    if cog in critical_cogs:
-                        logger.critical(
-                            f"🚨 Critical cog {cog} failed to load! Bot may not function properly."
-                        )
-                        print(f"DEBUG: CRITICAL COG FAILURE: {cog}")
-
-            logger.info(f"✅ {tier_name}: {tier_loaded} loaded, {tier_failed} failed")
-            print(
-                f"DEBUG: {tier_name} complete - {tier_loaded} loaded, {tier_failed} failed"
-            )
-
-            # If all foundation cogs fail, stop loading
-            if tier_name == "Foundation" and tier_loaded == 0:
-                logger.critical("🚨 No foundation cogs loaded! Stopping cog loading.")
-                print("DEBUG: CRITICAL: No foundation cogs loaded!")
-                break
-
-        # Final summary
-        total_attempted = sum(len(cogs) for _, cogs in all_tiers)
-        success_rate = (
-            (len(loaded_cogs) / total_attempted * 100) if total_attempted > 0 else 0
-        )
-
-        logger.info(
-            f"📊 Cog loading summary: {len(loaded_cogs)}/{total_attempted} loaded ({success_rate:.1f}% success)"
-        )
-        print(
-            f"DEBUG: Final summary - {len(loaded_cogs)}/{total_attempted} cogs loaded ({success_rate:.1f}% success)"
-        )
+        logger.info(f"📊 {self.cog_load_report}")
+        print(f"DEBUG: {self.cog_load_report.splitlines()[0]}")
 
         if failed_cogs:
             logger.warning("❌ Failed cogs:")
-            print("DEBUG: Failed cogs:")
             for cog, error in failed_cogs:
                 logger.warning(f"   - {cog}: {error}")
-                print(f"DEBUG:   - {cog}: {error}")
-
-            # Group failures by tier for analysis
-            failure_analysis = {}
-            for tier_name, cogs in all_tiers:
-                failed_in_tier = [cog for cog, _ in failed_cogs if cog in cogs]
-                if failed_in_tier:
-                    failure_analysis[tier_name] = failed_in_tier
-
-            if failure_analysis:
-                logger.warning("📊 Failure analysis by tier:")
-                for tier, failed_list in failure_analysis.items():
-                    logger.warning(
-                        f"   {tier}: {len(failed_list)} failed - {', '.join(failed_list)}"
-                    )
 
         # Verify critical cogs loaded
         critical_verification = {
@@ -480,22 +351,10 @@ class RowBot(commands.Bot):
         - Tracks reconnection events
         """
         print("DEBUG: on_ready() called")
-        # Placeholder for total members calculation, which is now done in setup_hook for accuracy
-        total_members = 0
-
-        # Calculate total members if guild data is available
-        if self.guilds:
-            all_members = set()
-            for guild in self.guilds:
-                try:
-                    async for member in guild.fetch_members(limit=None):
-                        all_members.add(member.id)
-                except discord.Forbidden:
-                    logger.warning(f"Missing permissions to fetch members in {guild.name}")
-                except Exception as e:
-                    logger.error(f"Error fetching members for {guild.name}: {e}")
-            total_members = len(all_members)
 
+        # Member count comes from the gateway-built index, not a REST crawl
+        await member_index.build(self.guilds)
+        total_members = member_index.count
 
         # Calculate cog count
         cog_count = len(self.cogs)
@@ -518,10 +377,14 @@ class RowBot(commands.Bot):
             logger.info(f"🏠 Connected to {len(self.guilds)} guild(s)")
             logger.info(f"👥 Monitoring {total_members} members across all guilds")
 
+            # Open the Google Sheets connection without delaying commands
+            if self.sheets is not None:
+                asyncio.create_task(self._connect_sheets_in_background())
+
             # Start dashboard integration
             try:
-                from dashboard.run_dashboard import run_dashboard_with_bot
-                dashboard_thread = run_dashboard_with_bot(self, host='0.0.0.0', port=5000)
+                from dashboard.run_dashboard import run_dashboard_in_loop
+                self.dashboard_server = await run_dashboard_in_loop(self, host='0.0.0.0', port=5000)
                 logger.info("🌐 Dashboard started successfully on port 5000")
             except Exception as e:
                 logger.error(f"❌ Failed to start dashboard: {e}")
@@ -532,7 +395,11 @@ class RowBot(commands.Bot):
                 guild_count=len(self.guilds),
                 member_count=total_members,
                 cog_count=cog_count,
-                sheets_status="✅ Connected" if self.sheets and self.sheets.is_connected() else "❌ Disconnected"
+                sheets_status=(
+                    "✅ Connected" if self.sheets and self.sheets.is_connected()
+                    else "⏳ Connecting" if self.sheets and self.sheets.is_connecting()
+                    else "❌ Disconnected"
+                )
             )
 
 
@@ -616,6 +483,35 @@ class RowBot(commands.Bot):
                 )
             return {"error": str(e)}
 
+    # ==========================================
+    # MEMBER INDEX MAINTENANCE
+    # ==========================================
+
+    async def on_member_join(self, member: discord.Member):
+        member_index.add_member(member)
+
+    async def on_member_remove(self, member: discord.Member):
+        member_index.remove_member(member)
+
+    async def on_member_update(self, before: discord.Member, after: discord.Member):
+        if before.display_name != after.display_name:
+            member_index.update_member(after)
+
+    async def on_user_update(self, before: discord.User, after: discord.User):
+        if (before.name, before.global_name) != (after.name, after.global_name):
+            for guild in self.guilds:
+                member = guild.get_member(after.id)
+                if member is not None:
+                    member_index.update_member(member)
+
+    async def on_guild_join(self, guild: discord.Guild):
+        if not guild.chunked:
+            await guild.chunk()
+        member_index.add_guild(guild)
+
+    async def on_guild_remove(self, guild: discord.Guild):
+        member_index.remove_guild(guild)
+
     async def close(self):
         """
         Clean shutdown of the bot instance.
@@ -634,10 +530,60 @@ class RowBot(commands.Bot):
             except:
                 pass  # Don't let notification failure prevent shutdown
 
-        from utils.file_ops import file_ops
+        from utils.storage import storage
+        from utils.sync_queue import sync_queue
+
+        # Close dashboard streams and stop serving
+        if self.dashboard_server is not None:
+            try:
+                await self.dashboard_server.stop()
+            except Exception as e:
+                logger.error(f"Failed to stop dashboard: {e}")
 
-        # Perform file operations cleanup
-        await file_ops.shutdown()
+        # Stop reminder timers before the cogs they call go away
+        try:
+            from utils.event_schedule import event_schedule
+
+            await event_schedule.stop()
+        except Exception as e:
+            logger.error(f"Failed to stop event reminders: {e}")
+
+        # Save signups still held by the background roster writer
+        event_manager = self.get_cog("EventManager")
+        if event_manager is not None:
+            try:
+                await event_manager.signups.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush signup saves: {e}")
+
+        # Push any queued Google Sheets syncs before the loop goes away
+        try:
+            await sync_queue.shutdown()
+        except Exception as e:
+            logger.error(f"Failed to flush sheets sync queue: {e}")
+
+        # Write out any buffered errors
+        try:
+            from services import error_logger as error_logger_module
+
+            if error_logger_module.error_logger:
+                await error_logger_module.error_logger.close()
+        except Exception as e:
+            logger.error(f"Failed to flush error log: {e}")
+
+        # Seal today's audit segment so its index is on disk
+        try:
+            from services.audit_logger import audit_logger
+
+            audit_logger.close()
+        except Exception as e:
+            logger.error(f"Failed to close audit log: {e}")
+
+        # Wait for in-flight writes and compact the journal into the data files
+        try:
+            await storage.close()
+        except Exception as e:
+            logger.error(f"Failed to close storage: {e}")
 
         await super().close()
         logger.info("Bot shutdown complete")
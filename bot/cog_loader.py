@@ -0,0 +1,148 @@
+"""
+Dependency-aware extension loader for RowBot.
+
+Each extension declares the extensions it needs loaded first. Anything
+whose dependencies are satisfied loads concurrently, so startup is bound
+by the longest dependency chain instead of the sum of every cog, and a
+per-cog timing report makes cold-start cost visible.
+"""
+
+import asyncio
+import time
+import traceback
+from graphlib import CycleError, TopologicalSorter
+from typing import Dict, List, Tuple
+
+from utils.logger import setup_logger
+
+logger = setup_logger("cog_loader")
+
+# Extension -> extensions it depends on
+COG_DEPENDENCIES: Dict[str, Tuple[str, ...]] = {
+    # Foundation
+    "utils.health_monitor": (),
+    "cogs.user.profile": (),  # IGN management - needed by most others
+    "cogs.user.commands": (),
+    "cogs.admin.actions": (),
+    # Core functionality
+    "cogs.events.manager": ("cogs.user.profile",),  # Needs profile for IGNs
+    "cogs.admin.attendance": (),
+    "cogs.admin.exporter": ("cogs.events.manager",),  # Needs events data
+    # Extended functionality
+    "cogs.events.results": ("cogs.events.manager",),
+    "services.smart_notifications": ("cogs.events.manager", "cogs.user.profile"),
+    "cogs.interactions.buttons": ("cogs.events.manager", "cogs.user.profile"),
+    "cogs.interactions.dropdowns": ("cogs.events.manager",),
+    "cogs.interactions.mention_handler": ("cogs.events.manager",),
+    # Advanced / optional
+    "cogs.admin.owner_actions": ("cogs.events.manager", "cogs.user.profile"),
+    "cogs.admin.sheets_test": (),
+    "cogs.admin.sheet_formatter": (),
+}
+
+# Extensions the bot cannot work without
+CRITICAL_COGS = ("cogs.user.profile", "cogs.events.manager", "cogs.admin.actions")
+
+
+class CogLoader:
+    """
+    Loads extensions along their dependency graph.
+
+    Features:
+    - Independent extensions load concurrently
+    - Dependents wait only for their own dependencies
+    - Dependents of a failed extension are skipped, not half-loaded
+    - Per-extension load timings
+    """
+
+    def __init__(self, bot, dependencies: Dict[str, Tuple[str, ...]] = None):
+        """
+        Initialize the loader.
+
+        Args:
+            bot: Bot to load extensions into
+            dependencies: Extension dependency graph (defaults to COG_DEPENDENCIES)
+
+        Raises:
+            ValueError: If a dependency is undeclared or the graph has a cycle
+        """
+        self.bot = bot
+        self.dependencies = dict(dependencies or COG_DEPENDENCIES)
+        self.timings: Dict[str, float] = {}
+        self.loaded: List[str] = []
+        self.failed: List[Tuple[str, str]] = []
+        self.wall_time = 0.0
+        self._validate()
+
+    def _validate(self):
+        for cog, deps in self.dependencies.items():
+            unknown = [dep for dep in deps if dep not in self.dependencies]
+            if unknown:
+                raise ValueError(f"{cog} depends on undeclared extensions: {', '.join(unknown)}")
+        try:
+            TopologicalSorter(self.dependencies).prepare()
+        except CycleError as e:
+            raise ValueError(f"Cog dependency cycle: {' -> '.join(e.args[1])}") from e
+
+    async def load_all(self) -> Tuple[List[str], List[Tuple[str, str]]]:
+        """
+        Load every declared extension.
+
+        Returns:
+            tuple: (loaded_cogs, failed_cogs) where failed_cogs holds
+                (cog_name, error_message) tuples
+        """
+        started = time.perf_counter()
+        sorter = TopologicalSorter(self.dependencies)
+        sorter.prepare()
+        pending: Dict[asyncio.Task, str] = {}
+
+        while sorter.is_active():
+            for cog in sorter.get_ready():
+                pending[asyncio.create_task(self._load(cog))] = cog
+            done, _ = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+            for task in done:
+                sorter.done(pending.pop(task))
+
+        self.wall_time = time.perf_counter() - started
+        return self.loaded, self.failed
+
+    async def _load(self, cog: str):
+        failed_deps = [dep for dep in self.dependencies[cog] if dep not in self.loaded]
+        if failed_deps:
+            error = f"dependency not loaded: {', '.join(failed_deps)}"
+            logger.error(f"⏭️ Skipped {cog}: {error}")
+            self.failed.append((cog, error))
+            return
+
+        started = time.perf_counter()
+        try:
+            await self.bot.load_extension(cog)
+            self.loaded.append(cog)
+            logger.info(f"✅ Loaded {cog}")
+        except Exception as e:
+            logger.error(f"❌ Failed to load {cog}: {e}")
+            logger.debug(traceback.format_exc())
+            self.failed.append((cog, str(e)))
+            if cog in CRITICAL_COGS:
+                logger.critical(
+                    f"🚨 Critical cog {cog} failed to load! Bot may not function properly."
+                )
+        finally:
+            self.timings[cog] = time.perf_counter() - started
+
+    def report(self) -> str:
+        """Per-extension timing report, slowest first."""
+        lines = [
+            f"Cog startup: {len(self.loaded)}/{len(self.dependencies)} loaded "
+            f"in {self.wall_time * 1000:.0f}ms "
+            f"(sequential would be {sum(self.timings.values()) * 1000:.0f}ms)"
+        ]
+        failed = dict(self.failed)
+        for cog, seconds in sorted(self.timings.items(), key=lambda item: item[1], reverse=True):
+            status = "❌" if cog in failed else "✅"
+            lines.append(f"   {status} {cog}: {seconds * 1000:.1f}ms")
+        for cog, error in self.failed:
+            if cog not in self.timings:
+                lines.append(f"   ⏭️ {cog}: {error}")
+        return "\n".join(lines)
@@ -1,7 +1,3 @@
-import json
-import os
-from datetime import datetime
-
 import discord
 from discord.ext import commands
 
@@ -15,7 +11,10 @@ from config.constants import (  # Fixed import
 from utils.file_ops import file_ops  # Use global instance
 from utils.helpers import Helpers
 from utils.logger import setup_logger
-from utils.sheets_manager import SheetsManager
+from utils.sheets_manager import get_sheets_manager
+from utils.models import BlockEntry
+from utils.stats_index import stats_index
+from utils.storage import storage
 from utils.validators import validate_days
 from utils.integrated_data_manager import data_manager
 
@@ -41,7 +40,7 @@ class AdminActions(commands.Cog):
         self.results_file = FILES["RESULTS"]
         self.data_manager = data_manager  # Use global integrated instance
         self.file_ops = file_ops  # Use global instance
-        self.sheets_manager = SheetsManager()  # Initialize sheets manager
+        self.sheets_manager = get_sheets_manager()  # Shared sheets connection
 
     async def load_results(self):
         """
@@ -50,10 +49,9 @@ class AdminActions(commands.Cog):
         Returns:
             dict: Dictionary containing wins, losses, and history data
         """
-        return await self.data_manager.load_data(
+        return await storage.load(
             self.results_file,
             default={"wins": 0, "losses": 0, "history": []},
-            prefer_sheets=True,
         )
 
     async def load_blocked_users(self):
@@ -63,7 +61,7 @@ class AdminActions(commands.Cog):
         Returns:
             dict: Dictionary of blocked users and their block information
         """
-        return await self.file_ops.load_json(self.blocked_file, {})
+        return await storage.load(self.blocked_file, {})
 
     async def sync_to_sheets(self, data_type: str, data: dict) -> bool:
         """Safely sync data to Google Sheets with fallback."""
@@ -85,9 +83,7 @@ class AdminActions(commands.Cog):
 
     async def save_blocked_users(self, data):
         """Save blocked users to both JSON and sheets."""
-        return await self.data_manager.save_data(
-            self.blocked_file, data, sync_to_sheets=True
-        )
+        return await storage.save(self.blocked_file, data, sync_to_sheets=True)
 
     @commands.command()
     @commands.has_any_role(*ADMIN_ROLE_IDS)
@@ -118,19 +114,15 @@ class AdminActions(commands.Cog):
             return
 
         user_id = str(member.id)
-        blocked_by = ctx.author.name
-        blocked_at = datetime.utcnow().isoformat()
         duration = max(days, 1)
+        block = BlockEntry.create(ctx.author.name, duration)
 
-        data = await self.load_blocked_users()
-        data[user_id] = {
-            "blocked_by": blocked_by,
-            "blocked_at": blocked_at,
-            "ban_duration_days": duration,
-        }
-        await self.save_blocked_users(data)
+        # Item-level write so concurrent blocks/unblocks can't overwrite each other
+        await storage.set_item(
+            self.blocked_file, user_id, block.to_dict(), sync_to_sheets=True
+        )
 
-        time_text = Helpers.days_until_expiry(blocked_at, duration)
+        time_text = Helpers.days_until_expiry(block.blocked_at, duration)
 
         # Send confirmation to the channel
         await ctx.send(f"✅ {member.mention} has been blocked for `{duration}` day(s).")
@@ -179,14 +171,11 @@ class AdminActions(commands.Cog):
             - DMs bot admin
         """
         user_id = str(member.id)
-        data = await self.load_blocked_users()
-
-        if user_id not in data:
+        if storage.get_item(self.blocked_file, user_id) is None:
             await ctx.send("⚠️ That user is not currently blocked.")
             return
 
-        del data[user_id]
-        await self.save_blocked_users(data)
+        await storage.delete_item(self.blocked_file, user_id, sync_to_sheets=True)
 
         await ctx.send(f"✅ {member.mention} has been unblocked.")
         logger.info(f"{ctx.author} manually unblocked {member}")
@@ -287,9 +276,10 @@ class AdminActions(commands.Cog):
                 return
 
             results = await self.load_results()
-            wins = results.get("wins", 0)
-            losses = results.get("losses", 0)
-            win_rate = (wins / (wins + losses)) * 100 if (wins + losses) > 0 else 0
+            summary = stats_index.get_summary()
+            wins = summary["match_wins"]
+            losses = summary["match_losses"]
+            win_rate = summary["match_win_rate"]
 
             # Team signups with IGNs
             team_fields = []
@@ -323,15 +313,8 @@ class AdminActions(commands.Cog):
                 blocked_info.append(f"{name} - `{time_left} days left`")
 
             # Event trends and results
-            if os.path.exists(self.history_file):
-                with open(self.history_file, "r") as f:
-                    try:
-                        history = json.load(f)
-                        if not isinstance(history, list):
-                            history = []
-                    except json.JSONDecodeError:
-                        history = []
-            else:
+            history = storage.view(self.history_file, [])
+            if not isinstance(history, list):
                 history = []
 
             trend_lines = []
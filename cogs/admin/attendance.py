@@ -6,6 +6,12 @@ from discord.ext import commands
 from config.constants import FILES
 from config.settings import ADMIN_ROLE_IDS
 from utils.data_manager import DataManager
+from utils.logger import setup_logger
+from utils.models import PlayerStats
+from utils.stats_index import stats_index
+from utils.storage import storage
+
+logger = setup_logger("attendance")
 
 
 class Attendance(commands.Cog):
@@ -33,49 +39,59 @@ class Attendance(commands.Cog):
 
     def load_absent_data(self):
         """
-        Load absent data using DataManager.
+        Load absent data from the storage service.
 
         Returns:
             dict: Dictionary containing absence records
                   Format: {user_id: {reason, timestamp, marked_by}}
         """
-        return self.data_manager.load_json(FILES["ABSENT"], {})
+        return storage.get(FILES["ABSENT"], {})
 
-    def save_absent_data(self):
+    async def record_absence(self, user_id: str, record: dict) -> bool:
         """
-        Save absent data and sync with Google Sheets.
+        Store one absence record and bump the player's absent count.
 
-        Updates player statistics to reflect absences.
+        Args:
+            user_id: Discord user ID being marked absent
+            record: Absence details (reason, timestamp, marked_by)
 
         Returns:
             bool: True if save was successful, False otherwise
         """
-        success = self.data_manager.save_json(
-            FILES["ABSENT"], self.absent_data, sync_to_sheets=True
-        )
-        if success:
-            # Update player stats for absents count
-            for user_id in self.absent_data.keys():
-                if user_id in self.data_manager.player_stats:
-                    self.data_manager.player_stats[user_id]["absents"] = (
-                        self.data_manager.player_stats[user_id].get("absents", 0) + 1
-                    )
-                else:
-                    # Initialize player stats if not exists
-                    self.data_manager.player_stats[user_id] = {
-                        "name": f"User_{user_id}",
-                        "team_results": {
-                            "main_team": {"wins": 0, "losses": 0},
-                            "team_2": {"wins": 0, "losses": 0},
-                            "team_3": {"wins": 0, "losses": 0},
-                        },
-                        "absents": 1,
-                        "blocked": False,
-                    }
-            self.data_manager.save_player_stats()
-        else:
-            print("❌ Failed to save absent data")
-        return success
+        if not await storage.set_item(FILES["ABSENT"], user_id, record):
+            logger.error("❌ Failed to save absent data")
+            return False
+
+        self.absent_data[user_id] = record
+
+        # Update player stats for absents count
+        def _bump_absents(entry):
+            stats = PlayerStats.from_dict(entry) if entry else PlayerStats(name=f"User_{user_id}")
+            stats.absents += 1
+            return stats.to_dict()
+
+        if await storage.update_item(
+            FILES["PLAYER_STATS"], user_id, _bump_absents, sync_to_sheets=True
+        ):
+            stats_index.update_player(user_id)
+        return True
+
+    async def clear_absence(self, user_id: str) -> bool:
+        """
+        Remove one absence record.
+
+        Args:
+            user_id: Discord user ID to mark present
+
+        Returns:
+            bool: True if save was successful, False otherwise
+        """
+        if not await storage.delete_item(FILES["ABSENT"], user_id):
+            logger.error("❌ Failed to save absent data")
+            return False
+
+        self.absent_data.pop(user_id, None)
+        return True
 
     @commands.command(name="absent")
     @commands.has_any_role(*ADMIN_ROLE_IDS)
@@ -96,13 +112,13 @@ class Attendance(commands.Cog):
             - Syncs with Google Sheets
         """
         user_id = str(ctx.author.id)
-        self.absent_data[user_id] = {
+        record = {
             "reason": reason,
             "timestamp": datetime.utcnow().isoformat(),
             "marked_by": str(ctx.author),
         }
 
-        if self.save_absent_data():
+        if await self.record_absence(user_id, record):
             await ctx.send(
                 f"✅ {ctx.author.mention} marked as absent. Reason: *{reason}*"
             )
@@ -131,8 +147,8 @@ class Attendance(commands.Cog):
         user_id = str(member.id)
 
         if user_id in self.absent_data:
-            removed = self.absent_data.pop(user_id)
-            if self.save_absent_data():
+            removed = self.absent_data[user_id]
+            if await self.clear_absence(user_id):
                 await ctx.send(f"✅ Removed absence mark for {member.mention}")
                 print(
                     f"🧹 {ctx.author} removed absence for {member} (was marked: {removed})"
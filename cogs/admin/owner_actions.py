@@ -8,7 +8,11 @@ from discord.ext import commands
 from config.constants import COLORS, EMOJIS, FILES
 from config.settings import BOT_ADMIN_USER_ID
 from utils.data_manager import DataManager
+from utils.ign_directory import ign_directory
+from utils.latency import latency_metrics
 from utils.logger import setup_logger
+from utils.models import BlockEntry, Signup, validate_document
+from utils.storage import storage
 from utils.log_cleaner import LogCleaner
 
 logger = setup_logger("owner_actions")
@@ -82,108 +86,7 @@ class OwnerActions(commands.Cog):
                 bool: True if structure is valid
                 List[str]: List of validation issues found
         """
-        issues: List[str] = []
-
-        if file_key == "EVENTS":
-            if not isinstance(data, dict):
-                issues.append("Events data should be a dictionary")
-            else:
-                for team in ("main_team", "team_2", "team_3"):
-                    if team not in data:
-                        issues.append(f"Missing team: {team}")
-                    elif not isinstance(data[team], list):
-                        issues.append(
-                            f"Team {team} should be a list, got {type(data[team]).__name__}"
-                        )
-                    else:
-                        for idx, member in enumerate(data[team]):
-                            # Accept both IGN strings and user IDs for backward compatibility
-                            if isinstance(member, int):
-                                if member <= 0:
-                                    issues.append(
-                                        f"Invalid user ID in {team}[{idx}]: {member}"
-                                    )
-                            elif isinstance(member, str):
-                                if not member.strip():
-                                    issues.append(f"Empty IGN in {team}[{idx}]")
-                            else:
-                                issues.append(
-                                    f"Invalid member type in {team}[{idx}]: {type(member).__name__}"
-                                )
-
-        elif file_key == "BLOCKED":
-            if not isinstance(data, dict):
-                issues.append("Blocked users data should be a dictionary")
-            else:
-                for user_id, info in data.items():
-                    if not user_id.isdigit():
-                        issues.append(f"Invalid user ID key: {user_id}")
-                    if not isinstance(info, dict):
-                        issues.append(f"User {user_id} info should be a dictionary")
-                        continue
-                    for field in ("blocked_by", "blocked_at", "ban_duration_days"):
-                        if field not in info:
-                            issues.append(f"User {user_id} missing field: {field}")
-                    if "blocked_at" in info:
-                        try:
-                            datetime.fromisoformat(info["blocked_at"])
-                        except ValueError:
-                            issues.append(
-                                f"User {user_id} has invalid timestamp format"
-                            )
-
-        elif file_key == "RESULTS":
-            if not isinstance(data, dict):
-                issues.append("Results data should be a dictionary")
-            else:
-                if "total_wins" not in data or not isinstance(data["total_wins"], int):
-                    issues.append("Missing or invalid total_wins")
-                if "total_losses" not in data or not isinstance(
-                    data["total_losses"], int
-                ):
-                    issues.append("Missing or invalid total_losses")
-                if "history" not in data or not isinstance(data["history"], list):
-                    issues.append("Missing or invalid history array")
-
-        elif file_key == "HISTORY":
-            if not isinstance(data, list):
-                issues.append("History data should be a list")
-            else:
-                for idx, entry in enumerate(data):
-                    if not isinstance(entry, dict):
-                        issues.append(f"History entry {idx} should be a dictionary")
-                        continue
-                    if "timestamp" not in entry:
-                        issues.append(f"History entry {idx} missing timestamp")
-                    if "teams" not in entry or not isinstance(entry["teams"], dict):
-                        issues.append(
-                            f"History entry {idx} missing or invalid teams data"
-                        )
-
-        elif file_key == "IGN_MAP":
-            if not isinstance(data, dict):
-                issues.append("IGN map should be a dictionary")
-            else:
-                for user_id, ign in data.items():
-                    if not user_id.isdigit():
-                        issues.append(f"Invalid user ID key: {user_id}")
-                    if not isinstance(ign, str) or not ign.strip():
-                        issues.append(f"Invalid IGN for user {user_id}: {ign}")
-
-        elif file_key == "TIMES":
-            if not isinstance(data, dict):
-                issues.append("Times data should be a dictionary")
-            else:
-                for team in ("main_team", "team_2", "team_3"):
-                    if team not in data:
-                        issues.append(f"Missing time for team: {team}")
-                    elif not isinstance(data[team], str):
-                        issues.append(f"Time for {team} should be a string")
-
-        elif file_key == "ABSENT":
-            if not isinstance(data, dict):
-                issues.append("Absent data should be a dictionary")
-
+        issues = validate_document(file_key, data)
         return (len(issues) == 0, issues)
 
     # ============================================
@@ -375,20 +278,23 @@ class OwnerActions(commands.Cog):
                 sheets_manager = self.bot.sheets
                 print("DEBUG: Using bot's sheets manager")
             else:
-                # Try to create new instance
-                print("DEBUG: Bot doesn't have sheets manager, creating new instance")
+                # Fall back to the shared instance
+                print("DEBUG: Bot doesn't have sheets manager, using shared instance")
                 try:
-                    from sheets import SheetsManager
+                    from sheets import get_sheets_manager
 
-                    sheets_manager = SheetsManager()
-                    print("DEBUG: Created new SheetsManager instance")
+                    sheets_manager = get_sheets_manager()
+                    print("DEBUG: Using shared SheetsManager instance")
                 except Exception as import_error:
                     await ctx.send(
                         f"❌ **Error importing sheets manager:** {import_error}"
                     )
                     return
 
-            if not sheets_manager.is_connected():
+            from sheets import shared_sheets
+
+            # May still be connecting in the background right after startup
+            if not await shared_sheets.wait_until_ready(timeout=60):
                 await ctx.send(
                     "❌ **Google Sheets not connected.** Check credentials in Secrets."
                 )
@@ -398,12 +304,12 @@ class OwnerActions(commands.Cog):
 
             event_manager = self.bot.get_cog("EventManager")
             all_data = {
-                "events": self.data_manager.load_json(FILES["EVENTS"], {}),
-                "results": self.data_manager.load_json(FILES["RESULTS"], {}),
+                "events": await storage.load(FILES["EVENTS"], {}),
+                "results": await storage.load(FILES["RESULTS"], {}),
                 "player_stats": getattr(event_manager.data_manager, "player_stats", {})
                 if event_manager
                 else {},
-                "notification_preferences": self.data_manager.load_json(
+                "notification_preferences": await storage.load(
                     "data/notification_preferences.json", {}
                 ),
             }
@@ -415,11 +321,17 @@ class OwnerActions(commands.Cog):
                 )
             else:
                 # Fallback to create_all_templates if full sync method doesn't exist
-                success = self.bot.sheets.create_all_templates(all_data)
+                from sheets import get_engine
+
+                template_results = await get_engine(sheets_manager).create_all_templates(
+                    all_data
+                )
+                summary = template_results.get("summary", {})
+                success = summary.get("successful", 0) > 0
                 sync_result = {
                     "success": success,
-                    "spreadsheet_url": self.bot.sheets.spreadsheet.url
-                    if self.bot.sheets.spreadsheet
+                    "spreadsheet_url": sheets_manager.spreadsheet.url
+                    if sheets_manager.spreadsheet
                     else None,
                 }
 
@@ -508,9 +420,9 @@ class OwnerActions(commands.Cog):
 
             if sheets_manager.spreadsheet:
                 try:
-                    worksheets = [
-                        ws.title for ws in sheets_manager.spreadsheet.worksheets()
-                    ]
+                    from sheets import get_engine
+
+                    worksheets = await get_engine(sheets_manager).get_worksheet_list()
                     embed.add_field(
                         name="📋 Spreadsheet",
                         value=f"**Worksheets:** {len(worksheets)}\n[Open Spreadsheet]({sheets_manager.spreadsheet.url})",
@@ -527,7 +439,7 @@ class OwnerActions(commands.Cog):
 
             embed.add_field(
                 name="🛠️ Commands",
-                value="`!syncmembers` • `!fullsync` • `!sheetsinfo`",
+                value="`!syncmembers` • `!fullsync` • `!sheetsinfo` • `!sheetsdiagnostics`",
                 inline=False,
             )
 
@@ -537,6 +449,78 @@ class OwnerActions(commands.Cog):
             logger.exception("Error in sheets_info")
             await ctx.send(f"❌ **Error:** {str(e)}")
 
+    @commands.command(name="sheetsdiagnostics", help="Show Google Sheets quota usage")
+    @commands.check(lambda ctx: ctx.author.id == BOT_ADMIN_USER_ID)
+    async def sheets_diagnostics(self, ctx: commands.Context):
+        """Show live Sheets API quota usage, throttling and retries."""
+        try:
+            from sheets.quota import quota_manager
+        except ImportError as e:
+            return await ctx.send(f"❌ **Error:** Sheets integration unavailable: {e}")
+
+        snapshot = quota_manager.snapshot()
+        throttled = any(q["throttled"] for q in snapshot["quotas"].values())
+        embed = discord.Embed(
+            title="📊 Google Sheets Quota",
+            description="Shared by every sheets writer in this process",
+            color=COLORS["WARNING"] if throttled else COLORS["INFO"],
+        )
+
+        for kind, quota in snapshot["quotas"].items():
+            slowed = quota["current_rate_per_minute"] < quota["limit_per_minute"]
+            embed.add_field(
+                name=f"{'⚠️' if slowed else '✅'} {kind.title()} quota",
+                value=(
+                    f"Last minute: {quota['used_last_minute']}/{quota['limit_per_minute']}\n"
+                    f"Rate: {quota['current_rate_per_minute']}/min\n"
+                    f"Tokens: {quota['tokens_available']}/{quota['burst']}\n"
+                    f"Requests: {quota['requests']} • 429s: {quota['throttled']}\n"
+                    f"Waited: {quota['total_wait_seconds']}s"
+                ),
+            )
+
+        by_priority = "\n".join(
+            f"{name.title()}: {count}" for name, count in snapshot["requests_by_priority"].items()
+        )
+        embed.add_field(name="🎯 Requests by Priority", value=by_priority, inline=False)
+        embed.add_field(
+            name="🔄 Retries",
+            value=f"Retried: {snapshot['retries']} • Gave up: {snapshot['failures']}",
+            inline=False,
+        )
+
+        await ctx.send(embed=embed)
+
+    @commands.command(name="latency", help="Show interaction acknowledgement latency")
+    @commands.check(lambda ctx: ctx.author.id == BOT_ADMIN_USER_ID)
+    async def latency(self, ctx: commands.Context):
+        """Show per-handler acknowledgement latency percentiles."""
+        summary = latency_metrics.summary()
+        budget = latency_metrics.budget_ms
+        embed = discord.Embed(
+            title="⏱️ Interaction Latency",
+            description=f"Acknowledgement budget: p99 under **{budget}ms**",
+            color=COLORS["INFO"],
+        )
+
+        if not summary:
+            embed.description += "\n\nNo interactions recorded since startup."
+        for name, stats in summary.items():
+            within = stats["p99_ms"] <= budget
+            embed.add_field(
+                name=f"{'✅' if within else '⚠️'} {name}",
+                value=(
+                    f"Count: {stats['count']}\n"
+                    f"p50: {stats['p50_ms']:.0f}ms • p95: {stats['p95_ms']:.0f}ms\n"
+                    f"p99: {stats['p99_ms']:.0f}ms • max: {stats['max_ms']:.0f}ms"
+                ),
+                inline=False,
+            )
+            if not within:
+                embed.color = COLORS["WARNING"]
+
+        await ctx.send(embed=embed)
+
     # ============================================
     # JSON FILE MANAGEMENT COMMANDS
     # ============================================
@@ -569,7 +553,7 @@ class OwnerActions(commands.Cog):
                 file_issues.append("File does not exist")
             else:
                 try:
-                    data = self.data_manager.load_json(path, {})
+                    data = await storage.load(path, {})
                     if data is None:
                         status_emoji = EMOJIS["ERROR"]
                         status_text = "❌ Corrupted"
@@ -647,7 +631,7 @@ class OwnerActions(commands.Cog):
                 if not os.path.exists(path):
                     needs_fix, reason = True, "File missing"
                 else:
-                    data = self.data_manager.load_json(path, None)
+                    data = await storage.load(path, None)
                     if data is None:
                         needs_fix, reason = True, "JSON corrupted"
                     else:
@@ -679,28 +663,16 @@ class OwnerActions(commands.Cog):
                         # Handle both user IDs and IGN strings
                         for team in ("main_team", "team_2", "team_3"):
                             if team in data and isinstance(data[team], list):
-                                valid_members = []
-                                for member in data[team]:
-                                    if isinstance(member, int) and member > 0:
-                                        valid_members.append(member)
-                                    elif isinstance(member, str) and member.strip():
-                                        valid_members.append(member.strip())
+                                valid_members = [
+                                    member.strip() if isinstance(member, str) else member
+                                    for idx, member in enumerate(data[team])
+                                    if Signup.validate_member(team, idx, member) is None
+                                ]
                                 default[team] = valid_members
 
                     elif key == "BLOCKED":
                         for uid, info in data.items():
-                            if (
-                                uid.isdigit()
-                                and isinstance(info, dict)
-                                and all(
-                                    field in info
-                                    for field in (
-                                        "blocked_by",
-                                        "blocked_at",
-                                        "ban_duration_days",
-                                    )
-                                )
-                            ):
+                            if not BlockEntry.validate(uid, info):
                                 default[uid] = info
 
                     elif key == "IGN_MAP":
@@ -708,7 +680,7 @@ class OwnerActions(commands.Cog):
                             if uid.isdigit() and isinstance(ign, str) and ign.strip():
                                 default[uid] = ign.strip()
 
-                saved = self.data_manager.save_json(path, default)
+                saved = await storage.save(path, default)
                 if saved:
                     fixed.append(f"**{key}**: {reason}")
                     logger.info(f"Fixed {key}: {reason}")
@@ -784,7 +756,7 @@ class OwnerActions(commands.Cog):
                 await ctx.send(f"⚠️ Backup failed: {e}")
 
         default = self._get_expected_structure(key)
-        success = self.data_manager.save_json(path, default)
+        success = await storage.save(path, default)
 
         if success:
             embed = discord.Embed(
@@ -811,14 +783,17 @@ class OwnerActions(commands.Cog):
     @commands.check(lambda ctx: ctx.author.id == BOT_ADMIN_USER_ID)
     async def migrate_user_ids_to_igns(self, ctx: commands.Context):
         """Convert user IDs in events.json to IGN strings."""
-        events_data = self.data_manager.load_json(
-            FILES["EVENTS"], {"main_team": [], "team_2": [], "team_3": []}
-        )
+        event_cog = self.bot.get_cog("EventManager")
         profile_cog = self.bot.get_cog("Profile")
 
+        if not event_cog:
+            return await ctx.send("❌ Event system not loaded. Cannot migrate data.")
         if not profile_cog:
             return await ctx.send("❌ Profile cog not loaded. Cannot migrate data.")
 
+        # The signup engine owns the rosters; migrate and save through it
+        events_data = event_cog.events
+
         converted_count = 0
         failed_conversions = []
 
@@ -826,11 +801,11 @@ class OwnerActions(commands.Cog):
             new_members = []
             for member in members:
                 if isinstance(member, int):
-                    # Convert user ID to IGN
-                    user = self.bot.get_user(member)
-                    if user:
-                        ign = profile_cog.get_ign(user)
-                        new_members.append(ign)
+                    # Convert user ID to IGN (directory first, no user lookup needed)
+                    ign = ign_directory.get(member)
+                    user = None if ign else self.bot.get_user(member)
+                    if ign or user:
+                        new_members.append(ign or profile_cog.get_ign(user))
                         converted_count += 1
                     else:
                         failed_conversions.append(f"User ID {member} not found")
@@ -844,7 +819,8 @@ class OwnerActions(commands.Cog):
             events_data[team_name] = new_members
 
         # Save the migrated data
-        success = self.data_manager.save_json(FILES["EVENTS"], events_data)
+        event_cog.events = events_data
+        success = await event_cog.save_events()
 
         embed = discord.Embed(
             title="🔄 Data Migration Complete",
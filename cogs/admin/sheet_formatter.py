@@ -1,5 +1,4 @@
 import asyncio
-import time
 
 import discord
 from discord.ext import commands
@@ -77,7 +76,11 @@ class SheetFormatter(commands.Cog):
                 )
                 return
 
+            from sheets.async_engine import get_engine
+            from sheets.quota import Priority
+
             sheets_manager = self.bot.sheets
+            engine = get_engine(sheets_manager)
 
             await ctx.send(
                 f"🔍 **Debug:** Checking connection... has is_connected method: {hasattr(sheets_manager, 'is_connected')}"
@@ -166,13 +169,14 @@ class SheetFormatter(commands.Cog):
             try:
                 await ctx.send("🔍 **Debug:** Calling create_player_stats_template...")
                 await asyncio.sleep(0.5)  # Brief pause before operation
-                success = sheets_manager.create_player_stats_template(
-                    all_data.get("player_stats", {})
+                success = await engine.run(
+                    sheets_manager.create_player_stats_template,
+                    all_data.get("player_stats", {}),
+                    priority=Priority.MAINTENANCE,
                 )
                 await ctx.send(
                     f"🔍 **Debug:** create_player_stats_template returned: {success}"
                 )
-                time.sleep(2)  # Rate limiting between operations
 
                 if success:
                     formatting_results.append(
@@ -204,9 +208,12 @@ class SheetFormatter(commands.Cog):
             try:
                 await ctx.send("🔍 **Debug:** Calling sync_current_teams...")
                 await asyncio.sleep(0.5)  # Brief pause before operation
-                success = sheets_manager.sync_current_teams(all_data.get("events", {}))
+                success = await engine.run(
+                    sheets_manager.sync_current_teams,
+                    all_data.get("events", {}),
+                    priority=Priority.MAINTENANCE,
+                )
                 await ctx.send(f"🔍 **Debug:** sync_current_teams returned: {success}")
-                time.sleep(2)  # Rate limiting between operations
 
                 if success:
                     formatting_results.append(
@@ -238,13 +245,14 @@ class SheetFormatter(commands.Cog):
             try:
                 await ctx.send("🔍 **Debug:** Calling sync_results_history...")
                 await asyncio.sleep(0.5)  # Brief pause before operation
-                success = sheets_manager.sync_results_history(
-                    all_data.get("results", {})
+                success = await engine.run(
+                    sheets_manager.sync_results_history,
+                    all_data.get("results", {}),
+                    priority=Priority.MAINTENANCE,
                 )
                 await ctx.send(
                     f"🔍 **Debug:** sync_results_history returned: {success}"
                 )
-                time.sleep(2)  # Rate limiting between operations
 
                 if success:
                     formatting_results.append(
@@ -281,7 +289,10 @@ class SheetFormatter(commands.Cog):
                     await ctx.send(
                         "🔍 **Debug:** Calling create_match_statistics_template..."
                     )
-                    match_success = sheets_manager.create_match_statistics_template()
+                    match_success = await engine.run(
+                        sheets_manager.create_match_statistics_template,
+                        priority=Priority.MAINTENANCE,
+                    )
                     await ctx.send(
                         f"🔍 **Debug:** create_match_statistics_template returned: {match_success}"
                     )
@@ -296,7 +307,10 @@ class SheetFormatter(commands.Cog):
                     await ctx.send(
                         "🔍 **Debug:** Calling create_alliance_tracking_sheet..."
                     )
-                    alliance_success = sheets_manager.create_alliance_tracking_sheet()
+                    alliance_success = await engine.run(
+                        sheets_manager.create_alliance_tracking_sheet,
+                        priority=Priority.MAINTENANCE,
+                    )
                     await ctx.send(
                         f"🔍 **Debug:** create_alliance_tracking_sheet returned: {alliance_success}"
                     )
@@ -311,8 +325,9 @@ class SheetFormatter(commands.Cog):
                     await ctx.send(
                         "🔍 **Debug:** Calling create_error_summary_template..."
                     )
-                    error_summary_success = (
-                        sheets_manager.create_error_summary_template()
+                    error_summary_success = await engine.run(
+                        sheets_manager.create_error_summary_template,
+                        priority=Priority.MAINTENANCE,
                     )
                     await ctx.send(
                         f"🔍 **Debug:** create_error_summary_template returned: {error_summary_success}"
@@ -328,8 +343,9 @@ class SheetFormatter(commands.Cog):
                     await ctx.send(
                         "🔍 **Debug:** Calling create_dashboard_summary_template..."
                     )
-                    dashboard_success = (
-                        sheets_manager.create_dashboard_summary_template()
+                    dashboard_success = await engine.run(
+                        sheets_manager.create_dashboard_summary_template,
+                        priority=Priority.MAINTENANCE,
                     )
                     await ctx.send(
                         f"🔍 **Debug:** create_dashboard_summary_template returned: {dashboard_success}"
@@ -504,6 +520,9 @@ class SheetFormatter(commands.Cog):
                 await ctx.send("❌ **Error:** Google Sheets not initialized.")
                 return
 
+            from sheets.async_engine import get_engine
+            from sheets.quota import READ, WRITE, Priority, quota_manager
+
             sheets_manager = self.bot.sheets
 
             if not sheets_manager.is_connected():
@@ -518,19 +537,29 @@ class SheetFormatter(commands.Cog):
             message = await ctx.send(embed=embed)
 
             # Get all worksheets and clear formatting
-            worksheets = sheets_manager.spreadsheet.worksheets()
+            engine = get_engine(sheets_manager)
+            worksheets = await engine.run(
+                quota_manager.call,
+                READ,
+                sheets_manager.spreadsheet.worksheets,
+                priority=Priority.MAINTENANCE,
+            )
             cleared_sheets = []
 
             for worksheet in worksheets:
                 try:
                     # Clear all formatting but keep data
-                    worksheet.format(
+                    await engine.run(
+                        quota_manager.call,
+                        WRITE,
+                        worksheet.format,
                         "1:1000",
                         {
                             "backgroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
                             "textFormat": {"bold": False, "fontSize": 10},
                             "borders": {"style": "NONE"},
                         },
+                        priority=Priority.MAINTENANCE,
                     )
                     cleared_sheets.append(f"✅ {worksheet.title}")
                 except Exception as e:
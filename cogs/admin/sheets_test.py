@@ -47,16 +47,18 @@ class SheetsTest(commands.Cog):
 
             # Try to import and initialize sheets manager
             try:
-                # Use the bot's sheets manager or create new one
+                # Use the bot's sheets manager or the shared one
+                from sheets import shared_sheets
+                from sheets.async_engine import get_engine
+                from sheets.quota import READ, Priority, quota_manager
+
                 if hasattr(self.bot, "sheets") and self.bot.sheets:
                     sheets_manager = self.bot.sheets
                 else:
-                    from sheets import SheetsManager
-
-                    sheets_manager = SheetsManager()
+                    sheets_manager = shared_sheets.get_manager()
                     self.bot.sheets = sheets_manager
 
-                if not sheets_manager.is_connected():
+                if not await shared_sheets.wait_until_ready(timeout=60):
                     await ctx.send(
                         "❌ Google Sheets connection failed. Check credentials and environment variables."
                     )
@@ -68,6 +70,8 @@ class SheetsTest(commands.Cog):
                     color=discord.Color.green(),
                 )
 
+                engine = get_engine(sheets_manager)
+
                 # Test basic operations
                 if sheets_manager.spreadsheet:
                     embed.add_field(
@@ -77,7 +81,12 @@ class SheetsTest(commands.Cog):
                     )
 
                     # List existing worksheets
-                    worksheets = sheets_manager.spreadsheet.worksheets()
+                    worksheets = await engine.run(
+                        quota_manager.call,
+                        READ,
+                        sheets_manager.spreadsheet.worksheets,
+                        priority=Priority.MAINTENANCE,
+                    )
                     worksheet_names = [ws.title for ws in worksheets]
                     embed.add_field(
                         name="📋 Existing Worksheets",
@@ -106,7 +115,11 @@ class SheetsTest(commands.Cog):
                         },
                     }
 
-                    success = sheets_manager.create_all_templates(test_data)
+                    success = await engine.run(
+                        sheets_manager.create_all_templates,
+                        test_data,
+                        priority=Priority.MAINTENANCE,
+                    )
                     if success:
                         embed.add_field(
                             name="🔧 Template Creation",
@@ -680,10 +693,11 @@ class SheetsTest(commands.Cog):
             # Test connection if possible
             if creds_exists and sheets_id_exists:
                 try:
-                    from sheets import SheetsManager
+                    from sheets import shared_sheets
 
-                    test_manager = SheetsManager()
-                    if test_manager.is_connected():
+                    # Shared connection; may still be connecting in the background
+                    test_manager = shared_sheets.get_manager()
+                    if await shared_sheets.wait_until_ready(timeout=60):
                         connection_status = "✅ Connected"
                         if test_manager.spreadsheet:
                             connection_status += (
@@ -0,0 +1,152 @@
+"""
+Live team rosters on the weekly signup post.
+
+Roster changes used to be visible only through ``!showteams`` or the
+"Show Teams" button, each building a fresh embed. The signup message posted
+by the event manager now edits itself in place whenever events.json, the
+signup lock or the event times change. Edits are debounced per message: a
+burst of signups marks the post dirty many times but it is edited at most
+once per interval, always with the latest rosters.
+"""
+
+import asyncio
+import os
+import time
+from typing import Callable, Optional
+
+import discord
+
+from config.constants import FILES, INTERACTION_CONFIG
+from utils.logger import setup_logger
+from utils.storage import storage
+
+logger = setup_logger("live_roster")
+
+# Files whose changes show up on the signup post
+WATCHED_FILES = {
+    os.path.basename(FILES["EVENTS"]),
+    os.path.basename(FILES["SIGNUP_LOCK"]),
+    os.path.basename(FILES["TIMES"]),
+}
+
+
+class LiveRosterPost:
+    """
+    Keeps the current signup message in sync with the rosters.
+
+    Features:
+    - Tracks the latest signup post, remembered across restarts
+    - Storage change events mark the post dirty
+    - At most one edit per interval, coalescing bursts into one edit
+    - Stops tracking a post that was deleted
+    """
+
+    def __init__(self, bot, build_embed: Callable[[], discord.Embed]):
+        """
+        Initialize the live roster post.
+
+        Args:
+            bot: The Discord bot instance
+            build_embed: Builds the signup embed from the current state
+        """
+        self.bot = bot
+        self.build_embed = build_embed
+        self.interval = INTERACTION_CONFIG["ROSTER_EDIT_INTERVAL"]
+        self.message: Optional[discord.PartialMessage] = None
+        self.edits = 0
+        self._dirty = False
+        self._last_edit = 0.0
+        self._task: Optional[asyncio.Task] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+
+    # ==========================================
+    # LIFECYCLE
+    # ==========================================
+
+    def start(self):
+        """Listen for storage changes; call from the bot's event loop."""
+        if self._loop is None:
+            self._loop = asyncio.get_running_loop()
+            storage.add_listener(self._on_data_changed)
+
+    async def restore(self):
+        """Re-attach to the signup post remembered from a previous run."""
+        ref = storage.view(FILES["SIGNUP_POST"], {})
+        channel = self.bot.get_channel(ref.get("channel_id") or 0)
+        if channel is None or not ref.get("message_id"):
+            return
+        self.message = channel.get_partial_message(ref["message_id"])
+        self.request_update()  # Catch up on changes made while offline
+
+    async def attach(self, message: discord.Message):
+        """
+        Track a newly posted signup message.
+
+        Args:
+            message: The signup post to keep updated
+        """
+        self.message = message
+        self._last_edit = time.monotonic()  # Just posted with fresh rosters
+        await storage.save(
+            FILES["SIGNUP_POST"],
+            {"channel_id": message.channel.id, "message_id": message.id},
+            sync_to_sheets=False,
+        )
+
+    async def stop(self):
+        """Stop listening for changes and cancel a pending edit."""
+        storage.remove_listener(self._on_data_changed)
+        self._loop = None
+        if self._task and not self._task.done():
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+        self._task = None
+
+    # ==========================================
+    # DEBOUNCED EDITS
+    # ==========================================
+
+    def _on_data_changed(self, filepath: str):
+        """Storage listener; may run off the loop, so hop back onto it."""
+        loop = self._loop  # stop() may clear it from another thread
+        if loop is None or os.path.basename(filepath) not in WATCHED_FILES:
+            return
+        try:
+            loop.call_soon_threadsafe(self.request_update)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    def request_update(self):
+        """Mark the post dirty and schedule an edit (call on the event loop)."""
+        if self.message is None:
+            return
+        self._dirty = True
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        while self._dirty and self.message is not None:
+            wait = self._last_edit + self.interval - time.monotonic()
+            if wait > 0:
+                await asyncio.sleep(wait)
+            self._dirty = False  # Changes from here on need another edit
+            self._last_edit = time.monotonic()
+            await self._edit()
+
+    async def _edit(self):
+        message = self.message
+        try:
+            await message.edit(embed=self.build_embed())
+            self.edits += 1
+        except discord.NotFound:
+            logger.info("ℹ️ Signup post was deleted, no longer updating it")
+            if self.message is message:
+                self.message = None
+                await storage.save(FILES["SIGNUP_POST"], {}, sync_to_sheets=False)
+        except discord.HTTPException as e:
+            logger.warning(f"⚠️ Failed to update signup post: {e}")
+        except Exception as e:
+            logger.error(f"❌ Error updating signup post: {e}")
@@ -1,10 +1,13 @@
 # cogs/events/manager.py
 
-from datetime import datetime, timedelta
+import asyncio
+from datetime import datetime
+from typing import Optional
 
 import discord
 from discord.ext import commands
 
+from cogs.events.live_roster import LiveRosterPost
 from cogs.events.signup_view import EventSignupView
 from config.constants import ALERT_CHANNEL_ID, COLORS, EMOJIS, FILES, TEAM_DISPLAY
 from config.settings import (
@@ -14,9 +17,14 @@ from config.settings import (
     RESTRICT_MAIN_TEAM,
     ROW_NOTIFICATION_ROLE_ID,
 )
+from services.audit_logger import log_signup
+from utils.event_schedule import event_schedule
 from utils.helpers import Helpers
 from utils.integrated_data_manager import data_manager
 from utils.logger import setup_logger
+from utils.models import BlockEntry
+from utils.signup_engine import SignupEngine, SignupResult, SignupStatus
+from utils.storage import storage
 from utils.validators import Validators
 
 logger = setup_logger("event_manager")
@@ -37,36 +45,134 @@ class EventManager(commands.Cog, name="EventManager"):
 
     def __init__(self, bot):
         self.bot = bot
-        self.events = {"main_team": [], "team_2": [], "team_3": []}
+        self.signups = SignupEngine()
+        self._background_tasks = set()
+        self.live_roster = LiveRosterPost(bot, self._create_signup_embed)
         self.data_manager = data_manager
-        self.blocked_users = {}
-        self.event_times = DEFAULT_TIMES
+        self.event_times = dict(DEFAULT_TIMES)
         self.signup_locked = False
+        self._rosters_loaded = False
 
     async def load_events(self):
-        """Load events with new integrated manager."""
-        data = await self.data_manager.load_data(
+        """Load events from the shared storage service."""
+        data = await storage.load(
             FILES["EVENTS"],
             default={"main_team": [], "team_2": [], "team_3": []},
         )
         self.events = data
 
+    @property
+    def events(self) -> dict:
+        """
+        Current rosters as team key -> list of players (a fresh copy).
+
+        Change signups through move_user(); assigning a whole document
+        (new event, reset) reloads the signup engine.
+        """
+        return self.signups.snapshot()
+
+    @events.setter
+    def events(self, data: dict):
+        self.signups.load(data)
+
     async def save_events(self) -> bool:
         """Save events with atomic operations."""
-        return await self.data_manager.save_data(
-            FILES["EVENTS"], self.events, sync_to_sheets=True
-        )
+        return await self.signups.commit()
+
+    async def move_user(
+        self, user: discord.abc.User, team: Optional[str], wait: bool = True
+    ) -> SignupResult:
+        """
+        Move a user to a team, or out of their team when team is None.
+
+        The one signup entry point for buttons, dropdowns and mention
+        commands. Checks the signup lock, blocks and the main team role
+        against in-memory state, then applies the move through the signup
+        engine. Audit logging always runs in the background.
+
+        Args:
+            user: Discord user or member signing up
+            team: Team key to join, or None to leave
+            wait: Await the save (False: interaction fast path, the move is
+                applied in memory and saved by the background writer)
+
+        Returns:
+            SignupResult: Outcome; check ``changed`` or ``status``
+        """
+        player = await self.get_user_display_name(user)
+
+        if self.is_signup_locked():
+            return SignupResult(SignupStatus.LOCKED, player, team)
+
+        if team is not None:
+            if await self.is_user_blocked(user.id):
+                entry = self.blocked_users.get(str(user.id), {})
+                days_left = Helpers.days_until_expiry(
+                    entry.get("blocked_at", ""), entry.get("ban_duration_days", 0)
+                )
+                return SignupResult(
+                    SignupStatus.BLOCKED, player, team, detail=f"{days_left} days"
+                )
+            if not self.can_join_team(user, team):
+                return SignupResult(SignupStatus.NO_PERMISSION, player, team)
+
+        if wait:
+            result = await self.signups.move(player, team)
+        else:
+            result = self.signups.apply(player, team)
+
+        if result.changed:
+            guild = getattr(user, "guild", None)
+            self._run_in_background(
+                asyncio.to_thread(
+                    self._audit_move, user.id, result, guild.id if guild else None
+                )
+            )
+
+        return result
+
+    @staticmethod
+    def _audit_move(user_id: int, result: SignupResult, guild_id: Optional[int]):
+        if result.previous_team:
+            log_signup(user_id, result.previous_team, "leave", guild_id)
+        if result.team:
+            log_signup(user_id, result.team, "join", guild_id)
+
+    def _run_in_background(self, coro):
+        """Run a coroutine as a task, keeping a reference until it finishes."""
+        task = asyncio.create_task(coro)
+        self._background_tasks.add(task)
+        task.add_done_callback(self._background_tasks.discard)
+
+    async def cog_unload(self):
+        """Save rosters still waiting on the background writer."""
+        await self.live_roster.stop()
+        if not await self.signups.flush():
+            logger.error("❌ Unsaved signup changes at unload")
 
     @commands.Cog.listener()
     async def on_ready(self):
-        await self.load_events()
+        # on_ready fires again after reconnects; reloading then would drop
+        # moves the background writer hasn't saved yet
+        if not self._rosters_loaded:
+            await self.load_events()
+            self._rosters_loaded = True
         # Load signup lock state
-        lock_data = await self.data_manager.load_data(FILES["SIGNUP_LOCK"], default=False)
+        lock_data = await storage.load(FILES["SIGNUP_LOCK"], default=False)
         self.signup_locked = bool(lock_data)
-        
-        # Load blocked users
-        blocked_data = await self.data_manager.load_data(FILES["BLOCKED"], default={})
-        self.blocked_users = blocked_data
+        await self.load_times()
+        self.live_roster.start()
+        await self.live_roster.restore()
+
+    @property
+    def blocked_users(self) -> dict:
+        """
+        Live blocked users mapping (read-only).
+
+        Shared with AdminActions through the storage service, so a block
+        made by either cog is seen by both and never overwritten.
+        """
+        return storage.view(FILES["BLOCKED"], {})
 
     def _default_events(self):
         """
@@ -77,24 +183,25 @@ class EventManager(commands.Cog, name="EventManager"):
         """
         return {"main_team": [], "team_2": [], "team_3": []}
 
-    async def save_blocked_users(self):
-        """Save blocked users data to file and sync to Google Sheets."""
-        if not await self.data_manager.save_data(
-            FILES["BLOCKED"], self.blocked_users, sync_to_sheets=True
-        ):
-            logger.error("❌ Failed to save blocked_users.json")
-        else:
-            logger.info("✅ Blocked users saved and synced to Sheets")
+    async def load_times(self):
+        """Load event times and arm the reminder schedule."""
+        data = await storage.load(FILES["TIMES"], default=DEFAULT_TIMES)
+        times = dict(DEFAULT_TIMES)
+        if isinstance(data, dict):
+            times.update(data)
+        self.event_times = times
+        event_schedule.set_times(self.event_times)
 
     async def save_times(self):
-        """Save event times configuration to file."""
-        if not await self.data_manager.save_data(FILES["TIMES"], self.event_times):
+        """Save event times configuration to file and re-arm reminders."""
+        event_schedule.set_times(self.event_times)
+        if not await storage.save(FILES["TIMES"], self.event_times):
             logger.error("❌ Failed to save row_times.json")
 
     async def save_signup_lock(self):
         """Save signup lock state."""
         try:
-            await self.data_manager.save_data(FILES["SIGNUP_LOCK"], self.signup_locked)
+            await storage.save(FILES["SIGNUP_LOCK"], self.signup_locked)
         except Exception as e:
             logger.error(f"Failed to save signup lock: {e}")
 
@@ -121,21 +228,18 @@ class EventManager(commands.Cog, name="EventManager"):
         Maintains a rolling history of the last 50 events.
         Each entry contains timestamp and team compositions.
         """
-        history = await self.data_manager.load_data(FILES["HISTORY"], default=[])
-        if not isinstance(history, list):
+        if not isinstance(storage.view(FILES["HISTORY"], []), list):
             logger.warning("⚠️ Event history file was not a list. Resetting.")
-            history = []
+            await storage.save(FILES["HISTORY"], [], sync_to_sheets=False)
 
         entry = {
             "timestamp": datetime.utcnow().isoformat(),
-            "teams": self.events.copy(),
+            "teams": self.events,
         }
-        history.append(entry)
-
-        if len(history) > 50:
-            history = history[-50:]
 
-        if await self.data_manager.save_data(FILES["HISTORY"], history, sync_to_sheets=True):
+        # Journaled append, keeping the last 50 events
+        if await storage.append_item(FILES["HISTORY"], entry, max_items=50):
+            storage.queue_sync(FILES["HISTORY"])
             logger.info("✅ Event history updated")
         else:
             logger.error("❌ Failed to save events_history.json")
@@ -154,17 +258,12 @@ class EventManager(commands.Cog, name="EventManager"):
         if not entry:
             return False
 
-        blocked_at = entry.get("blocked_at")
-        duration = entry.get("ban_duration_days", 7)
-
-        if not blocked_at:
-            return False
-
         try:
-            expiry = datetime.fromisoformat(blocked_at) + timedelta(days=duration)
-            if datetime.utcnow() >= expiry:
-                del self.blocked_users[str(user_id)]
-                await self.save_blocked_users()
+            block = BlockEntry.from_dict(entry)
+            if block.expires_at is None:
+                return False
+            if not block.is_active():
+                await storage.delete_item(FILES["BLOCKED"], str(user_id), sync_to_sheets=True)
                 return False
             return True
         except Exception as e:
@@ -180,19 +279,16 @@ class EventManager(commands.Cog, name="EventManager"):
             blocked_by: Discord ID of admin who blocked
             days: Number of days to block for
         """
-        self.blocked_users[str(user_id)] = {
-            "blocked_by": str(blocked_by),
-            "blocked_at": datetime.utcnow().isoformat(),
-            "ban_duration_days": days,
-        }
-        await self.save_blocked_users()
+        entry = BlockEntry.create(blocked_by, days).to_dict()
+        if not await storage.set_item(FILES["BLOCKED"], str(user_id), entry, sync_to_sheets=True):
+            logger.error("❌ Failed to save blocked_users.json")
+            return
         logger.info(f"🚫 User {user_id} blocked by {blocked_by} for {days} days")
 
     async def unblock_user(self, user_id: int):
         """Unblock a user, allowing them to sign up again."""
         if str(user_id) in self.blocked_users:
-            del self.blocked_users[str(user_id)]
-            await self.save_blocked_users()
+            await storage.delete_item(FILES["BLOCKED"], str(user_id), sync_to_sheets=True)
             logger.info(f"✅ User {user_id} unblocked")
 
     async def get_user_display_name(self, user: discord.User) -> str:
@@ -219,18 +315,14 @@ class EventManager(commands.Cog, name="EventManager"):
 
             logger.info(f"{ctx.author} started new event")
 
-            embed = discord.Embed(
-                title="📢 Weekly RoW Sign-Up",
-                description=self._create_event_description(),
-                color=COLORS["PRIMARY"],
-            )
-            embed.set_footer(text="First come, first served – choose wisely!")
-
             view = EventSignupView(self)
 
-            await ctx.send(
-                content=f"<@&{ROW_NOTIFICATION_ROLE_ID}>", embed=embed, view=view
+            message = await ctx.send(
+                content=f"<@&{ROW_NOTIFICATION_ROLE_ID}>",
+                embed=self._create_signup_embed(),
+                view=view,
             )
+            await self.live_roster.attach(message)
 
             logger.info("✅ Event posted in current channel")
 
@@ -261,6 +353,46 @@ class EventManager(commands.Cog, name="EventManager"):
 
         return "\n".join(lines)
 
+    def add_roster_fields(self, embed: discord.Embed, empty_text: str) -> int:
+        """
+        Add one field per team with its current roster.
+
+        Args:
+            embed: Embed to add the fields to
+            empty_text: Field value for a team without signups
+
+        Returns:
+            int: Total signups across all teams
+        """
+        for team_key in ["main_team", "team_2", "team_3"]:
+            members = self.signups.members(team_key)
+            display_name = TEAM_DISPLAY.get(team_key, team_key)
+
+            embed.add_field(
+                name=f"{display_name} ({len(members)}/{MAX_TEAM_SIZE})",
+                value=Helpers.format_user_list(members) or empty_text,
+                inline=False,
+            )
+        return self.signups.count()
+
+    def _create_signup_embed(self) -> discord.Embed:
+        """
+        Create the signup post embed with schedules and live rosters.
+
+        Returns:
+            discord.Embed: Embed for the signup message
+        """
+        embed = discord.Embed(
+            title="📢 Weekly RoW Sign-Up",
+            description=self._create_event_description(),
+            color=COLORS["WARNING"] if self.is_signup_locked() else COLORS["PRIMARY"],
+        )
+        total_signups = self.add_roster_fields(embed, "*No signups yet.*")
+        embed.set_footer(
+            text=f"First come, first served – choose wisely! • Total signups: {total_signups}"
+        )
+        return embed
+
     @commands.command(name="showteams")
     async def show_teams(self, ctx):
         """
@@ -287,18 +419,7 @@ class EventManager(commands.Cog, name="EventManager"):
             embed.title = "📋 Current RoW Team Signups 🔒 [LOCKED]"
             embed.color = COLORS["WARNING"]
 
-        for team_key in ["main_team", "team_2", "team_3"]:
-            members = self.events.get(team_key, [])
-            display_name = TEAM_DISPLAY.get(team_key, team_key)
-            member_list = Helpers.format_user_list(members)
-
-            embed.add_field(
-                name=f"{display_name} ({len(members)}/{MAX_TEAM_SIZE})",
-                value=member_list or "*No signups yet.*",
-                inline=False,
-            )
-
-        total_signups = sum(len(members) for members in self.events.values())
+        total_signups = self.add_roster_fields(embed, "*No signups yet.*")
         footer_text = f"Total signups: {total_signups}"
 
         if self.is_signup_locked():
@@ -382,17 +503,14 @@ class EventManager(commands.Cog, name="EventManager"):
             ctx: Context for message posting
         """
         try:
-            embed = discord.Embed(
-                title="📢 Weekly RoW Sign-Up",
-                description=self._create_event_description(),
-                color=COLORS["PRIMARY"],
-            )
-            embed.set_footer(text="First come, first served – choose wisely!")
             view = EventSignupView(self)
 
-            await ctx.send(
-                content=f"<@&{ROW_NOTIFICATION_ROLE_ID}>", embed=embed, view=view
+            message = await ctx.send(
+                content=f"<@&{ROW_NOTIFICATION_ROLE_ID}>",
+                embed=self._create_signup_embed(),
+                view=view,
             )
+            await self.live_roster.attach(message)
             logger.info("✅ Auto-posted weekly signup")
         except Exception:
             logger.exception("❌ Failed to auto-post signup")
@@ -423,18 +541,7 @@ class EventManager(commands.Cog, name="EventManager"):
                 color=COLORS["WARNING"],
             )
 
-            total_signups = 0
-            for team_key in ["main_team", "team_2", "team_3"]:
-                members = self.events.get(team_key, [])
-                display_name = TEAM_DISPLAY.get(team_key, team_key)
-                member_list = Helpers.format_user_list(members)
-                total_signups += len(members)
-
-                embed.add_field(
-                    name=f"{display_name} ({len(members)}/{MAX_TEAM_SIZE})",
-                    value=member_list or "*No signups.*",
-                    inline=False,
-                )
+            total_signups = self.add_roster_fields(embed, "*No signups.*")
 
             embed.set_footer(
                 text=f"Total signups: {total_signups} | Locked at Thursday 23:59 UTC"
@@ -469,12 +576,10 @@ class EventManager(commands.Cog, name="EventManager"):
         """
         try:
             # Reset all team signups to empty lists
-            self.events = {"main_team": [], "team_2": [], "team_3": []}
+            self.events = self._default_events()
 
             # Save the cleared state
-            success = await self.data_manager.save_data(
-                FILES["EVENTS"], self.events, sync_to_sheets=True
-            )
+            success = await self.save_events()
 
             if success:
                 logger.info("✅ Test signups cleared successfully")
@@ -487,7 +592,8 @@ class EventManager(commands.Cog, name="EventManager"):
     def can_join_team(self, member: discord.Member, team: str) -> bool:
         """Check if member can join specific team."""
         if team == "main_team" and RESTRICT_MAIN_TEAM:
-            return any(role.id == MAIN_TEAM_ROLE_ID for role in member.roles)
+            roles = getattr(member, "roles", [])  # Plain users (DMs) have no roles
+            return any(role.id == MAIN_TEAM_ROLE_ID for role in roles)
         return True  # Allow anyone to join any team if no restrictions
 
 
@@ -7,7 +7,12 @@ from discord.ext import commands
 
 from config.constants import COLORS, FILES, TEAM_DISPLAY
 from config.settings import ADMIN_ROLE_IDS
+from utils.ign_directory import ign_directory
 from utils.integrated_data_manager import data_manager
+from utils.leaderboard import BOARDS, leaderboard
+from utils.models import MatchResult
+from utils.stats_index import stats_index
+from utils.storage import storage
 
 logger = logging.getLogger("results")
 
@@ -34,6 +39,7 @@ class Results(commands.Cog):
         self.bot = bot
         self.data_manager = data_manager
         self.results = {"wins": 0, "losses": 0, "history": []}
+        self._results_loaded = False
         self.player_stats = {}  # Initialize player stats locally
 
     def calculate_win_rate(self, wins: int, losses: int) -> float:
@@ -42,17 +48,50 @@ class Results(commands.Cog):
         return (wins / total * 100) if total > 0 else 0
 
     async def load_results(self):
-        """Load results with integrated manager."""
-        self.results = await self.data_manager.load_data(
+        """Load results from the shared storage service."""
+        self.results = await storage.load(
             FILES["RESULTS"],
             default={"wins": 0, "losses": 0, "history": []},
         )
+        self._results_loaded = True
 
     async def save_results(self) -> bool:
         """Save results with atomic operations."""
-        return await self.data_manager.save_data(
-            FILES["RESULTS"], self.results, sync_to_sheets=True
-        )
+        return await storage.save(FILES["RESULTS"], self.results, sync_to_sheets=True)
+
+    async def _record_result(self, counter: str, result_entry: dict) -> bool:
+        """
+        Append a history entry and bump a result counter.
+
+        Both are item-level writes, so a result journals only the new entry
+        and counter rather than the whole (unbounded) history.
+
+        Args:
+            counter: Results field to increment (total_wins or total_losses)
+            result_entry: History entry for this result
+
+        Returns:
+            bool: True if the result was saved
+        """
+        try:
+            if not self._results_loaded:
+                await self.load_results()
+            if not await storage.append_item(FILES["RESULTS"], result_entry, key="history"):
+                return False
+            if not await storage.update_item(
+                FILES["RESULTS"], counter, lambda count: (count or 0) + 1,
+                default=0, sync_to_sheets=True,
+            ):
+                return False
+
+            # Mirror the change into the cached copy instead of reloading it
+            self.results[counter] = storage.get_item(FILES["RESULTS"], counter, 0)
+            self.results.setdefault("history", []).append(result_entry)
+            stats_index.record_match(result_entry["team"], result_entry["result"])
+            return True
+        except Exception as e:
+            logger.error(f"Failed to save result: {e}")
+            return False
 
     async def get_current_team_players(self, team_key: str):
         """
@@ -71,7 +110,7 @@ class Results(commands.Cog):
                 return event_manager.events.get(team_key, [])
             else:
                 # Fallback to loading from file
-                events = await self.data_manager.load_data(FILES["EVENTS"], {})
+                events = await storage.load(FILES["EVENTS"], {})
                 return events.get(team_key, [])
         except Exception as e:
             logger.error(f"Failed to get current team players: {e}")
@@ -92,18 +131,14 @@ class Results(commands.Cog):
             - Player history
         """
         try:
-            # Get IGN map for player names
-            ign_map = await self.data_manager.load_data(FILES["IGN_MAP"], {})
-
             for player_id in players:
-                player_name = ign_map.get(str(player_id), f"User_{player_id}")
+                player_name = ign_directory.get(player_id) or f"User_{player_id}"
                 await self.data_manager.update_player_stats(
-                    player_id, team_key, result, player_name
+                    player_id, team_key, result, player_name, sync_to_sheets=False
                 )
 
-            # Save updated player stats
-            player_stats = await self.data_manager.load_data(FILES["PLAYER_STATS"], {})
-            await self.data_manager.save_data(FILES["PLAYER_STATS"], player_stats)
+            # Sync once so Sheets gets a single diff update for the whole team
+            storage.queue_sync(FILES["PLAYER_STATS"])
             logger.info(
                 f"Updated player stats for {len(players)} players: {team_key} {result}"
             )
@@ -135,26 +170,15 @@ class Results(commands.Cog):
         # Get current players for this team
         current_players = await self.get_current_team_players(team_key)
 
-        await self.load_results()
-        self.results["total_wins"] = self.results.get("total_wins", 0) + 1
-        self.results["history"] = self.results.get("history", [])
-
-        result_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "date": datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC"),
-            "result": "win",
-            "team": team_key,
-            "players": current_players.copy(),  # Store player list at time of result
-            "recorded_by": str(ctx.author),
-            "by": str(ctx.author),
-        }
-
-        self.results["history"].append(result_entry)
+        # Store player list at time of result
+        result_entry = MatchResult.create(
+            team_key, "win", current_players, str(ctx.author)
+        ).to_dict()
 
         # Update individual player stats
         await self.update_player_stats_for_result(team_key, "win", current_players)
 
-        if await self.save_results():
+        if await self._record_result("total_wins", result_entry):
             # Send smart notifications to players
             notifications_cog = self.bot.get_cog("NotificationsCog")
             if notifications_cog:
@@ -207,25 +231,15 @@ class Results(commands.Cog):
         # Get current players for this team
         current_players = await self.get_current_team_players(team_key)
 
-        self.results["total_losses"] = self.results.get("total_losses", 0) + 1
-        self.results["history"] = self.results.get("history", [])
-
-        result_entry = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "date": datetime.utcnow().strftime("%Y-%m-%d %H:%M UTC"),
-            "result": "loss",
-            "team": team_key,
-            "players": current_players.copy(),  # Store player list at time of result
-            "recorded_by": str(ctx.author),
-            "by": str(ctx.author),
-        }
-
-        self.results["history"].append(result_entry)
+        # Store player list at time of result
+        result_entry = MatchResult.create(
+            team_key, "loss", current_players, str(ctx.author)
+        ).to_dict()
 
         # Update individual player stats
         await self.update_player_stats_for_result(team_key, "loss", current_players)
 
-        if await self.save_results():
+        if await self._record_result("total_losses", result_entry):
             # Send smart notifications to players
             notifications_cog = self.bot.get_cog("NotificationsCog")
             if notifications_cog:
@@ -292,6 +306,18 @@ class Results(commands.Cog):
             except Exception as e:
                 logger.warning(f"Skipping invalid result entry: {e}")
 
+        team_summary = stats_index.get_summary()["teams"]
+        team_lines = []
+        for team_key, team_name in TEAM_DISPLAY.items():
+            team = team_summary.get(team_key, {})
+            if team.get("match_wins", 0) + team.get("match_losses", 0):
+                team_lines.append(
+                    f"{team_name}: {team['match_wins']}W / {team['match_losses']}L "
+                    f"({team['match_win_rate']:.1f}%)"
+                )
+        if team_lines:
+            embed.add_field(name="🛡️ By Team", value="\n".join(team_lines), inline=False)
+
         if recent_results:
             embed.add_field(
                 name="📅 Recent Results (Last 10)",
@@ -305,6 +331,58 @@ class Results(commands.Cog):
 
         await ctx.send(embed=embed)
 
+    @commands.command(name="leaderboard", aliases=["lb"])
+    async def show_leaderboard(self, ctx, board: str = "winrate", count: int = 10):
+        """
+        Show the player leaderboard.
+
+        Args:
+            ctx: Command context
+            board: Ranking to show (winrate, games or power)
+            count: Number of top players to list (max 25)
+
+        Displays:
+            - Top players for the chosen ranking
+            - The caller's own position and neighbours if outside the top
+        """
+        board = board.lower()
+        if board not in BOARDS:
+            await ctx.send(f"❌ Unknown leaderboard. Use one of: {', '.join(BOARDS)}")
+            return
+        count = max(1, min(count, 25))
+
+        titles = {"winrate": "Win Rate", "games": "Games Played", "power": "Power Rating"}
+        embed = discord.Embed(
+            title=f"🏅 Leaderboard — {titles.get(board, board)}",
+            color=COLORS["PRIMARY"],
+        )
+
+        def _line(entry):
+            value = {
+                "winrate": f"{entry['win_rate']:.1f}% ({entry['total_games']} games)",
+                "games": f"{entry['total_games']} games ({entry['win_rate']:.1f}%)",
+                "power": f"{entry['power_rating']:,} power",
+            }[board]
+            return f"**#{entry['position']}** {entry['username']} — {value}"
+
+        top = leaderboard.top(count, board=board)
+        if not top:
+            embed.description = "No player statistics recorded yet."
+            await ctx.send(embed=embed)
+            return
+        embed.description = "\n".join(_line(entry) for entry in top)
+
+        position = leaderboard.rank(ctx.author.id, board=board)
+        if position is not None and position > count:
+            nearby = leaderboard.around(ctx.author.id, radius=2, board=board)
+            embed.add_field(
+                name=f"📍 Your Position (#{position} of {leaderboard.size()})",
+                value="\n".join(_line(entry) for entry in nearby),
+                inline=False,
+            )
+
+        await ctx.send(embed=embed)
+
     async def show_player_stats(self, ctx, user: Optional[discord.User] = None):
         """
         Show detailed player statistics.
@@ -328,51 +406,42 @@ class Results(commands.Cog):
 
         user_id = str(user.id)
 
-        # Get player stats
-        player_stats = await self.data_manager.load_data(FILES["PLAYER_STATS"], {})
-        if user_id not in player_stats:
+        # Served from the aggregate index, no scan of every player
+        stats = stats_index.get_player_summary(user_id)
+        if stats is None:
             await ctx.send(f"❌ No statistics found for {user.display_name}")
             return
 
-        stats = player_stats[user_id]
-        team_results = stats.get("team_results", {})
-
         embed = discord.Embed(
-            title=f"📊 Player Statistics: {stats.get('name', user.display_name)}",
+            title=f"📊 Player Statistics: {stats['name'] or user.display_name}",
             color=COLORS["INFO"],
         )
 
-        # Calculate totals
-        total_wins = sum(team.get("wins", 0) for team in team_results.values())
-        total_losses = sum(team.get("losses", 0) for team in team_results.values())
-        total_games = total_wins + total_losses
-        win_rate = (total_wins / total_games * 100) if total_games > 0 else 0
-
         embed.description = (
-            f"**Total Games:** {total_games}\n"
-            f"**Total Wins:** {total_wins}\n"
-            f"**Total Losses:** {total_losses}\n"
-            f"**Win Rate:** {win_rate:.1f}%"
+            f"**Total Games:** {stats['total_games']}\n"
+            f"**Total Wins:** {stats['wins']}\n"
+            f"**Total Losses:** {stats['losses']}\n"
+            f"**Win Rate:** {stats['win_rate']:.1f}%"
         )
 
         # Team-specific stats
         for team_key, team_name in TEAM_DISPLAY.items():
-            team_stats = team_results.get(team_key, {"wins": 0, "losses": 0})
-            team_wins = team_stats["wins"]
-            team_losses = team_stats["losses"]
-            team_total = team_wins + team_losses
-            team_wr = (team_wins / team_total * 100) if team_total > 0 else 0
-
+            team_stats = stats["teams"].get(
+                team_key, {"wins": 0, "losses": 0, "win_rate": 0}
+            )
             embed.add_field(
                 name=f"{team_name}",
-                value=f"W: {team_wins} | L: {team_losses}\nWR: {team_wr:.1f}%",
+                value=(
+                    f"W: {team_stats['wins']} | L: {team_stats['losses']}\n"
+                    f"WR: {team_stats['win_rate']:.1f}%"
+                ),
                 inline=True,
             )
 
         # Additional info
         embed.add_field(
             name="Other",
-            value=f"Absents: {stats.get('absents', 0)}\nBlocked: {'Yes' if stats.get('blocked', False) else 'No'}",
+            value=f"Absents: {stats['absents']}\nBlocked: {'Yes' if stats['blocked'] else 'No'}",
             inline=True,
         )
 
@@ -392,20 +461,32 @@ class Results(commands.Cog):
 
             # Gather current player data for template creation
             all_data = {
-                "events": await self.data_manager.load_data(FILES["EVENTS"], {}),
-                "blocked": await self.data_manager.load_data(FILES["BLOCKED"], {}),
+                "events": await storage.load(FILES["EVENTS"], {}),
+                "blocked": await storage.load(FILES["BLOCKED"], {}),
                 "results": self.results,
-                "player_stats": await self.data_manager.load_data("data/player_stats.json", {}),
-                "ign_map": await self.data_manager.load_data(FILES["IGN_MAP"], {}),
-                "absent": await self.data_manager.load_data(FILES["ABSENT"], {}),
-                "notification_preferences": await self.data_manager.load_data("data/notification_preferences.json", {})
+                "player_stats": await storage.load("data/player_stats.json", {}),
+                "ign_map": await storage.load(FILES["IGN_MAP"], {}),
+                "absent": await storage.load(FILES["ABSENT"], {}),
+                "notification_preferences": await storage.load("data/notification_preferences.json", {})
             }
 
             # Create templates with detailed results
-            if hasattr(self.data_manager.sheets_manager, 'setup_templates'):
-                results = self.data_manager.sheets_manager.setup_templates(all_data)
-            elif hasattr(self.data_manager.sheets_manager, 'create_all_templates'):
-                template_results = self.data_manager.sheets_manager.create_all_templates(all_data)
+            sheets_manager = self.data_manager.sheets_manager
+            engine = getattr(sheets_manager, 'engine', None)
+            if hasattr(sheets_manager, 'setup_templates'):
+                if engine:
+                    from sheets.quota import Priority
+
+                    results = await engine.run(
+                        sheets_manager.setup_templates, all_data, priority=Priority.MAINTENANCE
+                    )
+                else:
+                    results = sheets_manager.setup_templates(all_data)
+            elif hasattr(sheets_manager, 'create_all_templates'):
+                if engine:
+                    template_results = await engine.create_all_templates(all_data)
+                else:
+                    template_results = sheets_manager.create_all_templates(all_data)
                 # Convert to expected format
                 results = {
                     "connected": template_results.get("connected", False),
@@ -1,7 +1,7 @@
 import discord
 from discord.ext import commands
 
-from config.constants import MAIN_TEAM_ROLE_ID
+from utils.latency import latency_metrics
 from utils.logger import setup_logger
 
 logger = setup_logger("buttons")
@@ -29,75 +29,38 @@ class EventButtons(discord.ui.View):
         super().__init__(timeout=None)  # View is now persistent
         self.bot = bot
 
-    async def get_user_ign(self, interaction):
+    async def _move(self, interaction: discord.Interaction, team, action: str):
         """
-        Helper to get user's IGN from profile system.
+        Run a join or leave through EventManager.move_user and reply.
 
-        Args:
-            interaction: Discord interaction event
-
-        Returns:
-            str: User's IGN if set, display name as fallback, or None if IGN required
-        """
-        profile_cog = self.bot.get_cog("Profile")
-        if profile_cog:
-            ign = profile_cog.get_ign(interaction.user)
-            if not ign:
-                await profile_cog.warn_if_no_ign(interaction)
-                return None
-            return ign
-        return interaction.user.display_name
-
-    async def check_signup_permissions(self, interaction, team_key):
-        """
-        Check if user can join specific team and if signups are open.
+        Fast path: the move is checked and applied in memory and answered
+        right away; saving, audit logging and the Sheets sync run in the
+        background. Acknowledgement time goes into the latency histogram.
 
         Args:
             interaction: Discord interaction event
-            team_key: Team identifier to check permissions for
-
-        Returns:
-            tuple: (bool, EventManager) - Success status and event cog instance
-
-        Checks:
-            - Event system availability
-            - Signup lock status
-            - User block status
+            team: Team key to join, or None to leave
+            action: Handler name for error logs
         """
-        # FIXED: Changed from "Events" to "EventManager"
-        event_cog = self.bot.get_cog("EventManager")
-        if not event_cog or not hasattr(event_cog, 'events'):
-            await interaction.response.send_message(
-                "❌ Event system not available.", ephemeral=True
-            )
-            return False, None
-
-        # Check if signups are locked
-        if event_cog.is_signup_locked():
-            await interaction.response.send_message(
-                "🔒 Signups are currently locked! Teams have been finalized for this week.",
-                ephemeral=True,
-            )
-            return False, None
-
-        # Check if user is blocked
-        if event_cog.is_user_blocked(interaction.user.id):
-            blocked_info = event_cog.blocked_users.get(str(interaction.user.id), {})
-            blocked_at = blocked_info.get("blocked_at", "")
-            duration = blocked_info.get("ban_duration_days", 0)
-
-            from utils.helpers import Helpers
+        try:
+            event_cog = self.bot.get_cog("EventManager")
+            if not event_cog:
+                await interaction.response.send_message(
+                    "❌ Event system not available.", ephemeral=True
+                )
+                return
 
-            days_left = Helpers.days_until_expiry(blocked_at, duration)
+            with latency_metrics.measure(f"button.{action}"):
+                result = await event_cog.move_user(interaction.user, team, wait=False)
+                await interaction.response.send_message(result.message(), ephemeral=True)
 
-            await interaction.response.send_message(
-                f"🚫 You are currently blocked from events.\n"
-                f"⏰ Time remaining: {days_left} days",
-                ephemeral=True,
-            )
-            return False, None
-
-        return True, event_cog
+        except Exception as e:
+            logger.exception(f"Error in {action}: {e}")
+            message = "❌ An error occurred while updating your team."
+            if not interaction.response.is_done():
+                await interaction.response.send_message(message, ephemeral=True)
+            else:
+                await interaction.followup.send(message, ephemeral=True)
 
     @discord.ui.button(
         label="Join Main Team",
@@ -109,108 +72,7 @@ class EventButtons(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """Handle main team join button."""
-        try:
-            # Check basic permissions
-            can_proceed, event_cog = await self.check_signup_permissions(
-                interaction, "main_team"
-            )
-            if not can_proceed:
-                return
-
-            # Get user IGN
-            user_ign = await self.get_user_ign(interaction)
-            if not user_ign:
-                return
-
-            # Check Main Team role permission
-            if not interaction.guild:
-                await interaction.response.send_message(
-                    "❌ Could not verify guild membership.",
-                    ephemeral=True,
-                )
-                return
-                
-            member = interaction.guild.get_member(interaction.user.id)
-            if not member:
-                await interaction.response.send_message(
-                    "❌ Could not verify your server membership.",
-                    ephemeral=True,
-                )
-                return
-                
-            user_role_ids = [role.id for role in member.roles]
-            logger.debug(
-                f"User {interaction.user} role check: {user_role_ids} vs required {MAIN_TEAM_ROLE_ID}"
-            )
-
-            if not any(role.id == MAIN_TEAM_ROLE_ID for role in member.roles):
-                await interaction.response.send_message(
-                    "❌ You don't have permission to join the Main Team.\n"
-                    "🏆 The Main Team role is required for this team.",
-                    ephemeral=True,
-                )
-                return
-
-            # Check if already in main team
-            if not event_cog or not hasattr(event_cog, 'events'):
-                await interaction.response.send_message(
-                    "❌ Event system not available.", ephemeral=True
-                )
-                return
-
-            if user_ign in event_cog.events["main_team"]:
-                await interaction.response.send_message(
-                    "✅ You're already in the Main Team!", ephemeral=True
-                )
-                return
-
-            # Check team capacity
-            if len(event_cog.events["main_team"]) >= 40:
-                await interaction.response.send_message(
-                    "❌ Main Team is full (40/40).", ephemeral=True
-                )
-                return
-
-            # Remove user from other teams first
-            removed_from = None
-            for team in event_cog.events:
-                if user_ign in event_cog.events[team] and team != "main_team":
-                    event_cog.events[team].remove(user_ign)
-                    removed_from = team
-                    break
-
-            # Add to main team
-            event_cog.events["main_team"].append(user_ign)
-            event_cog.save_events()
-
-            # Log the signup for audit
-            try:
-                from services.audit_logger import log_signup
-
-                log_signup(
-                    interaction.user.id, "main_team", "join", interaction.guild_id
-                )
-            except ImportError:
-                pass  # Audit logging is optional
-
-            # Success message
-            message = f"✅ {user_ign} joined the Main Team!"
-            if removed_from:
-                message += f"\n(Moved from {removed_from.replace('_', ' ').title()})"
-
-            await interaction.response.send_message(message, ephemeral=True)
-            logger.info(f"{interaction.user} ({user_ign}) joined main_team")
-
-        except Exception as e:
-            logger.exception(f"Error in join_main_team: {e}")
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    "❌ An error occurred while joining the team.", ephemeral=True
-                )
-            else:
-                await interaction.followup.send(
-                    "❌ An error occurred while joining the team.", ephemeral=True
-                )
+        await self._move(interaction, "main_team", "join_main_team")
 
     @discord.ui.button(
         label="Join Team 2",
@@ -222,77 +84,7 @@ class EventButtons(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """Handle team 2 join button."""
-        try:
-            # Check basic permissions
-            can_proceed, event_cog = await self.check_signup_permissions(
-                interaction, "team_2"
-            )
-            if not can_proceed:
-                return
-
-            # Get user IGN
-            user_ign = await self.get_user_ign(interaction)
-            if not user_ign:
-                return
-
-            # Check if already in team 2
-            if not event_cog or not hasattr(event_cog, 'events'):
-                await interaction.response.send_message(
-                    "❌ Event system not available.", ephemeral=True
-                )
-                return
-
-            if user_ign in event_cog.events["team_2"]:
-                await interaction.response.send_message(
-                    "✅ You're already in Team 2!", ephemeral=True
-                )
-                return
-
-            # Check team capacity
-            if len(event_cog.events["team_2"]) >= 40:
-                await interaction.response.send_message(
-                    "❌ Team 2 is full (40/40).", ephemeral=True
-                )
-                return
-
-            # Remove user from other teams first
-            removed_from = None
-            for team in event_cog.events:
-                if user_ign in event_cog.events[team] and team != "team_2":
-                    event_cog.events[team].remove(user_ign)
-                    removed_from = team
-                    break
-
-            # Add to team 2
-            event_cog.events["team_2"].append(user_ign)
-            event_cog.save_events()
-
-            # Log the signup for audit
-            try:
-                from services.audit_logger import log_signup
-
-                log_signup(interaction.user.id, "team_2", "join", interaction.guild_id)
-            except ImportError:
-                pass  # Audit logging is optional
-
-            # Success message
-            message = f"✅ {user_ign} joined Team 2!"
-            if removed_from:
-                message += f"\n(Moved from {removed_from.replace('_', ' ').title()})"
-
-            await interaction.response.send_message(message, ephemeral=True)
-            logger.info(f"{interaction.user} ({user_ign}) joined team_2")
-
-        except Exception as e:
-            logger.exception(f"Error in join_team_2: {e}")
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    "❌ An error occurred while joining the team.", ephemeral=True
-                )
-            else:
-                await interaction.followup.send(
-                    "❌ An error occurred while joining the team.", ephemeral=True
-                )
+        await self._move(interaction, "team_2", "join_team_2")
 
     @discord.ui.button(
         label="Join Team 3",
@@ -304,77 +96,7 @@ class EventButtons(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """Handle team 3 join button."""
-        try:
-            # Check basic permissions
-            can_proceed, event_cog = await self.check_signup_permissions(
-                interaction, "team_3"
-            )
-            if not can_proceed:
-                return
-
-            # Get user IGN
-            user_ign = await self.get_user_ign(interaction)
-            if not user_ign:
-                return
-
-            # Check if already in team 3
-            if not event_cog or not hasattr(event_cog, 'events'):
-                await interaction.response.send_message(
-                    "❌ Event system not available.", ephemeral=True
-                )
-                return
-
-            if user_ign in event_cog.events["team_3"]:
-                await interaction.response.send_message(
-                    "✅ You're already in Team 3!", ephemeral=True
-                )
-                return
-
-            # Check team capacity
-            if len(event_cog.events["team_3"]) >= 40:
-                await interaction.response.send_message(
-                    "❌ Team 3 is full (40/40).", ephemeral=True
-                )
-                return
-
-            # Remove user from other teams first
-            removed_from = None
-            for team in event_cog.events:
-                if user_ign in event_cog.events[team] and team != "team_3":
-                    event_cog.events[team].remove(user_ign)
-                    removed_from = team
-                    break
-
-            # Add to team 3
-            event_cog.events["team_3"].append(user_ign)
-            event_cog.save_events()
-
-            # Log the signup for audit
-            try:
-                from services.audit_logger import log_signup
-
-                log_signup(interaction.user.id, "team_3", "join", interaction.guild_id)
-            except ImportError:
-                pass  # Audit logging is optional
-
-            # Success message
-            message = f"✅ {user_ign} joined Team 3!"
-            if removed_from:
-                message += f"\n(Moved from {removed_from.replace('_', ' ').title()})"
-
-            await interaction.response.send_message(message, ephemeral=True)
-            logger.info(f"{interaction.user} ({user_ign}) joined team_3")
-
-        except Exception as e:
-            logger.exception(f"Error in join_team_3: {e}")
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    "❌ An error occurred while joining the team.", ephemeral=True
-                )
-            else:
-                await interaction.followup.send(
-                    "❌ An error occurred while joining the team.", ephemeral=True
-                )
+        await self._move(interaction, "team_3", "join_team_3")
 
     @discord.ui.button(
         label="❌ Leave My Team",
@@ -385,69 +107,7 @@ class EventButtons(discord.ui.View):
         self, interaction: discord.Interaction, button: discord.ui.Button
     ):
         """Allow user to leave their current team."""
-        try:
-            # FIXED: Changed from "Events" to "EventManager"
-            event_cog = self.bot.get_cog("EventManager")
-            if not event_cog:
-                await interaction.response.send_message(
-                    "❌ Event system not available.", ephemeral=True
-                )
-                return
-
-            # Check if signups are locked
-            if event_cog.is_signup_locked():
-                await interaction.response.send_message(
-                    "🔒 Signups are locked! You cannot leave your team at this time.",
-                    ephemeral=True,
-                )
-                return
-
-            # Get user IGN
-            user_ign = await self.get_user_ign(interaction)
-            if not user_ign:
-                return
-
-            # Find and remove user from their current team
-            left_team = None
-            for team, members in event_cog.events.items():
-                if user_ign in members:
-                    members.remove(user_ign)
-                    left_team = team
-                    break
-
-            if left_team:
-                event_cog.save_events()
-
-                # Log the leave action for audit
-                try:
-                    from services.audit_logger import log_signup
-
-                    log_signup(
-                        interaction.user.id, left_team, "leave", interaction.guild_id
-                    )
-                except ImportError:
-                    pass  # Audit logging is optional
-
-                await interaction.response.send_message(
-                    f"✅ {user_ign} has left the **{left_team.replace('_', ' ').title()}**.",
-                    ephemeral=True,
-                )
-                logger.info(f"{interaction.user} ({user_ign}) left {left_team}")
-            else:
-                await interaction.response.send_message(
-                    "ℹ️ You're not signed up for any team.", ephemeral=True
-                )
-
-        except Exception as e:
-            logger.exception(f"Error in leave_team: {e}")
-            if not interaction.response.is_done():
-                await interaction.response.send_message(
-                    "❌ An error occurred while leaving the team.", ephemeral=True
-                )
-            else:
-                await interaction.followup.send(
-                    "❌ An error occurred while leaving the team.", ephemeral=True
-                )
+        await self._move(interaction, None, "leave_team")
 
     @discord.ui.button(
         label="📋 Show Teams",
@@ -475,8 +135,7 @@ class EventButtons(discord.ui.View):
             else:
                 ign_warning = ""
 
-            from config.constants import COLORS, TEAM_DISPLAY
-            from utils.helpers import Helpers
+            from config.constants import COLORS
 
             embed = discord.Embed(
                 title="📋 Current RoW Team Signups", color=COLORS["INFO"]
@@ -488,19 +147,9 @@ class EventButtons(discord.ui.View):
                 embed.color = COLORS["WARNING"]
 
             # Add team information
-            for team_key in ["main_team", "team_2", "team_3"]:
-                members = event_cog.events.get(team_key, [])
-                display_name = TEAM_DISPLAY.get(team_key, team_key)
-                member_list = Helpers.format_user_list(members)
-
-                embed.add_field(
-                    name=f"{display_name} ({len(members)}/40)",
-                    value=member_list or "*No signups yet.*",
-                    inline=False,
-                )
+            total_signups = event_cog.add_roster_fields(embed, "*No signups yet.*")
 
             # Footer with total signups and lock status
-            total_signups = sum(len(members) for members in event_cog.events.values())
             footer_text = f"Total signups: {total_signups}"
 
             if event_cog.is_signup_locked():
@@ -598,23 +247,14 @@ class ButtonHandler(commands.Cog):
             "custom_id" in interaction.data and 
             interaction.data["custom_id"].startswith("join_")):
             
-            team = interaction.data["custom_id"].split("_")[1]
+            team = interaction.data["custom_id"][len("join_"):].removesuffix("_btn")
             event_manager = self.bot.get_cog("EventManager")
+            if not event_manager:
+                return
 
-            # Add member
-            event_manager.events[team].append(interaction.user.display_name)
-
-            # Save with atomic operations
-            success = await event_manager.save_events()
-
-            if success:
-                await interaction.response.send_message(
-                    "✅ Joined team!", ephemeral=True
-                )
-            else:
-                await interaction.response.send_message(
-                    "❌ Failed to join team", ephemeral=True
-                )
+            with latency_metrics.measure("button.join"):
+                result = await event_manager.move_user(interaction.user, team, wait=False)
+                await interaction.response.send_message(result.message(), ephemeral=True)
 
     async def cog_load(self):
         """
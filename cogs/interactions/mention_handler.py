@@ -1,7 +1,6 @@
 # cogs/interactions/mention_handler.py
 
 import random
-from datetime import datetime, timedelta
 
 import discord
 from discord.ext import commands
@@ -9,6 +8,7 @@ from discord.ext import commands
 from config.constants import DEFAULT_TIMES, TEAM_DISPLAY
 from config.settings import BOT_ADMIN_USER_ID
 from utils.data_manager import DataManager
+from utils.event_schedule import event_schedule
 from utils.logger import setup_logger
 
 logger = setup_logger("mention_handler")
@@ -479,7 +479,10 @@ class MentionHandler(commands.Cog):
                     team_key = team_map[word]
                     break
 
-            if not team_key:
+            # Join/leave must lead the message; leave needs no team: @bot leave
+            command = words[0] if words else ""
+            leaving = command == "leave"
+            if not team_key and not leaving:
                 return False
 
             event_cog = self.bot.get_cog("EventManager")
@@ -487,6 +490,12 @@ class MentionHandler(commands.Cog):
                 await message.reply("❌ Event system unavailable")
                 return True
 
+            # Join/leave: @bot join 2, @bot leave
+            if leaving or command == "join":
+                result = await event_cog.move_user(message.author, None if leaving else team_key)
+                await message.reply(result.message())
+                return True
+
             # Handle different team commands
             if "stats" in words or "info" in words:
                 # Show team stats
@@ -504,8 +513,9 @@ class MentionHandler(commands.Cog):
 
             elif "clear" in words and message.author.id == BOT_ADMIN_USER_ID:
                 # Clear team signups (admin only)
-                event_cog.events[team_key] = []
-                await event_cog.save_events()
+                if not await event_cog.signups.clear_team(team_key):
+                    await message.reply("❌ Failed to clear signups")
+                    return True
                 await message.reply(f"✅ Cleared {TEAM_DISPLAY[team_key]} signups")
                 return True
 
@@ -748,45 +758,9 @@ class MentionHandler(commands.Cog):
             "2 hours, 30 minutes from now"
         """
         try:
-            # Parse time string
-            parts = time_str.split()
-            if len(parts) < 3:
-                return None
-
-            time_part = parts[0]  # "14:00"
-            day_part = parts[2]  # "Saturday"
-
-            hour, minute = map(int, time_part.split(":"))
-
-            # Map day names to weekday numbers
-            day_map = {
-                "monday": 0,
-                "tuesday": 1,
-                "wednesday": 2,
-                "thursday": 3,
-                "friday": 4,
-                "saturday": 5,
-                "sunday": 6,
-            }
-
-            target_day = day_map.get(day_part.lower())
-            if target_day is None:
-                return None
-
-            # Calculate next occurrence
-            now = datetime.utcnow()
-            days_ahead = target_day - now.weekday()
-
-            if days_ahead <= 0:  # Target day already happened this week
-                days_ahead += 7
-
-            target_time = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
-            target_time += timedelta(days=days_ahead)
-
-            # Calculate difference
-            time_diff = target_time - now
-
-            if time_diff.total_seconds() < 0:
+            # Parsed once and cached by the shared event schedule
+            time_diff = event_schedule.time_until(time_str)
+            if time_diff is None or time_diff.total_seconds() < 0:
                 return None
 
             days = time_diff.days
@@ -1,12 +1,10 @@
 # cogs/user/commands.py
 
-import json
-import os
-
 import discord
 from discord.ext import commands
 
 from config.settings import ADMIN_ROLE_IDS, BOT_ADMIN_USER_ID
+from utils.ign_directory import ign_directory
 
 
 class UserCommands(commands.Cog):
@@ -28,26 +26,15 @@ class UserCommands(commands.Cog):
             bot: The Discord bot instance
         """
         self.bot = bot
-        self.ign_map = {}
-        self.ign_file = "data/ign_map.json"
-        self.load_ign_map()
 
-    def load_ign_map(self):
+    @property
+    def ign_map(self) -> dict:
         """
-        Load IGN mapping from JSON file.
+        Copy of the IGN mapping from the shared IGN directory.
 
-        Creates empty mapping if file doesn't exist.
+        Always current, so IGNs set through the profile cog are seen here.
         """
-        if os.path.exists(self.ign_file):
-            with open(self.ign_file, "r") as f:
-                self.ign_map = json.load(f)
-        else:
-            self.ign_map = {}
-
-    def save_ign_map(self):
-        """Save current IGN mapping to JSON file."""
-        with open(self.ign_file, "w") as f:
-            json.dump(self.ign_map, f, indent=4)
+        return ign_directory.as_dict()
 
     def get_ign(self, user):
         """
@@ -59,7 +46,7 @@ class UserCommands(commands.Cog):
         Returns:
             str: User's IGN or None if not set
         """
-        return self.ign_map.get(str(user.id))
+        return ign_directory.get(user.id)
 
     def has_ign(self, user):
         """
@@ -71,7 +58,7 @@ class UserCommands(commands.Cog):
         Returns:
             bool: True if user has IGN set
         """
-        return str(user.id) in self.ign_map
+        return ign_directory.has(user.id)
 
     async def warn_if_no_ign(self, interaction: discord.Interaction):
         """
@@ -161,8 +148,10 @@ class UserCommands(commands.Cog):
                 "`!setign` — Set your in-game name",
                 "`!clearign` — Clear your stored IGN",
                 "`!myign` — View your stored IGN",
+                "`!whois` — Find who uses an in-game name",
                 "`!events` — View current signups",
                 "`!mystats` — View your personal statistics",
+                "`!leaderboard` — Top players by win rate, games or power",
                 "`!teams` — View current team compositions",
                 "`!notifications settings` — Configure notification preferences",
                 "`!notifications test` — Test notification delivery",
@@ -11,8 +11,9 @@ Handles:
 import discord
 from discord.ext import commands
 
-from config.constants import EMOJIS, FILES
+from config.constants import EMOJIS
 from utils.data_manager import DataManager
+from utils.ign_directory import ign_directory
 from utils.logger import setup_logger
 from utils.validators import Validators
 
@@ -39,16 +40,39 @@ class ProfileCog(commands.Cog, name="Profile"):
         """
         self.bot = bot
         self.data_manager = DataManager()
-        self.ign_map = self.data_manager.load_json(FILES["IGN_MAP"], {})
 
-    def save_data(self) -> bool:
+    @property
+    def ign_map(self) -> dict:
+        """Copy of the IGN mapping from the shared IGN directory."""
+        return ign_directory.as_dict()
+
+    async def save_ign(self, user_id: str, ign: str) -> bool:
+        """
+        Store a single IGN mapping.
+
+        Args:
+            user_id: Discord user ID
+            ign: In-game name to store
+
+        Returns:
+            bool: True if save was successful
+        """
+        success = await ign_directory.set_ign(user_id, ign, sync_to_sheets=True)
+        if not success:
+            logger.error("❌ Failed to save IGN mappings to ign_map.json")
+        return success
+
+    async def remove_ign(self, user_id: str) -> bool:
         """
-        Save IGN mappings to file and sync to sheets.
+        Remove a single IGN mapping.
+
+        Args:
+            user_id: Discord user ID
 
         Returns:
             bool: True if save was successful
         """
-        success = self.data_manager.save_json(FILES["IGN_MAP"], self.ign_map)
+        success = await ign_directory.remove_ign(user_id, sync_to_sheets=True)
         if not success:
             logger.error("❌ Failed to save IGN mappings to ign_map.json")
         return success
@@ -63,7 +87,7 @@ class ProfileCog(commands.Cog, name="Profile"):
         Returns:
             str: User's IGN or display name as fallback
         """
-        return self.ign_map.get(str(user.id), user.display_name)
+        return ign_directory.get(user.id) or user.display_name
 
     def has_ign(self, user: discord.User) -> bool:
         """
@@ -75,7 +99,7 @@ class ProfileCog(commands.Cog, name="Profile"):
         Returns:
             bool: True if user has custom IGN set
         """
-        return str(user.id) in self.ign_map
+        return ign_directory.has(user.id)
 
     async def warn_if_no_ign(self, interaction: discord.Interaction):
         """
@@ -103,10 +127,9 @@ class ProfileCog(commands.Cog, name="Profile"):
             return await ctx.send(f"{EMOJIS['ERROR']} {error}")
 
         user_id = str(ctx.author.id)
-        old_ign = self.ign_map.get(user_id)
-        self.ign_map[user_id] = ign.strip()
+        old_ign = ign_directory.get(user_id)
 
-        if self.save_data():
+        if await self.save_ign(user_id, ign.strip()):
             if old_ign:
                 await ctx.send(
                     f"{EMOJIS['SUCCESS']} IGN updated from `{old_ign}` to `{ign}`"
@@ -133,11 +156,10 @@ class ProfileCog(commands.Cog, name="Profile"):
     async def clear_ign(self, ctx):
         """Clear your stored IGN."""
         user_id = str(ctx.author.id)
-        if user_id in self.ign_map:
-            old_ign = self.ign_map[user_id]
-            del self.ign_map[user_id]
+        old_ign = ign_directory.get(user_id)
+        if old_ign is not None:
 
-            if self.save_data():
+            if await self.remove_ign(user_id):
                 await ctx.send(
                     f"{EMOJIS['SUCCESS']} Your IGN `{old_ign}` has been cleared."
                 )
@@ -149,6 +171,24 @@ class ProfileCog(commands.Cog, name="Profile"):
         else:
             await ctx.send(f"{EMOJIS['ERROR']} You haven't set an IGN yet.")
 
+    @commands.command(name="whois")
+    async def who_is(self, ctx, *, ign: str):
+        """Find who uses an in-game name."""
+        user_ids = ign_directory.users_for(ign)
+        if user_ids:
+            mentions = ", ".join(f"<@{uid}>" for uid in user_ids)
+            return await ctx.send(
+                f"🎮 `{ign}` belongs to {mentions}",
+                allowed_mentions=discord.AllowedMentions.none(),
+            )
+
+        suggestions = ign_directory.suggest(ign)
+        if suggestions:
+            names = ", ".join(f"`{name}`" for name, _ in suggestions)
+            await ctx.send(f"{EMOJIS['ERROR']} No player with IGN `{ign}`. Did you mean {names}?")
+        else:
+            await ctx.send(f"{EMOJIS['ERROR']} No player with IGN `{ign}`.")
+
 
 async def setup(bot):
     """
@@ -143,10 +143,14 @@ FILES = {
     # Configuration
     "TIMES": os.path.join(DATA_DIR, "row_times.json"),
     "SIGNUP_LOCK": os.path.join(DATA_DIR, "signup_lock.json"),
+    "SIGNUP_POST": os.path.join(DATA_DIR, "signup_post.json"),
     # System files
     "AUDIT_LOG": os.path.join(DATA_DIR, "audit_log.json"),
+    "AUDIT_DIR": os.path.join(DATA_DIR, "audit"),
     "NOTIFICATION_PREFS": os.path.join(DATA_DIR, "notification_preferences.json"),
+    "NOTIFICATION_QUEUE": os.path.join(DATA_DIR, "notification_queue.json"),
     "MATCH_STATS": os.path.join(DATA_DIR, "match_statistics.json"),
+    "ERROR_LOG": os.path.join(DATA_DIR, "error_log.json"),
     # Logs
     "BOT_LOG": os.path.join(DATA_DIR, "logs", "bot.log"),
 }
@@ -227,6 +231,7 @@ HELP_DESCRIPTIONS = {
     "setign": "Set your in-game name",
     "myign": "View your stored IGN",
     "clearign": "Clear your stored IGN",
+    "whois": "Find who uses an in-game name",
     "showteams": "Show current team signups",
     "startevent": "Start a new event (Admin only)",
     "win": "Record a win for a team (Admin only)",
@@ -300,6 +305,37 @@ SHEETS_CONFIG = {
     "BACKOFF_BASE": 2,
     "MIN_INTERVAL": 1.1,  # Seconds between requests
     "TIMEOUT": 30,  # Request timeout in seconds
+    "SYNC_DEBOUNCE": 5.0,  # Seconds of quiet before a queued sync is flushed
+    "SYNC_MAX_STALENESS": 30.0,  # Max seconds a queued sync may wait during bursts
+    "CONNECT_HOLD_TIMEOUT": 120,  # Max seconds sheets work waits for the background connect
+}
+
+NOTIFICATION_CONFIG = {
+    "DM_CONCURRENCY": 5,  # Concurrent DM sends/user lookups during a fan-out
+    "MENTIONS_PER_MESSAGE": 50,  # Channel-method users pinged per grouped message
+    "REMINDER_MINUTES": (60, 15, 5),  # Reminders sent this many minutes before an event
+    "REMINDER_GRACE": 120,  # Seconds a late reminder timer may still fire
+    "QUEUE_MAX_AGE_HOURS": 24,  # Quiet-hours deferred notifications dropped after this
+    "QUEUE_RETRY_MINUTES": 5,  # Delay before retrying a deferred notification that failed to send
+}
+
+DASHBOARD_CONFIG = {
+    "SNAPSHOT_TTL": 30,  # Max seconds a dashboard snapshot is served without a rebuild
+    "STATE_REFRESH": 5,  # Seconds between bot state captures for the dashboard
+    "STREAM_KEEPALIVE": 15,  # Seconds between keepalive comments on live streams
+}
+
+INTERACTION_CONFIG = {
+    "ACK_BUDGET_MS": 500,  # Target p99 time to acknowledge a button/dropdown click
+    "PERSIST_RETRY_DELAY": 5,  # Seconds before a failed background roster save is retried
+    "ROSTER_EDIT_INTERVAL": 2.0,  # Min seconds between live roster edits of the signup post
+}
+
+ERROR_LOG_CONFIG = {
+    "MAX_LOCAL_ERRORS": 1000,  # Error groups kept in data/error_log.json
+    "MAX_PENDING": 200,  # Distinct errors buffered between flushes (oldest dropped)
+    "FLUSH_INTERVAL": 10,  # Seconds between batched flushes
+    "SUMMARY_INTERVAL": 300,  # Min seconds between admin error summaries
 }
 
 WORKSHEET_NAMES = {
@@ -1,5 +1,5 @@
 
-from flask import Flask, render_template, jsonify, request
+from flask import Flask, Response, render_template, jsonify, request
 import json
 import os
 from datetime import datetime, timedelta
@@ -10,7 +10,13 @@ import time
 
 from utils.logger import setup_logger
 from utils.data_manager import DataManager
-from config.constants import TEAM_DISPLAY, COLORS
+from utils.leaderboard import leaderboard, performance_tier
+from utils.models import PlayerStats
+from utils.stats_index import stats_index
+from utils.storage import storage
+from config.constants import DASHBOARD_CONFIG, FILES, TEAM_DISPLAY, COLORS
+from dashboard.live_state import LiveState
+from dashboard.snapshot_cache import SnapshotCache
 
 logger = setup_logger("dashboard")
 
@@ -25,6 +31,7 @@ class DashboardApp:
     - Google Sheets integration status
     - Health monitoring
     - Interactive data visualization
+    - Cached, ETag-tagged snapshots invalidated by bot data writes
     """
     
     def __init__(self, bot=None):
@@ -33,7 +40,58 @@ class DashboardApp:
                         template_folder='templates',
                         static_folder='static')
         self.data_manager = DataManager()
+        # Discord state is read through this thread-safe snapshot, never from self.bot directly
+        self.live = LiveState(bot)
+        self.setup_snapshots()
         self.setup_routes()
+
+    def setup_snapshots(self):
+        """Register cached payloads and the data files each one is built from."""
+        self.snapshots = SnapshotCache(ttl=DASHBOARD_CONFIG["SNAPSHOT_TTL"])
+        self.snapshot_builders = {
+            "stats": self.get_dashboard_stats,
+            "events": self.get_events_data,
+            "players": self.get_player_data,
+            "current_events": self.get_current_events,
+            "sheets": self.get_sheets_data,
+            "health": self.get_health_status,
+        }
+        self.snapshots.register("stats", ["events.json", "events_history.json", "player_stats.json", "event_results.json"])
+        self.snapshots.register("events", ["events.json", "events_history.json"])
+        self.snapshots.register("players", ["player_stats.json", "event_results.json"])
+        self.snapshots.register("current_events", ["events.json"])
+        self.snapshots.register("sheets")
+        self.snapshots.register("health")
+        storage.add_listener(self.snapshots.on_data_changed)
+
+    def snapshot(self, key):
+        """Get the cached snapshot for a payload key."""
+        return self.snapshots.get(key, self.snapshot_builders[key])
+
+    def json_snapshot_response(self, key):
+        """Serve a pre-rendered snapshot, or 304 if the client's ETag matches."""
+        snapshot = self.snapshot(key)
+        if request.if_none_match.contains(snapshot.etag):
+            response = Response(status=304)
+        else:
+            response = Response(snapshot.body, mimetype="application/json")
+        response.set_etag(snapshot.etag)
+        response.headers["Cache-Control"] = "no-cache"
+        return response
+
+    def load_bot_data(self):
+        """
+        In-memory views of the data the dashboard shows.
+
+        Read from the shared storage cache, never from Sheets, so building a
+        snapshot costs no network round trip.
+        """
+        events = storage.view(FILES["EVENTS"], {})
+        events_history = storage.view(FILES["HISTORY"], [])
+        return {
+            "events": events if isinstance(events, dict) else {},
+            "events_history": events_history if isinstance(events_history, list) else [],
+        }
         
     def setup_routes(self):
         """Set up all dashboard routes."""
@@ -43,7 +101,7 @@ class DashboardApp:
             """Main dashboard overview page."""
             try:
                 # Get basic statistics
-                stats = self.get_dashboard_stats()
+                stats = self.snapshot("stats").data
                 return render_template('dashboard.html', stats=stats)
             except Exception as e:
                 logger.error(f"Error loading dashboard: {e}")
@@ -53,7 +111,7 @@ class DashboardApp:
         def events_page():
             """Events management and history page."""
             try:
-                events_data = self.get_events_data()
+                events_data = self.snapshot("events").data
                 return render_template('events.html', data=events_data)
             except Exception as e:
                 logger.error(f"Error loading events page: {e}")
@@ -63,7 +121,7 @@ class DashboardApp:
         def players_page():
             """Player statistics and performance page."""
             try:
-                player_data = self.get_player_data()
+                player_data = self.snapshot("players").data
                 return render_template('players.html', data=player_data)
             except Exception as e:
                 logger.error(f"Error loading players page: {e}")
@@ -73,7 +131,7 @@ class DashboardApp:
         def sheets_page():
             """Google Sheets integration status page."""
             try:
-                sheets_data = self.get_sheets_data()
+                sheets_data = self.snapshot("sheets").data
                 return render_template('sheets.html', data=sheets_data)
             except Exception as e:
                 logger.error(f"Error loading sheets page: {e}")
@@ -83,7 +141,7 @@ class DashboardApp:
         def api_stats():
             """API endpoint for real-time statistics."""
             try:
-                return jsonify(self.get_dashboard_stats())
+                return self.json_snapshot_response("stats")
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
         
@@ -91,7 +149,7 @@ class DashboardApp:
         def api_health():
             """API endpoint for bot health status."""
             try:
-                return jsonify(self.get_health_status())
+                return self.json_snapshot_response("health")
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
         
@@ -99,7 +157,7 @@ class DashboardApp:
         def api_current_events():
             """API endpoint for current event signups."""
             try:
-                return jsonify(self.get_current_events())
+                return self.json_snapshot_response("current_events")
             except Exception as e:
                 return jsonify({"error": str(e)}), 500
     
@@ -107,15 +165,16 @@ class DashboardApp:
         """Get comprehensive dashboard statistics."""
         try:
             # Load all data
-            all_data = self.data_manager.load_all_data_from_sheets()
+            all_data = self.load_bot_data()
+            bot_state = self.live.current()
             
             # Basic bot stats
             stats = {
                 "timestamp": datetime.utcnow().isoformat(),
-                "bot_status": "Online" if self.bot and self.bot.is_ready() else "Offline",
+                "bot_status": "Online" if bot_state.ready else "Offline",
                 "uptime": self.calculate_uptime(),
-                "guild_count": len(self.bot.guilds) if self.bot else 0,
-                "member_count": sum(len(guild.members) for guild in self.bot.guilds) if self.bot else 0,
+                "guild_count": bot_state.guild_count,
+                "member_count": bot_state.member_count,
             }
             
             # Event statistics
@@ -127,13 +186,13 @@ class DashboardApp:
                 "total_signups": sum(len(team) for team in events.values())
             }
             
-            # Player statistics
-            player_stats = all_data.get("player_stats", {})
+            # Player statistics (maintained incrementally, no per-request scan)
+            summary = stats_index.get_summary()
             stats["player_summary"] = {
-                "total_players": len(player_stats),
-                "active_players": len([p for p in player_stats.values() if p.get("wins", 0) + p.get("losses", 0) > 0]),
-                "total_matches": sum(p.get("wins", 0) + p.get("losses", 0) for p in player_stats.values()),
-                "average_win_rate": self.calculate_average_win_rate(player_stats)
+                "total_players": summary["total_players"],
+                "active_players": summary["active_players"],
+                "total_matches": summary["total_games"],
+                "average_win_rate": summary["average_win_rate"]
             }
             
             # Recent activity
@@ -152,7 +211,7 @@ class DashboardApp:
     def get_events_data(self):
         """Get comprehensive events data."""
         try:
-            all_data = self.data_manager.load_all_data_from_sheets()
+            all_data = self.load_bot_data()
             
             # Current signups
             current_events = all_data.get("events", {})
@@ -188,46 +247,19 @@ class DashboardApp:
     def get_player_data(self):
         """Get comprehensive player data."""
         try:
-            all_data = self.data_manager.load_all_data_from_sheets()
-            player_stats = all_data.get("player_stats", {})
-            
-            # Process player data
-            players = []
-            for username, stats in player_stats.items():
-                wins = stats.get("wins", 0)
-                losses = stats.get("losses", 0)
-                total_games = wins + losses
-                win_rate = (wins / total_games * 100) if total_games > 0 else 0
-                
-                players.append({
-                    "username": username,
-                    "wins": wins,
-                    "losses": losses,
-                    "total_games": total_games,
-                    "win_rate": round(win_rate, 1),
-                    "rank": self.calculate_player_rank(stats),
-                    "last_active": stats.get("last_seen", "Unknown")
-                })
-            
-            # Sort by performance
-            players.sort(key=lambda x: (x["win_rate"], x["total_games"]), reverse=True)
-            
-            # Add rankings
-            for i, player in enumerate(players, 1):
-                player["position"] = i
-            
-            # Statistics
-            total_players = len(players)
-            active_players = len([p for p in players if p["total_games"] > 0])
-            
+            # Already in rank order; no per-request sort
+            players = leaderboard.all()
+            summary = stats_index.get_summary()
+            total_players = summary["total_players"]
+
             return {
                 "players": players,
-                "leaderboard": players[:10],  # Top 10
+                "leaderboard": leaderboard.top(10),
                 "statistics": {
                     "total_players": total_players,
-                    "active_players": active_players,
-                    "average_games": round(sum(p["total_games"] for p in players) / total_players, 1) if total_players > 0 else 0,
-                    "average_win_rate": round(sum(p["win_rate"] for p in players) / total_players, 1) if total_players > 0 else 0
+                    "active_players": summary["active_players"],
+                    "average_games": round(summary["total_games"] / total_players, 1) if total_players > 0 else 0,
+                    "average_win_rate": summary["average_win_rate"]
                 }
             }
             
@@ -279,9 +311,10 @@ class DashboardApp:
             }
             
             # Bot connection check
+            bot_state = self.live.current()
             health["checks"]["bot_connection"] = {
-                "status": "pass" if self.bot and self.bot.is_ready() else "fail",
-                "message": "Bot is connected to Discord" if self.bot and self.bot.is_ready() else "Bot is offline"
+                "status": "pass" if bot_state.ready else "fail",
+                "message": "Bot is connected to Discord" if bot_state.ready else "Bot is offline"
             }
             
             # Data files check
@@ -293,7 +326,7 @@ class DashboardApp:
             
             # Sheets connection check
             if hasattr(self.bot, 'sheets') and self.bot.sheets:
-                sheets_connected = self.bot.sheets.is_connected()
+                sheets_connected = bot_state.sheets_connected
                 health["checks"]["sheets_connection"] = {
                     "status": "pass" if sheets_connected else "fail",
                     "message": "Google Sheets connected" if sheets_connected else "Google Sheets disconnected"
@@ -312,7 +345,7 @@ class DashboardApp:
     def get_current_events(self):
         """Get current event signups for API."""
         try:
-            all_data = self.data_manager.load_all_data_from_sheets()
+            all_data = self.load_bot_data()
             events = all_data.get("events", {})
             
             return {
@@ -327,8 +360,9 @@ class DashboardApp:
     # Helper methods
     def calculate_uptime(self):
         """Calculate bot uptime."""
-        if hasattr(self.bot, 'start_time'):
-            uptime = datetime.utcnow() - self.bot.start_time
+        start_time = self.live.current().start_time
+        if start_time:
+            uptime = datetime.utcnow() - start_time
             return str(uptime).split('.')[0]  # Remove microseconds
         return "Unknown"
     
@@ -354,25 +388,10 @@ class DashboardApp:
     
     def calculate_player_rank(self, stats):
         """Calculate player rank based on performance."""
-        wins = stats.get("wins", 0)
-        losses = stats.get("losses", 0)
-        total_games = wins + losses
-        
-        if total_games == 0:
-            return "Unranked"
-        
-        win_rate = (wins / total_games) * 100
-        
-        if win_rate >= 80 and total_games >= 10:
-            return "Elite"
-        elif win_rate >= 70 and total_games >= 5:
-            return "Expert"
-        elif win_rate >= 60:
-            return "Advanced"
-        elif win_rate >= 50:
-            return "Intermediate"
-        else:
-            return "Beginner"
+        player = PlayerStats.from_dict(stats)
+        total_games = player.total_wins + player.total_losses
+        win_rate = (player.total_wins / total_games) * 100 if total_games else 0
+        return performance_tier(win_rate, total_games)
     
     def is_this_month(self, timestamp_str):
         """Check if timestamp is from this month."""
@@ -399,8 +418,10 @@ class DashboardApp:
         try:
             checks = []
             
+            bot_state = self.live.current()
+
             # Check if bot is running
-            if self.bot and self.bot.is_ready():
+            if bot_state.ready:
                 checks.append("bot_online")
             
             # Check data files
@@ -408,7 +429,7 @@ class DashboardApp:
                 checks.append("data_files")
             
             # Check sheets connection
-            if hasattr(self.bot, 'sheets') and self.bot.sheets and self.bot.sheets.is_connected():
+            if bot_state.sheets_connected:
                 checks.append("sheets_connected")
             
             # Determine health status
@@ -0,0 +1,169 @@
+"""
+Async dashboard server running inside the bot's event loop.
+
+Serves the same pages and JSON API as the Flask app, but through aiohttp
+(already installed with discord.py) on the bot's own loop. Nothing reads
+bot state from another thread, requests are handled concurrently, and
+``/api/stream/signups`` pushes live signup counts over Server-Sent Events
+so the events page no longer has to poll.
+"""
+
+import asyncio
+import json
+
+from aiohttp import web
+from flask import render_template
+
+from config.constants import DASHBOARD_CONFIG
+from dashboard.live_state import signup_counts
+from utils.logger import setup_logger
+
+logger = setup_logger("dashboard_async")
+
+# Path -> (template, snapshot key, template variable)
+PAGES = {
+    "/": ("dashboard.html", "stats", "stats"),
+    "/events": ("events.html", "events", "data"),
+    "/players": ("players.html", "players", "data"),
+    "/sheets": ("sheets.html", "sheets", "data"),
+}
+
+# Path -> snapshot key
+API_ROUTES = {
+    "/api/stats": "stats",
+    "/api/health": "health",
+    "/api/events/current": "current_events",
+}
+
+# Snapshots whose builders may call the Sheets API, built off the loop
+BLOCKING_SNAPSHOTS = {"sheets"}
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    """Check an If-None-Match header against an ETag."""
+    if not header:
+        return False
+    for candidate in header.split(","):
+        candidate = candidate.strip()
+        if candidate == "*" or candidate.removeprefix("W/").strip('"') == etag:
+            return True
+    return False
+
+
+class AsyncDashboardServer:
+    """
+    aiohttp front-end for a DashboardApp.
+
+    Features:
+    - Runs on the bot's event loop, no dashboard thread
+    - Shares the DashboardApp snapshot cache and templates
+    - ETag / 304 responses on the JSON API
+    - Server-Sent Events stream of live signup counts
+    """
+
+    def __init__(self, dashboard, host: str = "0.0.0.0", port: int = 5000):
+        """
+        Initialize the server.
+
+        Args:
+            dashboard: DashboardApp providing snapshots and templates
+            host: Host to bind to
+            port: Port to listen on
+        """
+        self.dashboard = dashboard
+        self.host = host
+        self.port = port
+        self.runner = None
+
+    def build_app(self) -> web.Application:
+        app = web.Application()
+        for path in PAGES:
+            app.router.add_get(path, self.page)
+        for path in API_ROUTES:
+            app.router.add_get(path, self.api)
+        app.router.add_get("/api/stream/signups", self.stream_signups)
+        return app
+
+    async def start(self):
+        """Start serving on the running loop."""
+        self.dashboard.live.start()
+        self.runner = web.AppRunner(self.build_app(), access_log=None)
+        await self.runner.setup()
+        await web.TCPSite(self.runner, self.host, self.port).start()
+        logger.info(f"🚀 Async dashboard listening on {self.host}:{self.port}")
+
+    async def stop(self):
+        """Stop serving and end open streams."""
+        await self.dashboard.live.stop()
+        if self.runner is not None:
+            await self.runner.cleanup()
+            self.runner = None
+        logger.info("✅ Async dashboard stopped")
+
+    # ==========================================
+    # HANDLERS
+    # ==========================================
+
+    async def _snapshot(self, key: str):
+        if key in BLOCKING_SNAPSHOTS:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(None, self.dashboard.snapshot, key)
+        return self.dashboard.snapshot(key)
+
+    def _render(self, path: str, template: str, **context) -> str:
+        # Flask request context so templates can keep using url_for
+        with self.dashboard.app.test_request_context(path):
+            return render_template(template, **context)
+
+    async def page(self, request: web.Request) -> web.Response:
+        template, key, variable = PAGES[request.path]
+        try:
+            snapshot = await self._snapshot(key)
+            html = self._render(request.path, template, **{variable: snapshot.data})
+        except Exception as e:
+            logger.error(f"Error loading {request.path}: {e}")
+            html = self._render(request.path, "error.html", error=str(e))
+        return web.Response(text=html, content_type="text/html")
+
+    async def api(self, request: web.Request) -> web.Response:
+        try:
+            snapshot = await self._snapshot(API_ROUTES[request.path])
+        except Exception as e:
+            return web.json_response({"error": str(e)}, status=500)
+
+        headers = {"ETag": f'"{snapshot.etag}"', "Cache-Control": "no-cache"}
+        if _etag_matches(request.headers.get("If-None-Match", ""), snapshot.etag):
+            return web.Response(status=304, headers=headers)
+        return web.Response(body=snapshot.body, content_type="application/json", headers=headers)
+
+    async def stream_signups(self, request: web.Request) -> web.StreamResponse:
+        """Server-Sent Events stream of signup counts, sent on every change."""
+        response = web.StreamResponse(
+            headers={
+                "Content-Type": "text/event-stream",
+                "Cache-Control": "no-cache",
+                "X-Accel-Buffering": "no",
+            }
+        )
+        await response.prepare(request)
+
+        live = self.dashboard.live
+        queue = live.subscribe()
+        keepalive = DASHBOARD_CONFIG.get("STREAM_KEEPALIVE", 15)
+        try:
+            await response.write(f"data: {json.dumps(signup_counts())}\n\n".encode("utf-8"))
+            while True:
+                try:
+                    payload = await asyncio.wait_for(queue.get(), timeout=keepalive)
+                except asyncio.TimeoutError:
+                    # Comment line keeps proxies from closing an idle stream
+                    await response.write(b": keepalive\n\n")
+                    continue
+                if payload is None:
+                    break  # Server shutting down
+                await response.write(f"data: {json.dumps(payload)}\n\n".encode("utf-8"))
+        except ConnectionResetError:
+            pass  # Client went away
+        finally:
+            live.unsubscribe(queue)
+        return response
@@ -0,0 +1,184 @@
+"""
+Thread-safe view of bot state for the dashboard.
+
+Dashboard code used to read ``bot.guilds``, ``bot.is_ready()`` and the
+member lists from the Flask thread while the event loop was changing
+them. The bot state is now captured on the event loop into an immutable
+snapshot that any thread may read, and signup count changes are pushed to
+streaming (SSE) subscribers instead of having clients poll.
+"""
+
+import asyncio
+import os
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional, Set
+
+from config.constants import DASHBOARD_CONFIG, FILES, TEAM_DISPLAY
+from utils.logger import setup_logger
+from utils.member_index import member_index
+from utils.storage import storage
+
+logger = setup_logger("dashboard_live")
+
+
+class BotStateSnapshot:
+    """
+    Copy of the bot state the dashboard shows.
+
+    Never mutated after creation; capture() swaps in a new one, so readers
+    on other threads always see a consistent set of values.
+    """
+
+    __slots__ = (
+        "ready",
+        "guild_count",
+        "member_count",
+        "start_time",
+        "sheets_connected",
+        "captured_at",
+    )
+
+    def __init__(
+        self,
+        ready: bool = False,
+        guild_count: int = 0,
+        member_count: int = 0,
+        start_time: Optional[datetime] = None,
+        sheets_connected: bool = False,
+    ):
+        self.ready = ready
+        self.guild_count = guild_count
+        self.member_count = member_count
+        self.start_time = start_time
+        self.sheets_connected = sheets_connected
+        self.captured_at = time.time()
+
+
+def signup_counts() -> Dict[str, Any]:
+    """Current signup count per team from the in-memory events data."""
+    events = storage.view(FILES["EVENTS"], {})
+    if not isinstance(events, dict):
+        events = {}
+    teams = {team_key: len(events.get(team_key, []) or []) for team_key in TEAM_DISPLAY}
+    return {
+        "teams": teams,
+        "total": sum(teams.values()),
+        "timestamp": datetime.utcnow().isoformat(),
+    }
+
+
+class LiveState:
+    """
+    Publishes bot state snapshots and live signup counts.
+
+    Features:
+    - Bot state captured on the event loop, read from any thread
+    - Periodic refresh plus immediate refresh on signup changes
+    - Per-subscriber bounded queues for streaming endpoints
+    """
+
+    def __init__(self, bot=None):
+        self.bot = bot
+        self._state = BotStateSnapshot()
+        self._subscribers: Set[asyncio.Queue] = set()
+        self._last_counts: Optional[Dict[str, int]] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def current(self) -> BotStateSnapshot:
+        """Latest bot state (safe from any thread)."""
+        return self._state
+
+    def capture(self):
+        """Copy the bot state; must run on the bot's event loop."""
+        bot = self.bot
+        if bot is None:
+            return
+        try:
+            sheets = getattr(bot, "sheets", None)
+            self._state = BotStateSnapshot(
+                ready=bot.is_ready(),
+                guild_count=len(bot.guilds),
+                member_count=(
+                    member_index.count
+                    if member_index.built
+                    else sum(guild.member_count or 0 for guild in bot.guilds)
+                ),
+                start_time=getattr(bot, "start_time", None),
+                sheets_connected=bool(sheets and sheets.is_connected()),
+            )
+        except Exception as e:
+            logger.error(f"❌ Failed to capture bot state: {e}")
+
+    # ==========================================
+    # LIFECYCLE
+    # ==========================================
+
+    def start(self):
+        """Start publishing; call from the bot's event loop."""
+        if self._task and not self._task.done():
+            return
+        self._loop = asyncio.get_running_loop()
+        self.capture()
+        storage.add_listener(self._on_data_changed)
+        self._task = asyncio.create_task(self._refresh_loop())
+
+    async def stop(self):
+        """Stop publishing and release streaming subscribers."""
+        storage.remove_listener(self._on_data_changed)
+        if self._task:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        for queue in list(self._subscribers):
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(None)  # Tells the stream to end
+
+    async def _refresh_loop(self):
+        interval = DASHBOARD_CONFIG.get("STATE_REFRESH", 5)
+        while True:
+            await asyncio.sleep(interval)
+            self.capture()
+
+    # ==========================================
+    # LIVE SIGNUPS
+    # ==========================================
+
+    def _on_data_changed(self, filepath: str):
+        """Storage listener; may run off the loop, so hop back onto it."""
+        if self._loop is None or os.path.basename(filepath) != os.path.basename(FILES["EVENTS"]):
+            return
+        try:
+            self._loop.call_soon_threadsafe(self._publish_signups)
+        except RuntimeError:
+            pass  # Loop already closed
+
+    def _publish_signups(self):
+        payload = signup_counts()
+        if payload["teams"] == self._last_counts:
+            return
+        self._last_counts = payload["teams"]
+        for queue in list(self._subscribers):
+            if queue.full():
+                # Slow client: drop its oldest update, the newest is what matters
+                queue.get_nowait()
+            queue.put_nowait(payload)
+
+    def subscribe(self) -> asyncio.Queue:
+        """Register a streaming subscriber (call on the event loop)."""
+        queue: asyncio.Queue = asyncio.Queue(maxsize=10)
+        self._subscribers.add(queue)
+        return queue
+
+    def unsubscribe(self, queue: asyncio.Queue):
+        """Remove a streaming subscriber."""
+        self._subscribers.discard(queue)
+
+    @property
+    def subscriber_count(self) -> int:
+        return len(self._subscribers)
@@ -4,7 +4,9 @@
 Dashboard Runner for RoW Discord Bot.
 
 This script can be used to run the dashboard independently
-or integrated with the main bot.
+or integrated with the main bot. Integrated with the bot it is served by
+aiohttp on the bot's own event loop (run_dashboard_in_loop); the threaded
+Flask server is kept for standalone use.
 """
 
 import sys
@@ -32,6 +34,10 @@ def run_dashboard_standalone(host='0.0.0.0', port=5000):
     logger.info("🚀 Starting RoW Bot Dashboard (Standalone Mode)")
     
     try:
+        # No bot to open the shared Sheets connection in the background
+        from sheets import shared_sheets
+        shared_sheets.connect_now()
+
         # Create dashboard app without bot instance
         app = create_dashboard_app(bot=None)
         
@@ -43,6 +49,7 @@ def run_dashboard_standalone(host='0.0.0.0', port=5000):
         logger.info("   - /sheets (Google Sheets Status)")
         logger.info("   - /api/stats (Statistics API)")
         logger.info("   - /api/health (Health Check API)")
+        logger.info("   - /api/stream/signups (Live Signups, async mode only)")
         
         # Run the dashboard
         app.run(host=host, port=port, debug=False)
@@ -51,22 +58,46 @@ def run_dashboard_standalone(host='0.0.0.0', port=5000):
         logger.error(f"❌ Failed to start dashboard: {e}")
         raise
 
+async def run_dashboard_in_loop(bot, host='0.0.0.0', port=5000):
+    """
+    Serve the dashboard on the bot's event loop.
+
+    Args:
+        bot: Discord bot instance
+        host: Host to bind to
+        port: Port to run on
+
+    Returns:
+        AsyncDashboardServer: Running server (call stop() on shutdown)
+    """
+    from dashboard.async_server import AsyncDashboardServer
+
+    logger.info("🚀 Starting RoW Bot Dashboard (Async Mode)")
+    server = AsyncDashboardServer(create_dashboard_app(bot=bot), host=host, port=port)
+    await server.start()
+    logger.info(f"📊 Dashboard running on http://{host}:{port}")
+    return server
+
 def run_dashboard_with_bot(bot, host='0.0.0.0', port=5000):
     """
-    Run the dashboard integrated with the bot.
+    Run the dashboard integrated with the bot in a Flask thread.
+
+    Must be called from the bot's event loop, which keeps the live state
+    snapshot the Flask thread reads up to date.
     
     Args:
         bot: Discord bot instance
         host: Host to bind to
         port: Port to run on
     """
+    # Create dashboard app with bot instance; live state runs on this loop
+    app = create_dashboard_app(bot=bot)
+    app.live.start()
+
     def dashboard_thread():
         logger.info("🚀 Starting RoW Bot Dashboard (Integrated Mode)")
         
         try:
-            # Create dashboard app with bot instance
-            app = create_dashboard_app(bot=bot)
-            
             logger.info(f"📊 Dashboard running on http://{host}:{port}")
             
             # Run the dashboard
@@ -0,0 +1,138 @@
+"""
+Pre-rendered JSON snapshots for the dashboard.
+
+Every dashboard request used to rebuild its payload from
+``DataManager.load_all_data_from_sheets()`` - a Sheets round trip per
+request when Sheets is connected. Snapshots are built once, serialized
+once, and reused until the bot writes a data file they depend on or
+their TTL runs out. Each snapshot carries an ETag so polling clients get
+a 304 while nothing changed.
+"""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from typing import Any, Callable, Dict, Iterable, Optional
+
+from utils.logger import setup_logger
+
+logger = setup_logger("dashboard_cache")
+
+
+class Snapshot:
+    """One built payload with its serialized body and ETag."""
+
+    __slots__ = ("data", "body", "etag", "built_at", "version")
+
+    def __init__(self, data: Any, version: int):
+        self.data = data
+        self.body = json.dumps(data, default=str, separators=(",", ":")).encode("utf-8")
+        self.etag = hashlib.sha1(self.body).hexdigest()
+        self.built_at = time.monotonic()
+        self.version = version
+
+
+class SnapshotCache:
+    """
+    Keyed snapshot cache invalidated by data-change events.
+
+    Features:
+    - Payloads built and JSON-encoded once per change
+    - Per-key data file dependencies, bumped by storage write events
+    - TTL bound for values that change without a write (uptime, health)
+    - Single builder per key; concurrent requests reuse its result
+    """
+
+    def __init__(self, ttl: float = 30.0):
+        """
+        Initialize the cache.
+
+        Args:
+            ttl: Max seconds a snapshot is served without a rebuild
+        """
+        self.ttl = ttl
+        self._lock = threading.Lock()
+        self._build_locks: Dict[str, threading.Lock] = {}
+        self._snapshots: Dict[str, Snapshot] = {}
+        self._depends: Dict[str, frozenset] = {}
+        self._versions: Dict[str, int] = {}
+        self.hits = 0
+        self.builds = 0
+
+    def register(self, key: str, depends_on: Iterable[str] = ()):
+        """
+        Declare which data files a snapshot is built from.
+
+        Args:
+            key: Snapshot key
+            depends_on: Data file names (e.g. "events.json") that invalidate it
+        """
+        with self._lock:
+            self._depends[key] = frozenset(depends_on)
+            self._versions.setdefault(key, 0)
+            self._build_locks.setdefault(key, threading.Lock())
+
+    def on_data_changed(self, filepath: str):
+        """Storage change listener: mark dependent snapshots stale."""
+        name = os.path.basename(filepath)
+        with self._lock:
+            for key, files in self._depends.items():
+                if name in files:
+                    self._versions[key] += 1
+
+    def invalidate(self, key: Optional[str] = None):
+        """Mark one snapshot (or all) stale."""
+        with self._lock:
+            for name in [key] if key else list(self._versions):
+                self._versions[name] = self._versions.get(name, 0) + 1
+
+    def _fresh(self, key: str) -> Optional[Snapshot]:
+        snapshot = self._snapshots.get(key)
+        if snapshot is None:
+            return None
+        if snapshot.version != self._versions.get(key, 0):
+            return None
+        if time.monotonic() - snapshot.built_at > self.ttl:
+            return None
+        return snapshot
+
+    def get(self, key: str, builder: Callable[[], Any]) -> Snapshot:
+        """
+        Get a snapshot, building it if stale.
+
+        Args:
+            key: Registered snapshot key
+            builder: Builds the payload (called at most once per rebuild)
+
+        Returns:
+            Snapshot: Current payload, body and ETag
+        """
+        with self._lock:
+            snapshot = self._fresh(key)
+            if snapshot is not None:
+                self.hits += 1
+                return snapshot
+            build_lock = self._build_locks.setdefault(key, threading.Lock())
+
+        with build_lock:
+            # Another request may have rebuilt it while we waited
+            with self._lock:
+                snapshot = self._fresh(key)
+                if snapshot is not None:
+                    self.hits += 1
+                    return snapshot
+                version = self._versions.get(key, 0)
+
+            snapshot = Snapshot(builder(), version)
+            with self._lock:
+                self._snapshots[key] = snapshot
+                self.builds += 1
+            logger.debug(f"📸 Rebuilt dashboard snapshot '{key}' ({len(snapshot.body)} bytes)")
+            return snapshot
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/build counters for diagnostics."""
+        with self._lock:
+            return {"hits": self.hits, "builds": self.builds, "snapshots": len(self._snapshots)}
@@ -8,17 +8,18 @@ This module provides comprehensive audit logging functionality:
 - Result recording
 - Action history searching
 
-The audit log is stored as JSON and maintains the last 1000 entries
-to prevent excessive file growth.
+The audit log is stored as append-only daily JSONL segments with
+per-segment indexes (see utils/audit_store.py) and keeps full history.
 """
 
-import json
 import os
-from datetime import datetime
-from typing import Any, Dict, Optional
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
 
-from utils.data_manager import DataManager
+from config.constants import FILES
+from utils.audit_store import AuditStore
 from utils.logger import setup_logger
+from utils.state_store import state_store
 
 logger = setup_logger("audit_logger")
 
@@ -28,28 +29,33 @@ class AuditLogger:
     Handles audit logging for important bot actions.
 
     Features:
-    - Automatic log rotation (1000 entries)
-    - JSON-based persistent storage
-    - Action filtering and searching
+    - Append-only daily segments with full history
+    - Indexed lookups by user, target user and action type
+    - Paged action history queries
     - User history tracking
     - Guild-specific logging
     """
 
     def __init__(self):
-        self.audit_file = "data/audit_log.json"
-        self.data_manager = DataManager()
-        self._ensure_audit_file()
-
-    def _ensure_audit_file(self):
-        """Ensure audit log file exists."""
-        if not os.path.exists(self.audit_file):
-            try:
-                os.makedirs(os.path.dirname(self.audit_file), exist_ok=True)
-                with open(self.audit_file, "w") as f:
-                    json.dump([], f)
-                logger.info(f"✅ Created audit log file: {self.audit_file}")
-            except Exception as e:
-                logger.error(f"❌ Failed to create audit log file: {e}")
+        self.audit_file = FILES["AUDIT_LOG"]
+        migrate = not os.path.isdir(FILES["AUDIT_DIR"])
+        self.store = AuditStore(FILES["AUDIT_DIR"])
+        if migrate:
+            self._migrate_legacy_log()
+
+    def _migrate_legacy_log(self):
+        """Copy entries from the old single-file audit log into segments."""
+        try:
+            legacy = state_store.view(self.audit_file, [])
+            if not isinstance(legacy, list) or not legacy:
+                return
+            migrated = sum(
+                1 for entry in legacy if isinstance(entry, dict) and self.store.append(entry)
+            )
+            self.store.close()
+            logger.info(f"✅ Migrated {migrated} audit entries to {FILES['AUDIT_DIR']}")
+        except Exception as e:
+            logger.error(f"❌ Failed to migrate legacy audit log: {e}")
 
     def log_action(
         self,
@@ -76,9 +82,6 @@ class AuditLogger:
         - Additional details dictionary
         """
         try:
-            # Load existing audit log
-            audit_log = self.data_manager.load_json(self.audit_file, [])
-
             # Create audit entry
             entry = {
                 "timestamp": datetime.utcnow().isoformat(),
@@ -89,15 +92,8 @@ class AuditLogger:
                 "details": details,
             }
 
-            # Add to log
-            audit_log.append(entry)
-
-            # Keep only last 1000 entries to prevent file bloat
-            if len(audit_log) > 1000:
-                audit_log = audit_log[-1000:]
-
-            # Save audit log
-            if self.data_manager.save_json(self.audit_file, audit_log):
+            # O(1) append to today's segment
+            if self.store.append(entry):
                 logger.debug(f"📝 Audit logged: {action_type} by {user_id}")
             else:
                 logger.error("❌ Failed to save audit log entry")
@@ -163,6 +159,39 @@ class AuditLogger:
             guild_id=guild_id,
         )
 
+    def query_actions(
+        self,
+        user_id: Optional[int] = None,
+        target_user_id: Optional[int] = None,
+        action_type: Optional[str] = None,
+        limit: int = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Page through audit entries, newest first.
+
+        Args:
+            user_id: Optional ID of the user who performed the action
+            target_user_id: Optional ID of the user acted upon
+            action_type: Optional action type prefix to filter by
+            limit: Page size
+            cursor: Cursor returned with the previous page
+
+        Returns:
+            tuple: (entries, cursor for the next page or None)
+        """
+        try:
+            return self.store.query(
+                user_id=str(user_id) if user_id is not None else None,
+                target_user_id=str(target_user_id) if target_user_id is not None else None,
+                action_type=action_type,
+                limit=limit,
+                cursor=cursor,
+            )
+        except Exception as e:
+            logger.error(f"❌ Error querying audit log: {e}")
+            return [], None
+
     def get_user_actions(self, user_id: int, limit: int = 50) -> list:
         """
         Get recent actions by a specific user.
@@ -174,20 +203,7 @@ class AuditLogger:
         Returns:
             list: Most recent actions by the user, newest first
         """
-        try:
-            audit_log = self.data_manager.load_json(self.audit_file, [])
-            user_actions = []
-
-            for entry in reversed(audit_log):
-                if entry.get("user_id") == str(user_id):
-                    user_actions.append(entry)
-                    if len(user_actions) >= limit:
-                        break
-
-            return user_actions
-        except Exception as e:
-            logger.error(f"❌ Error getting user actions: {e}")
-            return []
+        return self.query_actions(user_id=user_id, limit=limit)[0]
 
     def get_recent_actions(self, limit: int = 100) -> list:
         """
@@ -199,12 +215,7 @@ class AuditLogger:
         Returns:
             list: Most recent audit log entries, newest first
         """
-        try:
-            audit_log = self.data_manager.load_json(self.audit_file, [])
-            return audit_log[-limit:]
-        except Exception as e:
-            logger.error(f"❌ Error getting recent actions: {e}")
-            return []
+        return self.query_actions(limit=limit)[0]
 
     def search_actions(
         self,
@@ -224,35 +235,22 @@ class AuditLogger:
             list: Matching audit log entries within time period
         """
         try:
-            audit_log = self.data_manager.load_json(self.audit_file, [])
-            results = []
-
-            cutoff_date = datetime.utcnow().timestamp() - (days_back * 86400)
-
-            for entry in audit_log:
-                try:
-                    entry_date = datetime.fromisoformat(entry["timestamp"]).timestamp()
-                    if entry_date < cutoff_date:
-                        continue
-                except:
-                    continue
-
-                # Apply filters
-                if action_type and not entry.get("action_type", "").startswith(
-                    action_type
-                ):
-                    continue
-
-                if user_id and entry.get("user_id") != str(user_id):
-                    continue
-
-                results.append(entry)
-
+            results, _ = self.store.query(
+                user_id=str(user_id) if user_id else None,
+                action_type=action_type or None,
+                since=datetime.utcnow() - timedelta(days=days_back),
+                limit=None,
+            )
+            results.reverse()
             return results
         except Exception as e:
             logger.error(f"❌ Error searching audit log: {e}")
             return []
 
+    def close(self):
+        """Seal the current audit segment."""
+        self.store.close()
+
 
 # Global audit logger instance
 audit_logger = AuditLogger()
@@ -1,11 +1,24 @@
-"""Error logging service for the Discord bot."""
+"""Error logging service for the Discord bot.
 
-import json
+Errors are buffered and deduplicated by fingerprint (error type + source +
+raising location) instead of being written one by one. A background task
+flushes each batch to data/error_log.json and the Sheets "Error Summary"
+tab, and sends the admin at most one rate-limited summary per interval,
+so an error storm costs a few writes instead of one file rewrite per error.
+"""
+
+import asyncio
+import os
+import re
+import time
 import traceback
+from collections import OrderedDict
 from datetime import datetime
-from typing import Optional, Dict, Any, TYPE_CHECKING
+from typing import Optional, Dict, Any, List, Tuple, TYPE_CHECKING
 
+from config.constants import ERROR_LOG_CONFIG, FILES
 from utils.logger import setup_logger
+from utils.storage import storage
 
 if TYPE_CHECKING:
     from utils.sheets_manager import SheetsManager
@@ -13,81 +26,229 @@ if TYPE_CHECKING:
 
 logger = setup_logger("error_logger")
 
+_FRAME_RE = re.compile(r'File "([^"]+)", line (\d+)')
+
+Fingerprint = Tuple[str, str, str]
+
+
+def _error_location(traceback_str: str) -> str:
+    """Innermost 'file:line' of a traceback, or '' if there is none."""
+    frames = _FRAME_RE.findall(traceback_str or "")
+    if not frames:
+        return ""
+    filename, line = frames[-1]
+    return f"{os.path.basename(filename.replace(os.sep, '/'))}:{line}"
+
+
 class ErrorLogger:
     def __init__(self, bot: 'commands.Bot'):
         self.bot = bot
-        self.error_log_file = "data/error_log.json"
-        self.max_local_errors = 1000
+        self.error_log_file = FILES["ERROR_LOG"]
+        self.max_local_errors = ERROR_LOG_CONFIG["MAX_LOCAL_ERRORS"]
+        self.max_pending = ERROR_LOG_CONFIG["MAX_PENDING"]
+        self.flush_interval = ERROR_LOG_CONFIG["FLUSH_INTERVAL"]
+        self.summary_interval = ERROR_LOG_CONFIG["SUMMARY_INTERVAL"]
         self._sheets_manager: Optional['SheetsManager'] = None
 
+        # Fingerprint -> grouped entry waiting for the next flush (bounded)
+        self._pending: "OrderedDict[Fingerprint, Dict[str, Any]]" = OrderedDict()
+        # Fingerprint -> occurrences since the last admin summary (bounded;
+        # groups evicted to make room are counted in _summary_other)
+        self._summary_counts: "OrderedDict[Fingerprint, int]" = OrderedDict()
+        self._summary_other = 0
+        self._dropped = 0
+        self._last_summary = 0.0
+        self._flusher: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+
     def set_sheets_manager(self, sheets_manager: 'SheetsManager') -> None:
         """Set the sheets manager instance for error logging."""
         self._sheets_manager = sheets_manager
 
-    async def log_error(self, 
-                 error_type: str, 
-                 command: str, 
-                 user_id: Optional[int], 
+    async def log_error(self,
+                 error_type: str,
+                 command: str,
+                 user_id: Optional[int],
                  error_message: str,
                  traceback_str: str,
                  severity: str = "Medium",
                  context: Optional[Dict[str, Any]] = None) -> None:
-        """Log error to both local file and sheets."""
+        """Buffer an error for the next batched flush to file and sheets."""
         try:
-            timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
-            error_entry = {
+            self.record(
+                error_type, command, user_id, error_message, traceback_str, severity, context
+            )
+            self._ensure_flusher()
+        except Exception as e:
+            logger.error(f"Failed to log error: {e}")
+
+    def record(self,
+               error_type: str,
+               command: str,
+               user_id: Optional[int],
+               error_message: str,
+               traceback_str: str,
+               severity: str = "Medium",
+               context: Optional[Dict[str, Any]] = None) -> None:
+        """
+        Add an error to the pending batch without any I/O.
+
+        Repeats of an already pending error only bump its count and
+        last-seen fields.
+        """
+        location = _error_location(traceback_str)
+        fingerprint = (error_type, command, location)
+        timestamp = datetime.utcnow().strftime("%Y-%m-%d %H:%M:%S")
+
+        entry = self._pending.get(fingerprint)
+        if entry is None:
+            if len(self._pending) >= self.max_pending:
+                self._pending.popitem(last=False)
+                self._dropped += 1
+            entry = {
                 "timestamp": timestamp,
                 "error_type": error_type,
                 "command": command,
+                "location": location,
                 "user_id": str(user_id) if user_id else "System",
                 "error_message": error_message,
                 "traceback": traceback_str,
                 "severity": severity,
-                "context": context or {}
+                "context": context or {},
+                "count": 0,
             }
+            self._pending[fingerprint] = entry
+        else:
+            self._pending.move_to_end(fingerprint)
+            entry["error_message"] = error_message
 
-            # Save to local file
-            self._save_to_file(error_entry)
+        entry["count"] += 1
+        entry["last_seen"] = timestamp
+        self._count_for_summary(fingerprint)
 
-            # Log to sheets if available
-            if self._sheets_manager and self._sheets_manager.is_connected():
-                await self._log_to_sheets(error_entry)
+        if len(self._pending) >= self.max_pending and self._wake is not None:
+            self._wake.set()
 
-        except Exception as e:
-            logger.error(f"Failed to log error: {e}")
+    def _count_for_summary(self, fingerprint: Fingerprint) -> None:
+        """Count an occurrence for the admin summary, capped at max_pending groups."""
+        count = self._summary_counts.pop(fingerprint, None)
+        if count is None:
+            count = 0
+            if len(self._summary_counts) >= self.max_pending:
+                _, evicted = self._summary_counts.popitem(last=False)
+                self._summary_other += evicted
+        self._summary_counts[fingerprint] = count + 1
+
+    # ==========================================
+    # BATCHED FLUSHING
+    # ==========================================
 
-    def _save_to_file(self, error_entry: Dict[str, Any]) -> None:
-        """Save error to local JSON file."""
+    def _ensure_flusher(self) -> None:
+        if self._flusher is None or self._flusher.done():
+            self._wake = asyncio.Event()
+            self._flusher = asyncio.create_task(self._flush_loop())
+
+    async def _flush_loop(self) -> None:
+        while True:
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=self.flush_interval)
+            except asyncio.TimeoutError:
+                pass
+            self._wake.clear()
+            try:
+                await self.flush()
+            except Exception as e:
+                logger.error(f"Failed to flush error batch: {e}")
+
+    async def flush(self) -> int:
+        """
+        Write pending errors to local storage and sheets.
+
+        Returns:
+            int: Number of error groups flushed
+        """
+        batch: List[Dict[str, Any]] = list(self._pending.values())
+        self._pending.clear()
+
+        if self._dropped:
+            logger.warning(f"⚠️ Error buffer full, dropped {self._dropped} error groups")
+            self._dropped = 0
+
+        if batch:
+            await self._save_to_file(batch)
+            await self._log_to_sheets(batch)
+        await self._maybe_send_summary()
+        return len(batch)
+
+    async def _save_to_file(self, batch: List[Dict[str, Any]]) -> None:
+        """Append a batch to the local error log (journaled, capped)."""
         try:
-            errors = self._load_errors()
-            errors.append(error_entry)
-            
-            # Keep only last N errors
-            if len(errors) > self.max_local_errors:
-                errors = errors[-self.max_local_errors:]
-
-            with open(self.error_log_file, 'w', encoding='utf-8') as f:
-                json.dump(errors, f, indent=2)
+            for entry in batch:
+                await storage.append_item(
+                    self.error_log_file, entry, max_items=self.max_local_errors
+                )
         except Exception as e:
-            logger.error(f"Failed to save error to file: {e}")
+            logger.error(f"Failed to save errors to file: {e}")
 
-    def _load_errors(self) -> list:
-        """Load existing errors from file."""
-        try:
-            with open(self.error_log_file, 'r', encoding='utf-8') as f:
-                return json.load(f)
-        except (FileNotFoundError, json.JSONDecodeError):
-            return []
+    def _get_sheets_manager(self) -> Optional['SheetsManager']:
+        return self._sheets_manager or storage.sheets_manager
 
-    async def _log_to_sheets(self, error_entry: Dict[str, Any]) -> None:
-        """Log error to Google Sheets."""
+    async def _log_to_sheets(self, batch: List[Dict[str, Any]]) -> None:
+        """Append a batch to Google Sheets in one request."""
+        manager = self._get_sheets_manager()
         try:
-            if self._sheets_manager and hasattr(self._sheets_manager, 'append_error'):
-                await self._sheets_manager.append_error(error_entry)
+            if not manager or not manager.is_connected():
+                return
+            if not hasattr(manager, 'append_error_rows'):
+                logger.debug("SheetsManager does not have append_error_rows method")
+                return
+            engine = getattr(manager, "engine", None)
+            if engine is not None:
+                from sheets.quota import Priority
+
+                # Error logging is background work; keep it behind user-facing syncs
+                await engine.run(manager.append_error_rows, batch, priority=Priority.SYNC)
             else:
-                logger.error("SheetsManager does not have append_error method")
+                await asyncio.get_running_loop().run_in_executor(
+                    None, manager.append_error_rows, batch
+                )
         except Exception as e:
-            logger.error(f"Failed to log error to sheets: {e}")
+            logger.error(f"Failed to log errors to sheets: {e}")
+
+    async def _maybe_send_summary(self) -> None:
+        """Send the admin one grouped summary per summary interval."""
+        if not self._summary_counts and not self._summary_other:
+            return
+        now = time.monotonic()
+        if now - self._last_summary < self.summary_interval:
+            return
+
+        counts = sorted(self._summary_counts.items(), key=lambda item: item[1], reverse=True)
+        if self._summary_other:
+            counts.append((("Other errors", "various sources", ""), self._summary_other))
+        self._summary_counts.clear()
+        self._summary_other = 0
+        self._last_summary = now
+
+        try:
+            from utils import admin_notifier as notifier_module
+
+            notifier = notifier_module.admin_notifier
+            if notifier:
+                await notifier.send_error_summary(counts, self.summary_interval)
+        except Exception as e:
+            logger.error(f"Failed to send error summary: {e}")
+
+    async def close(self) -> None:
+        """Stop the flusher and write anything still pending."""
+        if self._flusher is not None:
+            self._flusher.cancel()
+            try:
+                await self._flusher
+            except asyncio.CancelledError:
+                pass
+            self._flusher = None
+        await self.flush()
 
 # Global error logger instance
 error_logger: Optional[ErrorLogger] = None
@@ -109,4 +270,4 @@ async def log_error(error_type: str, error: Exception, context: str = "") -> Non
             traceback_str=traceback.format_exc(),
             severity="High",
             context={"details": context}
-        )
\ No newline at end of file
+        )
@@ -5,7 +5,7 @@ This module manages recurring tasks:
 - Tuesday signup posts (10:00 UTC, bi-weekly)
 - Thursday team lock (23:59 UTC, bi-weekly)
 - Sunday summaries (23:30 UTC, bi-weekly)
-- Smart event reminders (continuous)
+- Smart event reminders (timers armed from the event schedule)
 
 All tasks run on even weeks only to match bi-weekly event schedule.
 """
@@ -19,6 +19,7 @@ from discord.ext import tasks
 from config.constants import ALERT_CHANNEL_ID, DEFAULT_TIMES, FILES, TEAM_DISPLAY
 from config.settings import ROW_NOTIFICATION_ROLE_ID
 from utils.data_manager import DataManager
+from utils.event_schedule import event_schedule
 from utils.helpers import Helpers
 
 logger = logging.getLogger("scheduler")
@@ -44,7 +45,7 @@ def start_scheduler(bot):
         post_event_signup.start(bot)
         post_weekly_summary.start(bot)
         thursday_teams_and_lock.start(bot)  # NEW: Thursday task
-        smart_event_reminders.start(bot)  # NEW: Smart notification reminders
+        start_smart_event_reminders(bot)  # Exact-deadline reminder timers
 
 
 # Tuesday at 10:00 UTC - Auto-post weekly signups (bi-weekly)
@@ -278,139 +279,42 @@ async def before_thursday_teams_and_lock():
     await asyncio.sleep(30)  # Small delay to ensure bot is fully ready
 
 
-# Every minute - Check for smart event reminders
-@tasks.loop(minutes=1)
-async def smart_event_reminders(bot):
+# Exact-deadline smart event reminders
+def start_smart_event_reminders(bot):
     """
-    Send smart notifications for upcoming events.
+    Arm smart notification timers for upcoming events.
 
     Features:
     - Configurable reminder intervals (60, 15, 5 minutes)
-    - Team-specific timing
+    - Team-specific timing from the shared event schedule
     - User preference based delivery
     - Fallback time handling
     """
-    try:
-        now = datetime.utcnow()
 
-        # Get actual event times from EventManager
+    async def send_reminder(team_key, reminder_minutes, event_time):
         event_manager = bot.get_cog("EventManager")
-        if not event_manager:
-            return
-
-        # Parse the actual event times from the loaded data
-        upcoming = {}
-        for team_key in ["main_team", "team_2", "team_3"]:
-            team_time_str = event_manager.event_times.get(
-                team_key, DEFAULT_TIMES.get(team_key, "17:30 UTC Tuesday")
-            )
-
-            # Parse "17:30 UTC Tuesday" format
-            try:
-                parts = team_time_str.split()
-                time_part = parts[0]  # "17:30"
-                day_part = parts[2]  # "Tuesday"
-
-                hour, minute = map(int, time_part.split(":"))
-
-                # Map day names to weekday numbers (Monday=0, Sunday=6)
-                day_map = {
-                    "monday": 0,
-                    "tuesday": 1,
-                    "wednesday": 2,
-                    "thursday": 3,
-                    "friday": 4,
-                    "saturday": 5,
-                    "sunday": 6,
-                }
-                target_day = day_map.get(day_part.lower(), 1)  # Default to Tuesday
-
-                # Calculate next occurrence of this day at this time
-                days_ahead = target_day - now.weekday()
-                if days_ahead <= 0:  # Target day already happened this week
-                    days_ahead += 7
-
-                from datetime import time
-
-                event_datetime = datetime.combine(
-                    now.date(), time(hour, minute)
-                ) + timedelta(days=days_ahead)
-                upcoming[team_key] = event_datetime
-
-            except Exception as e:
-                logger.error(
-                    f"Failed to parse event time for {team_key}: {team_time_str}, error: {e}"
-                )
-                # Fallback to Tuesday 17:30 UTC
-                from datetime import time
-
-                days_ahead = 1 - now.weekday()  # Tuesday
-                if days_ahead <= 0:
-                    days_ahead += 7
-                upcoming[team_key] = datetime.combine(
-                    now.date(), time(17, 30)
-                ) + timedelta(days=days_ahead)
-
-        # Get smart notifications service
         smart_notifications_cog = bot.get_cog("NotificationsCog")
-        if not smart_notifications_cog:
+        if not event_manager or not smart_notifications_cog:
             return
 
-        smart_notifications = smart_notifications_cog.smart_notifications
-
-        # Check each team for upcoming events
-        for team_key, event_time in upcoming.items():
-            delta = event_time - now
-            minutes_until = delta.total_seconds() / 60
-
-            # Send reminders at different intervals (60 minutes, 15 minutes, 5 minutes)
-            reminder_times = [60, 15, 5]
-
-            for reminder_minutes in reminder_times:
-                # Check if we're within 1 minute of the reminder time
-                if abs(minutes_until - reminder_minutes) <= 0.5:
-                    logger.info(
-                        f"Sending {reminder_minutes}-minute reminder for {team_key}"
-                    )
-
-                    # Get team members
-                    event_manager = bot.get_cog("EventManager")
-                    if not event_manager:
-                        continue
-
-                    team_members = event_manager.events.get(team_key, [])
-                    if not team_members:
-                        continue
-
-                    # Send smart notifications to each team member
-                    team_display = TEAM_DISPLAY.get(
-                        team_key, team_key.replace("_", " ").title()
-                    )
-                    team_time = event_manager.event_times.get(
-                        team_key, DEFAULT_TIMES.get(team_key, "TBD")
-                    )
-
-                    for member_id in team_members:
-                        try:
-                            content = {
-                                "message": f"Event starting in {reminder_minutes} minutes!",
-                                "details": f"**Team:** {team_display}\n**Time:** {team_time}\n**Starting in:** {reminder_minutes} minutes",
-                            }
+        team_members = event_manager.events.get(team_key, [])
+        if not team_members:
+            return
 
-                            await smart_notifications.send_smart_notification(
-                                str(member_id), "event_reminders", content
-                            )
-                        except Exception as e:
-                            logger.error(
-                                f"Failed to send smart reminder to {member_id}: {e}"
-                            )
+        logger.info(f"Sending {reminder_minutes}-minute reminder for {team_key}")
 
-    except Exception as e:
-        logger.exception(f"Error in smart_event_reminders: {e}")
+        team_display = TEAM_DISPLAY.get(team_key, team_key.replace("_", " ").title())
+        team_time = event_schedule.get_time_string(
+            team_key, DEFAULT_TIMES.get(team_key, "TBD")
+        )
+        content = {
+            "message": f"Event starting in {reminder_minutes} minutes!",
+            "details": f"**Team:** {team_display}\n**Time:** {team_time}\n**Starting in:** {reminder_minutes} minutes",
+        }
 
+        # One batched fan-out per team instead of one await per member
+        await smart_notifications_cog.smart_notifications.send_bulk_notification(
+            list(team_members), "event_reminders", content
+        )
 
-@smart_event_reminders.before_loop
-async def before_smart_event_reminders():
-    """Ensure bot is ready before starting reminders."""
-    # Wait for bot to be ready
-    await asyncio.sleep(45)  # Small delay to ensure bot is fully ready
+    event_schedule.start(send_reminder)
@@ -10,14 +10,25 @@ This module provides:
 - Event reminders and results notifications
 """
 
-from datetime import datetime
-from typing import Any, Dict, List, Optional
+import asyncio
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, Optional
 
 import discord
 from discord.ext import commands, tasks
 
-from config.constants import COLORS, DEFAULT_TIMES, EMOJIS, TEAM_DISPLAY
+from config.constants import (
+    ALERT_CHANNEL_ID,
+    COLORS,
+    DEFAULT_TIMES,
+    EMOJIS,
+    NOTIFICATION_CONFIG,
+    TEAM_DISPLAY,
+)
 from utils.integrated_data_manager import data_manager
+from utils.member_index import member_index
+from utils.notification_queue import deferred_notifications
+from utils.storage import storage
 from utils.logger import setup_logger
 
 logger = setup_logger("smart_notifications")
@@ -33,18 +44,18 @@ class SmartNotifications:
         self.bot = bot
         self.data_manager = data_manager
         self.notification_prefs = {"users": {}, "default_settings": {}}
-        self.notification_queue = []  # Initialize the notification queue
+        self.notification_queue = deferred_notifications
 
     async def load_preferences(self):
-        """Load preferences with integrated manager."""
-        self.notification_prefs = await self.data_manager.load_data(
+        """Load preferences from the shared storage service."""
+        self.notification_prefs = await storage.load(
             "data/notification_preferences.json",
             default={"users": {}, "default_settings": {}},
         )
 
     async def save_preferences(self) -> bool:
         """Save preferences with atomic operations."""
-        return await self.data_manager.save_data(
+        return await storage.save(
             "data/notification_preferences.json",
             self.notification_prefs,
             sync_to_sheets=True,
@@ -131,6 +142,55 @@ class SmartNotifications:
             logger.error(f"Error checking quiet hours for {user_id}: {e}")
             return False
 
+    def quiet_hours_end(self, user_id: str) -> Optional[datetime]:
+        """
+        Get when a user's current quiet hours end.
+
+        Args:
+            user_id: Discord user ID
+
+        Returns:
+            datetime: End of quiet hours in UTC, or None if not in quiet hours
+        """
+        if not self.is_quiet_hours(user_id):
+            return None
+        try:
+            prefs = self.get_user_preferences(user_id)
+            quiet_hours = prefs.get("quiet_hours", {"start": 22, "end": 8})
+            offset = timedelta(hours=prefs.get("timezone_offset", 0))
+
+            user_time = datetime.utcnow() + offset
+            end = user_time.replace(
+                hour=quiet_hours["end"], minute=0, second=0, microsecond=0
+            )
+            if end <= user_time:
+                end += timedelta(days=1)
+            return end - offset
+        except Exception as e:
+            logger.error(f"Error getting quiet hours end for {user_id}: {e}")
+            return None
+
+    async def defer_notification(
+        self,
+        user_id: str,
+        notification_type: str,
+        content: Dict[str, Any],
+        expires_at: Optional[datetime] = None,
+    ) -> bool:
+        """
+        Queue a notification if the user is in quiet hours.
+
+        Returns:
+            bool: True if the notification was queued instead of sent
+        """
+        release_at = self.quiet_hours_end(user_id)
+        if release_at is None:
+            return False
+        await self.notification_queue.push(
+            user_id, notification_type, content, release_at, expires_at
+        )
+        return True
+
     async def update_user_preferences_async(
         self, user_id: str, preferences: Dict[str, Any]
     ) -> bool:
@@ -170,28 +230,24 @@ class SmartNotifications:
 
     async def send_smart_notification(
         self, user_id: str, notification_type: str, content: Dict[str, Any]
-    ):
-        """Send a smart notification based on user preferences."""
+    ) -> bool:
+        """
+        Send a smart notification based on user preferences.
+
+        Returns:
+            bool: True if it was delivered, deferred or not wanted; False if sending failed
+        """
         try:
             user_id = str(user_id)
             prefs = self.get_user_preferences(user_id)
 
             # Check if user wants this type of notification
             if not prefs.get(notification_type, True):
-                return
+                return True
 
-            # Check quiet hours
-            if self.is_quiet_hours(user_id):
-                # Queue for later delivery
-                self.notification_queue.append(
-                    {
-                        "user_id": user_id,
-                        "type": notification_type,
-                        "content": content,
-                        "queued_at": datetime.utcnow(),
-                    }
-                )
-                return
+            # Queue for later delivery during quiet hours
+            if await self.defer_notification(user_id, notification_type, content):
+                return True
 
             # Get notification method
             method = prefs.get("method", "channel")
@@ -200,7 +256,10 @@ class SmartNotifications:
             embed = self._create_notification_embed(notification_type, content)
 
             try:
-                user = await self.bot.fetch_user(int(user_id))
+                user = await self._resolve_user(user_id)
+                if user is None:
+                    logger.warning(f"⚠️ Could not resolve user {user_id} for notification")
+                    return False
                 dm_sent = False
                 channel_sent = False
 
@@ -233,8 +292,6 @@ class SmartNotifications:
                 if method == "channel" or method == "both":
                     try:
                         # Send to main notification channel
-                        from config.constants import ALERT_CHANNEL_ID
-
                         channel = self.bot.get_channel(ALERT_CHANNEL_ID)
                         if channel:
                             await channel.send(f"<@{user_id}>", embed=embed)
@@ -268,15 +325,165 @@ class SmartNotifications:
                     logger.info(
                         f"💬 Delivered notification to {user.display_name} ({user_id}) via channel only"
                     )
+                return dm_sent or channel_sent
 
             except Exception as e:
                 logger.error(f"❌ Failed to send notification to {user_id}: {e}")
                 import traceback
 
                 logger.error(f"Full traceback: {traceback.format_exc()}")
+                return False
 
         except Exception as e:
             logger.error(f"Error in send_smart_notification: {e}")
+            return False
+
+    # ==========================================
+    # BULK DELIVERY
+    # ==========================================
+
+    def _resolve_member_ids(self, members: Iterable[Any]) -> List[str]:
+        """
+        Map roster entries to Discord user IDs.
+
+        Rosters hold IGN strings (or legacy user IDs), so names are looked up
+        in the IGN map first and then among guild member names.
+
+        Args:
+            members: Roster entries (user IDs or IGNs)
+
+        Returns:
+            List[str]: Unique user IDs in roster order; unresolvable entries are dropped
+        """
+        user_ids: Dict[str, None] = {}
+
+        for member in members:
+            text = str(member).strip()
+            user_id = member_index.resolve(text)
+            if user_id is None:
+                logger.warning(f"⚠️ Could not resolve roster entry '{text}' to a user")
+            else:
+                user_ids[user_id] = None
+
+        return list(user_ids)
+
+    async def _resolve_user(
+        self, user_id: str, semaphore: Optional[asyncio.Semaphore] = None
+    ) -> Optional[discord.User]:
+        """Get a user from the client cache, falling back to one REST lookup."""
+        user = self.bot.get_user(int(user_id))
+        if user is not None:
+            return user
+        try:
+            if semaphore is None:
+                return await self.bot.fetch_user(int(user_id))
+            async with semaphore:
+                return await self.bot.fetch_user(int(user_id))
+        except discord.HTTPException as e:
+            logger.warning(f"⚠️ Could not fetch user {user_id}: {e}")
+            return None
+
+    async def _send_channel_batch(self, user_ids: List[str], embed: discord.Embed) -> int:
+        """
+        Deliver one embed to many channel-method users with grouped mentions.
+
+        Returns:
+            int: Number of users mentioned in a successfully sent message
+        """
+        channel = self.bot.get_channel(ALERT_CHANNEL_ID)
+        if not channel:
+            logger.error(f"❌ Alert channel not found (ID: {ALERT_CHANNEL_ID})")
+            return 0
+
+        per_message = NOTIFICATION_CONFIG["MENTIONS_PER_MESSAGE"]
+        delivered = 0
+        for start in range(0, len(user_ids), per_message):
+            chunk = user_ids[start : start + per_message]
+            try:
+                await channel.send(
+                    " ".join(f"<@{user_id}>" for user_id in chunk),
+                    embed=embed,
+                    allowed_mentions=discord.AllowedMentions(
+                        users=True, roles=False, everyone=False
+                    ),
+                )
+                delivered += len(chunk)
+            except discord.HTTPException as e:
+                logger.error(f"❌ Failed to send grouped channel notification: {e}")
+        return delivered
+
+    async def send_bulk_notification(
+        self, members: Iterable[Any], notification_type: str, content: Dict[str, Any]
+    ) -> Dict[str, int]:
+        """
+        Fan one notification out to many users.
+
+        Users are resolved from the client cache before any REST lookup,
+        channel-method users share one grouped message, and DMs are sent
+        concurrently under a bounded semaphore (discord.py still handles the
+        per-route rate-limit buckets).
+
+        Args:
+            members: Roster entries (user IDs or IGNs)
+            notification_type: Preference key (event_reminders, team_updates, ...)
+            content: Notification content for the embed
+
+        Returns:
+            Dict[str, int]: Counts of dm, channel, queued, skipped and failed deliveries
+        """
+        summary = {"dm": 0, "channel": 0, "queued": 0, "skipped": 0, "failed": 0}
+        embed = self._create_notification_embed(notification_type, content)
+
+        dm_targets: List[tuple] = []
+        channel_targets: Dict[str, None] = {}
+        for user_id in self._resolve_member_ids(members):
+            prefs = self.get_user_preferences(user_id)
+            if not prefs.get(notification_type, True):
+                summary["skipped"] += 1
+                continue
+
+            if await self.defer_notification(user_id, notification_type, content):
+                summary["queued"] += 1
+                continue
+
+            method = prefs.get("method", "channel")
+            if method in ("dm", "both"):
+                dm_targets.append((user_id, method))
+            if method in ("channel", "both"):
+                channel_targets[user_id] = None
+
+        semaphore = asyncio.Semaphore(NOTIFICATION_CONFIG["DM_CONCURRENCY"])
+
+        async def _send_dm(user_id: str) -> bool:
+            user = await self._resolve_user(user_id, semaphore)
+            if user is None:
+                return False
+            async with semaphore:
+                try:
+                    await user.send(embed=embed)
+                    return True
+                except discord.HTTPException as e:
+                    logger.warning(f"⚠️ Cannot send DM to {user_id}: {e}")
+                    return False
+
+        results = await asyncio.gather(*(_send_dm(user_id) for user_id, _ in dm_targets))
+        for (user_id, method), sent in zip(dm_targets, results):
+            if sent:
+                summary["dm"] += 1
+            elif method == "dm":
+                # Fallback to channel if DM-only failed
+                channel_targets[user_id] = None
+
+        if channel_targets:
+            delivered = await self._send_channel_batch(list(channel_targets), embed)
+            summary["channel"] += delivered
+            summary["failed"] += len(channel_targets) - delivered
+
+        logger.info(
+            f"📨 {notification_type} fan-out: {summary['dm']} DM, {summary['channel']} channel, "
+            f"{summary['queued']} queued, {summary['skipped']} opted out, {summary['failed']} failed"
+        )
+        return summary
 
     def _create_notification_embed(
         self, notification_type: str, content: Dict[str, Any]
@@ -321,32 +528,41 @@ class SmartNotifications:
         return embed
 
     async def process_notification_queue(self):
-        """Process queued notifications for users who were in quiet hours."""
+        """Deliver queued notifications whose quiet hours have ended."""
         try:
-            processed = []
+            await self.notification_queue.load()
+            for entry_id, notification in await self.notification_queue.pop_due():
+                # pop_due took every due entry off the heap, so a bad entry
+                # must be rescheduled here rather than abandon the rest
+                try:
+                    delivered = await self._deliver_queued(notification)
+                except Exception as e:
+                    logger.error(f"Error delivering queued notification {entry_id}: {e}")
+                    delivered = False
 
-            for notification in self.notification_queue[:]:
-                user_id = notification["user_id"]
+                # Only forget the entry once it was actually delivered
+                if delivered:
+                    await self.notification_queue.ack(entry_id)
+                else:
+                    await self.notification_queue.retry(entry_id)
 
-                # Check if still in quiet hours
-                if not self.is_quiet_hours(user_id):
-                    await self.send_smart_notification(
-                        user_id, notification["type"], notification["content"]
-                    )
-                    processed.append(notification)
+        except Exception as e:
+            logger.error(f"Error processing notification queue: {e}")
 
-                # Remove old queued notifications (24+ hours)
-                elif (
-                    datetime.utcnow() - notification["queued_at"]
-                ).total_seconds() > 86400:
-                    processed.append(notification)
+    async def _deliver_queued(self, notification: Dict) -> bool:
+        """Deliver (or re-defer) one queued notification; True once handled."""
+        user_id = notification["user_id"]
+        expires_at = datetime.fromisoformat(notification["expires_at"])
 
-            # Remove processed notifications
-            for notification in processed:
-                self.notification_queue.remove(notification)
+        # Preferences may have changed since queuing; keep the original expiry
+        if await self.defer_notification(
+            user_id, notification["type"], notification["content"], expires_at
+        ):
+            return True
 
-        except Exception as e:
-            logger.error(f"Error processing notification queue: {e}")
+        return await self.send_smart_notification(
+            user_id, notification["type"], notification["content"]
+        )
 
     async def send_event_reminders(self, team_key: str, minutes_before: List[int]):
         """Send event reminders to team members."""
@@ -358,19 +574,12 @@ class SmartNotifications:
 
             team_members = event_manager.events.get(team_key, [])
 
-            for member_id in team_members:
-                prefs = self.get_user_preferences(member_id)
-
-                if prefs.get("event_reminders", True):
-                    for minutes in minutes_before:
-                        content = {
-                            "message": f"Event starting in {minutes} minutes!",
-                            "details": f"Team: {team_key.replace('_', ' ').title()}\nTime: {minutes} minutes from now",
-                        }
-
-                        await self.send_smart_notification(
-                            member_id, "event_reminders", content
-                        )
+            for minutes in minutes_before:
+                content = {
+                    "message": f"Event starting in {minutes} minutes!",
+                    "details": f"Team: {team_key.replace('_', ' ').title()}\nTime: {minutes} minutes from now",
+                }
+                await self.send_bulk_notification(team_members, "event_reminders", content)
 
         except Exception as e:
             logger.error(f"Error sending event reminders: {e}")
@@ -408,6 +617,10 @@ class SmartNotifications:
                 # Try to get actual usernames
                 roster_names = []
                 for member_id in team_members:
+                    if not str(member_id).isdigit():
+                        # Rosters already store IGNs
+                        roster_names.append(str(member_id))
+                        continue
                     try:
                         user = self.bot.get_user(int(member_id))
                         if user:
@@ -435,30 +648,15 @@ class SmartNotifications:
 
             details = f"**Team:** {team_display}\n**Scheduled Time:** {team_time}{team_roster}"
 
-            # Send reminder to each team member
-            successful_sends = 0
-            for member_id in team_members:
-                try:
-                    prefs = self.get_user_preferences(str(member_id))
-
-                    # Check if user wants team update notifications
-                    if prefs.get("team_updates", True):
-                        content = {
-                            "message": message,
-                            "details": details,
-                            "team": team_key,
-                            "team_display": team_display,
-                        }
-
-                        await self.send_smart_notification(
-                            str(member_id), "team_updates", content
-                        )
-                        successful_sends += 1
-                    else:
-                        logger.debug(f"User {member_id} has team updates disabled")
-
-                except Exception as e:
-                    logger.error(f"Failed to send team reminder to {member_id}: {e}")
+            # Fan the reminder out to the whole team at once
+            content = {
+                "message": message,
+                "details": details,
+                "team": team_key,
+                "team_display": team_display,
+            }
+            summary = await self.send_bulk_notification(team_members, "team_updates", content)
+            successful_sends = summary["dm"] + summary["channel"]
 
             logger.info(
                 f"Sent team-specific reminders to {successful_sends}/{len(team_members)} members of {team_display}"
@@ -518,16 +716,12 @@ class SmartNotifications:
             result_text = "Victory!" if won else "Defeat"
             emoji = EMOJIS["SUCCESS"] if won else EMOJIS["ERROR"]
 
-            for player_id in players:
-                content = {
-                    "message": f"{emoji} {result_text}",
-                    "won": won,
-                    "details": f"Team: {team_key.replace('_', ' ').title()}",
-                }
-
-                await self.send_smart_notification(
-                    player_id, "result_notifications", content
-                )
+            content = {
+                "message": f"{emoji} {result_text}",
+                "won": won,
+                "details": f"Team: {team_key.replace('_', ' ').title()}",
+            }
+            await self.send_bulk_notification(players, "result_notifications", content)
 
         except Exception as e:
             logger.error(f"Error notifying match result: {e}")
@@ -850,14 +1044,16 @@ class NotificationsCog(commands.Cog):
     def cog_unload(self):
         self.process_queue.cancel()
 
-    @tasks.loop(minutes=10)
+    @tasks.loop(minutes=1)
     async def process_queue(self):
-        """Process notification queue periodically."""
+        """Deliver due queued notifications (only due entries are popped)."""
         await self.smart_notifications.process_notification_queue()
 
     @process_queue.before_loop
     async def before_process_queue(self):
         await self.bot.wait_until_ready()
+        await self.smart_notifications.load_preferences()
+        await self.smart_notifications.notification_queue.load()
 
     @commands.group(name="notifications", aliases=["notif"])
     async def notifications(self, ctx):
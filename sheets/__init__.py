@@ -5,9 +5,15 @@ This module provides a clean interface for syncing bot data with Google Sheets.
 Falls back gracefully if sheets integration is not available.
 """
 
+from .async_engine import AsyncSheetsEngine, get_engine
 from .manager import SheetsManager
+from .quota import Priority, quota_manager
+from .shared import get_sheets_manager, shared_sheets
 
-__all__ = ['SheetsManager']
+__all__ = [
+    'SheetsManager', 'AsyncSheetsEngine', 'get_engine', 'get_sheets_manager', 'shared_sheets',
+    'Priority', 'quota_manager',
+]
 
 # Version info
 __version__ = "1.0.0"
\ No newline at end of file
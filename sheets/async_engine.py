@@ -0,0 +1,275 @@
+"""
+Asyncio front-end for the Google Sheets manager.
+
+gspread is a blocking library, so every sheets call made from a cog would
+otherwise stall the Discord event loop (and the gateway heartbeat) for the
+whole duration of a sync. The engine runs those calls on a dedicated
+single-worker executor and paces admission with the shared quota manager,
+so callers simply ``await`` the sync methods.
+
+Queued work is dispatched by priority: an interactive sync submitted while
+a template rebuild is waiting goes first, and the priority travels with the
+job onto the worker thread so its requests use the matching quota floor.
+"""
+
+import asyncio
+import functools
+import heapq
+import itertools
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from config.constants import SHEETS_CONFIG
+from utils.logger import setup_logger
+
+from .quota import Priority, quota_manager
+
+logger = setup_logger("sheets_async_engine")
+
+
+class AsyncSheetsEngine:
+    """
+    Awaitable wrapper around a SheetsManager instance.
+
+    Features:
+    - Dedicated executor so Sheets work never runs on the event loop
+    - Serialised access to the (non thread-safe) gspread client
+    - Async quota admission before work is queued
+    - Priority dispatch: interactive work jumps queued bulk/maintenance jobs
+    - Graceful degradation when sheets are not connected
+    - Work submitted before a deferred connect waits for it
+    """
+
+    def __init__(self, manager, max_workers: int = 1):
+        """
+        Initialize the engine.
+
+        Args:
+            manager: SheetsManager (or compatible) instance to wrap
+            max_workers: Executor threads; keep at 1 so gspread calls never overlap
+        """
+        self.manager = manager
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._max_workers = max_workers
+        self._closed = False
+        self._gate: Optional[asyncio.Event] = None
+        self._running = 0
+        self._waiting: List[Tuple[int, int, asyncio.Future]] = []
+        self._sequence = itertools.count()
+
+    def _get_executor(self) -> ThreadPoolExecutor:
+        """Create the executor on first use."""
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self._max_workers, thread_name_prefix="sheets-engine"
+            )
+        return self._executor
+
+    def is_connected(self) -> bool:
+        """Check if the wrapped manager is connected."""
+        try:
+            return bool(self.manager and self.manager.is_connected())
+        except Exception:
+            return False
+
+    def hold(self):
+        """Make run() wait for connect(); call on the event loop before the connect starts."""
+        if self._gate is None:
+            self._gate = asyncio.Event()
+
+    async def connect(self) -> bool:
+        """
+        Connect the manager on the engine executor, then release held work.
+
+        Returns:
+            bool: True if connected
+        """
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._get_executor(), self.manager.connect)
+        finally:
+            if self._gate is not None:
+                self._gate.set()
+                self._gate = None
+
+    async def _wait_for_connect(self):
+        gate = self._gate
+        if gate is None:
+            return
+        timeout = SHEETS_CONFIG.get("CONNECT_HOLD_TIMEOUT", 120)
+        try:
+            await asyncio.wait_for(gate.wait(), timeout)
+        except asyncio.TimeoutError:
+            # Run anyway; the sheets methods fail gracefully when not connected
+            logger.warning(f"⚠️ Sheets connect still pending after {timeout}s, running queued work")
+
+    # ==========================================
+    # PRIORITY DISPATCH
+    # ==========================================
+
+    async def _enter(self, priority: int):
+        """Wait for a free worker slot; lower priority values are served first."""
+        if self._running < self._max_workers and not self._waiting:
+            self._running += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiting, (priority, next(self._sequence), waiter))
+        try:
+            await waiter  # The slot is handed over by _leave()
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                self._leave()  # Slot was handed over as we were cancelled
+            raise
+
+    def _leave(self):
+        """Hand the worker slot to the most urgent waiter, if any."""
+        while self._waiting:
+            _, _, waiter = heapq.heappop(self._waiting)
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._running -= 1
+
+    def _in_scope(self, priority: int, call: Callable) -> Any:
+        """Run a call on the worker thread at the given priority."""
+        with quota_manager.priority_scope(priority):
+            return call()
+
+    async def run(
+        self, func: Callable, *args, priority: int = Priority.INTERACTIVE, **kwargs
+    ) -> Any:
+        """
+        Run a blocking sheets callable on the engine executor.
+
+        Args:
+            func: Blocking function to execute
+            *args, **kwargs: Arguments for the function
+            priority: Priority class (see sheets.quota.Priority)
+
+        Returns:
+            Result of the function
+        """
+        if self._closed:
+            raise RuntimeError("Sheets engine has been shut down")
+
+        await self._wait_for_connect()
+
+        await self._enter(priority)
+        try:
+            # Wait out any token debt here so backlog piles up on the loop, not the executor
+            await quota_manager.admit(priority)
+            loop = asyncio.get_running_loop()
+            call = functools.partial(func, *args, **kwargs)
+            return await loop.run_in_executor(
+                self._get_executor(), self._in_scope, priority, call
+            )
+        finally:
+            self._leave()
+
+    async def call(
+        self,
+        method_name: str,
+        *args,
+        default: Any = False,
+        priority: int = Priority.INTERACTIVE,
+        **kwargs,
+    ) -> Any:
+        """
+        Call a SheetsManager method by name without blocking the event loop.
+
+        Args:
+            method_name: Name of the manager method
+            default: Value returned when the method is missing or fails
+            priority: Priority class (see sheets.quota.Priority)
+
+        Returns:
+            Method result, or ``default`` if unavailable or failed
+        """
+        method = getattr(self.manager, method_name, None)
+        if method is None:
+            logger.debug(f"⚠️ Sheets method '{method_name}' not available")
+            return default
+
+        try:
+            return await self.run(method, *args, priority=priority, **kwargs)
+        except Exception as e:
+            logger.error(f"❌ Sheets operation {method_name} failed: {e}")
+            return default
+
+    # ==========================================
+    # AWAITABLE SYNC METHODS
+    # ==========================================
+
+    async def sync_current_teams(self, events_data: Dict) -> bool:
+        """Awaitable version of SheetsManager.sync_current_teams."""
+        return await self.call("sync_current_teams", events_data)
+
+    async def sync_player_stats(self, player_stats: Dict) -> bool:
+        """Awaitable version of SheetsManager.sync_player_stats."""
+        return await self.call("sync_player_stats", player_stats)
+
+    async def sync_match_results(self, results_data: Dict) -> bool:
+        """Awaitable version of SheetsManager.sync_match_results."""
+        return await self.call("sync_match_results", results_data)
+
+    async def sync_all_data(self, bot_data: Dict[str, Any]) -> bool:
+        """Awaitable version of SheetsManager.sync_all_data."""
+        return await self.call("sync_all_data", bot_data, priority=Priority.SYNC)
+
+    async def create_all_templates(self, bot_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Awaitable version of SheetsManager.create_all_templates."""
+        return await self.call(
+            "create_all_templates",
+            bot_data,
+            default={"connected": False, "error": "Template creation failed"},
+            priority=Priority.MAINTENANCE,
+        )
+
+    async def load_data_from_sheets(self) -> Optional[Dict[str, Any]]:
+        """Awaitable version of SheetsManager.load_data_from_sheets."""
+        return await self.call("load_data_from_sheets", default=None)
+
+    async def get_worksheet_list(self) -> list:
+        """Awaitable version of SheetsManager.get_worksheet_list."""
+        return await self.call("get_worksheet_list", default=[])
+
+    async def shutdown(self, wait: bool = True):
+        """
+        Stop accepting work and shut the executor down.
+
+        Args:
+            wait: Whether to wait for queued sheets work to finish
+        """
+        self._closed = True
+        if self._executor is not None:
+            executor, self._executor = self._executor, None
+            await asyncio.get_running_loop().run_in_executor(
+                None, functools.partial(executor.shutdown, wait=wait)
+            )
+            logger.info("✅ Sheets engine shut down")
+
+
+def get_engine(manager) -> Optional[AsyncSheetsEngine]:
+    """
+    Get the async engine attached to a sheets manager.
+
+    Args:
+        manager: SheetsManager instance (may be None)
+
+    Returns:
+        AsyncSheetsEngine or None if no manager is available
+    """
+    if manager is None:
+        return None
+
+    engine = getattr(manager, "engine", None)
+    if isinstance(engine, AsyncSheetsEngine):
+        return engine
+
+    engine = AsyncSheetsEngine(manager)
+    try:
+        manager.engine = engine
+    except AttributeError:
+        pass
+    return engine
@@ -6,9 +6,30 @@ import gspread
 from google.oauth2.service_account import Credentials
 import json
 import os
-import time
+import threading
 from typing import Optional
 from utils.logger import setup_logger
+from .quota import READ, WRITE, quota_manager
+
+# gspread methods charged to the read quota; anything else counts as a write
+READ_METHODS = frozenset({
+    "acell",
+    "batch_get",
+    "cell",
+    "col_values",
+    "fetch_sheet_metadata",
+    "find",
+    "findall",
+    "get",
+    "get_all_records",
+    "get_all_values",
+    "get_values",
+    "get_worksheet",
+    "range",
+    "row_values",
+    "worksheet",
+    "worksheets",
+})
 
 logger = setup_logger("sheets_client")
 
@@ -18,10 +39,47 @@ class SheetsClient:
     def __init__(self):
         self.gc: Optional[gspread.Client] = None
         self.spreadsheet: Optional[gspread.Spreadsheet] = None
-        self._last_request_time = 0
-        self._min_request_interval = 1.0  # 1 second between requests (more conservative)
-        self._request_count = 0
-        self._max_requests_per_minute = 50  # Conservative limit
+        self.quota = quota_manager  # Shared across all clients
+        self.initialized = False
+        self._connect_lock = threading.Lock()
+        self._connect_scheduled = False
+        self._connect_done = threading.Event()
+
+    def connect(self) -> bool:
+        """
+        Connect once, on first call (thread-safe).
+
+        Later calls return straight away with the outcome of the first
+        attempt, so a shared client never authorizes twice.
+
+        Returns:
+            bool: True if connected
+        """
+        with self._connect_lock:
+            if not self._connect_done.is_set():
+                self._connect_scheduled = True
+                self.initialized = self.initialize()
+                self._connect_done.set()
+        return self.is_connected()
+
+    def schedule_connect(self):
+        """Mark a background connect as pending, so callers queue work instead of dropping it."""
+        self._connect_scheduled = True
+
+    def is_connecting(self) -> bool:
+        """Check if a connect is scheduled or running but not finished yet."""
+        return self._connect_scheduled and not self._connect_done.is_set()
+
+    def wait_until_connected(self, timeout: Optional[float] = None) -> bool:
+        """
+        Block until a pending connect finishes.
+
+        Returns:
+            bool: True if connected
+        """
+        if self.is_connecting():
+            self._connect_done.wait(timeout)
+        return self.is_connected()
 
     def initialize(self) -> bool:
         """Initialize Google Sheets client with service account credentials."""
@@ -74,13 +132,20 @@ class SheetsClient:
         """Check if sheets connection is active."""
         return self.gc is not None and self.spreadsheet is not None
 
-    def _rate_limit(self):
-        """Simple rate limiting to avoid API quota issues."""
-        current_time = time.time()
-        time_since_last = current_time - self._last_request_time
-        if time_since_last < self._min_request_interval:
-            time.sleep(self._min_request_interval - time_since_last)
-        self._last_request_time = time.time()
+    def _rate_limit(self, kind: str = WRITE):
+        """
+        Wait for read or write quota before calling the Sheets API.
+
+        Blocks the calling thread, so sync methods should run on the
+        AsyncSheetsEngine executor rather than on the event loop.
+        """
+        self.quota.acquire_blocking(kind)
+
+    @staticmethod
+    def _request_kind(operation) -> str:
+        """Whether a gspread call reads or writes (by method name)."""
+        name = getattr(operation, "__name__", "")
+        return READ if name in READ_METHODS else WRITE
 
     def get_or_create_worksheet(self, title: str, rows: int = 100, cols: int = 10):
         """Get existing worksheet or create new one with rate limiting."""
@@ -88,12 +153,12 @@ class SheetsClient:
             return None
 
         try:
-            self._rate_limit()
-            return self.spreadsheet.worksheet(title)
+            return self.quota.call(READ, self.spreadsheet.worksheet, title)
         except gspread.WorksheetNotFound:
             try:
-                self._rate_limit()
-                worksheet = self.spreadsheet.add_worksheet(title=title, rows=rows, cols=cols)
+                worksheet = self.quota.call(
+                    WRITE, self.spreadsheet.add_worksheet, title=title, rows=rows, cols=cols
+                )
                 logger.info(f"Created new worksheet: {title}")
                 return worksheet
             except Exception as e:
@@ -104,13 +169,12 @@ class SheetsClient:
             return None
 
     def safe_worksheet_operation(self, worksheet, operation, *args, **kwargs):
-        """Execute worksheet operation with error handling and rate limiting."""
+        """Execute worksheet operation with error handling, quota admission and retries."""
         if not worksheet:
             return None
 
         try:
-            self._rate_limit()
-            return operation(*args, **kwargs)
+            return self.quota.call(self._request_kind(operation), operation, *args, **kwargs)
         except Exception as e:
             logger.error(f"Worksheet operation failed: {e}")
             return None
\ No newline at end of file
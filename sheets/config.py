@@ -60,12 +60,19 @@ SHEET_CONFIGS = {
 # Enhanced rate limiting settings
 RATE_LIMIT_SETTINGS = {
     "requests_per_minute": 60,        # Conservative limit
-    "batch_size": 20,                 # Smaller batches
+    "read_requests_per_minute": 60,   # Google per-user read quota
+    "write_requests_per_minute": 60,  # Google per-user write quota
+    "batch_size": 20,                 # Smaller batches (also the token bucket burst)
     "delay_between_operations": 2.0,  # Seconds
     "delay_between_batches": 5.0,     # Seconds
     "delay_between_rows": 0.5,        # Seconds
     "max_retries": 3,
-    "retry_delay": 2.0
+    "retry_delay": 2.0,               # Base backoff delay (doubles per attempt, jittered)
+    "max_retry_delay": 60.0,          # Backoff ceiling
+    "sync_reserve": 0.25,             # Share of the burst bulk syncs leave for interactive syncs
+    "maintenance_reserve": 0.5,       # Share of the burst templates/formatting leave free
+    "min_rate_factor": 0.2,           # Lowest fraction of quota used after repeated 429s
+    "recovery_step": 0.05,            # Rate fraction regained per successful request
 }
 
 # Retry settings
@@ -2,10 +2,11 @@
 Main Google Sheets manager class - the primary interface for the bot.
 """
 
-import time
 from typing import Dict, List, Any, Optional
 from datetime import datetime
+from .async_engine import AsyncSheetsEngine
 from .operations import SheetsOperations
+from .quota import READ, Priority
 from .config import SHEET_CONFIGS
 from utils.logger import setup_logger
 
@@ -20,169 +21,22 @@ class SheetsManager(SheetsOperations):
     """
 
 
-    def create_notification_preferences(self, notification_data=None):
-        """Create Notification Preferences sheet template."""
-        if not self.spreadsheet:
-            return False
-
-        try:
-            try:
-                worksheet = self.spreadsheet.worksheet("Notification Preferences")
-                worksheet.clear()
-            except:
-                worksheet = self.spreadsheet.add_worksheet(title="Notification Preferences", rows="100", cols="9")
-
-            # Headers
-            headers = ["👤 User ID", "📝 Display Name", "📢 Event Alerts", "🏆 Result Notifications", "⚠️ Error Alerts", "📱 DM Notifications", "🕐 Reminder Time", "🌍 Timezone", "📅 Last Updated"]
-            worksheet.append_row(headers)
-
-            # Format header
-            worksheet.format("A1:I1", {
-                "backgroundColor": {"red": 0.4, "green": 0.7, "blue": 0.4},
-                "textFormat": {
-                    "foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                    "fontSize": 12,
-                    "bold": True
-                },
-                "horizontalAlignment": "CENTER"
-            })
-
-            # Freeze header
-            worksheet.freeze(rows=1)
-
-            # Add sample notification preferences
-            sample_preferences = [
-                ["123456789", "TestUser1", "✅ Enabled", "✅ Enabled", "❌ Disabled", "✅ Enabled", "30 minutes", "UTC-5", datetime.utcnow().strftime("%Y-%m-%d")],
-                ["987654321", "TestUser2", "✅ Enabled", "❌ Disabled", "✅ Enabled", "❌ Disabled", "1 hour", "UTC+0", datetime.utcnow().strftime("%Y-%m-%d")],
-                ["111222333", "TestUser3", "❌ Disabled", "✅ Enabled", "✅ Enabled", "✅ Enabled", "2 hours", "UTC+8", datetime.utcnow().strftime("%Y-%m-%d")]
-            ]
-
-            for i, pref_data in enumerate(sample_preferences, 2):
-                worksheet.append_row(pref_data)
-
-            # Add data validation for preference columns
-            enabled_options = ["✅ Enabled", "❌ Disabled"]
-            worksheet.add_validation("C2:F100", "ONE_OF_LIST", enabled_options)
-
-            time_options = ["15 minutes", "30 minutes", "1 hour", "2 hours", "6 hours", "24 hours"]
-            worksheet.add_validation("G2:G100", "ONE_OF_LIST", time_options)
-
-            # Add borders
-            worksheet.format("A1:I100", {"borders": {"style": "SOLID", "width": 1}})
-
-            # Auto-resize columns
-            worksheet.columns_auto_resize(0, 9)
-
-            # Add instructions section
-            instruction_row = len(sample_preferences) + 4
-            worksheet.update(f'A{instruction_row}', '💡 INSTRUCTIONS:')
-            worksheet.format(f"A{instruction_row}:I{instruction_row}", {
-                "backgroundColor": {"red": 0.9, "green": 0.9, "blue": 1.0},
-                "textFormat": {"fontSize": 12, "bold": True},
-                "horizontalAlignment": "LEFT"
-            })
-
-            instructions = [
-                "• Modify preferences directly in this sheet",
-                "• Changes sync automatically with the bot",
-                "• Use dropdowns for consistent formatting",
-                "• Contact admin for timezone changes"
-            ]
-
-            for i, instruction in enumerate(instructions):
-                worksheet.update(f'A{instruction_row + 1 + i}', instruction)
-
-            logger.info("✅ Created Notification Preferences sheet")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to create notification preferences: {e}")
-            return False
-
-    def create_results_history_template(self, results_data=None):
-        """Create Results History sheet template."""
-        if not self.spreadsheet:
-            return False
-
-        try:
-            try:
-                worksheet = self.spreadsheet.worksheet("Results History")
-                worksheet.clear()
-            except:
-                worksheet = self.spreadsheet.add_worksheet(title="Results History", rows="200", cols="8")
-
-            # Headers with emojis
-            headers = ["📅 Date", "👥 Team", "🎯 Result", "🎮 Players", "👤 Recorded By", "🏆 Match Score", "📊 Running Total", "💪 Performance"]
-            worksheet.append_row(headers)
-
-            # Format header row
-            worksheet.format("A1:H1", {
-                "backgroundColor": {"red": 0.2, "green": 0.4, "blue": 0.8},
-                "textFormat": {
-                    "foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
-                    "fontSize": 12,
-                    "bold": True
-                },
-                "horizontalAlignment": "CENTER"
-            })
-
-            # Freeze header row
-            worksheet.freeze(rows=1)
-
-            # Add sample data
-            sample_results = [
-                ["2025-01-15", "Main Team", "Win", "Player1,Player2,Player3", "Admin", "🏆 WIN", "1W - 0L", "🔥 Great start!"],
-                ["2025-01-14", "Team 2", "Loss", "Player4,Player5,Player6", "Admin", "❌ LOSS", "0W - 1L", "💪 Next time!"],
-                ["2025-01-13", "Team 3", "Win", "Player7,Player8,Player9", "Admin", "🏆 WIN", "1W - 0L", "🎯 Excellent!"]
-            ]
-
-            for i, result_data in enumerate(sample_results, 2):
-                worksheet.append_row(result_data)
-
-                # Color code results
-                if "Win" in result_data[2]:
-                    worksheet.format(f"A{i}:H{i}", {
-                        "backgroundColor": {"red": 0.85, "green": 1.0, "blue": 0.85}
-                    })
-                else:
-                    worksheet.format(f"A{i}:H{i}", {
-                        "backgroundColor": {"red": 1.0, "green": 0.9, "blue": 0.9}
-                    })
-
-            # Add borders
-            worksheet.format("A1:H100", {"borders": {"style": "SOLID", "width": 1}})
-
-            # Auto-resize columns
-            worksheet.columns_auto_resize(0, 8)
-
-            # Add summary section
-            summary_row = len(sample_results) + 4
-            worksheet.update(f'A{summary_row}', '📊 SUMMARY STATISTICS')
-            worksheet.format(f"A{summary_row}:H{summary_row}", {
-                "backgroundColor": {"red": 0.8, "green": 0.8, "blue": 0.8},
-                "textFormat": {"fontSize": 14, "bold": True},
-                "horizontalAlignment": "CENTER"
-            })
-
-            summary_row += 1
-            worksheet.update(f'A{summary_row}', 'Total Wins: 2')
-            worksheet.update(f'C{summary_row}', 'Total Losses: 1')
-            worksheet.update(f'E{summary_row}', 'Win Rate: 66.7%')
-
-            logger.info("✅ Created Results History sheet template")
-            return True
-
-        except Exception as e:
-            logger.error(f"Failed to create results history template: {e}")
-            return False
-
     # Also add this import at the top of your services/sheets_manager.py file if it's not already there:
     from datetime import datetime
 
-    def __init__(self):
-        """Initialize the sheets manager."""
-        super().__init__()
-        if self.initialized:
+    def __init__(self, connect: bool = True):
+        """
+        Initialize the sheets manager.
+
+        Args:
+            connect: Connect now; pass False to defer until connect() (see sheets.shared)
+        """
+        super().__init__(connect=connect)
+        # Awaitable front-end used by cogs so sheets work stays off the event loop
+        self.engine = AsyncSheetsEngine(self)
+        if not connect:
+            logger.debug("Google Sheets connection deferred")
+        elif self.initialized:
             logger.info("✅ Google Sheets integration ready")
         else:
             logger.info("ℹ️ Google Sheets integration not available (credentials not found)")
@@ -208,23 +62,17 @@ class SheetsManager(SheetsOperations):
         logger.info("🔄 Starting batch data sync to Google Sheets...")
         success_count = 0
 
-        # Use batch operations with delays between major sync operations
-        import time
-
+        # Each request is paced by the shared token bucket in SheetsClient
         operations = [
             ("current teams", lambda: self.sync_current_teams(bot_data.get("events", {}))),
             ("player stats", lambda: self.sync_player_stats(bot_data.get("player_stats", {}))),
             ("match results", lambda: self.sync_match_results(bot_data.get("results", {})))
         ]
 
-        for i, (name, operation) in enumerate(operations):
+        for name, operation in operations:
             try:
                 logger.info(f"Syncing {name}...")
 
-                # Add delay between major operations to respect rate limits
-                if i > 0:
-                    time.sleep(3)  # 3 second delay between major sync operations
-
                 if operation():
                     success_count += 1
                     logger.info(f"✅ Synced {name}")
@@ -251,7 +99,6 @@ class SheetsManager(SheetsOperations):
         if not self.is_connected():
             return {"connected": False}
 
-        import time
         results = {"connected": True}
 
         try:
@@ -259,9 +106,6 @@ class SheetsManager(SheetsOperations):
             logger.info("Quick syncing current teams...")
             results["teams"] = self.sync_current_teams(events_data)
 
-            # Small delay before player stats
-            time.sleep(2)
-
             # Sync essential player stats only (limit to active players)
             logger.info("Quick syncing active player stats...")
             active_players = {k: v for k, v in player_stats.items() if v.get("total_events", 0) > 0}
@@ -304,6 +148,7 @@ class SheetsManager(SheetsOperations):
         info = {
             "connected": self.is_connected(),
             "initialized": self.initialized,
+            "connecting": self.is_connecting(),
             "spreadsheet_url": None,
             "spreadsheet_id": None,
             "worksheets": []
@@ -338,7 +183,7 @@ class SheetsManager(SheetsOperations):
             return []
 
         try:
-            worksheets = self.spreadsheet.worksheets()
+            worksheets = self.quota.call(READ, self.spreadsheet.worksheets)
             return [ws.title for ws in worksheets]
         except Exception as e:
             logger.error(f"Failed to get worksheet list: {e}")
@@ -458,6 +303,9 @@ class SheetsManager(SheetsOperations):
         """
         Scan Discord guild and sync all members to Player Stats sheet.
 
+        Member data is snapshotted on the event loop, then the blocking
+        sheet writes run on the async engine's executor.
+
         Args:
             bot: Discord bot instance
             guild_id: Guild ID to scan
@@ -468,14 +316,40 @@ class SheetsManager(SheetsOperations):
         if not self.is_connected():
             return {"success": False, "error": "Sheets not connected"}
 
+        logger.info(f"🔍 Scanning Discord guild {guild_id} for members...")
+
+        # Get the guild
+        guild = bot.get_guild(guild_id)
+        if not guild:
+            return {"success": False, "error": f"Guild {guild_id} not found"}
+
+        # Skip bots and snapshot only what the sheet needs
+        members = [
+            (str(member.id), member.display_name)
+            for member in guild.members
+            if not member.bot
+        ]
+
         try:
-            logger.info(f"🔍 Scanning Discord guild {guild_id} for members...")
+            return await self.engine.run(
+                self._sync_member_rows, guild.name, members, priority=Priority.SYNC
+            )
+        except Exception as e:
+            logger.error(f"❌ Failed to sync Discord members: {e}")
+            return {"success": False, "error": str(e)}
 
-            # Get the guild
-            guild = bot.get_guild(guild_id)
-            if not guild:
-                return {"success": False, "error": f"Guild {guild_id} not found"}
+    def _sync_member_rows(self, guild_name: str, members: List[tuple]) -> Dict[str, Any]:
+        """
+        Blocking half of scan_and_sync_all_members.
 
+        Args:
+            guild_name: Name of the scanned guild
+            members: List of (user_id, display_name) tuples
+
+        Returns:
+            Dictionary with sync results
+        """
+        try:
             # Get or create Player Stats worksheet (sync to existing sheet)
             config = SHEET_CONFIGS["Player Stats"]
             worksheet = self.get_or_create_worksheet("Player Stats", config["rows"], config["cols"])
@@ -483,6 +357,7 @@ class SheetsManager(SheetsOperations):
                 return {"success": False, "error": "Failed to get Player Stats worksheet"}
 
             logger.info("🔄 Syncing Discord members to existing Player Stats sheet...")
+            self._player_stats_shadow.reset()
 
             # Get existing data to preserve stats
             existing_data = self.safe_worksheet_operation(worksheet, worksheet.get_all_values)
@@ -507,24 +382,18 @@ class SheetsManager(SheetsOperations):
             new_members_added = 0
             existing_members_updated = 0
 
-            for member in guild.members:
-                # Skip bots
-                if member.bot:
-                    continue
-
-                user_id = str(member.id)
-                
+            for user_id, display_name in members:
                 if user_id in existing_players:
                     # Update existing member data (preserve stats, update name)
                     row = existing_players[user_id].copy()
                     if len(row) > 1:
-                        row[1] = member.display_name  # Update display name
+                        row[1] = display_name  # Update display name
                     existing_members_updated += 1
                 else:
                     # New member - create fresh row
                     row = [
                         user_id,
-                        member.display_name,
+                        display_name,
                         "ENTER_POWER_HERE",  # Power rating placeholder
                         0, 0,  # Main team wins/losses
                         0, 0,  # Team 2 wins/losses  
@@ -536,13 +405,11 @@ class SheetsManager(SheetsOperations):
                     new_members_added += 1
 
                 # Add the row
-                time.sleep(0.3)  # Rate limiting
                 result = self.safe_worksheet_operation(worksheet, worksheet.append_row, row)
                 if result is None:
-                    logger.warning(f"Failed to add member: {member.display_name}")
+                    logger.warning(f"Failed to add member: {display_name}")
 
             # Apply formatting
-            time.sleep(2)
             self._apply_header_formatting(worksheet, len(config["headers"]), "blue")
 
             total_members = new_members_added + existing_members_updated
@@ -550,7 +417,7 @@ class SheetsManager(SheetsOperations):
 
             return {
                 "success": True,
-                "guild_name": guild.name,
+                "guild_name": guild_name,
                 "total_discord_members": total_members,
                 "new_members_added": new_members_added,
                 "existing_members_updated": existing_members_updated,
@@ -559,4 +426,4 @@ class SheetsManager(SheetsOperations):
 
         except Exception as e:
             logger.error(f"❌ Failed to sync Discord members: {e}")
-            return {"success": False, "error": str(e)}
\ No newline at end of file
+            return {"success": False, "error": str(e)}
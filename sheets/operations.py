@@ -8,6 +8,8 @@ import gspread
 import time
 from .client import SheetsClient
 from .config import SHEET_CONFIGS, TEAM_MAPPING
+from .quota import WRITE
+from .shadow import WorksheetShadow
 from utils.logger import setup_logger
 
 logger = setup_logger("sheets_operations")
@@ -15,9 +17,18 @@ logger = setup_logger("sheets_operations")
 class SheetsOperations(SheetsClient):
     """Handles all Google Sheets operations for the bot."""
 
-    def __init__(self):
+    def __init__(self, connect: bool = True):
+        """
+        Args:
+            connect: Authorize and open the spreadsheet now; pass False to
+                defer until connect() is called
+        """
         super().__init__()
-        self.initialized = self.initialize()
+        # Last-synced Player Stats rows, used to send cell-level diffs
+        self._player_stats_shadow = WorksheetShadow(SHEET_CONFIGS["Player Stats"]["headers"])
+        self._player_stats_needs_format = False
+        if connect:
+            self.connect()
 
     def _safe_batch_operation(self, worksheet, operation_name: str, operation_func, *args, **kwargs):
         """Execute batch operations with enhanced error handling and rate limiting."""
@@ -27,9 +38,9 @@ class SheetsOperations(SheetsClient):
 
         try:
             logger.info(f"Starting {operation_name}...")
-            time.sleep(2)  # Rate limiting
-
-            result = operation_func(*args, **kwargs)
+            result = self.quota.call(
+                self._request_kind(operation_func), operation_func, *args, **kwargs
+            )
 
             if result is None:
                 logger.error(f"❌ {operation_name} returned None (likely failed)")
@@ -61,7 +72,7 @@ class SheetsOperations(SheetsClient):
                 }
             }]
 
-            self.spreadsheet.batch_update({"requests": requests})
+            self.quota.call(WRITE, self.spreadsheet.batch_update, {"requests": requests})
             logger.info(f"✅ Froze {num_rows} header row(s) in {worksheet.title}")
             return True
         except Exception as e:
@@ -83,7 +94,7 @@ class SheetsOperations(SheetsClient):
             header_range = f"A1:{chr(ord('A') + num_cols - 1)}1"
 
             # Apply formatting
-            worksheet.format(header_range, {
+            self.quota.call(WRITE, worksheet.format, header_range, {
                 "backgroundColor": bg_color,
                 "textFormat": {
                     "foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
@@ -146,7 +157,6 @@ class SheetsOperations(SheetsClient):
                 return False
 
             # Apply formatting with freezing
-            time.sleep(1)
             self._apply_header_formatting(worksheet, num_cols, "blue")
 
             logger.info(f"✅ Successfully synced {len(all_rows)-1} teams to Current Teams")
@@ -156,82 +166,109 @@ class SheetsOperations(SheetsClient):
             logger.error(f"❌ Failed to sync current teams: {e}")
             return False
 
+    def _build_player_stats_row(self, user_id: str, stats: Dict, current: Optional[List[str]]) -> List[Any]:
+        """Build a Player Stats row, keeping manually entered power and notes."""
+        team_results = stats.get("team_results", {})
+        current = current or []
+
+        power_rating = stats.get("power_rating")
+        if power_rating is None:
+            power_rating = current[2] if len(current) > 2 and current[2] else "ENTER_POWER_HERE"
+        notes = current[11] if len(current) > 11 else ""
+
+        return [
+            user_id,
+            stats.get("name", "Unknown"),
+            power_rating,
+            team_results.get("main_team", {}).get("wins", 0),
+            team_results.get("main_team", {}).get("losses", 0),
+            team_results.get("team_2", {}).get("wins", 0),
+            team_results.get("team_2", {}).get("losses", 0),
+            team_results.get("team_3", {}).get("wins", 0),
+            team_results.get("team_3", {}).get("losses", 0),
+            stats.get("total_events", 0),
+            stats.get("last_active", "Never"),
+            notes,
+        ]
+
+    def _load_player_stats_shadow(self) -> bool:
+        """Read the Player Stats sheet once to seed the local diff shadow."""
+        shadow = self._player_stats_shadow
+        config = SHEET_CONFIGS["Player Stats"]
+        worksheet = self.get_or_create_worksheet("Player Stats", config["rows"], config["cols"])
+        if not worksheet:
+            return False
+
+        sheet_values = self.safe_worksheet_operation(worksheet, worksheet.get_all_values)
+        if sheet_values is None:
+            return False
+
+        if not shadow.load(worksheet, sheet_values):
+            # Sheet holds something else (old layout) - start from a clean sheet
+            logger.info("Player Stats layout changed, clearing before diff sync")
+            if not self._safe_batch_operation(worksheet, "clear Player Stats", worksheet.clear):
+                return False
+            shadow.load(worksheet, [])
+
+        if not shadow.header_synced:
+            self._player_stats_needs_format = True
+        return True
+
     def sync_player_stats(self, player_stats: Dict[str, Dict]) -> bool:
-        """Sync player statistics with chunked processing and improved error handling."""
+        """
+        Sync player statistics by sending only the cells that changed.
+
+        A local shadow of the sheet (keyed by User ID) is diffed against the
+        new stats and every changed range goes out in one batch_update, so a
+        single recorded result costs one API request once the shadow is warm.
+        """
         if not self.is_connected():
             return False
 
+        shadow = self._player_stats_shadow
         try:
-            config = SHEET_CONFIGS["Player Stats"]
-            worksheet = self.get_or_create_worksheet("Player Stats", config["rows"], config["cols"])
-            if not worksheet:
+            if not shadow.loaded and not self._load_player_stats_shadow():
                 return False
 
-            # Process in smaller chunks to avoid API limits
-            chunk_size = 25  # Reduced chunk size
-            player_items = list(player_stats.items())
-
-            logger.info(f"Processing {len(player_items)} players in chunks of {chunk_size}")
-
-            # Clear worksheet first
-            if not self._safe_batch_operation(worksheet, "clear Player Stats", worksheet.clear):
+            desired = {
+                str(user_id): self._build_player_stats_row(
+                    str(user_id), stats, shadow.current_row(str(user_id))
+                )
+                for user_id, stats in player_stats.items()
+            }
+            updates, pending = shadow.diff(desired)
+
+            if not updates:
+                logger.debug("Player Stats already up to date")
+                return True
+
+            worksheet = shadow.worksheet
+            extra_rows = shadow.rows_needed(pending)
+            if extra_rows and not self._safe_batch_operation(
+                worksheet, f"grow Player Stats by {extra_rows} rows", worksheet.add_rows, extra_rows
+            ):
+                shadow.reset()
                 return False
 
-            # Add headers first
-            if not self._safe_batch_operation(worksheet, "add Player Stats headers", 
-                                            worksheet.append_row, config["headers"]):
+            if not self._safe_batch_operation(
+                worksheet, f"diff update Player Stats ({len(updates)} ranges)",
+                worksheet.batch_update, updates, value_input_option="RAW"
+            ):
+                # Sheet state is unknown now - re-read it on the next sync
+                shadow.reset()
                 return False
 
-            # Process players in chunks
-            for chunk_start in range(0, len(player_items), chunk_size):
-                chunk = player_items[chunk_start:chunk_start + chunk_size]
-                chunk_rows = []
-
-                for user_id, stats in chunk:
-                    team_results = stats.get("team_results", {})
-                    main_wins = team_results.get("main_team", {}).get("wins", 0)
-                    main_losses = team_results.get("main_team", {}).get("losses", 0)
-                    team2_wins = team_results.get("team_2", {}).get("wins", 0)
-                    team2_losses = team_results.get("team_2", {}).get("losses", 0)
-                    team3_wins = team_results.get("team_3", {}).get("wins", 0)
-                    team3_losses = team_results.get("team_3", {}).get("losses", 0)
-
-                    row = [
-                        user_id,
-                        stats.get("name", "Unknown"),
-                        stats.get("power_rating", "ENTER_POWER_HERE"),
-                        main_wins, main_losses,
-                        team2_wins, team2_losses,
-                        team3_wins, team3_losses,
-                        stats.get("total_events", 0),
-                        stats.get("last_active", "Never"),
-                        ""  # Notes column
-                    ]
-                    chunk_rows.append(row)
-
-                # Add chunk to worksheet
-                if chunk_rows:
-                    try:
-                        time.sleep(3)  # Longer delay between chunks
-                        for row in chunk_rows:
-                            result = self.safe_worksheet_operation(worksheet, worksheet.append_row, row)
-                            if result is None:
-                                logger.warning(f"Failed to add player row: {row[1]}")
-                            time.sleep(0.5)  # Small delay between rows
-
-                        logger.info(f"✅ Added chunk {chunk_start//chunk_size + 1}: {len(chunk_rows)} players")
-                    except Exception as e:
-                        logger.error(f"❌ Failed to add player chunk: {e}")
-                        return False
+            shadow.commit(pending, extra_rows)
 
-            # Apply formatting with freezing
-            time.sleep(2)
-            self._apply_header_formatting(worksheet, len(config["headers"]), "blue")
+            if self._player_stats_needs_format:
+                self._apply_header_formatting(worksheet, len(shadow.headers), "blue")
+                self._player_stats_needs_format = False
 
-            logger.info(f"✅ Successfully synced {len(player_items)} players to Player Stats")
+            logger.info(f"✅ Synced Player Stats: {len(updates)} changed ranges for {len(desired)} players")
             return True
 
         except Exception as e:
+            shadow.reset()
             logger.error(f"❌ Failed to sync player stats: {e}")
             return False
 
@@ -280,7 +317,6 @@ class SheetsOperations(SheetsClient):
                     return False
 
             # Apply formatting
-            time.sleep(1)
             self._apply_header_formatting(worksheet, len(config["headers"]), "orange")
 
             logger.info(f"✅ Successfully synced {len(all_rows)-1} match results")
@@ -307,6 +343,7 @@ class SheetsOperations(SheetsClient):
                 return False
 
             logger.info("Creating Player Stats template...")
+            self._player_stats_shadow.reset()
 
             # Clear worksheet first
             if not self._safe_batch_operation(worksheet, "clear Player Stats template", worksheet.clear):
@@ -334,7 +371,6 @@ class SheetsOperations(SheetsClient):
                     "ENTER_NOTES_HERE"
                 ]
 
-                time.sleep(0.8)  # Delay between rows
                 result = self.safe_worksheet_operation(worksheet, worksheet.append_row, row)
                 if result is None:
                     logger.warning(f"Failed to add player {stats.get('name', 'Unknown')}")
@@ -344,7 +380,6 @@ class SheetsOperations(SheetsClient):
                     logger.info(f"Added {i + 1}/{len(player_items)} players...")
 
             # Apply formatting with freezing
-            time.sleep(2)
             self._apply_header_formatting(worksheet, len(config["headers"]), "blue")
 
             logger.info(f"✅ Created player stats template with {len(player_items)} players")
@@ -386,13 +421,11 @@ class SheetsOperations(SheetsClient):
             ]
 
             for i, row in enumerate(example_rows):
-                time.sleep(1)
                 result = self.safe_worksheet_operation(worksheet, worksheet.append_row, row)
                 if result is None:
                     logger.warning(f"Failed to add example row {i}")
 
             # Apply formatting with freezing
-            time.sleep(1)
             self._apply_header_formatting(worksheet, len(config["headers"]), "red")
 
             logger.info("✅ Created alliance tracking template with header freezing")
@@ -439,16 +472,14 @@ class SheetsOperations(SheetsClient):
 
             # Add all rows
             for i, row in enumerate(dashboard_data):
-                time.sleep(0.5)
                 result = self.safe_worksheet_operation(worksheet, worksheet.append_row, row)
                 if result is None:
                     logger.warning(f"Failed to add dashboard row {i}")
 
             # Apply multiple formatting sections
-            time.sleep(2)
             try:
                 # Title formatting
-                worksheet.format("A1:D1", {
+                self.quota.call(WRITE, worksheet.format, "A1:D1", {
                     "backgroundColor": {"red": 0.1, "green": 0.5, "blue": 0.2},
                     "textFormat": {
                         "foregroundColor": {"red": 1.0, "green": 1.0, "blue": 1.0},
@@ -459,14 +490,14 @@ class SheetsOperations(SheetsClient):
                 })
 
                 # Team performance header
-                worksheet.format("A5:D5", {
+                self.quota.call(WRITE, worksheet.format, "A5:D5", {
                     "backgroundColor": {"red": 0.8, "green": 0.8, "blue": 0.8},
                     "textFormat": {"bold": True},
                     "horizontalAlignment": "CENTER"
                 })
 
                 # Statistics header
-                worksheet.format("A11:D11", {
+                self.quota.call(WRITE, worksheet.format, "A11:D11", {
                     "backgroundColor": {"red": 0.6, "green": 0.6, "blue": 0.6},
                     "textFormat": {"bold": True},
                     "horizontalAlignment": "CENTER"
@@ -695,9 +726,6 @@ class SheetsOperations(SheetsClient):
                 logger.info(f"📋 Creating {template_name}...")
                 start_time = time.time()
 
-                # Longer delay between major template operations
-                time.sleep(5)
-
                 success = create_func()
                 duration = time.time() - start_time
 
@@ -764,13 +792,11 @@ class SheetsOperations(SheetsClient):
             ]
 
             for i, match_data in enumerate(sample_matches):
-                time.sleep(1)
                 result = self.safe_worksheet_operation(worksheet, worksheet.append_row, match_data)
                 if result is None:
                     logger.warning(f"Failed to add sample match {i}")
 
             # Apply formatting
-            time.sleep(1)
             self._apply_header_formatting(worksheet, len(headers), "orange")
 
             logger.info("✅ Created Match Statistics template")
@@ -807,13 +833,11 @@ class SheetsOperations(SheetsClient):
             # Add sample error
             sample_error = [datetime.utcnow().strftime("%Y-%m-%d %H:%M"), "API Error", "Sheets Sync", "Rate limit exceeded", "Bot", "Resolved", "✅", "Implemented retry logic"]
             
-            time.sleep(1)
             result = self.safe_worksheet_operation(worksheet, worksheet.append_row, sample_error)
             if result is None:
                 logger.warning("Failed to add sample error")
 
             # Apply formatting
-            time.sleep(1)
             self._apply_header_formatting(worksheet, len(headers), "red")
 
             logger.info("✅ Created Error Summary template")
@@ -823,6 +847,37 @@ class SheetsOperations(SheetsClient):
             logger.error(f"❌ Failed to create error summary template: {e}")
             return False
 
+    def append_error_rows(self, errors: List[Dict[str, Any]]) -> bool:
+        """Append a batch of grouped errors to the Error Summary sheet in one request."""
+        if not self.is_connected() or not errors:
+            return False
+
+        try:
+            worksheet = self.get_or_create_worksheet("Error Summary", 100, 8)
+            if not worksheet:
+                return False
+
+            rows = [
+                [
+                    error.get("timestamp", ""),
+                    error.get("error_type", ""),
+                    error.get("command", ""),
+                    str(error.get("error_message", ""))[:500],
+                    error.get("user_id", ""),
+                    "Open",
+                    "",
+                    f"x{error.get('count', 1)} at {error.get('location') or 'unknown'}, last {error.get('last_seen', '')}",
+                ]
+                for error in errors
+            ]
+            return self._safe_batch_operation(
+                worksheet, f"append {len(rows)} error rows", worksheet.append_rows, rows
+            )
+
+        except Exception as e:
+            logger.error(f"❌ Failed to append error rows: {e}")
+            return False
+
     def create_results_history_template(self, results_data: Dict = None) -> bool:
         """Create Results History sheet template."""
         if not self.is_connected():
@@ -855,13 +910,11 @@ class SheetsOperations(SheetsClient):
             ]
 
             for i, result_data in enumerate(sample_results):
-                time.sleep(1)
                 result = self.safe_worksheet_operation(worksheet, worksheet.append_row, result_data)
                 if result is None:
                     logger.warning(f"Failed to add sample result {i}")
 
             # Apply formatting
-            time.sleep(1)
             self._apply_header_formatting(worksheet, len(headers), "blue")
 
             logger.info("✅ Created Results History template")
@@ -902,13 +955,11 @@ class SheetsOperations(SheetsClient):
             ]
 
             for i, pref_data in enumerate(sample_preferences):
-                time.sleep(1)
                 result = self.safe_worksheet_operation(worksheet, worksheet.append_row, pref_data)
                 if result is None:
                     logger.warning(f"Failed to add sample preference {i}")
 
             # Apply formatting
-            time.sleep(1)
             self._apply_header_formatting(worksheet, len(headers), "green")
 
             logger.info("✅ Created Notification Preferences template")
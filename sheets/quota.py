@@ -0,0 +1,297 @@
+"""
+Process-wide Google Sheets quota manager.
+
+Google meters the Sheets API per minute, separately for reads and writes.
+Every request made by any sheets writer passes through this manager:
+
+- Token-bucket admission per quota (read / write), shared by all clients
+- Priority classes: interactive syncs keep headroom that bulk syncs and
+  template/formatting work may not use
+- Adaptive pacing: a 429 halves the request rate and empties the bucket,
+  successful requests win the rate back step by step
+- Exponential backoff with full jitter when a request hits 429 or a 5xx
+
+The priority of the work running on a thread is set by the async sheets
+engine, so the blocking gspread code only says whether it reads or writes.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from contextlib import contextmanager
+from typing import Any, Callable, Deque, Dict, Optional
+
+import gspread
+
+from utils.logger import setup_logger
+
+from .config import RATE_LIMIT_SETTINGS
+from .throttle import TokenBucket
+
+logger = setup_logger("sheets_quota")
+
+READ = "read"
+WRITE = "write"
+
+RETRYABLE_STATUS = {429, 500, 502, 503, 504}
+
+
+class Priority:
+    """Priority classes for sheets work (lower runs first)."""
+
+    INTERACTIVE = 0  # Write-behind syncs of bot data, user-triggered reads
+    SYNC = 1  # Bulk syncs (full sync, member sync)
+    MAINTENANCE = 2  # Template creation and formatting
+
+    NAMES = {INTERACTIVE: "interactive", SYNC: "sync", MAINTENANCE: "maintenance"}
+
+
+def error_status(error: Exception) -> Optional[int]:
+    """HTTP status of a Sheets API error, if it has one."""
+    response = getattr(error, "response", None)
+    status = getattr(response, "status_code", None)
+    if isinstance(status, int):
+        return status
+    text = str(error)
+    if "RATE_LIMIT_EXCEEDED" in text or "429" in text:
+        return 429
+    for code in (500, 502, 503, 504):
+        if str(code) in text:
+            return code
+    return None
+
+
+def is_retryable(error: Exception) -> bool:
+    """Check if an error is worth retrying (429 or a 5xx)."""
+    return isinstance(error, gspread.exceptions.APIError) and error_status(error) in RETRYABLE_STATUS
+
+
+class _QuotaState:
+    """Bucket, adaptive rate and usage counters of one quota."""
+
+    def __init__(self, name: str, per_minute: int, burst: int):
+        self.name = name
+        self.base_rate = per_minute / 60.0
+        self.bucket = TokenBucket(rate=self.base_rate, capacity=burst)
+        self.recent: Deque[float] = deque()  # Request times in the last minute
+        self.requests = 0
+        self.throttled = 0  # 429 responses
+        self.wait_time = 0.0
+        self.lock = threading.Lock()
+
+    def record(self, waited: float):
+        now = time.monotonic()
+        with self.lock:
+            self.requests += 1
+            self.wait_time += waited
+            self.recent.append(now)
+            while self.recent and now - self.recent[0] > 60:
+                self.recent.popleft()
+
+    def used_last_minute(self) -> int:
+        now = time.monotonic()
+        with self.lock:
+            while self.recent and now - self.recent[0] > 60:
+                self.recent.popleft()
+            return len(self.recent)
+
+
+class SheetsQuotaManager:
+    """
+    Shared admission control and retry policy for the Sheets API.
+
+    Features:
+    - Separate per-minute read and write quotas
+    - Priority floors so interactive work is admitted first
+    - Multiplicative slow-down on 429, additive recovery on success
+    - Jittered exponential backoff on 429/5xx
+    - Live usage snapshot for diagnostics
+    """
+
+    _instance: Optional["SheetsQuotaManager"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        settings = RATE_LIMIT_SETTINGS
+        burst = settings["batch_size"]
+        self._quotas: Dict[str, _QuotaState] = {
+            READ: _QuotaState(READ, settings["read_requests_per_minute"], burst),
+            WRITE: _QuotaState(WRITE, settings["write_requests_per_minute"], burst),
+        }
+        self._floors = {
+            Priority.INTERACTIVE: 0.0,
+            Priority.SYNC: burst * settings["sync_reserve"],
+            Priority.MAINTENANCE: burst * settings["maintenance_reserve"],
+        }
+        self.max_retries = settings["max_retries"]
+        self.base_delay = settings["retry_delay"]
+        self.max_delay = settings["max_retry_delay"]
+        self.min_rate_factor = settings["min_rate_factor"]
+        self.recovery_step = settings["recovery_step"]
+        self._local = threading.local()
+        self._by_priority: Dict[int, int] = {p: 0 for p in Priority.NAMES}
+        self.retries = 0
+        self.failures = 0
+        self._initialized = True
+
+    # ==========================================
+    # PRIORITY
+    # ==========================================
+
+    @property
+    def current_priority(self) -> int:
+        """Priority of the work running on this thread."""
+        return getattr(self._local, "priority", Priority.INTERACTIVE)
+
+    @contextmanager
+    def priority_scope(self, priority: int):
+        """Run a block (on the current thread) at a priority."""
+        previous = self.current_priority
+        self._local.priority = priority
+        try:
+            yield
+        finally:
+            self._local.priority = previous
+
+    # ==========================================
+    # ADMISSION
+    # ==========================================
+
+    def acquire_blocking(self, kind: str = WRITE):
+        """
+        Wait for quota for one request on the calling (worker) thread.
+
+        Args:
+            kind: READ or WRITE
+        """
+        quota = self._quotas[kind]
+        priority = self.current_priority
+        waited = quota.bucket.acquire_blocking(1.0, self._floors.get(priority, 0.0))
+        quota.record(waited)
+        self._by_priority[priority] = self._by_priority.get(priority, 0) + 1
+
+    async def admit(self, priority: int = Priority.INTERACTIVE):
+        """
+        Wait on the event loop until work at a priority may start.
+
+        Waits out token debt so a backlog queues on the loop rather than
+        on the engine's executor thread.
+        """
+        floor = self._floors.get(priority, 0.0)
+        for quota in self._quotas.values():
+            await quota.bucket.acquire(0, floor)
+
+    # ==========================================
+    # ADAPTIVE RATE
+    # ==========================================
+
+    def record_throttle(self, kind: str):
+        """Slow a quota down after a 429 and empty its bucket."""
+        quota = self._quotas[kind]
+        with quota.lock:
+            quota.throttled += 1
+        floor_rate = quota.base_rate * self.min_rate_factor
+        new_rate = max(floor_rate, quota.bucket.rate / 2)
+        quota.bucket.set_rate(new_rate)
+        quota.bucket.drain()
+        logger.warning(
+            f"⚠️ Sheets {kind} quota exceeded, slowing to {new_rate * 60:.0f} requests/min"
+        )
+
+    def record_success(self, kind: str):
+        """Win back some of a throttled quota's rate."""
+        quota = self._quotas[kind]
+        if quota.bucket.rate < quota.base_rate:
+            quota.bucket.set_rate(
+                min(quota.base_rate, quota.bucket.rate + quota.base_rate * self.recovery_step)
+            )
+
+    def backoff_delay(self, attempt: int) -> float:
+        """Full-jitter exponential backoff for a retry attempt (1-based)."""
+        ceiling = min(self.max_delay, self.base_delay * (2 ** (attempt - 1)))
+        return random.uniform(0, ceiling)
+
+    # ==========================================
+    # REQUESTS
+    # ==========================================
+
+    def call(self, kind: str, func: Callable, *args, **kwargs) -> Any:
+        """
+        Make one Sheets API request with admission and retries.
+
+        Blocking; call from a worker thread.
+
+        Args:
+            kind: READ or WRITE
+            func: gspread call
+            *args, **kwargs: Arguments for the call
+
+        Returns:
+            Result of the call
+
+        Raises:
+            Exception: The last error if the request is not retryable or
+                retries are exhausted
+        """
+        attempt = 0
+        while True:
+            self.acquire_blocking(kind)
+            try:
+                result = func(*args, **kwargs)
+            except Exception as e:
+                if not is_retryable(e) or attempt >= self.max_retries:
+                    if is_retryable(e):
+                        self.failures += 1
+                    raise
+                attempt += 1
+                self.retries += 1
+                if error_status(e) == 429:
+                    self.record_throttle(kind)
+                delay = self.backoff_delay(attempt)
+                logger.info(
+                    f"🔄 Retrying sheets {kind} in {delay:.1f}s "
+                    f"(attempt {attempt}/{self.max_retries}, status {error_status(e)})"
+                )
+                time.sleep(delay)
+                continue
+            self.record_success(kind)
+            return result
+
+    # ==========================================
+    # DIAGNOSTICS
+    # ==========================================
+
+    def snapshot(self) -> Dict[str, Any]:
+        """Live quota usage for diagnostics."""
+        quotas = {}
+        for kind, quota in self._quotas.items():
+            quotas[kind] = {
+                "limit_per_minute": round(quota.base_rate * 60),
+                "current_rate_per_minute": round(quota.bucket.rate * 60, 1),
+                "used_last_minute": quota.used_last_minute(),
+                "tokens_available": round(max(quota.bucket.available, 0.0), 1),
+                "burst": quota.bucket.capacity,
+                "requests": quota.requests,
+                "throttled": quota.throttled,
+                "total_wait_seconds": round(quota.wait_time, 1),
+            }
+        return {
+            "quotas": quotas,
+            "requests_by_priority": {
+                Priority.NAMES[p]: count for p, count in sorted(self._by_priority.items())
+            },
+            "retries": self.retries,
+            "failures": self.failures,
+        }
+
+
+# Global instance
+quota_manager = SheetsQuotaManager()
@@ -0,0 +1,229 @@
+"""
+Local shadow of a keyed worksheet for row-level diff syncing.
+
+Instead of clearing a worksheet and re-appending every row, the shadow
+remembers what was last written (keyed by the first column, e.g. User ID)
+so a sync only sends the cells that actually changed, batched into a
+single ``values.batchUpdate`` request.
+"""
+
+import time
+from typing import Any, Dict, List, Optional, Tuple
+
+from utils.logger import setup_logger
+
+logger = setup_logger("sheets_shadow")
+
+
+def column_letter(index: int) -> str:
+    """Convert a zero-based column index to an A1 column letter."""
+    letters = ""
+    index += 1
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(ord("A") + remainder) + letters
+    return letters
+
+
+def _normalize(value: Any) -> str:
+    """Normalize a cell value the way the Sheets API returns it."""
+    return "" if value is None else str(value)
+
+
+class WorksheetShadow:
+    """
+    Last-synced state of a worksheet whose rows are keyed by the first column.
+
+    Features:
+    - Key -> row number index seeded from a single read of the sheet
+    - Cell-level diffs grouped into contiguous ranges per row
+    - Freed rows are reused before the sheet grows
+    - Periodic re-seed so manual edits in the sheet are picked up
+    """
+
+    def __init__(self, headers: List[str], max_age: float = 900.0):
+        """
+        Initialize an empty shadow.
+
+        Args:
+            headers: Expected header row of the worksheet
+            max_age: Seconds before the shadow is re-read from the sheet
+        """
+        self.headers = list(headers)
+        self.width = len(self.headers)
+        self.max_age = max_age
+        self.reset()
+
+    def reset(self):
+        """Forget everything so the next sync re-reads the sheet."""
+        self.worksheet = None
+        self.row_count = 0
+        self.rows: Dict[str, int] = {}
+        self.values: Dict[int, List[str]] = {}
+        self.free_rows: List[int] = []
+        self.next_row = 2
+        self.header_synced = False
+        self.loaded_at = 0.0
+
+    @property
+    def loaded(self) -> bool:
+        """Whether the shadow holds a usable, fresh copy of the sheet."""
+        return (
+            self.worksheet is not None
+            and time.monotonic() - self.loaded_at < self.max_age
+        )
+
+    def load(self, worksheet, sheet_values: List[List[str]]) -> bool:
+        """
+        Seed the shadow from the current worksheet contents.
+
+        Args:
+            worksheet: gspread worksheet the shadow mirrors
+            sheet_values: Result of ``worksheet.get_all_values()``
+
+        Returns:
+            bool: False if the sheet has foreign content and must be cleared first
+        """
+        self.reset()
+
+        if sheet_values and self._pad(sheet_values[0]) != self.headers:
+            if any(any(cell for cell in row) for row in sheet_values):
+                return False
+            sheet_values = []
+
+        self.worksheet = worksheet
+        self.row_count = getattr(worksheet, "row_count", 0) or 0
+        self.header_synced = bool(sheet_values)
+        self.loaded_at = time.monotonic()
+
+        for offset, raw_row in enumerate(sheet_values[1:]):
+            row_number = offset + 2
+            row = self._pad(raw_row)
+            key = row[0]
+
+            if key and key not in self.rows:
+                self.rows[key] = row_number
+                self.values[row_number] = row
+            elif any(row):
+                # Duplicate or keyless leftovers get blanked on the next diff
+                self.values[row_number] = row
+            else:
+                self.free_rows.append(row_number)
+
+        self.next_row = len(sheet_values) + 1 if sheet_values else 2
+        logger.debug(
+            f"Loaded shadow for {getattr(worksheet, 'title', 'worksheet')}: "
+            f"{len(self.rows)} keyed rows"
+        )
+        return True
+
+    def _pad(self, row: List[Any]) -> List[str]:
+        """Normalize a row to exactly the header width."""
+        normalized = [_normalize(cell) for cell in row[: self.width]]
+        return normalized + [""] * (self.width - len(normalized))
+
+    def current_row(self, key: str) -> Optional[List[str]]:
+        """Get the last-synced values for a key, if it has a row."""
+        row_number = self.rows.get(key)
+        return self.values.get(row_number) if row_number else None
+
+    def diff(
+        self, desired: Dict[str, List[Any]]
+    ) -> Tuple[List[Dict[str, Any]], Dict[str, Any]]:
+        """
+        Compute the cell ranges needed to make the sheet match ``desired``.
+
+        Args:
+            desired: Mapping of key -> full row values (first column is the key)
+
+        Returns:
+            Tuple containing:
+                List[Dict]: ``batch_update`` payload of {"range", "values"} entries
+                Dict: Pending state to pass to ``commit`` once the write succeeds
+        """
+        updates: List[Dict[str, Any]] = []
+        rows = dict(self.rows)
+        values = dict(self.values)
+        free_rows = list(self.free_rows)
+        next_row = self.next_row
+
+        if not self.header_synced:
+            updates.append(self._range_update(1, 0, list(self.headers)))
+
+        # Rows of keys that disappeared (and leftover duplicates) become free;
+        # they are diffed against their old content when reused, blanked otherwise
+        keyed_rows = set(rows.values())
+        for key in [k for k in rows if k not in desired]:
+            keyed_rows.discard(rows.pop(key))
+        stale: Dict[int, List[str]] = {
+            row_number: values.pop(row_number)
+            for row_number in sorted(values)
+            if row_number not in keyed_rows
+        }
+        free_rows = sorted(set(free_rows) | set(stale))
+
+        for key, row in desired.items():
+            new = [_normalize(cell) for cell in row[: self.width]]
+            new += [""] * (self.width - len(new))
+            typed = list(row[: self.width]) + [""] * (self.width - len(row))
+
+            row_number = rows.get(key)
+            if row_number is None:
+                if free_rows:
+                    row_number = free_rows.pop(0)
+                else:
+                    row_number = next_row
+                    next_row += 1
+                rows[key] = row_number
+                old = stale.pop(row_number, [""] * self.width)
+            else:
+                old = values[row_number]
+
+            start = None
+            for col in range(self.width + 1):
+                changed = col < self.width and new[col] != old[col]
+                if changed and start is None:
+                    start = col
+                elif not changed and start is not None:
+                    updates.append(self._range_update(row_number, start, typed[start:col]))
+                    start = None
+
+            values[row_number] = new
+
+        for row_number, old in sorted(stale.items()):
+            if any(old):
+                updates.append(self._range_update(row_number, 0, [""] * self.width))
+
+        pending = {
+            "rows": rows,
+            "values": values,
+            "free_rows": free_rows,
+            "next_row": next_row,
+        }
+        return updates, pending
+
+    def rows_needed(self, pending: Dict[str, Any]) -> int:
+        """Number of extra grid rows the pending state requires."""
+        return max(0, pending["next_row"] - 1 - self.row_count)
+
+    def commit(self, pending: Dict[str, Any], added_rows: int = 0):
+        """
+        Apply pending state after the batch write succeeded.
+
+        Args:
+            pending: State returned by ``diff``
+            added_rows: Grid rows appended to the worksheet for this write
+        """
+        self.rows = pending["rows"]
+        self.values = pending["values"]
+        self.free_rows = pending["free_rows"]
+        self.next_row = pending["next_row"]
+        self.row_count += added_rows
+        self.header_synced = True
+
+    def _range_update(self, row_number: int, start: int, cells: List[Any]) -> Dict[str, Any]:
+        """Build one A1 range entry for ``batch_update``."""
+        first = f"{column_letter(start)}{row_number}"
+        last = f"{column_letter(start + len(cells) - 1)}{row_number}"
+        cell_range = first if first == last else f"{first}:{last}"
+        return {"range": cell_range, "values": [list(cells)]}
@@ -0,0 +1,136 @@
+"""
+Single shared Google Sheets connection.
+
+Every DataManager, the bot and the integrated data manager used to build
+their own SheetsManager, each one authorizing and opening the spreadsheet
+synchronously at construction - several blocking network round trips on
+the startup path. They now share one manager that is created without
+connecting and connected in the background once the bot is ready.
+
+Sheets work submitted before the connect finishes is held by the
+manager's sheets engine and then runs behind the connect on its
+single-worker executor, so nothing is dropped while connecting.
+"""
+
+import asyncio
+import threading
+import time
+from typing import Optional
+
+from utils.logger import setup_logger
+
+from .manager import SheetsManager
+
+logger = setup_logger("sheets_shared")
+
+
+class SharedSheetsConnection:
+    """
+    Lazily created, lazily connected SheetsManager shared by the whole bot.
+
+    Features:
+    - One manager and one authorization per process
+    - Construction never touches the network
+    - Background connect on the sheets engine; earlier work queues behind it
+    - Blocking connect for scripts and the standalone dashboard
+    """
+
+    _instance = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._manager: Optional[SheetsManager] = None
+        self._lock = threading.Lock()
+        self._task: Optional[asyncio.Task] = None
+        self._initialized = True
+
+    def get_manager(self) -> SheetsManager:
+        """Get the shared manager, creating it (unconnected) on first use."""
+        if self._manager is None:
+            with self._lock:
+                if self._manager is None:
+                    self._manager = SheetsManager(connect=False)
+                    from utils.storage import storage
+
+                    if storage.sheets_manager is None:
+                        storage.attach_sheets(self._manager)
+        return self._manager
+
+    def hold(self):
+        """
+        Queue sheets work until the background connect finishes.
+
+        Call from the event loop during setup, before start().
+        """
+        manager = self.get_manager()
+        if not manager.initialized:
+            manager.schedule_connect()
+            manager.engine.hold()
+
+    def start(self) -> Optional[asyncio.Task]:
+        """
+        Connect in the background; call from the event loop.
+
+        Safe to call repeatedly (e.g. on every on_ready).
+
+        Returns:
+            asyncio.Task or None if the connect already finished
+        """
+        manager = self.get_manager()
+        if self._task is None and not manager.initialized:
+            self.hold()
+            self._task = asyncio.create_task(self._connect(manager))
+        return self._task
+
+    async def _connect(self, manager: SheetsManager) -> bool:
+        started = time.perf_counter()
+        try:
+            connected = await manager.engine.connect()
+        except Exception as e:
+            logger.error(f"❌ Background Google Sheets connect failed: {e}")
+            return False
+
+        elapsed = time.perf_counter() - started
+        if connected:
+            logger.info(f"✅ Google Sheets connected in background ({elapsed:.1f}s)")
+        else:
+            logger.info(f"ℹ️ Google Sheets not available ({elapsed:.1f}s), running JSON-only")
+        return connected
+
+    async def wait_until_ready(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for a pending background connect.
+
+        Args:
+            timeout: Max seconds to wait
+
+        Returns:
+            bool: True if connected
+        """
+        manager = self.get_manager()
+        if self._task is not None and not self._task.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(self._task), timeout)
+            except asyncio.TimeoutError:
+                return False
+        return manager.is_connected()
+
+    def connect_now(self) -> bool:
+        """Connect on the calling thread (scripts, standalone dashboard)."""
+        return self.get_manager().connect()
+
+
+# Global instance
+shared_sheets = SharedSheetsConnection()
+
+
+def get_sheets_manager() -> SheetsManager:
+    """Get the shared SheetsManager (may still be connecting)."""
+    return shared_sheets.get_manager()
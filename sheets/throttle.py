@@ -0,0 +1,95 @@
+"""
+Request pacing for Google Sheets operations.
+
+Provides a token bucket that can be waited on from both the asyncio event
+loop and from the worker threads that run blocking gspread calls.
+"""
+
+import asyncio
+import threading
+import time
+
+
+class TokenBucket:
+    """
+    Thread-safe token bucket for pacing Sheets API requests.
+
+    Tokens refill continuously at ``rate`` per second up to ``capacity``.
+    Worker threads call ``acquire_blocking`` before each request, while
+    coroutines call ``acquire`` so the event loop is never put to sleep.
+    """
+
+    def __init__(self, rate: float, capacity: float):
+        self.rate = rate
+        self.capacity = capacity
+        self._tokens = capacity
+        self._updated = time.monotonic()
+        self._lock = threading.Lock()
+
+    def _reserve(self, tokens: float = 1.0, floor: float = 0.0) -> float:
+        """
+        Reserve tokens and return how long the caller must wait for them.
+
+        Args:
+            tokens: Tokens to take
+            floor: Level the bucket must still hold after this request;
+                lower-priority callers pass a floor so headroom stays
+                available for more urgent work
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self._tokens -= tokens
+            if self._tokens >= floor:
+                return 0.0
+            return (floor - self._tokens) / self.rate
+
+    def acquire_blocking(self, tokens: float = 1.0, floor: float = 0.0) -> float:
+        """
+        Wait for tokens on the calling thread (never call from the event loop).
+
+        Returns:
+            float: Seconds waited
+        """
+        wait = self._reserve(tokens, floor)
+        if wait > 0:
+            time.sleep(wait)
+        return wait
+
+    async def acquire(self, tokens: float = 1.0, floor: float = 0.0) -> float:
+        """
+        Wait for tokens without blocking the event loop.
+
+        Returns:
+            float: Seconds waited
+        """
+        wait = self._reserve(tokens, floor)
+        if wait > 0:
+            await asyncio.sleep(wait)
+        return wait
+
+    def set_rate(self, rate: float):
+        """Change the refill rate, keeping tokens earned at the old rate."""
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(
+                self.capacity, self._tokens + (now - self._updated) * self.rate
+            )
+            self._updated = now
+            self.rate = rate
+
+    def drain(self):
+        """Empty the bucket (e.g. after the server reports quota exhaustion)."""
+        with self._lock:
+            self._tokens = min(self._tokens, 0.0)
+            self._updated = time.monotonic()
+
+    @property
+    def available(self) -> float:
+        """Approximate number of tokens currently available."""
+        with self._lock:
+            elapsed = time.monotonic() - self._updated
+            return min(self.capacity, self._tokens + elapsed * self.rate)
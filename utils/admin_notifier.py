@@ -271,6 +271,41 @@ class AdminNotifier:
         except Exception as e:
             logger.error(f"Failed to send error alert: {e}")
 
+    async def send_error_summary(self, counts, window_seconds: int):
+        """
+        Send one grouped alert for the errors seen in a window.
+
+        Args:
+            counts: List of ((error_type, source, location), occurrences), most frequent first
+            window_seconds: Length of the summary window
+        """
+        if not counts or not await self._ensure_ready():
+            return
+
+        try:
+            total = sum(count for _, count in counts)
+            embed = discord.Embed(
+                title="🚨 Bot Error Summary",
+                description=f"**{total}** errors in **{len(counts)}** groups over the last {window_seconds // 60} minutes",
+                color=0xED4245,
+                timestamp=datetime.utcnow(),
+            )
+
+            lines = []
+            for (error_type, source, location), count in counts[:10]:
+                where = f" @ `{location}`" if location else ""
+                lines.append(f"**{count}×** {error_type} in {source}{where}")
+            if len(counts) > 10:
+                lines.append(f"...and {len(counts) - 10} more groups")
+
+            embed.add_field(name="❌ Top Errors", value="\n".join(lines)[:1024], inline=False)
+            embed.set_footer(text="Full details in data/error_log.json")
+
+            await self.admin_user.send(embed=embed)
+
+        except Exception as e:
+            logger.error(f"Failed to send error summary: {e}")
+
     async def send_activity_notification(
         self, activity_type: str, details: Dict[str, Any]
     ):
@@ -0,0 +1,315 @@
+"""
+Append-only, day-partitioned audit log store.
+
+Audit entries used to live in one JSON list capped at 1000 entries, and
+every per-user or per-type lookup walked the whole list. Entries are now
+appended as JSON lines to one segment file per UTC day, so writes are a
+single O(1) append and history is never truncated. Each segment has a
+secondary index (user_id, target_user_id, action_type -> byte offsets)
+kept in memory for the active day and written as a sidecar file when the
+day rolls over, so queries read only the segments and lines they need.
+"""
+
+import json
+import os
+import threading
+from collections import OrderedDict
+from datetime import datetime
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+from utils.logger import setup_logger
+
+logger = setup_logger("audit_store")
+
+INDEXED_FIELDS = ("user_id", "target_user_id", "action_type")
+SEGMENT_SUFFIX = ".jsonl"
+INDEX_SUFFIX = ".idx.json"
+
+# field -> value -> byte offsets of matching lines (ascending)
+SegmentIndex = Dict[str, Dict[str, List[int]]]
+
+
+def _new_index() -> SegmentIndex:
+    return {field: {} for field in INDEXED_FIELDS}
+
+
+def _index_entry(index: SegmentIndex, entry: Dict[str, Any], offset: int):
+    for field in INDEXED_FIELDS:
+        value = entry.get(field)
+        if field == "action_type":
+            # Every line gets an action_type key so this field covers the whole segment
+            value = value or ""
+        if value is not None:
+            index[field].setdefault(str(value), []).append(offset)
+
+
+class AuditStore:
+    """
+    Daily JSONL audit segments with per-segment secondary indexes.
+
+    Features:
+    - O(1) appends to the current day's segment
+    - Full history, no entry cap
+    - Index lookups by user, target user and action type (prefix match)
+    - Newest-first paged queries with a resumable cursor
+    """
+
+    def __init__(self, directory: str, cached_indexes: int = 32):
+        """
+        Initialize the store.
+
+        Args:
+            directory: Directory holding the segment files
+            cached_indexes: Number of sealed segment indexes kept in memory
+        """
+        self.directory = directory
+        self._lock = threading.Lock()
+        self._cached_indexes = cached_indexes
+        self._index_cache: "OrderedDict[str, SegmentIndex]" = OrderedDict()
+        self._active_day: Optional[str] = None
+        self._active_index: SegmentIndex = _new_index()
+        self._active_file = None
+
+        os.makedirs(self.directory, exist_ok=True)
+        self._days: List[str] = sorted(
+            name[: -len(SEGMENT_SUFFIX)]
+            for name in os.listdir(self.directory)
+            if name.endswith(SEGMENT_SUFFIX)
+        )
+
+    # ==========================================
+    # SEGMENTS
+    # ==========================================
+
+    def _segment_path(self, day: str) -> str:
+        return os.path.join(self.directory, day + SEGMENT_SUFFIX)
+
+    def _index_path(self, day: str) -> str:
+        return os.path.join(self.directory, day + INDEX_SUFFIX)
+
+    def _scan_segment(self, day: str) -> SegmentIndex:
+        """Build a segment's index by reading it once."""
+        index = _new_index()
+        path = self._segment_path(day)
+        if not os.path.exists(path):
+            return index
+        with open(path, "rb") as f:
+            offset = 0
+            for line in f:
+                try:
+                    _index_entry(index, json.loads(line), offset)
+                except ValueError:
+                    logger.warning(f"⚠️ Skipping corrupt audit line in {day} at {offset}")
+                offset += len(line)
+        return index
+
+    def _write_index(self, day: str, index: SegmentIndex):
+        path = self._index_path(day)
+        temp_path = path + ".tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as f:
+                json.dump(index, f, separators=(",", ":"))
+            os.replace(temp_path, path)
+        except Exception as e:
+            logger.error(f"❌ Failed to write audit index for {day}: {e}")
+
+    def _seal_active(self):
+        """Close the active segment and persist its index."""
+        if self._active_file is not None:
+            self._active_file.close()
+            self._active_file = None
+        if self._active_day is not None:
+            self._write_index(self._active_day, self._active_index)
+            self._cache_index(self._active_day, self._active_index)
+        self._active_day = None
+        self._active_index = _new_index()
+
+    def _open_day(self, day: str):
+        """Make ``day`` the active segment, sealing the previous one."""
+        self._seal_active()
+        if day not in self._days:
+            self._days.append(day)
+            self._days.sort()
+        index_path = self._index_path(day)
+        # Reopened after a restart: the sidecar may be stale, rescan this one day
+        self._active_index = self._scan_segment(day)
+        if os.path.exists(index_path):
+            os.remove(index_path)
+        self._index_cache.pop(day, None)
+        self._active_file = open(self._segment_path(day), "ab")
+        self._active_day = day
+
+    def _cache_index(self, day: str, index: SegmentIndex):
+        self._index_cache[day] = index
+        self._index_cache.move_to_end(day)
+        while len(self._index_cache) > self._cached_indexes:
+            self._index_cache.popitem(last=False)
+
+    def _get_index(self, day: str) -> SegmentIndex:
+        """Index of a segment (active, cached, sidecar, or rebuilt)."""
+        if day == self._active_day:
+            return self._active_index
+        index = self._index_cache.get(day)
+        if index is not None:
+            self._index_cache.move_to_end(day)
+            return index
+
+        index = None
+        try:
+            with open(self._index_path(day), encoding="utf-8") as f:
+                index = json.load(f)
+        except (OSError, ValueError):
+            pass
+        if index is None:
+            index = self._scan_segment(day)
+            self._write_index(day, index)
+        self._cache_index(day, index)
+        return index
+
+    # ==========================================
+    # WRITES
+    # ==========================================
+
+    def append(self, entry: Dict[str, Any]) -> bool:
+        """
+        Append one audit entry.
+
+        Args:
+            entry: Entry with an ISO ``timestamp`` plus the indexed fields
+
+        Returns:
+            bool: True if the entry was written
+        """
+        try:
+            line = (json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n").encode("utf-8")
+            day = str(entry.get("timestamp", ""))[:10] or datetime.utcnow().strftime("%Y-%m-%d")
+            with self._lock:
+                if day != self._active_day:
+                    self._open_day(day)
+                offset = self._active_file.tell()
+                self._active_file.write(line)
+                self._active_file.flush()
+                _index_entry(self._active_index, entry, offset)
+            return True
+        except Exception as e:
+            logger.error(f"❌ Failed to append audit entry: {e}")
+            return False
+
+    def close(self):
+        """Flush and seal the active segment."""
+        with self._lock:
+            self._seal_active()
+
+    # ==========================================
+    # QUERIES
+    # ==========================================
+
+    @staticmethod
+    def _lookup(index: SegmentIndex, field: str, value: str, prefix: bool) -> List[int]:
+        values = index.get(field, {})
+        if not prefix:
+            return values.get(value, [])
+        offsets = []
+        for key, key_offsets in values.items():
+            if key.startswith(value):
+                offsets.extend(key_offsets)
+        return sorted(offsets)
+
+    def _read_lines(self, day: str, offsets: List[int]) -> Iterator[Tuple[int, Dict[str, Any]]]:
+        """Read entries at the given offsets, newest (highest offset) first."""
+        if day == self._active_day and self._active_file is not None:
+            self._active_file.flush()
+        try:
+            with open(self._segment_path(day), "rb") as f:
+                for offset in sorted(offsets, reverse=True):
+                    f.seek(offset)
+                    try:
+                        yield offset, json.loads(f.readline())
+                    except ValueError:
+                        continue
+        except OSError as e:
+            logger.error(f"❌ Failed to read audit segment {day}: {e}")
+
+    def _all_offsets(self, day: str) -> List[int]:
+        """Every line offset of a segment, from any one complete index field."""
+        index = self._get_index(day)
+        return [offset for values in index["action_type"].values() for offset in values]
+
+    def query(
+        self,
+        user_id: Optional[str] = None,
+        target_user_id: Optional[str] = None,
+        action_type: Optional[str] = None,
+        since: Optional[datetime] = None,
+        limit: Optional[int] = 50,
+        cursor: Optional[str] = None,
+    ) -> Tuple[List[Dict[str, Any]], Optional[str]]:
+        """
+        Page through matching entries, newest first.
+
+        Args:
+            user_id: Only entries by this user
+            target_user_id: Only entries acting on this user
+            action_type: Only entries whose action type starts with this
+            since: Only entries at or after this time (UTC)
+            limit: Page size (None for everything that matches)
+            cursor: Cursor from a previous page to continue after
+
+        Returns:
+            tuple: (entries, cursor for the next page or None when done)
+        """
+        filters = [
+            (field, str(value), field == "action_type")
+            for field, value in (
+                ("user_id", user_id),
+                ("target_user_id", target_user_id),
+                ("action_type", action_type),
+            )
+            if value is not None
+        ]
+        since_day = since.strftime("%Y-%m-%d") if since else None
+        since_iso = since.isoformat() if since else None
+
+        cursor_day, cursor_offset = None, None
+        if cursor:
+            cursor_day, _, raw_offset = cursor.partition(":")
+            cursor_offset = int(raw_offset)
+
+        results: List[Dict[str, Any]] = []
+        with self._lock:
+            days = list(self._days)
+            for day in reversed(days):
+                if since_day and day < since_day:
+                    break
+                if cursor_day and day > cursor_day:
+                    continue
+
+                index = self._get_index(day)
+                if filters:
+                    # Drive from the most selective index, check the rest per entry
+                    field, value, prefix = min(
+                        filters, key=lambda f: len(self._lookup(index, *f))
+                    )
+                    offsets = self._lookup(index, field, value, prefix)
+                else:
+                    offsets = self._all_offsets(day)
+                if day == cursor_day:
+                    offsets = [o for o in offsets if o < cursor_offset]
+
+                for offset, entry in self._read_lines(day, offsets):
+                    if since_iso and entry.get("timestamp", "") < since_iso:
+                        continue
+                    if not all(
+                        str(entry.get(f, "")).startswith(v) if p else str(entry.get(f)) == v
+                        for f, v, p in filters
+                    ):
+                        continue
+                    results.append(entry)
+                    if limit is not None and len(results) >= limit:
+                        return results, f"{day}:{offset}"
+        return results, None
+
+    def count(self) -> int:
+        """Total number of stored entries."""
+        with self._lock:
+            return sum(len(self._all_offsets(day)) for day in self._days)
@@ -25,6 +25,9 @@ from typing import Dict, List, Optional
 
 from utils.data_manager import DataManager
 from utils.logger import setup_logger
+from utils.event_schedule import event_schedule
+from utils.state_store import state_store
+from utils.storage import storage
 
 logger = setup_logger("backup_manager")
 
@@ -69,6 +72,9 @@ class BackupManager:
 
             from config.constants import FILES
 
+            # Make sure journaled changes are on disk before zipping
+            state_store.compact()
+
             # Create backup metadata
             metadata = {
                 "timestamp": datetime.utcnow().isoformat(),
@@ -188,8 +194,16 @@ class BackupManager:
 
         return backups
 
-    def restore_backup(self, backup_filename: str, confirm: bool = False) -> bool:
-        """Restore data from a backup."""
+    def restore_backup(
+        self, backup_filename: str, confirm: bool = False, bot=None
+    ) -> bool:
+        """
+        Restore data from a backup.
+
+        Pass the running bot so cogs holding data in memory (signup rosters,
+        event times) reload it; otherwise their next save would overwrite
+        the restored files.
+        """
         if not confirm:
             logger.warning("⚠️ Restore not confirmed - use confirm=True to proceed")
             return False
@@ -208,6 +222,8 @@ class BackupManager:
 
             from config.constants import FILES
 
+            state_store.compact()
+
             with zipfile.ZipFile(backup_path, "r") as zipf:
                 # Read metadata
                 metadata = None
@@ -237,6 +253,12 @@ class BackupManager:
                         restored_files.append(filepath)
                         logger.info(f"✅ Restored: {filepath}")
 
+                # Drop cached copies so the restored files are served
+                state_store.reload()
+                storage.reloaded(restored_files)
+                if bot is not None:
+                    self._reload_event_state(bot)
+
                 logger.info(
                     f"✅ Restore completed: {len(restored_files)} files restored"
                 )
@@ -246,6 +268,27 @@ class BackupManager:
             logger.exception(f"❌ Failed to restore backup: {e}")
             return False
 
+    @staticmethod
+    def _reload_event_state(bot):
+        """Reload the event cog's rosters and times from the restored files."""
+        from config.constants import FILES
+        from config.settings import DEFAULT_TIMES
+
+        event_cog = bot.get_cog("EventManager")
+        if not event_cog:
+            return
+        event_cog.events = storage.get(
+            FILES["EVENTS"], default={"main_team": [], "team_2": [], "team_3": []}
+        )
+        times = dict(DEFAULT_TIMES)
+        data = storage.get(FILES["TIMES"], default={})
+        if isinstance(data, dict):
+            times.update(data)
+        event_cog.event_times = times
+        event_schedule.set_times(event_cog.event_times)
+        event_cog.signup_locked = bool(storage.get(FILES["SIGNUP_LOCK"], default=False))
+        logger.info("✅ Reloaded event rosters and times from restored files")
+
     def _cleanup_old_backups(self):
         """Remove old backups to stay within limit."""
         try:
@@ -411,13 +454,14 @@ def list_backups() -> List[Dict]:
     return backup_manager.list_backups()
 
 
-def restore_backup(backup_filename: str, confirm: bool = False) -> bool:
+def restore_backup(backup_filename: str, confirm: bool = False, bot=None) -> bool:
     """
     Restore data from a backup.
 
     Args:
         backup_filename: Name of backup file to restore
         confirm: Safety confirmation flag
+        bot: Running bot whose event cog should reload the restored data
 
     Returns:
         bool: True if restore successful
@@ -428,4 +472,4 @@ def restore_backup(backup_filename: str, confirm: bool = False) -> bool:
         - File validation
         - Error handling
     """
-    return backup_manager.restore_backup(backup_filename, confirm)
+    return backup_manager.restore_backup(backup_filename, confirm, bot)
@@ -17,12 +17,15 @@ MODIFICATION GOALS:
 - Add graceful degradation
 """
 
+import asyncio
 import os
-import json
 import time
 from typing import Any, Dict, Optional, List
 from datetime import datetime
 from utils.logger import setup_logger
+from utils.models import PlayerStats
+from utils.storage import storage
+from utils.sync_queue import sync_queue
 
 logger = setup_logger("data_manager")
 
@@ -41,7 +44,7 @@ class DataManager:
     def __init__(self):
         """Initialize DataManager with enhanced Google Sheets integration."""
         self.sheets_manager = None
-        self.player_stats = {}
+        self.player_stats: Dict[str, PlayerStats] = {}
         self.last_sync_time = None
         self.sync_enabled = True
         self._initialize_sheets()
@@ -62,20 +65,17 @@ class DataManager:
                 logger.info("🔍 GOOGLE_SHEETS_CREDENTIALS found, attempting to initialize sheets integration...")
 
                 try:
-                    # Try new clean architecture first (sheets/ directory)
-                    from sheets import SheetsManager
-                    logger.info("✅ Successfully imported SheetsManager from clean architecture (sheets/)")
+                    # Try new clean architecture first (sheets/ directory).
+                    # All DataManagers share one connection, opened in the
+                    # background once the bot is ready (see sheets.shared).
+                    from sheets import get_sheets_manager
 
-                    self.sheets_manager = SheetsManager()
+                    self.sheets_manager = get_sheets_manager()
 
-                    # Test the connection
-                    if hasattr(self.sheets_manager, 'is_connected') and self.sheets_manager.is_connected():
-                        logger.info("✅ Google Sheets integration enabled and connected successfully")
-                        if hasattr(self.sheets_manager, 'spreadsheet') and self.sheets_manager.spreadsheet:
-                            logger.info(f"📊 Connected to spreadsheet: {self.sheets_manager.spreadsheet.url}")
+                    if self.sheets_manager.is_connected():
+                        logger.debug("✅ Using shared Google Sheets connection")
                     else:
-                        logger.warning("⚠️ Google Sheets manager created but connection test failed")
-                        # Keep the manager for potential retry later
+                        logger.debug("⏳ Using shared Google Sheets connection (not connected yet)")
 
                 except ImportError as e:
                     logger.warning(f"❌ Failed to import from sheets/ directory: {e}")
@@ -112,6 +112,8 @@ class DataManager:
 
         # Log final status
         if self.sheets_manager:
+            if storage.sheets_manager is None:
+                storage.attach_sheets(self.sheets_manager)
             logger.info("🔗 DataManager: Google Sheets integration active")
         else:
             logger.info("📁 DataManager: Using JSON file storage only")
@@ -137,6 +139,13 @@ class DataManager:
             logger.debug(f"Sheets availability check failed: {e}")
             return False
 
+    def is_sheets_connecting(self) -> bool:
+        """Check if the shared sheets connection is still being opened."""
+        try:
+            return bool(self.sheets_manager and self.sheets_manager.is_connecting())
+        except AttributeError:
+            return False
+
     def get_sheets_status(self) -> Dict[str, Any]:
         """
         Get detailed status of Google Sheets integration.
@@ -151,6 +160,7 @@ class DataManager:
             "spreadsheet_id": None,
             "last_sync": self.last_sync_time,
             "sync_enabled": self.sync_enabled,
+            "sync_queue": sync_queue.get_metrics(),
             "error": None
         }
 
@@ -208,6 +218,15 @@ class DataManager:
             logger.info("📁 Falling back to JSON files")
             return self._load_from_json_fallback()
 
+    async def load_all_data_from_sheets_async(self):
+        """
+        Awaitable version of load_all_data_from_sheets.
+
+        Returns:
+            dict: Complete bot data from sheets or JSON fallback
+        """
+        return await self._run_off_loop(self.load_all_data_from_sheets)
+
     def _load_from_json_fallback(self):
         """
         Fallback to load data from JSON files.
@@ -257,21 +276,13 @@ class DataManager:
             Any: Loaded JSON data or default value
         """
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-            if os.path.exists(filepath):
-                with open(filepath, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-                    logger.debug(f"✅ Loaded {filepath}")
-                    return data
-            else:
+            # Served from the shared storage cache; the file is read only once
+            data = storage.get(filepath)
+            if data is None:
                 logger.debug(f"📁 File {filepath} doesn't exist, using default")
                 return default if default is not None else {}
+            return data
 
-        except json.JSONDecodeError as e:
-            logger.error(f"❌ Invalid JSON in {filepath}: {e}")
-            return default if default is not None else {}
         except Exception as e:
             logger.error(f"❌ Error loading {filepath}: {e}")
             return default if default is not None else {}
@@ -289,12 +300,9 @@ class DataManager:
             bool: True if save was successful
         """
         try:
-            # Ensure directory exists
-            os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-            # Save to JSON file
-            with open(filepath, 'w', encoding='utf-8') as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
+            # Journaled through the shared storage service; compaction rewrites the file
+            if not storage.save_now(filepath, data, sync_to_sheets=False):
+                return False
 
             logger.debug(f"✅ Saved {filepath}")
 
@@ -308,59 +316,139 @@ class DataManager:
             logger.error(f"❌ Failed to save {filepath}: {e}")
             return False
 
+    def _get_sync_method(self, filepath: str) -> Optional[str]:
+        """
+        Resolve the SheetsManager method that syncs a given data file.
+
+        Args:
+            filepath (str): Path of the file being synced
+
+        Returns:
+            str: Method name, or None if the file is not synced to sheets
+        """
+        filename = os.path.basename(filepath)
+
+        # Enhanced sync mapping with better error handling
+        sync_methods = {
+            "events.json": ("sync_current_teams", "events"),
+            "event_results.json": ("sync_results_history", "results"),
+            "events_history.json": ("sync_events_history", "events_history"),
+            "blocked_users.json": ("sync_blocked_users", "blocked"),
+            "player_stats.json": ("sync_player_stats", "player_stats"),
+            "notification_preferences.json": ("sync_notification_preferences", "notification_preferences"),
+            "ign_map.json": ("sync_ign_map", "ign_map"),
+            "absent_users.json": (None, None)  # Handled in player stats
+        }
+
+        if filename not in sync_methods:
+            logger.debug(f"No sync method defined for {filename}")
+            return None
+
+        method_name, data_type = sync_methods[filename]
+        if method_name and not hasattr(self.sheets_manager, method_name):
+            logger.debug(f"⚠️ Sync method '{method_name}' not found for {filename}")
+            return None
+
+        return method_name
+
     def _sync_to_sheets(self, filepath: str, data: Any):
         """
         Sync data to Google Sheets with enhanced error handling.
 
+        When called from the event loop the snapshot goes to the write-behind
+        sync queue, which coalesces repeated saves of the same file; outside
+        a loop (scripts, tests) it runs inline.
+
         Args:
             filepath (str): Path of the file being synced
             data (Any): Data to sync to sheets
         """
-        if not self.is_sheets_available():
+        if not (self.is_sheets_available() or self.is_sheets_connecting()):
             logger.debug("Sheets not available for sync")
             return
 
+        if not self._get_sync_method(filepath):
+            return
+
+        async def _sync(snapshot):
+            return await self.sync_to_sheets_async(filepath, snapshot)
+
+        if not sync_queue.enqueue(filepath, data, _sync):
+            self._run_sheets_sync(filepath, data)
+
+    def _run_sheets_sync(self, filepath: str, data: Any):
+        """Run a sheets sync inline on the calling thread."""
         try:
-            filename = os.path.basename(filepath)
-
-            # Enhanced sync mapping with better error handling
-            sync_methods = {
-                "events.json": ("sync_current_teams", "events"),
-                "event_results.json": ("sync_results_history", "results"),
-                "events_history.json": ("sync_events_history", "events_history"),
-                "blocked_users.json": ("sync_blocked_users", "blocked"),
-                "player_stats.json": ("sync_player_stats", "player_stats"),
-                "notification_preferences.json": ("sync_notification_preferences", "notification_preferences"),
-                "ign_map.json": ("sync_ign_map", "ign_map"),
-                "absent_users.json": (None, None)  # Handled in player stats
-            }
+            method_name = self._get_sync_method(filepath)
+            if not method_name:
+                return
 
-            if filename in sync_methods:
-                method_name, data_type = sync_methods[filename]
+            method = getattr(self.sheets_manager, method_name)
+            self._record_sync_result(filepath, method(data))
 
-                if method_name and hasattr(self.sheets_manager, method_name):
-                    try:
-                        method = getattr(self.sheets_manager, method_name)
-                        success = method(data)
+        except Exception as e:
+            logger.warning(f"Failed to sync {filepath} to sheets: {e}")
+
+    async def sync_to_sheets_async(self, filepath: str, data: Any) -> bool:
+        """
+        Sync data to Google Sheets without blocking the event loop.
+
+        Args:
+            filepath (str): Path of the file being synced
+            data (Any): Data to sync to sheets
 
-                        if success:
-                            logger.info(f"✅ Synced {filename} to Google Sheets")
-                            self.last_sync_time = datetime.utcnow().isoformat()
-                        else:
-                            logger.warning(f"⚠️ Failed to sync {filename} to Google Sheets")
+        Returns:
+            bool: True if the sync succeeded
+        """
+        if not (self.is_sheets_available() or self.is_sheets_connecting()):
+            return False
 
-                    except Exception as e:
-                        logger.error(f"❌ Error syncing {filename}: {e}")
-                        # Don't disable sync for single failures
+        try:
+            method_name = self._get_sync_method(filepath)
+            if not method_name:
+                return False
 
-                else:
-                    if method_name:  # Only log if method was expected
-                        logger.debug(f"⚠️ Sync method '{method_name}' not found for {filename}")
-            else:
-                logger.debug(f"No sync method defined for {filename}")
+            method = getattr(self.sheets_manager, method_name)
+            success = await self._run_off_loop(method, data)
+            return self._record_sync_result(filepath, success)
 
         except Exception as e:
-            logger.warning(f"Failed to sync {filepath} to sheets: {e}")
+            logger.error(f"❌ Error syncing {os.path.basename(filepath)}: {e}")
+            # Don't disable sync for single failures
+            return False
+
+    async def _run_off_loop(self, func, *args, priority: Optional[int] = None) -> Any:
+        """
+        Run a blocking sheets-backed call without stalling the event loop.
+
+        Uses the sheets async engine when available so all sheets work shares
+        one executor and one quota manager.
+
+        Args:
+            func: Blocking function to execute
+            *args: Arguments for the function
+            priority: Engine priority class (defaults to interactive)
+        """
+        engine = getattr(self.sheets_manager, "engine", None)
+        if engine is not None:
+            if priority is None:
+                return await engine.run(func, *args)
+            return await engine.run(func, *args, priority=priority)
+
+        # Legacy managers without an engine still run off the loop
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, func, *args)
+
+    def _record_sync_result(self, filepath: str, success: Any) -> bool:
+        """Log the outcome of a sheets sync and update the sync timestamp."""
+        filename = os.path.basename(filepath)
+        if success:
+            logger.info(f"✅ Synced {filename} to Google Sheets")
+            self.last_sync_time = datetime.utcnow().isoformat()
+            return True
+
+        logger.warning(f"⚠️ Failed to sync {filename} to Google Sheets")
+        return False
 
     def update_player_stats(self, user_id: str, team: str, result: str, user_name: str = ""):
         """
@@ -375,36 +463,19 @@ class DataManager:
         user_id = str(user_id)
 
         # Initialize player stats if not exists
-        if user_id not in self.player_stats:
-            self.player_stats[user_id] = {
-                "name": user_name,
-                "team_results": {
-                    "main_team": {"wins": 0, "losses": 0},
-                    "team_2": {"wins": 0, "losses": 0},
-                    "team_3": {"wins": 0, "losses": 0}
-                },
-                "power_rating": 0,
-                "absents": 0,
-                "blocked": False,
-                "specializations": {
-                    "cavalry": False,
-                    "mages": False,
-                    "archers": False,
-                    "infantry": False,
-                    "whale": False
-                }
-            }
+        player = self.player_stats.get(user_id)
+        if player is None:
+            player = PlayerStats(
+                name=user_name, power_rating=0, specializations=frozenset()
+            )
+            self.player_stats[user_id] = player
 
         # Update team results
-        if team in self.player_stats[user_id]["team_results"]:
-            if result.lower() in ["win", "wins"]:
-                self.player_stats[user_id]["team_results"][team]["wins"] += 1
-            elif result.lower() in ["loss", "losses"]:
-                self.player_stats[user_id]["team_results"][team]["losses"] += 1
+        player.record(team, result)
 
         # Update name if provided
         if user_name:
-            self.player_stats[user_id]["name"] = user_name
+            player.name = user_name
 
         logger.info(f"Updated stats for {user_id}: {team} {result}")
 
@@ -418,8 +489,8 @@ class DataManager:
         Returns:
             dict: Player statistics or empty dict if not found
         """
-        user_id = str(user_id)
-        return self.player_stats.get(user_id, {})
+        player = self.player_stats.get(str(user_id))
+        return player.to_dict() if player else {}
 
     def get_all_player_stats(self) -> Dict[str, Any]:
         """
@@ -428,7 +499,7 @@ class DataManager:
         Returns:
             dict: All player statistics
         """
-        return self.player_stats.copy()
+        return {user_id: player.to_dict() for user_id, player in self.player_stats.items()}
 
     def create_all_templates(self, all_data: dict) -> bool:
         """
@@ -460,6 +531,22 @@ class DataManager:
             logger.error(f"Failed to create sheet templates: {e}")
             return False
 
+    async def create_all_templates_async(self, all_data: dict) -> bool:
+        """
+        Awaitable version of create_all_templates.
+
+        Args:
+            all_data (dict): Complete bot data for template creation
+
+        Returns:
+            bool: True if templates were created successfully
+        """
+        from sheets.quota import Priority
+
+        return await self._run_off_loop(
+            self.create_all_templates, all_data, priority=Priority.MAINTENANCE
+        )
+
     def update_player_power(self, user_id: str, power_rating: int, specializations: dict = None):
         """
         Update player power rating and specializations.
@@ -474,10 +561,11 @@ class DataManager:
         if user_id not in self.player_stats:
             self.update_player_stats(user_id, "main_team", "", "")
 
-        self.player_stats[user_id]["power_rating"] = power_rating
+        player = self.player_stats[user_id]
+        player.power_rating = power_rating
 
         if specializations:
-            self.player_stats[user_id]["specializations"].update(specializations)
+            player.set_specializations(specializations)
 
         logger.info(f"Updated power for {user_id}: {power_rating}")
 
@@ -627,6 +715,17 @@ class DataManager:
             logger.error(f"❌ Force resync failed: {e}")
             return False
 
+    async def force_resync_async(self) -> bool:
+        """
+        Awaitable version of force_resync.
+
+        Returns:
+            bool: True if resync was successful
+        """
+        from sheets.quota import Priority
+
+        return await self._run_off_loop(self.force_resync, priority=Priority.SYNC)
+
     def get_sync_status(self) -> Dict[str, Any]:
         """
         Get comprehensive synchronization status.
@@ -0,0 +1,269 @@
+"""
+Precomputed event-time schedule shared by reminders and time queries.
+
+Event times are stored as strings like "17:30 UTC Tuesday". The reminder
+task used to re-parse every team's string once a minute and compare the
+result against a ±0.5 minute window, and the mention handler parsed them
+again on every "when is RoW" question. The schedule parses each string
+once when times are loaded or saved, keeps the upcoming reminder fire
+times in a min-heap and sleeps until the earliest one is due.
+"""
+
+import asyncio
+import heapq
+from datetime import datetime, timedelta
+from functools import lru_cache
+from typing import Awaitable, Callable, Dict, List, Optional, Set, Tuple
+
+from config.constants import DEFAULT_TIMES, NOTIFICATION_CONFIG
+from utils.logger import setup_logger
+
+logger = setup_logger("event_schedule")
+
+DAY_MAP = {
+    "monday": 0,
+    "tuesday": 1,
+    "wednesday": 2,
+    "thursday": 3,
+    "friday": 4,
+    "saturday": 5,
+    "sunday": 6,
+}
+
+# Used when a stored time cannot be parsed (matches the old reminder fallback)
+FALLBACK_SLOT = (1, 17, 30)
+
+# (weekday, hour, minute)
+Slot = Tuple[int, int, int]
+ReminderCallback = Callable[[str, int, datetime], Awaitable[None]]
+
+
+@lru_cache(maxsize=64)
+def parse_event_time(time_str: str) -> Optional[Slot]:
+    """
+    Parse an event time string.
+
+    Args:
+        time_str: Time string in format '14:00 UTC Saturday'
+
+    Returns:
+        tuple: (weekday, hour, minute) with Monday=0, or None if invalid
+    """
+    try:
+        parts = str(time_str).split()
+        if len(parts) < 3:
+            return None
+        hour, minute = map(int, parts[0].split(":"))
+        weekday = DAY_MAP.get(parts[2].lower())
+        if weekday is None or not (0 <= hour < 24 and 0 <= minute < 60):
+            return None
+        return weekday, hour, minute
+    except ValueError:
+        return None
+
+
+def next_occurrence(slot: Slot, now: Optional[datetime] = None) -> datetime:
+    """
+    Get the next time a weekly slot comes round.
+
+    Args:
+        slot: (weekday, hour, minute)
+        now: Reference time (UTC), defaults to now
+
+    Returns:
+        datetime: Next occurrence after ``now`` (later today counts)
+    """
+    now = now or datetime.utcnow()
+    weekday, hour, minute = slot
+    days_ahead = (weekday - now.weekday()) % 7
+    target = now.replace(hour=hour, minute=minute, second=0, microsecond=0)
+    target += timedelta(days=days_ahead)
+    if target <= now:  # Already started this week
+        target += timedelta(days=7)
+    return target
+
+
+class EventSchedule:
+    """
+    Parsed event times and exact-deadline reminder timers.
+
+    Features:
+    - Each team's time string parsed once per change
+    - Min-heap of upcoming (fire time, team, minutes before) reminders
+    - One sleeper task woken early when times change
+    - Late timers past the grace window are skipped, not fired
+    """
+
+    _instance: Optional["EventSchedule"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._times: Dict[str, str] = {}
+        self._slots: Dict[str, Slot] = {}
+        self._heap: List[Tuple[datetime, str, int]] = []
+        self._reminder_minutes = tuple(NOTIFICATION_CONFIG.get("REMINDER_MINUTES", (60, 15, 5)))
+        self._grace = timedelta(seconds=NOTIFICATION_CONFIG.get("REMINDER_GRACE", 120))
+        self._callback: Optional[ReminderCallback] = None
+        self._runner: Optional[asyncio.Task] = None
+        self._wake: Optional[asyncio.Event] = None
+        self._pending: Set[asyncio.Task] = set()
+        self.set_times(DEFAULT_TIMES)
+        self._initialized = True
+
+    # ==========================================
+    # EVENT TIMES
+    # ==========================================
+
+    def set_times(self, times: Dict[str, str]):
+        """
+        Load team event times and re-arm the reminder timers.
+
+        Args:
+            times: Team key -> time string
+        """
+        self._times = dict(times or {})
+        self._slots = {}
+        for team_key, time_str in self._times.items():
+            slot = parse_event_time(time_str)
+            if slot is None:
+                logger.error(
+                    f"❌ Failed to parse event time for {team_key}: {time_str}, using Tuesday 17:30 UTC"
+                )
+                slot = FALLBACK_SLOT
+            self._slots[team_key] = slot
+        self._rebuild_heap()
+
+    def get_time_string(self, team_key: str, default: str = "TBD") -> str:
+        """Get the configured time string for a team."""
+        return self._times.get(team_key, default)
+
+    def next_event(self, team_key: str, now: Optional[datetime] = None) -> Optional[datetime]:
+        """Get a team's next event start (UTC), or None if unknown."""
+        slot = self._slots.get(team_key)
+        return next_occurrence(slot, now) if slot else None
+
+    def time_until(self, time_str: str, now: Optional[datetime] = None) -> Optional[timedelta]:
+        """
+        Time left until the next occurrence of a time string.
+
+        Args:
+            time_str: Time string in format '14:00 UTC Saturday'
+            now: Reference time (UTC), defaults to now
+
+        Returns:
+            timedelta: Time until the event, or None if the string is invalid
+        """
+        slot = parse_event_time(time_str)
+        if slot is None:
+            return None
+        now = now or datetime.utcnow()
+        return next_occurrence(slot, now) - now
+
+    # ==========================================
+    # REMINDER TIMERS
+    # ==========================================
+
+    def _next_fire(self, team_key: str, minutes: int, now: datetime) -> datetime:
+        """Next reminder fire time strictly after ``now``."""
+        fire_at = next_occurrence(self._slots[team_key], now) - timedelta(minutes=minutes)
+        while fire_at <= now:
+            fire_at += timedelta(days=7)
+        return fire_at
+
+    def _rebuild_heap(self):
+        now = datetime.utcnow()
+        self._heap = [
+            (self._next_fire(team_key, minutes, now), team_key, minutes)
+            for team_key in self._slots
+            for minutes in self._reminder_minutes
+        ]
+        heapq.heapify(self._heap)
+        if self._wake is not None:
+            self._wake.set()
+
+    def upcoming(self, count: int = 5) -> List[Tuple[datetime, str, int]]:
+        """Get the next ``count`` reminders as (fire time, team, minutes)."""
+        return heapq.nsmallest(count, self._heap)
+
+    def start(self, callback: ReminderCallback):
+        """
+        Start firing reminders.
+
+        Args:
+            callback: Coroutine called as ``callback(team_key, minutes, event_time)``
+        """
+        self._callback = callback
+        if self._runner and not self._runner.done():
+            return
+        self._wake = asyncio.Event()
+        self._runner = asyncio.create_task(self._run())
+        logger.info(f"⏰ Event reminders armed ({len(self._heap)} timers)")
+
+    async def stop(self):
+        """Cancel the timer task."""
+        if self._runner:
+            self._runner.cancel()
+            try:
+                await self._runner
+            except asyncio.CancelledError:
+                pass
+            self._runner = None
+
+    async def _run(self):
+        while True:
+            try:
+                self._wake.clear()
+                if not self._heap:
+                    await self._wake.wait()
+                    continue
+
+                delay = (self._heap[0][0] - datetime.utcnow()).total_seconds()
+                if delay > 0:
+                    # Capped so a wall-clock jump is noticed within the hour
+                    try:
+                        await asyncio.wait_for(self._wake.wait(), timeout=min(delay, 3600))
+                    except asyncio.TimeoutError:
+                        pass
+                    continue
+
+                self._fire_due(datetime.utcnow())
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logger.exception(f"Error in event reminder timer: {e}")
+                await asyncio.sleep(5)
+
+    def _fire_due(self, now: datetime):
+        while self._heap and self._heap[0][0] <= now:
+            fire_at, team_key, minutes = heapq.heappop(self._heap)
+            heapq.heappush(self._heap, (self._next_fire(team_key, minutes, now), team_key, minutes))
+
+            if now - fire_at > self._grace:
+                logger.warning(
+                    f"⚠️ Skipped {minutes}-minute reminder for {team_key}, "
+                    f"{(now - fire_at).total_seconds():.0f}s late"
+                )
+                continue
+            if self._callback is None:
+                continue
+
+            event_time = fire_at + timedelta(minutes=minutes)
+            task = asyncio.create_task(self._callback(team_key, minutes, event_time))
+            self._pending.add(task)
+            task.add_done_callback(self._reminder_done)
+
+    def _reminder_done(self, task: asyncio.Task):
+        self._pending.discard(task)
+        if not task.cancelled() and task.exception():
+            logger.error(f"Failed to send smart reminders: {task.exception()}")
+
+
+# Global instance
+event_schedule = EventSchedule()
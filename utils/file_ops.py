@@ -1,17 +1,16 @@
 import asyncio
-import json
-import os
 import shutil
 from datetime import datetime
 from typing import Any, Optional
 
 from utils.logger import setup_logger
+from utils.storage import storage
 
 logger = setup_logger("file_ops")
 
 
 class FileOps:
-    """Thread-safe file operations manager."""
+    """Thread-safe file operations manager (thin wrapper over the storage service)."""
 
     _instance: Optional["FileOps"] = None
 
@@ -23,75 +22,26 @@ class FileOps:
 
     def __init__(self):
         if not self._initialized:
-            self._locks = {}
             self._initialized = True
 
     def get_lock(self, filepath: str) -> asyncio.Lock:
-        if filepath not in self._locks:
-            self._locks[filepath] = asyncio.Lock()
-        return self._locks[filepath]
+        """Get the storage service lock for a file."""
+        return storage.lock(filepath)
 
     async def load_json(self, filepath: str, default: Any = None) -> Any:
-        """Load JSON data from file with atomic operations and validation."""
-        async with self.get_lock(filepath):
-            try:
-                if not os.path.exists(filepath):
-                    logger.debug(f"File {filepath} does not exist, returning default")
-                    return default
-
-                # Use asyncio to read file to avoid blocking
-                loop = asyncio.get_event_loop()
-
-                def _read_file():
-                    with open(filepath, "r", encoding="utf-8") as f:
-                        return json.load(f)
-
-                data = await loop.run_in_executor(None, _read_file)
-
-                logger.debug(f"✅ Loaded {filepath}")
-                return data
+        """Load JSON data through the storage service."""
+        try:
+            data = await storage.load(filepath, default)
+            logger.debug(f"✅ Loaded {filepath}")
+            return data
 
-            except json.JSONDecodeError as e:
-                logger.error(f"❌ Invalid JSON in {filepath}: {e}")
-                await self._create_backup(filepath)
-                return default
-            except Exception as e:
-                logger.error(f"❌ Failed to load {filepath}: {e}")
-                return default
+        except Exception as e:
+            logger.error(f"❌ Failed to load {filepath}: {e}")
+            return default
 
     async def save_json(self, filepath: str, data: Any) -> bool:
-        """Save JSON data with atomic operations and proper locking."""
-        async with self.get_lock(filepath):
-            temp_file = f"{filepath}.tmp"
-            backup_file = f"{filepath}.bak"
-
-            try:
-                # Use asyncio executor for file operations to avoid blocking
-                loop = asyncio.get_event_loop()
-
-                def _write_file():
-                    # Create directory if needed
-                    os.makedirs(os.path.dirname(filepath), exist_ok=True)
-
-                    # Write to temp file
-                    with open(temp_file, "w", encoding="utf-8") as f:
-                        json.dump(data, f, indent=2)
-
-                    # Backup existing file
-                    if os.path.exists(filepath):
-                        shutil.copy2(filepath, backup_file)
-
-                    # Atomic replace
-                    shutil.move(temp_file, filepath)
-
-                await loop.run_in_executor(None, _write_file)
-                return True
-
-            except Exception as e:
-                logger.error(f"Failed to save {filepath}: {e}")
-                if os.path.exists(temp_file):
-                    os.remove(temp_file)
-                return False
+        """Save JSON data through the storage service with proper locking."""
+        return await storage.save(filepath, data, sync_to_sheets=False)
 
     async def _create_backup(self, filepath: str):
         """Create backup of corrupted file."""
@@ -105,12 +55,7 @@ class FileOps:
 
     async def shutdown(self):
         """Cleanup any open resources."""
-        # Wait for any pending operations
-        for lock in self._locks.values():
-            if lock.locked():
-                await lock.acquire()
-                lock.release()
-        self._locks.clear()
+        # Pending writes are drained by storage.close()
 
 
 # Global instance
@@ -0,0 +1,233 @@
+"""
+Shared in-game name directory.
+
+Cogs each read ign_map.json on their own and reverse lookups (IGN to
+user) walked the whole mapping. The directory keeps forward, reverse and
+case-insensitive indexes plus a trigram index for "did you mean"
+suggestions. IGN changes made through it are applied to the indexes in
+place; writes to ign_map.json from anywhere else (restores, data fixes,
+sheets imports) are noticed through storage change events and trigger a
+lazy rebuild on the next read.
+"""
+
+import os
+from typing import Dict, List, Optional, Set, Tuple
+
+from config.constants import FILES
+from utils.logger import setup_logger
+from utils.storage import storage
+
+logger = setup_logger("ign_directory")
+
+
+def normalize_ign(ign: str) -> str:
+    """Case- and whitespace-insensitive form of an IGN."""
+    return " ".join(str(ign).split()).casefold()
+
+
+def _trigrams(normalized: str) -> Set[str]:
+    padded = f"  {normalized} "
+    return {padded[i:i + 3] for i in range(len(padded) - 2)}
+
+
+class IGNDirectory:
+    """
+    Forward, reverse and fuzzy IGN lookups over ign_map.json.
+
+    Features:
+    - O(1) user ID -> IGN and IGN -> user ID lookups
+    - Case-insensitive matching through a normalized index
+    - Trigram similarity suggestions for misspelled IGNs
+    - In-place index updates for set/remove, lazy rebuild on outside writes
+    """
+
+    _instance: Optional["IGNDirectory"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self.file = FILES["IGN_MAP"]
+        self._forward: Dict[str, str] = {}
+        self._by_normalized: Dict[str, Set[str]] = {}
+        self._trigram_index: Dict[str, Set[str]] = {}
+        self._display: Dict[str, str] = {}  # Normalized -> IGN as first written
+        self._writes = 0  # ign_map.json writes seen by the storage listener
+        self._indexed_writes = -1  # Write count the indexes reflect
+        storage.add_listener(self._on_data_changed)
+        self._initialized = True
+
+    # ==========================================
+    # INDEX MAINTENANCE
+    # ==========================================
+
+    def _on_data_changed(self, filepath: str):
+        if os.path.basename(filepath) == os.path.basename(self.file):
+            self._writes += 1
+
+    def _ensure_fresh(self):
+        if self._indexed_writes == self._writes:
+            return
+        writes = self._writes
+        self._forward.clear()
+        self._by_normalized.clear()
+        self._trigram_index.clear()
+        self._display.clear()
+        for user_id, ign in storage.view(self.file, {}).items():
+            if isinstance(ign, str) and ign.strip():
+                self._index(str(user_id), ign)
+        self._indexed_writes = writes
+        logger.debug(f"🔄 IGN directory rebuilt: {len(self._forward)} entries")
+
+    def _index(self, user_id: str, ign: str):
+        self._forward[user_id] = ign
+        normalized = normalize_ign(ign)
+        users = self._by_normalized.setdefault(normalized, set())
+        if not users:
+            self._display[normalized] = ign
+            for gram in _trigrams(normalized):
+                self._trigram_index.setdefault(gram, set()).add(normalized)
+        users.add(user_id)
+
+    def _unindex(self, user_id: str):
+        ign = self._forward.pop(user_id, None)
+        if ign is None:
+            return
+        normalized = normalize_ign(ign)
+        users = self._by_normalized.get(normalized)
+        if users is None:
+            return
+        users.discard(user_id)
+        if not users:
+            del self._by_normalized[normalized]
+            self._display.pop(normalized, None)
+            for gram in _trigrams(normalized):
+                names = self._trigram_index.get(gram)
+                if names is not None:
+                    names.discard(normalized)
+                    if not names:
+                        del self._trigram_index[gram]
+
+    # ==========================================
+    # WRITES
+    # ==========================================
+
+    async def set_ign(self, user_id, ign: str, sync_to_sheets: bool = True) -> bool:
+        """
+        Store a user's IGN and update the indexes in place.
+
+        Args:
+            user_id: Discord user ID
+            ign: In-game name
+            sync_to_sheets: Queue a Google Sheets sync
+
+        Returns:
+            bool: True if saved
+        """
+        user_id = str(user_id)
+        self._ensure_fresh()
+        seen = self._writes
+        success = await storage.set_item(self.file, user_id, ign, sync_to_sheets=sync_to_sheets)
+        # Only our own write landed meanwhile: patch instead of rebuilding
+        if success and self._writes == seen + 1:
+            self._unindex(user_id)
+            self._index(user_id, ign)
+            self._indexed_writes = self._writes
+        return success
+
+    async def remove_ign(self, user_id, sync_to_sheets: bool = True) -> bool:
+        """
+        Remove a user's IGN and update the indexes in place.
+
+        Returns:
+            bool: True if removed
+        """
+        user_id = str(user_id)
+        self._ensure_fresh()
+        seen = self._writes
+        success = await storage.delete_item(self.file, user_id, sync_to_sheets=sync_to_sheets)
+        if success and self._writes == seen + 1:
+            self._unindex(user_id)
+            self._indexed_writes = self._writes
+        return success
+
+    # ==========================================
+    # READS
+    # ==========================================
+
+    def get(self, user_id) -> Optional[str]:
+        """IGN of a user, or None if not set."""
+        self._ensure_fresh()
+        return self._forward.get(str(user_id))
+
+    def has(self, user_id) -> bool:
+        """Check if a user has an IGN set."""
+        self._ensure_fresh()
+        return str(user_id) in self._forward
+
+    def users_for(self, ign: str) -> List[str]:
+        """User IDs registered with an IGN (case-insensitive)."""
+        self._ensure_fresh()
+        return sorted(self._by_normalized.get(normalize_ign(ign), ()))
+
+    def user_for(self, ign: str) -> Optional[str]:
+        """
+        User ID registered with an IGN (case-insensitive).
+
+        When several users share an IGN, the one whose stored IGN matches
+        exactly (including case) wins, else the lowest user ID.
+        """
+        users = self.users_for(ign)
+        if len(users) > 1:
+            exact = [uid for uid in users if self._forward.get(uid) == ign]
+            return (exact or users)[0]
+        return users[0] if users else None
+
+    def suggest(self, text: str, limit: int = 3, min_score: float = 0.3) -> List[Tuple[str, float]]:
+        """
+        IGNs similar to a (possibly misspelled) name.
+
+        Args:
+            text: Name to match
+            limit: Max suggestions
+            min_score: Minimum trigram similarity (0-1)
+
+        Returns:
+            list: (ign, score) pairs, best first
+        """
+        self._ensure_fresh()
+        normalized = normalize_ign(text)
+        if not normalized:
+            return []
+
+        query = _trigrams(normalized)
+        shared: Dict[str, int] = {}
+        for gram in query:
+            for name in self._trigram_index.get(gram, ()):
+                shared[name] = shared.get(name, 0) + 1
+
+        scored = []
+        for name, overlap in shared.items():
+            score = overlap / (len(query) + len(_trigrams(name)) - overlap)
+            if score >= min_score:
+                scored.append((self._display[name], round(score, 3)))
+        scored.sort(key=lambda item: (-item[1], item[0].casefold()))
+        return scored[:limit]
+
+    def as_dict(self) -> Dict[str, str]:
+        """Copy of the user ID -> IGN mapping."""
+        self._ensure_fresh()
+        return dict(self._forward)
+
+    def __len__(self) -> int:
+        self._ensure_fresh()
+        return len(self._forward)
+
+
+# Global instance
+ign_directory = IGNDirectory()
@@ -0,0 +1,126 @@
+"""
+Latency histograms for time-critical bot paths.
+
+Discord fails an interaction that is not acknowledged within 3 seconds.
+Button and dropdown handlers record how long they took to send their
+response into fixed-bucket histograms, so tail latency (p95/p99) can be
+checked against the acknowledgement budget without keeping every sample.
+"""
+
+import bisect
+import time
+from contextlib import contextmanager
+from typing import Dict, List, Optional, Tuple
+
+from config.constants import INTERACTION_CONFIG
+from utils.logger import setup_logger
+
+logger = setup_logger("latency")
+
+# Bucket upper bounds in milliseconds; the last bucket is unbounded
+BUCKETS_MS: Tuple[float, ...] = (
+    5, 10, 25, 50, 75, 100, 150, 250, 400, 500, 750, 1000, 2000, 3000, 5000,
+)
+
+
+class LatencyHistogram:
+    """
+    Fixed-bucket latency histogram.
+
+    Percentiles are reported as the upper bound of the bucket holding the
+    requested rank (never optimistic), capped at the slowest sample seen.
+    """
+
+    __slots__ = ("counts", "total", "sum_ms", "max_ms")
+
+    def __init__(self):
+        self.counts: List[int] = [0] * (len(BUCKETS_MS) + 1)
+        self.total = 0
+        self.sum_ms = 0.0
+        self.max_ms = 0.0
+
+    def record(self, elapsed_ms: float):
+        self.counts[bisect.bisect_left(BUCKETS_MS, elapsed_ms)] += 1
+        self.total += 1
+        self.sum_ms += elapsed_ms
+        self.max_ms = max(self.max_ms, elapsed_ms)
+
+    def percentile(self, pct: float) -> Optional[float]:
+        """Latency in ms that pct percent of samples did not exceed."""
+        if not self.total:
+            return None
+        rank = max(1, round(self.total * pct / 100))
+        seen = 0
+        for idx, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank:
+                bound = BUCKETS_MS[idx] if idx < len(BUCKETS_MS) else self.max_ms
+                return min(bound, self.max_ms)
+        return self.max_ms
+
+    def summary(self) -> Dict[str, Optional[float]]:
+        if not self.total:
+            return {"count": 0}
+        return {
+            "count": self.total,
+            "avg_ms": round(self.sum_ms / self.total, 1),
+            "p50_ms": round(self.percentile(50), 1),
+            "p95_ms": round(self.percentile(95), 1),
+            "p99_ms": round(self.percentile(99), 1),
+            "max_ms": round(self.max_ms, 1),
+        }
+
+
+class LatencyMetrics:
+    """
+    Named latency histograms shared by the whole bot.
+
+    Features:
+    - One histogram per measured path (e.g. "button.join_team_2")
+    - Slow samples over the acknowledgement budget are logged
+    - Summaries with p50/p95/p99 for admin commands
+    """
+
+    _instance: Optional["LatencyMetrics"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._histograms: Dict[str, LatencyHistogram] = {}
+        self.budget_ms = INTERACTION_CONFIG["ACK_BUDGET_MS"]
+        self._initialized = True
+
+    def record(self, name: str, elapsed_ms: float):
+        """Add one sample (milliseconds) to a named histogram."""
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = LatencyHistogram()
+        histogram.record(elapsed_ms)
+        if elapsed_ms > self.budget_ms:
+            logger.warning(f"🐢 {name} took {elapsed_ms:.0f}ms (budget {self.budget_ms}ms)")
+
+    @contextmanager
+    def measure(self, name: str):
+        """Record the wall time of a block into a named histogram."""
+        started = time.perf_counter()
+        try:
+            yield
+        finally:
+            self.record(name, (time.perf_counter() - started) * 1000)
+
+    def summary(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Per-histogram count, average and percentiles."""
+        return {name: hist.summary() for name, hist in sorted(self._histograms.items())}
+
+    def reset(self):
+        self._histograms.clear()
+
+
+# Global instance
+latency_metrics = LatencyMetrics()
@@ -0,0 +1,220 @@
+"""
+Sorted player leaderboards kept in step with the stats index.
+
+Each board is a list of sort keys kept in order with ``bisect``, plus a
+user -> key map. Rank lookups and the start of "top N" / "players around
+X" queries are binary searches. A stat change moves only that player's
+key instead of re-sorting every player per request.
+"""
+
+import threading
+from bisect import bisect_left, insort
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from utils.logger import setup_logger
+from utils.models import PlayerStats
+from utils.stats_index import stats_index
+
+logger = setup_logger("leaderboard")
+
+SortKey = Tuple[Any, ...]
+
+
+def _win_rate(player: PlayerStats) -> float:
+    games = player.total_wins + player.total_losses
+    return (player.total_wins / games * 100) if games > 0 else 0.0
+
+
+def performance_tier(win_rate: float, total_games: int) -> str:
+    """
+    Classify a player's performance.
+
+    Args:
+        win_rate: Win rate percentage
+        total_games: Games played
+
+    Returns:
+        str: Elite, Expert, Advanced, Intermediate, Beginner or Unranked
+    """
+    if total_games == 0:
+        return "Unranked"
+    if win_rate >= 80 and total_games >= 10:
+        return "Elite"
+    if win_rate >= 70 and total_games >= 5:
+        return "Expert"
+    if win_rate >= 60:
+        return "Advanced"
+    if win_rate >= 50:
+        return "Intermediate"
+    return "Beginner"
+
+
+# Board name -> sort key (ascending order = best first)
+BOARDS: Dict[str, Callable[[PlayerStats], SortKey]] = {
+    "winrate": lambda p: (-_win_rate(p), -(p.total_wins + p.total_losses)),
+    "games": lambda p: (-(p.total_wins + p.total_losses), -_win_rate(p)),
+    "power": lambda p: (-(p.power_rating or 0), -_win_rate(p)),
+}
+
+
+class _Board:
+    """One ordered ranking of players."""
+
+    __slots__ = ("key_func", "keys", "by_user")
+
+    def __init__(self, key_func: Callable[[PlayerStats], SortKey]):
+        self.key_func = key_func
+        self.keys: List[SortKey] = []
+        self.by_user: Dict[str, SortKey] = {}
+
+    def rebuild(self, players: Dict[str, PlayerStats]):
+        self.by_user = {
+            user_id: self.key_func(player) + (user_id,)
+            for user_id, player in players.items()
+        }
+        self.keys = sorted(self.by_user.values())
+
+    def upsert(self, user_id: str, player: Optional[PlayerStats]):
+        old = self.by_user.pop(user_id, None)
+        new = self.key_func(player) + (user_id,) if player is not None else None
+        if old == new:
+            if new is not None:
+                self.by_user[user_id] = new
+            return
+        if old is not None:
+            del self.keys[bisect_left(self.keys, old)]
+        if new is not None:
+            insort(self.keys, new)
+            self.by_user[user_id] = new
+
+    def rank(self, user_id: str) -> Optional[int]:
+        key = self.by_user.get(user_id)
+        return bisect_left(self.keys, key) + 1 if key is not None else None
+
+
+class Leaderboard:
+    """
+    Win rate, games played and power rating leaderboards.
+
+    Features:
+    - Incremental updates from the stats index
+    - Rank of a player by binary search
+    - Top N and players-around-X slices
+    - Shared by the dashboard and the !leaderboard command
+    """
+
+    _instance: Optional["Leaderboard"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._lock = threading.RLock()
+        self._boards = {name: _Board(key_func) for name, key_func in BOARDS.items()}
+        self._players: Dict[str, PlayerStats] = {}
+        stats_index.add_listener(self._on_stats_change)
+        # Make sure the first read seeds the boards with a full rebuild
+        stats_index.invalidate()
+        self._initialized = True
+
+    def _on_stats_change(self, user_id: Optional[str], payload: Any):
+        """Stats index listener: full rebuild or a single player's update."""
+        with self._lock:
+            if user_id is None:
+                self._players = dict(payload)
+                for board in self._boards.values():
+                    board.rebuild(self._players)
+                return
+
+            if payload is None:
+                self._players.pop(user_id, None)
+            else:
+                self._players[user_id] = payload
+            for board in self._boards.values():
+                board.upsert(user_id, payload)
+
+    def _board(self, board: str) -> _Board:
+        if board not in self._boards:
+            raise ValueError(f"Unknown leaderboard: {board}")
+        # Pull in any pending rebuild before taking our own lock
+        stats_index.refresh()
+        return self._boards[board]
+
+    def _entry(self, position: int, user_id: str) -> Dict[str, Any]:
+        player = self._players[user_id]
+        wins, losses = player.total_wins, player.total_losses
+        win_rate = _win_rate(player)
+        return {
+            "position": position,
+            "user_id": user_id,
+            "username": player.name or user_id,
+            "wins": wins,
+            "losses": losses,
+            "total_games": wins + losses,
+            "win_rate": round(win_rate, 1),
+            "power_rating": player.power_rating or 0,
+            "rank": performance_tier(win_rate, wins + losses),
+        }
+
+    def _slice(self, board: _Board, start: int, stop: int) -> List[Dict[str, Any]]:
+        start = max(start, 0)
+        return [
+            self._entry(position, key[-1])
+            for position, key in enumerate(board.keys[start:stop], start + 1)
+        ]
+
+    def top(self, count: int = 10, board: str = "winrate") -> List[Dict[str, Any]]:
+        """
+        Get the best ``count`` players.
+
+        Args:
+            count: Number of players to return
+            board: winrate, games or power
+
+        Returns:
+            List[Dict]: Leaderboard entries, best first
+        """
+        ranking = self._board(board)
+        with self._lock:
+            return self._slice(ranking, 0, count)
+
+    def rank(self, user_id: str, board: str = "winrate") -> Optional[int]:
+        """Get a player's 1-based position, or None if they have no stats."""
+        ranking = self._board(board)
+        with self._lock:
+            return ranking.rank(str(user_id))
+
+    def around(self, user_id: str, radius: int = 2, board: str = "winrate") -> List[Dict[str, Any]]:
+        """
+        Get a player and the ``radius`` players either side of them.
+
+        Returns:
+            List[Dict]: Leaderboard entries, empty if the player has no stats
+        """
+        ranking = self._board(board)
+        with self._lock:
+            position = ranking.rank(str(user_id))
+            if position is None:
+                return []
+            return self._slice(ranking, position - 1 - radius, position + radius)
+
+    def all(self, board: str = "winrate") -> List[Dict[str, Any]]:
+        """Get every player in board order."""
+        ranking = self._board(board)
+        with self._lock:
+            return self._slice(ranking, 0, len(ranking.keys))
+
+    def size(self) -> int:
+        """Number of ranked players."""
+        stats_index.refresh()
+        with self._lock:
+            return len(self._players)
+
+
+# Global instance
+leaderboard = Leaderboard()
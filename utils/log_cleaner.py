@@ -4,8 +4,7 @@ Log cleanup utility for managing log file sizes and rotation.
 
 Features:
 - Automatic log file size monitoring
-- Log rotation with configurable limits
-- Cleanup of old log files
+- Cleanup of old log files (size rotation itself happens in utils.logger)
 - Compression of archived logs
 - Integration with existing logger system
 
@@ -33,7 +32,7 @@ class LogCleaner:
     Manages log file cleanup and rotation.
 
     Features:
-    - Size-based log rotation
+    - Size-based log cleanup
     - Time-based log cleanup
     - Log compression
     - Automatic monitoring
@@ -75,7 +74,6 @@ class LogCleaner:
             dict: Cleanup statistics and results
 
         Features:
-        - Size-based rotation
         - Age-based cleanup
         - Total size management
         - Compression handling
@@ -96,17 +94,16 @@ class LogCleaner:
             initial_stats = self._get_log_stats()
             logger.info(f"📊 Current log stats: {initial_stats['file_count']} files, {initial_stats['total_size_mb']:.2f} MB")
 
-            # Step 1: Rotate large log files
-            self._rotate_large_files()
+            # Size rotation is done by the logger's rotating file handlers
 
-            # Step 2: Compress old rotated logs
+            # Step 1: Compress old timestamp-rotated logs
             if self.compress_old_logs:
                 self._compress_old_logs()
 
-            # Step 3: Clean up old log files
+            # Step 2: Clean up old log files
             self._cleanup_old_files()
 
-            # Step 4: Manage total directory size
+            # Step 3: Manage total directory size
             self._manage_total_size()
 
             # Get final statistics
@@ -143,28 +140,6 @@ class LogCleaner:
                 "actions": {}
             }
 
-    def _rotate_large_files(self):
-        """Rotate log files that exceed size limit."""
-        for log_file in self.log_dir.glob("*.log"):
-            try:
-                if log_file.stat().st_size > self.max_file_size:
-                    # Create rotated filename with timestamp
-                    timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-                    rotated_name = f"{log_file.stem}_{timestamp}.log"
-                    rotated_path = self.log_dir / rotated_name
-
-                    # Move current log to rotated name
-                    shutil.move(str(log_file), str(rotated_path))
-
-                    # Create new empty log file
-                    log_file.touch()
-
-                    self.cleaned_files.append(str(rotated_path))
-                    logger.info(f"🔄 Rotated large log: {log_file.name} -> {rotated_name}")
-
-            except Exception as e:
-                logger.warning(f"Failed to rotate {log_file}: {e}")
-
     def _compress_old_logs(self):
         """Compress old rotated log files."""
         # Find rotated logs (contain timestamp in filename)
@@ -191,27 +166,32 @@ class LogCleaner:
             except Exception as e:
                 logger.warning(f"Failed to compress {log_file}: {e}")
 
+    def _archived_logs(self) -> List[Path]:
+        """
+        Rotated and compressed logs, never the active ``{component}.log`` files.
+
+        Covers the logger's numbered backups (``name.log.1``), older
+        timestamp-rotated logs and their ``.gz`` archives.
+        """
+        archived = set(self.log_dir.glob("*.log.[0-9]*"))
+        archived.update(self.log_dir.glob("*_????????_??????.log"))
+        archived.update(self.log_dir.glob("*.log.gz"))
+        return sorted(archived)
+
     def _cleanup_old_files(self):
         """Remove old log files based on age."""
         cutoff_date = datetime.now() - timedelta(days=self.max_age_days)
         cutoff_timestamp = cutoff_date.timestamp()
 
-        # Check all log files and compressed logs
-        patterns = ["*.log", "*.log.gz"]
-        for pattern in patterns:
-            for log_file in self.log_dir.glob(pattern):
-                try:
-                    # Skip current active log files (no timestamp in name)
-                    if pattern == "*.log" and "_" not in log_file.stem:
-                        continue
-
-                    if log_file.stat().st_mtime < cutoff_timestamp:
-                        log_file.unlink()
-                        self.deleted_files.append(str(log_file))
-                        logger.info(f"🗑️ Deleted old log: {log_file.name}")
+        for log_file in self._archived_logs():
+            try:
+                if log_file.stat().st_mtime < cutoff_timestamp:
+                    log_file.unlink()
+                    self.deleted_files.append(str(log_file))
+                    logger.info(f"🗑️ Deleted old log: {log_file.name}")
 
-                except Exception as e:
-                    logger.warning(f"Failed to delete {log_file}: {e}")
+            except Exception as e:
+                logger.warning(f"Failed to delete {log_file}: {e}")
 
     def _manage_total_size(self):
         """Manage total directory size by removing oldest files if needed."""
@@ -222,19 +202,14 @@ class LogCleaner:
 
         logger.info(f"📏 Directory size ({current_size / 1024 / 1024:.2f} MB) exceeds limit, removing oldest files...")
 
-        # Get all log files sorted by modification time (oldest first)
+        # Get all archived log files sorted by modification time (oldest first)
         all_files = []
-        for pattern in ["*.log", "*.log.gz"]:
-            for log_file in self.log_dir.glob(pattern):
-                # Skip current active logs
-                if pattern == "*.log" and "_" not in log_file.stem:
-                    continue
-                
-                try:
-                    stat = log_file.stat()
-                    all_files.append((log_file, stat.st_mtime, stat.st_size))
-                except:
-                    continue
+        for log_file in self._archived_logs():
+            try:
+                stat = log_file.stat()
+                all_files.append((log_file, stat.st_mtime, stat.st_size))
+            except:
+                continue
 
         # Sort by modification time (oldest first)
         all_files.sort(key=lambda x: x[1])
@@ -352,7 +327,6 @@ def cleanup_logs(force: bool = False) -> Dict:
         dict: Cleanup results and statistics
 
     Features:
-        - Size-based rotation
         - Age-based cleanup
         - Compression handling
         - Statistics tracking
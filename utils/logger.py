@@ -3,18 +3,169 @@ Logging configuration module for the RoW Discord bot.
 
 Features:
 - Individual log files per component
+- Non-blocking: records are queued and written by one background thread
+- Per-component log levels
+- Size-based rotation of each component file
+- Optional structured JSON lines
 - UTF-8 encoding support
-- Debug level logging
-- Timestamp formatting
-- Directory structure management
 - Duplicate handler prevention
 
 Log files are stored in data/logs/{component_name}.log
 Format: [timestamp] [level] name: message
+
+Environment:
+    LOG_LEVEL: Default level for every component (default INFO)
+    LOG_LEVELS: Per-component overrides, e.g. "sheets_client=WARNING,storage=DEBUG"
+    LOG_FORMAT: "text" (default) or "json"
+    LOG_MAX_MB: Size at which a component file is rotated (default 10)
+    LOG_BACKUP_COUNT: Rotated files kept per component (default 5)
 """
 
+import atexit
+import copy
+import json
 import logging
 import os
+import queue
+import threading
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+from typing import Dict, Optional
+
+LOG_DIR = "data/logs"
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO").upper()
+LOG_FORMAT = os.getenv("LOG_FORMAT", "text").lower()
+LOG_MAX_BYTES = int(float(os.getenv("LOG_MAX_MB", "10")) * 1024 * 1024)
+LOG_BACKUP_COUNT = int(os.getenv("LOG_BACKUP_COUNT", "5"))
+
+
+def _parse_component_levels(spec: str) -> Dict[str, str]:
+    """Parse "name=LEVEL,name2=LEVEL" into a dict."""
+    levels = {}
+    for item in spec.split(","):
+        name, sep, level = item.partition("=")
+        if sep and name.strip() and level.strip():
+            levels[name.strip()] = level.strip().upper()
+    return levels
+
+
+COMPONENT_LEVELS = _parse_component_levels(os.getenv("LOG_LEVELS", ""))
+
+
+class JsonFormatter(logging.Formatter):
+    """One JSON object per line for log shippers."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        payload = {
+            "time": self.formatTime(record),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        if record.exc_text:
+            payload["exception"] = record.exc_text
+        return json.dumps(payload, ensure_ascii=False)
+
+
+def _make_formatter() -> logging.Formatter:
+    if LOG_FORMAT == "json":
+        return JsonFormatter()
+    # Format: [timestamp] [level] name: message
+    return logging.Formatter("[%(asctime)s] [%(levelname)s] %(name)s: %(message)s")
+
+
+class _ComponentFileHandler(logging.Handler):
+    """
+    Routes each record to its component's rotating file.
+
+    Only used from the queue listener thread, so file handlers are opened
+    lazily there and never touched by the event loop.
+    """
+
+    def __init__(self):
+        super().__init__(logging.DEBUG)
+        self._formatter = _make_formatter()
+        self._files: Dict[str, RotatingFileHandler] = {}
+
+    def _file_for(self, name: str) -> RotatingFileHandler:
+        handler = self._files.get(name)
+        if handler is None:
+            log_path = os.path.join(LOG_DIR, f"{name}.log")
+            os.makedirs(LOG_DIR, exist_ok=True)
+            handler = RotatingFileHandler(
+                log_path,
+                maxBytes=LOG_MAX_BYTES,
+                backupCount=LOG_BACKUP_COUNT,
+                encoding="utf-8",
+            )
+            handler.setFormatter(self._formatter)
+            self._files[name] = handler
+        return handler
+
+    def emit(self, record: logging.LogRecord):
+        try:
+            self._file_for(record.name).handle(record)
+        except Exception:
+            self.handleError(record)
+
+    def close(self):
+        for handler in self._files.values():
+            handler.close()
+        self._files.clear()
+        super().close()
+
+
+class _TracebackQueueHandler(QueueHandler):
+    """
+    QueueHandler that keeps the traceback out of the message.
+
+    The stock prepare() folds the formatted traceback into ``msg``; this
+    keeps it in ``exc_text`` so the writer's formatter places it (and
+    JsonFormatter reports it as its own ``exception`` field).
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        if record.exc_info and not record.exc_text:
+            record.exc_text = self.formatter.formatException(record.exc_info)
+        # Resolve args now; exc_info holds a traceback the queue shouldn't keep
+        record.msg = record.getMessage()
+        record.args = None
+        record.exc_info = None
+        return record
+
+
+_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_queue_handler = _TracebackQueueHandler(_queue)
+_queue_handler.setFormatter(logging.Formatter())
+_listener: Optional[QueueListener] = None
+_listener_lock = threading.Lock()
+
+
+def _ensure_listener():
+    """Start the single writer thread on first use."""
+    global _listener
+    with _listener_lock:
+        if _listener is None:
+            _listener = QueueListener(_queue, _ComponentFileHandler())
+            _listener.start()
+            atexit.register(shutdown_logging)
+
+
+def shutdown_logging():
+    """Write out queued records and stop the writer thread."""
+    global _listener
+    with _listener_lock:
+        if _listener is not None:
+            _listener.stop()
+            for handler in _listener.handlers:
+                handler.close()
+            _listener = None
+
+
+def get_component_level(name: str) -> int:
+    """Configured level for a component (LOG_LEVELS override, else LOG_LEVEL)."""
+    level = logging.getLevelName(COMPONENT_LEVELS.get(name, LOG_LEVEL))
+    return level if isinstance(level, int) else logging.INFO
 
 
 def setup_logger(name: str) -> logging.Logger:
@@ -29,34 +180,21 @@ def setup_logger(name: str) -> logging.Logger:
 
     Features:
     - Individual log files
-    - Debug level logging
-    - UTF-8 encoding
+    - Queued, off-thread writes
+    - Per-component level
+    - Size-based rotation
     - Duplicate prevention
-    - Directory creation
     - Consistent formatting
 
     Format:
         [timestamp] [level] name: message
     """
     logger = logging.getLogger(name)
-    logger.setLevel(logging.DEBUG)
+    logger.setLevel(get_component_level(name))
 
     # Prevent duplicate handlers
-    if not logger.handlers:
-        # Ensure the logs directory exists
-        log_path = f"data/logs/{name}.log"
-        os.makedirs(os.path.dirname(log_path), exist_ok=True)
-
-        # File handler
-        file_handler = logging.FileHandler(log_path, encoding="utf-8")
-        file_handler.setLevel(logging.DEBUG)
-
-        # Format: [timestamp] [level] name: message
-        formatter = logging.Formatter(
-            "[%(asctime)s] [%(levelname)s] %(name)s: %(message)s"
-        )
-        file_handler.setFormatter(formatter)
-
-        logger.addHandler(file_handler)
+    if _queue_handler not in logger.handlers:
+        _ensure_listener()
+        logger.addHandler(_queue_handler)
 
     return logger
@@ -0,0 +1,219 @@
+"""
+In-memory index of guild members.
+
+on_ready used to crawl every guild with ``guild.fetch_members()`` - a
+paginated REST walk repeated on every reconnect - just to count members,
+and cogs resolved names by scanning ``guild.members``. The index is built
+once from the gateway member cache (chunking guilds that are not chunked
+yet) and kept current by member join, leave and update events, so lookups
+by ID, display name and IGN are O(1) dictionary hits.
+"""
+
+from typing import Dict, Iterable, List, Optional, Set
+
+from utils.ign_directory import ign_directory
+from utils.logger import setup_logger
+
+logger = setup_logger("member_index")
+
+
+class MemberRecord:
+    """Identity fields of one member across the bot's guilds."""
+
+    __slots__ = ("id", "name", "global_name", "display_names")
+
+    def __init__(self, member):
+        self.id = member.id
+        # Guild ID -> display name there (nicknames are per guild)
+        self.display_names: Dict[int, str] = {}
+        self.refresh(member)
+
+    def refresh(self, member):
+        self.name = member.name
+        self.global_name = getattr(member, "global_name", None)
+        self.display_names[member.guild.id] = member.display_name
+
+    @property
+    def guild_ids(self) -> Set[int]:
+        return set(self.display_names)
+
+    @property
+    def display_name(self) -> str:
+        """A display name for the member (first guild seen)."""
+        return next(iter(self.display_names.values()), self.name)
+
+    def names(self) -> Set[str]:
+        """Lowercased names this member can be looked up by."""
+        candidates = (self.name, self.global_name, *self.display_names.values())
+        return {n.strip().lower() for n in candidates if n}
+
+
+class MemberIndex:
+    """
+    Member lookups by ID, name and IGN without scanning guilds.
+
+    Features:
+    - Built from the gateway member cache, never a REST crawl
+    - Maintained by join, leave and update events
+    - Unique member count across guilds
+    - IGN lookups through the shared IGN directory
+    """
+
+    _instance: Optional["MemberIndex"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._members: Dict[int, MemberRecord] = {}
+        self._by_name: Dict[str, Set[int]] = {}
+        self.built = False
+        self._initialized = True
+
+    # ==========================================
+    # BUILDING
+    # ==========================================
+
+    async def build(self, guilds: Iterable):
+        """
+        Index every member of the given guilds.
+
+        Guilds whose member cache is incomplete are chunked over the
+        gateway first; nothing is fetched over REST.
+
+        Args:
+            guilds: Guilds the bot is in
+        """
+        self._members.clear()
+        self._by_name.clear()
+
+        for guild in guilds:
+            try:
+                if not guild.chunked:
+                    await guild.chunk()
+            except Exception as e:
+                logger.warning(f"⚠️ Could not chunk members for {guild.name}: {e}")
+            self.add_guild(guild)
+
+        self.built = True
+        logger.info(f"👥 Member index built: {len(self._members)} members")
+
+    def add_guild(self, guild):
+        """Index every cached member of a guild."""
+        for member in guild.members:
+            self.add_member(member)
+
+    def remove_guild(self, guild):
+        """Forget a guild the bot left."""
+        for record in list(self._members.values()):
+            if guild.id in record.guild_ids:
+                self._remove_from_guild(record, guild.id)
+
+    # ==========================================
+    # EVENT MAINTENANCE
+    # ==========================================
+
+    def add_member(self, member):
+        """Index a member (join, or initial build)."""
+        record = self._members.get(member.id)
+        if record is None:
+            record = MemberRecord(member)
+            self._members[member.id] = record
+            self._index_names(record)
+        elif member.guild.id not in record.display_names:
+            self.update_member(member)
+
+    def remove_member(self, member):
+        """Drop a member from one guild; forget them if no guild is left."""
+        record = self._members.get(member.id)
+        if record is not None:
+            self._remove_from_guild(record, member.guild.id)
+
+    def update_member(self, member):
+        """Re-index a member's names after a nickname or profile change."""
+        record = self._members.get(member.id)
+        if record is None:
+            self.add_member(member)
+            return
+        self._unindex_names(record)
+        record.refresh(member)
+        self._index_names(record)
+
+    def _remove_from_guild(self, record: MemberRecord, guild_id: int):
+        self._unindex_names(record)
+        record.display_names.pop(guild_id, None)
+        if record.display_names:
+            self._index_names(record)
+        else:
+            del self._members[record.id]
+
+    def _index_names(self, record: MemberRecord):
+        for name in record.names():
+            self._by_name.setdefault(name, set()).add(record.id)
+
+    def _unindex_names(self, record: MemberRecord):
+        for name in record.names():
+            ids = self._by_name.get(name)
+            if ids is not None:
+                ids.discard(record.id)
+                if not ids:
+                    del self._by_name[name]
+
+    # ==========================================
+    # READS
+    # ==========================================
+
+    def get(self, user_id) -> Optional[MemberRecord]:
+        """Get a member record by user ID."""
+        try:
+            return self._members.get(int(user_id))
+        except (TypeError, ValueError):
+            return None
+
+    def find_by_name(self, name: str) -> List[int]:
+        """User IDs whose username, global name or display name matches (case-insensitive)."""
+        return sorted(self._by_name.get(name.strip().lower(), ()))
+
+    def find_by_ign(self, ign: str) -> Optional[str]:
+        """User ID registered with an IGN (case-insensitive)."""
+        return ign_directory.user_for(ign)
+
+    def resolve(self, text: str) -> Optional[str]:
+        """
+        Resolve a user ID, mention, IGN or member name to a user ID.
+
+        IGNs win over Discord names; an ambiguous name resolves to nothing.
+
+        Args:
+            text: Raw roster entry or command argument
+
+        Returns:
+            str or None: Matching user ID
+        """
+        text = str(text).strip()
+        digits = text.strip("<@!>")
+        if digits.isdigit():
+            return digits
+
+        user_id = self.find_by_ign(text)
+        if user_id is not None:
+            return user_id
+
+        matches = self.find_by_name(text)
+        if len(matches) == 1:
+            return str(matches[0])
+        return None
+
+    @property
+    def count(self) -> int:
+        """Unique members across all indexed guilds."""
+        return len(self._members)
+
+
+# Global instance
+member_index = MemberIndex()
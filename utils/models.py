@@ -0,0 +1,516 @@
+"""
+Typed domain model for the bot's persistent data.
+
+Player stats, signups, blocks and match results are stored as plain JSON
+but handled in code as these compact ``__slots__`` dataclasses. Every type
+converts to and from the existing JSON schema unchanged, so data files,
+backups and Sheets syncs keep their current layout.
+
+Features:
+- Slotted dataclasses with no per-instance ``__dict__``
+- ``from_dict``/``to_dict`` round-trips that keep unknown fields
+- ``validate_document`` schema checks for the owner JSON commands
+"""
+
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from typing import Any, Dict, FrozenSet, List, Optional, Union
+
+from config.constants import TEAM_DISPLAY
+
+TEAM_KEYS = tuple(TEAM_DISPLAY)
+SPECIALIZATIONS = ("cavalry", "mages", "archers", "infantry", "whale")
+
+# Member entries in events.json are IGN strings or legacy Discord IDs
+Member = Union[str, int]
+
+
+# ==========================================
+# PLAYER STATS
+# ==========================================
+
+
+@dataclass(slots=True)
+class TeamRecord:
+    """Wins and losses for one player on one team."""
+
+    wins: int = 0
+    losses: int = 0
+
+    @property
+    def total(self) -> int:
+        return self.wins + self.losses
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "TeamRecord":
+        return cls(int(data.get("wins", 0) or 0), int(data.get("losses", 0) or 0))
+
+    def to_dict(self) -> Dict[str, int]:
+        return {"wins": self.wins, "losses": self.losses}
+
+
+def _default_team_results() -> Dict[str, TeamRecord]:
+    return {team: TeamRecord() for team in TEAM_KEYS}
+
+
+def parse_power(value: Any) -> Optional[int]:
+    """
+    Leniently parse a stored power rating.
+
+    Accepts ints, floats and digit strings with thousands separators
+    ("125,000,000"); anything else (e.g. the "ENTER_POWER_HERE" sheet
+    placeholder) gives None.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, int):
+        return value
+    if isinstance(value, float):
+        return int(value)
+    if isinstance(value, str):
+        cleaned = value.replace(",", "").replace("_", "").strip()
+        try:
+            return int(float(cleaned)) if cleaned else None
+        except ValueError:
+            return None
+    return None
+
+
+@dataclass(slots=True)
+class PlayerStats:
+    """
+    One entry of player_stats.json.
+
+    ``power_rating`` and ``specializations`` are None for entries that never
+    had them, so they are only written back for players that use them.
+    Specializations are kept as the set of enabled names rather than a dict
+    of five booleans.
+    """
+
+    name: str = ""
+    team_results: Dict[str, TeamRecord] = field(default_factory=_default_team_results)
+    absents: int = 0
+    blocked: bool = False
+    power_rating: Optional[int] = None
+    specializations: Optional[FrozenSet[str]] = None
+    extra: Optional[Dict[str, Any]] = None
+
+    _KNOWN = frozenset(
+        ("name", "team_results", "absents", "blocked", "power_rating", "specializations")
+    )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "PlayerStats":
+        """
+        Build from a player_stats.json entry.
+
+        Args:
+            data: Stored player entry
+
+        Returns:
+            PlayerStats: Parsed entry; unknown keys are kept in ``extra``
+        """
+        team_results = _default_team_results()
+        for team, record in (data.get("team_results") or {}).items():
+            if isinstance(record, dict):
+                team_results[team] = TeamRecord.from_dict(record)
+
+        specializations = data.get("specializations")
+        if isinstance(specializations, dict):
+            specializations = frozenset(k for k, v in specializations.items() if v)
+        else:
+            specializations = None
+
+        raw_power = data.get("power_rating")
+        power_rating = parse_power(raw_power)
+        extra = {k: v for k, v in data.items() if k not in cls._KNOWN}
+        if raw_power is not None and power_rating is None:
+            extra["power_rating"] = raw_power  # Unparseable; written back unchanged
+
+        return cls(
+            name=str(data.get("name", "") or ""),
+            team_results=team_results,
+            absents=int(data.get("absents", 0) or 0),
+            blocked=bool(data.get("blocked", False)),
+            power_rating=power_rating,
+            specializations=specializations,
+            extra=extra or None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert back to the player_stats.json entry layout."""
+        data: Dict[str, Any] = {
+            "name": self.name,
+            "team_results": {
+                team: record.to_dict() for team, record in self.team_results.items()
+            },
+        }
+        if self.power_rating is not None:
+            data["power_rating"] = self.power_rating
+        data["absents"] = self.absents
+        data["blocked"] = self.blocked
+        if self.specializations is not None:
+            data["specializations"] = {
+                spec: spec in self.specializations
+                for spec in (*SPECIALIZATIONS, *sorted(self.specializations - set(SPECIALIZATIONS)))
+            }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    def record(self, team: str, result: str) -> bool:
+        """
+        Count a win or loss for a team.
+
+        Args:
+            team: Team key (main_team, team_2, team_3)
+            result: 'win'/'wins' or 'loss'/'losses'
+
+        Returns:
+            bool: True if the result was counted
+        """
+        record = self.team_results.get(team)
+        if record is None:
+            return False
+        result = result.lower()
+        if result in ("win", "wins"):
+            record.wins += 1
+        elif result in ("loss", "losses"):
+            record.losses += 1
+        else:
+            return False
+        return True
+
+    def set_specializations(self, specializations: Dict[str, bool]):
+        """Merge specialization flags into the enabled set."""
+        enabled = set(self.specializations or ())
+        for spec, value in specializations.items():
+            if value:
+                enabled.add(spec)
+            else:
+                enabled.discard(spec)
+        self.specializations = frozenset(enabled)
+
+    @property
+    def total_wins(self) -> int:
+        return sum(record.wins for record in self.team_results.values())
+
+    @property
+    def total_losses(self) -> int:
+        return sum(record.losses for record in self.team_results.values())
+
+    @staticmethod
+    def validate(user_id: str, data: Any) -> List[str]:
+        """Schema check for one player_stats.json entry."""
+        if not isinstance(data, dict):
+            return [f"Player {user_id} stats should be a dictionary"]
+        issues = []
+        team_results = data.get("team_results")
+        if not isinstance(team_results, dict):
+            issues.append(f"Player {user_id} missing or invalid team_results")
+        else:
+            for team, record in team_results.items():
+                if not isinstance(record, dict) or not all(
+                    isinstance(record.get(k, 0), int) for k in ("wins", "losses")
+                ):
+                    issues.append(f"Player {user_id} has invalid record for {team}")
+        if not isinstance(data.get("absents", 0), int):
+            issues.append(f"Player {user_id} has invalid absents count")
+        return issues
+
+
+# ==========================================
+# SIGNUPS
+# ==========================================
+
+
+@dataclass(slots=True, frozen=True)
+class Signup:
+    """One member entry in a team roster of events.json."""
+
+    team: str
+    member: Member
+
+    @classmethod
+    def from_events(cls, events: Dict[str, List[Member]]) -> List["Signup"]:
+        """Flatten an events.json document into signups."""
+        return [
+            cls(team, member)
+            for team, members in events.items()
+            if isinstance(members, list)
+            for member in members
+        ]
+
+    @staticmethod
+    def validate_member(team: str, idx: int, member: Any) -> Optional[str]:
+        """Schema check for one roster entry; returns the issue or None."""
+        # Accept both IGN strings and user IDs for backward compatibility
+        if isinstance(member, bool):
+            return f"Invalid member type in {team}[{idx}]: bool"
+        if isinstance(member, int):
+            return f"Invalid user ID in {team}[{idx}]: {member}" if member <= 0 else None
+        if isinstance(member, str):
+            return f"Empty IGN in {team}[{idx}]" if not member.strip() else None
+        return f"Invalid member type in {team}[{idx}]: {type(member).__name__}"
+
+
+# ==========================================
+# BLOCKS
+# ==========================================
+
+
+@dataclass(slots=True)
+class BlockEntry:
+    """One entry of blocked_users.json."""
+
+    blocked_by: str
+    blocked_at: str
+    ban_duration_days: int = 7
+    extra: Optional[Dict[str, Any]] = None
+
+    REQUIRED = ("blocked_by", "blocked_at", "ban_duration_days")
+
+    @classmethod
+    def create(cls, blocked_by: Any, days: int) -> "BlockEntry":
+        """New block starting now."""
+        return cls(str(blocked_by), datetime.utcnow().isoformat(), days)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "BlockEntry":
+        extra = {k: v for k, v in data.items() if k not in cls.REQUIRED}
+        return cls(
+            blocked_by=str(data.get("blocked_by", "")),
+            blocked_at=str(data.get("blocked_at", "") or ""),
+            ban_duration_days=int(data.get("ban_duration_days", 7) or 0),
+            extra=extra or None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "blocked_by": self.blocked_by,
+            "blocked_at": self.blocked_at,
+            "ban_duration_days": self.ban_duration_days,
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+    @property
+    def expires_at(self) -> Optional[datetime]:
+        """Expiry time, or None if the entry has no valid start timestamp."""
+        if not self.blocked_at:
+            return None
+        try:
+            return datetime.fromisoformat(self.blocked_at) + timedelta(
+                days=self.ban_duration_days
+            )
+        except ValueError:
+            return None
+
+    def is_active(self, now: Optional[datetime] = None) -> bool:
+        """Whether the block is still in force."""
+        expiry = self.expires_at
+        return expiry is not None and (now or datetime.utcnow()) < expiry
+
+    @classmethod
+    def validate(cls, user_id: str, data: Any) -> List[str]:
+        """Schema check for one blocked_users.json entry."""
+        issues = []
+        if not user_id.isdigit():
+            issues.append(f"Invalid user ID key: {user_id}")
+        if not isinstance(data, dict):
+            issues.append(f"User {user_id} info should be a dictionary")
+            return issues
+        for field_name in cls.REQUIRED:
+            if field_name not in data:
+                issues.append(f"User {user_id} missing field: {field_name}")
+        if "blocked_at" in data:
+            try:
+                datetime.fromisoformat(data["blocked_at"])
+            except (TypeError, ValueError):
+                issues.append(f"User {user_id} has invalid timestamp format")
+        return issues
+
+
+# ==========================================
+# RESULTS
+# ==========================================
+
+
+@dataclass(slots=True)
+class MatchResult:
+    """One history entry of event_results.json."""
+
+    team: str
+    result: str
+    players: List[Member] = field(default_factory=list)
+    recorded_by: str = ""
+    timestamp: str = ""
+    date: str = ""
+    extra: Optional[Dict[str, Any]] = None
+
+    _KNOWN = frozenset(("team", "result", "players", "recorded_by", "by", "timestamp", "date"))
+
+    @classmethod
+    def create(cls, team: str, result: str, players: List[Member], recorded_by: str) -> "MatchResult":
+        """New result stamped with the current time."""
+        now = datetime.utcnow()
+        return cls(
+            team=team,
+            result=result,
+            players=list(players),
+            recorded_by=recorded_by,
+            timestamp=now.isoformat(),
+            date=now.strftime("%Y-%m-%d %H:%M UTC"),
+        )
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "MatchResult":
+        extra = {k: v for k, v in data.items() if k not in cls._KNOWN}
+        return cls(
+            team=str(data.get("team", "")),
+            result=str(data.get("result", "")),
+            players=list(data.get("players") or []),
+            recorded_by=str(data.get("recorded_by") or data.get("by") or ""),
+            timestamp=str(data.get("timestamp", "")),
+            date=str(data.get("date", "")),
+            extra=extra or None,
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = {
+            "timestamp": self.timestamp,
+            "date": self.date,
+            "result": self.result,
+            "team": self.team,
+            "players": list(self.players),
+            "recorded_by": self.recorded_by,
+            # Older readers still look for "by"
+            "by": self.recorded_by,
+        }
+        if self.extra:
+            data.update(self.extra)
+        return data
+
+
+# ==========================================
+# SCHEMA CHECKS
+# ==========================================
+
+
+def _check_events(data: Any) -> List[str]:
+    if not isinstance(data, dict):
+        return ["Events data should be a dictionary"]
+    issues = []
+    for team in TEAM_KEYS:
+        if team not in data:
+            issues.append(f"Missing team: {team}")
+        elif not isinstance(data[team], list):
+            issues.append(f"Team {team} should be a list, got {type(data[team]).__name__}")
+        else:
+            for idx, member in enumerate(data[team]):
+                issue = Signup.validate_member(team, idx, member)
+                if issue:
+                    issues.append(issue)
+    return issues
+
+
+def _check_blocked(data: Any) -> List[str]:
+    if not isinstance(data, dict):
+        return ["Blocked users data should be a dictionary"]
+    issues = []
+    for user_id, info in data.items():
+        issues.extend(BlockEntry.validate(user_id, info))
+    return issues
+
+
+def _check_results(data: Any) -> List[str]:
+    if not isinstance(data, dict):
+        return ["Results data should be a dictionary"]
+    issues = []
+    if not isinstance(data.get("total_wins"), int):
+        issues.append("Missing or invalid total_wins")
+    if not isinstance(data.get("total_losses"), int):
+        issues.append("Missing or invalid total_losses")
+    if not isinstance(data.get("history"), list):
+        issues.append("Missing or invalid history array")
+    return issues
+
+
+def _check_history(data: Any) -> List[str]:
+    if not isinstance(data, list):
+        return ["History data should be a list"]
+    issues = []
+    for idx, entry in enumerate(data):
+        if not isinstance(entry, dict):
+            issues.append(f"History entry {idx} should be a dictionary")
+            continue
+        if "timestamp" not in entry:
+            issues.append(f"History entry {idx} missing timestamp")
+        if not isinstance(entry.get("teams"), dict):
+            issues.append(f"History entry {idx} missing or invalid teams data")
+    return issues
+
+
+def _check_ign_map(data: Any) -> List[str]:
+    if not isinstance(data, dict):
+        return ["IGN map should be a dictionary"]
+    issues = []
+    for user_id, ign in data.items():
+        if not user_id.isdigit():
+            issues.append(f"Invalid user ID key: {user_id}")
+        if not isinstance(ign, str) or not ign.strip():
+            issues.append(f"Invalid IGN for user {user_id}: {ign}")
+    return issues
+
+
+def _check_times(data: Any) -> List[str]:
+    if not isinstance(data, dict):
+        return ["Times data should be a dictionary"]
+    issues = []
+    for team in TEAM_KEYS:
+        if team not in data:
+            issues.append(f"Missing time for team: {team}")
+        elif not isinstance(data[team], str):
+            issues.append(f"Time for {team} should be a string")
+    return issues
+
+
+def _check_absent(data: Any) -> List[str]:
+    return [] if isinstance(data, dict) else ["Absent data should be a dictionary"]
+
+
+def _check_player_stats(data: Any) -> List[str]:
+    if not isinstance(data, dict):
+        return ["Player stats should be a dictionary"]
+    issues = []
+    for user_id, entry in data.items():
+        issues.extend(PlayerStats.validate(user_id, entry))
+    return issues
+
+
+_SCHEMA_CHECKS = {
+    "EVENTS": _check_events,
+    "BLOCKED": _check_blocked,
+    "RESULTS": _check_results,
+    "HISTORY": _check_history,
+    "IGN_MAP": _check_ign_map,
+    "TIMES": _check_times,
+    "ABSENT": _check_absent,
+    "PLAYER_STATS": _check_player_stats,
+}
+
+
+def validate_document(file_key: str, data: Any) -> List[str]:
+    """
+    Check a data file against its expected schema.
+
+    Args:
+        file_key: Key of the file in FILES (EVENTS, BLOCKED, ...)
+        data: Parsed JSON content
+
+    Returns:
+        List[str]: Issues found; empty if valid or the file has no schema
+    """
+    check = _SCHEMA_CHECKS.get(file_key)
+    return check(data) if check else []
@@ -0,0 +1,192 @@
+"""
+Persistent priority queue for notifications deferred by quiet hours.
+
+Notifications for users in quiet hours used to sit in an in-memory list
+that was scanned in full every pass (with an O(n) ``list.remove`` per
+delivered item) and lost on restart. Entries are now kept in a min-heap
+keyed by when they become deliverable - the user's quiet-hours end, or
+their 24h expiry if that comes first - and each entry is journaled as one
+item of a dict-shaped data file, so a restart restores the heap without
+re-checking every user. A popped entry stays persisted until the caller
+acknowledges its delivery, so a failed send or a restart mid-delivery
+doesn't lose it.
+"""
+
+import heapq
+import itertools
+import uuid
+from datetime import datetime, timedelta
+from typing import Any, Dict, List, Optional, Tuple
+
+from config.constants import FILES, NOTIFICATION_CONFIG
+from utils.logger import setup_logger
+from utils.storage import storage
+
+logger = setup_logger("notification_queue")
+
+
+def _parse_time(value: Any) -> Optional[datetime]:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        return None
+
+
+class DeferredNotificationQueue:
+    """
+    Quiet-hours notification queue ordered by delivery time.
+
+    Features:
+    - O(log n) push and pop of due entries
+    - 24h expiry folded into each entry's heap key
+    - Item-level persistence, restored on startup without a user rescan
+    - At-least-once delivery: entries are deleted only when acknowledged
+    """
+
+    _instance: Optional["DeferredNotificationQueue"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self.filepath = FILES["NOTIFICATION_QUEUE"]
+        self.max_age = timedelta(hours=NOTIFICATION_CONFIG.get("QUEUE_MAX_AGE_HOURS", 24))
+        self.retry_delay = timedelta(minutes=NOTIFICATION_CONFIG.get("QUEUE_RETRY_MINUTES", 5))
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._entries: Dict[str, Dict[str, Any]] = {}
+        self._seq = itertools.count()
+        self._loaded = False
+        self._initialized = True
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def _push_heap(self, entry_id: str, entry: Dict[str, Any]):
+        # Deliverable at quiet-hours end, or droppable at expiry if sooner
+        times = [
+            t for t in (_parse_time(entry.get("release_at")), _parse_time(entry.get("expires_at")))
+            if t is not None
+        ]
+        due_at = min(times) if times else datetime.utcnow()
+        heapq.heappush(self._heap, (due_at, next(self._seq), entry_id))
+
+    async def load(self):
+        """Restore queued notifications from storage (once)."""
+        if self._loaded:
+            return
+        data = await storage.load(self.filepath, default={})
+        self._entries = data if isinstance(data, dict) else {}
+        self._heap = []
+        for entry_id, entry in self._entries.items():
+            self._push_heap(entry_id, entry)
+        self._loaded = True
+        if self._entries:
+            logger.info(f"📬 Restored {len(self._entries)} deferred notifications")
+
+    async def push(
+        self,
+        user_id: str,
+        notification_type: str,
+        content: Dict[str, Any],
+        release_at: datetime,
+        expires_at: Optional[datetime] = None,
+    ) -> str:
+        """
+        Queue a notification until a user's quiet hours end.
+
+        Args:
+            user_id: Discord user ID
+            notification_type: Preference key of the notification
+            content: Notification content for the embed
+            release_at: When the notification may be delivered (UTC)
+            expires_at: When it should be dropped instead (default: 24h from now)
+
+        Returns:
+            str: Queue entry ID
+        """
+        now = datetime.utcnow()
+        entry_id = uuid.uuid4().hex
+        entry = {
+            "user_id": str(user_id),
+            "type": notification_type,
+            "content": content,
+            "queued_at": now.isoformat(),
+            "release_at": release_at.isoformat(),
+            "expires_at": (expires_at or now + self.max_age).isoformat(),
+        }
+        self._entries[entry_id] = entry
+        self._push_heap(entry_id, entry)
+        await storage.set_item(self.filepath, entry_id, entry)
+        return entry_id
+
+    async def pop_due(
+        self, now: Optional[datetime] = None
+    ) -> List[Tuple[str, Dict[str, Any]]]:
+        """
+        Take every entry whose delivery time has come.
+
+        Returned entries stay persisted until ``ack`` (delivered) or are
+        rescheduled with ``retry`` (failed). Entries that reached their
+        expiry first are dropped, not returned.
+
+        Args:
+            now: Reference time (UTC), defaults to now
+
+        Returns:
+            List[Tuple[str, Dict]]: (entry ID, entry) pairs, oldest delivery time first
+        """
+        now = now or datetime.utcnow()
+        due, expired = [], 0
+        while self._heap and self._heap[0][0] <= now:
+            _, _, entry_id = heapq.heappop(self._heap)
+            entry = self._entries.get(entry_id)
+            if entry is None:
+                continue
+
+            expires_at = _parse_time(entry.get("expires_at"))
+            if expires_at is None or expires_at <= now:
+                await self.ack(entry_id)
+                expired += 1
+                continue
+            due.append((entry_id, entry))
+
+        if expired:
+            logger.info(f"🗑️ Dropped {expired} expired deferred notifications")
+        return due
+
+    async def ack(self, entry_id: str):
+        """
+        Forget an entry once it has been delivered (or re-queued).
+
+        Args:
+            entry_id: Entry ID returned by pop_due
+        """
+        if self._entries.pop(entry_id, None) is not None:
+            await storage.delete_item(self.filepath, entry_id)
+
+    async def retry(self, entry_id: str, now: Optional[datetime] = None):
+        """
+        Reschedule an entry whose delivery failed.
+
+        The entry keeps its expiry, so one that keeps failing is dropped
+        once it expires.
+
+        Args:
+            entry_id: Entry ID returned by pop_due
+            now: Reference time (UTC), defaults to now
+        """
+        entry = self._entries.get(entry_id)
+        if entry is None:
+            return
+        entry["release_at"] = ((now or datetime.utcnow()) + self.retry_delay).isoformat()
+        self._push_heap(entry_id, entry)
+        await storage.set_item(self.filepath, entry_id, entry)
+
+
+# Global instance
+deferred_notifications = DeferredNotificationQueue()
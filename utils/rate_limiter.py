@@ -15,10 +15,13 @@ Components:
 - Button spam prevention
 - Cooldown management
 - Activity monitoring
+- Per-guild and global command limits
+- Sliding-window counters (O(1) checks) with idle-user sweeping
+  and a cap on tracked users
 """
 
 import time
-from collections import defaultdict, deque
+from collections import OrderedDict
 from typing import Dict, Optional, Tuple
 
 from discord.ext import commands
@@ -28,6 +31,56 @@ from utils.logger import setup_logger
 logger = setup_logger("rate_limiter")
 
 
+class SlidingWindowCounter:
+    """
+    Approximate sliding-window event counter in O(1) time and space.
+
+    Keeps the count of the current fixed window and the previous one; the
+    sliding count weights the previous window by how much of it still
+    overlaps the last ``window`` seconds.
+    """
+
+    __slots__ = ("window", "_start", "_current", "_previous")
+
+    def __init__(self, window: float, now: float):
+        self.window = window
+        self._start = now
+        self._current = 0
+        self._previous = 0
+
+    def _roll(self, now: float):
+        elapsed = now - self._start
+        if elapsed >= self.window:
+            periods = int(elapsed // self.window)
+            self._previous = self._current if periods == 1 else 0
+            self._current = 0
+            self._start += periods * self.window
+
+    def count(self, now: float) -> float:
+        """Events in the last ``window`` seconds (approximate)."""
+        self._roll(now)
+        overlap = 1 - (now - self._start) / self.window
+        return self._previous * overlap + self._current
+
+    def add(self, now: float):
+        self._roll(now)
+        self._current += 1
+
+
+class _UserLimits:
+    """Counters and cooldowns of one tracked user."""
+
+    __slots__ = ("commands_minute", "commands_hour", "buttons_minute", "buttons_burst", "cooldowns", "last_seen")
+
+    def __init__(self, limits: Dict, now: float):
+        self.commands_minute = SlidingWindowCounter(60, now)
+        self.commands_hour = SlidingWindowCounter(3600, now)
+        self.buttons_minute = SlidingWindowCounter(60, now)
+        self.buttons_burst = SlidingWindowCounter(limits["button_spam_window"], now)
+        self.cooldowns: Dict[str, float] = {}  # command -> last used
+        self.last_seen = now
+
+
 class RateLimiter:
     """
     Rate limiter with configurable limits per user/command.
@@ -39,26 +92,29 @@ class RateLimiter:
     - Spam detection
     - Activity monitoring
     - Limit configuration
+    - Per-guild and global command limits
+    - O(1) sliding-window checks, idle users swept, tracked users bounded
 
     Attributes:
-        user_activity: User command timestamps
-        command_cooldowns: Command-specific cooldowns
-        button_activity: Button click timestamps
         limits: Rate limiting configuration
     """
 
     def __init__(self):
-        # Store user activity: user_id -> deque of timestamps
-        self.user_activity = defaultdict(lambda: deque())
-        # Store command cooldowns: (user_id, command) -> last_used_time
-        self.command_cooldowns = {}
-        # Store button activity: user_id -> deque of timestamps
-        self.button_activity = defaultdict(lambda: deque())
+        # user_id -> counters, least recently active first
+        self._users: "OrderedDict[int, _UserLimits]" = OrderedDict()
+        # guild_id -> per-minute command counter
+        self._guilds: Dict[int, SlidingWindowCounter] = {}
+        self._global_minute = SlidingWindowCounter(60, time.time())
+        self._global_hour = SlidingWindowCounter(3600, time.time())
+        self._last_sweep = time.time()
+        self.evicted_users = 0
 
         # Rate limiting configuration
         self.limits = {
             "commands_per_minute": 10,
             "commands_per_hour": 100,
+            "guild_commands_per_minute": 60,
+            "global_commands_per_minute": 120,
             "buttons_per_minute": 5,
             "button_spam_window": 2,  # seconds
             "button_spam_limit": 3,  # max clicks in window
@@ -69,10 +125,69 @@ class RateLimiter:
                 "block": 30,  # 30 seconds
                 "unblock": 30,  # 30 seconds
             },
+            "idle_ttl": 3600,  # Seconds of inactivity before a user is forgotten
+            "sweep_interval": 60,  # Seconds between idle sweeps
+            "max_tracked_users": 5000,  # Least recently active users evicted beyond this
         }
 
+    # ==========================================
+    # TRACKED USERS
+    # ==========================================
+
+    def _user(self, user_id: int, now: float) -> _UserLimits:
+        """Get (or start tracking) a user and mark them active."""
+        self._maybe_sweep(now)
+        state = self._users.get(user_id)
+        if state is None:
+            state = self._users[user_id] = _UserLimits(self.limits, now)
+            while len(self._users) > self.limits["max_tracked_users"]:
+                self._users.popitem(last=False)
+                self.evicted_users += 1
+        else:
+            self._users.move_to_end(user_id)
+        state.last_seen = now
+        return state
+
+    def _maybe_sweep(self, now: float):
+        if now - self._last_sweep >= self.limits["sweep_interval"]:
+            self.sweep(now)
+
+    def sweep(self, now: Optional[float] = None) -> int:
+        """
+        Forget users idle longer than ``idle_ttl``.
+
+        Users are kept least recently active first, so only the evicted
+        entries are visited.
+
+        Returns:
+            int: Number of users evicted
+        """
+        now = time.time() if now is None else now
+        self._last_sweep = now
+        cutoff = now - self.limits["idle_ttl"]
+        evicted = 0
+        while self._users:
+            user_id, state = next(iter(self._users.items()))
+            if state.last_seen > cutoff:
+                break
+            del self._users[user_id]
+            evicted += 1
+
+        idle_guilds = [gid for gid, counter in self._guilds.items() if counter.count(now) == 0]
+        for guild_id in idle_guilds:
+            del self._guilds[guild_id]
+
+        if evicted:
+            self.evicted_users += evicted
+            logger.debug(f"🧹 Rate limiter swept {evicted} idle users")
+        return evicted
+
+    # ==========================================
+    # CHECKS
+    # ==========================================
+
     def check_command_rate_limit(
-        self, user_id: int, command_name: str
+        self, user_id: int, command_name: str, guild_id: Optional[int] = None
     ) -> Tuple[bool, Optional[str]]:
         """
         Check if user can execute a command.
@@ -80,6 +195,7 @@ class RateLimiter:
         Args:
             user_id: User's Discord ID
             command_name: Command being executed
+            guild_id: Guild the command was used in (None for DMs)
 
         Returns:
             tuple: (allowed: bool, message: Optional[str])
@@ -88,47 +204,52 @@ class RateLimiter:
         - Per-minute command limit
         - Per-hour command limit
         - Command-specific cooldowns
-        - Global rate limits
+        - Per-guild and global rate limits
         """
         current_time = time.time()
-
-        # Check global command rate limits
-        user_commands = self.user_activity[user_id]
-
-        # Remove old entries (older than 1 hour)
-        while user_commands and current_time - user_commands[0] > 3600:
-            user_commands.popleft()
+        user = self._user(user_id, current_time)
 
         # Check per-minute limit
-        recent_commands = sum(1 for t in user_commands if current_time - t <= 60)
-        if recent_commands >= self.limits["commands_per_minute"]:
+        if user.commands_minute.count(current_time) >= self.limits["commands_per_minute"]:
             return (
                 False,
                 f"Rate limit: max {self.limits['commands_per_minute']} commands per minute",
             )
 
         # Check per-hour limit
-        if len(user_commands) >= self.limits["commands_per_hour"]:
+        if user.commands_hour.count(current_time) >= self.limits["commands_per_hour"]:
             return (
                 False,
                 f"Rate limit: max {self.limits['commands_per_hour']} commands per hour",
             )
 
         # Check command-specific cooldowns
-        if command_name in self.limits["cooldown_commands"]:
-            cooldown_key = (user_id, command_name)
-            if cooldown_key in self.command_cooldowns:
-                last_used = self.command_cooldowns[cooldown_key]
-                cooldown_time = self.limits["cooldown_commands"][command_name]
-                time_left = cooldown_time - (current_time - last_used)
-
-                if time_left > 0:
-                    return False, f"Command cooldown: {int(time_left)}s remaining"
+        cooldown_time = self.limits["cooldown_commands"].get(command_name)
+        if cooldown_time is not None and command_name in user.cooldowns:
+            time_left = cooldown_time - (current_time - user.cooldowns[command_name])
+            if time_left > 0:
+                return False, f"Command cooldown: {int(time_left)}s remaining"
+
+        # Check guild and global limits
+        guild = None
+        if guild_id is not None:
+            guild = self._guilds.get(guild_id)
+            if guild is None:
+                guild = self._guilds[guild_id] = SlidingWindowCounter(60, current_time)
+            if guild.count(current_time) >= self.limits["guild_commands_per_minute"]:
+                return False, "Rate limit: this server is sending too many commands, try again shortly"
+        if self._global_minute.count(current_time) >= self.limits["global_commands_per_minute"]:
+            return False, "Rate limit: the bot is busy, try again shortly"
 
         # All checks passed - record the command
-        user_commands.append(current_time)
-        if command_name in self.limits["cooldown_commands"]:
-            self.command_cooldowns[(user_id, command_name)] = current_time
+        user.commands_minute.add(current_time)
+        user.commands_hour.add(current_time)
+        self._global_minute.add(current_time)
+        self._global_hour.add(current_time)
+        if guild is not None:
+            guild.add(current_time)
+        if cooldown_time is not None:
+            user.cooldowns[command_name] = current_time
 
         return True, None
 
@@ -146,85 +267,69 @@ class RateLimiter:
         - Per-minute click limiting
         - Spam detection window
         - Click tracking
-        - Activity cleanup
         """
         current_time = time.time()
-
-        user_buttons = self.button_activity[user_id]
-
-        # Remove old entries (older than 1 minute)
-        while user_buttons and current_time - user_buttons[0] > 60:
-            user_buttons.popleft()
+        user = self._user(user_id, current_time)
 
         # Check per-minute limit
-        if len(user_buttons) >= self.limits["buttons_per_minute"]:
+        if user.buttons_minute.count(current_time) >= self.limits["buttons_per_minute"]:
             return (
                 False,
                 f"Button rate limit: max {self.limits['buttons_per_minute']} clicks per minute",
             )
 
         # Check spam detection (rapid clicking)
-        spam_window = self.limits["button_spam_window"]
-        recent_clicks = sum(1 for t in user_buttons if current_time - t <= spam_window)
-
-        if recent_clicks >= self.limits["button_spam_limit"]:
+        if user.buttons_burst.count(current_time) >= self.limits["button_spam_limit"]:
             return False, "Button spam detected: slow down!"
 
         # Record the button click
-        user_buttons.append(current_time)
+        user.buttons_minute.add(current_time)
+        user.buttons_burst.add(current_time)
         return True, None
 
     def is_user_rate_limited(self, user_id: int) -> bool:
         """Check if user is currently rate limited."""
-        current_time = time.time()
-
-        # Check if they've hit any limits recently
-        user_commands = self.user_activity[user_id]
-        recent_commands = sum(1 for t in user_commands if current_time - t <= 60)
+        user = self._users.get(user_id)
+        if user is None:
+            return False
+        return user.commands_minute.count(time.time()) >= self.limits["commands_per_minute"]
 
-        return recent_commands >= self.limits["commands_per_minute"]
+    # ==========================================
+    # STATS & ADMIN
+    # ==========================================
 
     def get_user_stats(self, user_id: int) -> Dict:
         """Get rate limiting stats for a user."""
         current_time = time.time()
-
-        user_commands = self.user_activity[user_id]
-        user_buttons = self.button_activity[user_id]
-
-        # Count recent activity
-        commands_last_minute = sum(1 for t in user_commands if current_time - t <= 60)
-        commands_last_hour = sum(1 for t in user_commands if current_time - t <= 3600)
-        buttons_last_minute = sum(1 for t in user_buttons if current_time - t <= 60)
+        user = self._users.get(user_id)
+        if user is None:
+            return {
+                "commands_last_minute": 0,
+                "commands_last_hour": 0,
+                "buttons_last_minute": 0,
+                "active_cooldowns": {},
+                "is_rate_limited": False,
+            }
 
         # Check active cooldowns
         active_cooldowns = {}
-        for (uid, cmd), last_used in self.command_cooldowns.items():
-            if uid == user_id:
-                cooldown_time = self.limits["cooldown_commands"].get(cmd, 0)
-                time_left = cooldown_time - (current_time - last_used)
-                if time_left > 0:
-                    active_cooldowns[cmd] = int(time_left)
+        for cmd, last_used in user.cooldowns.items():
+            cooldown_time = self.limits["cooldown_commands"].get(cmd, 0)
+            time_left = cooldown_time - (current_time - last_used)
+            if time_left > 0:
+                active_cooldowns[cmd] = int(time_left)
 
         return {
-            "commands_last_minute": commands_last_minute,
-            "commands_last_hour": commands_last_hour,
-            "buttons_last_minute": buttons_last_minute,
+            "commands_last_minute": round(user.commands_minute.count(current_time)),
+            "commands_last_hour": round(user.commands_hour.count(current_time)),
+            "buttons_last_minute": round(user.buttons_minute.count(current_time)),
             "active_cooldowns": active_cooldowns,
             "is_rate_limited": self.is_user_rate_limited(user_id),
         }
 
     def reset_user_limits(self, user_id: int):
         """Reset rate limits for a user (admin function)."""
-        if user_id in self.user_activity:
-            del self.user_activity[user_id]
-        if user_id in self.button_activity:
-            del self.button_activity[user_id]
-
-        # Remove command cooldowns for this user
-        to_remove = [key for key in self.command_cooldowns.keys() if key[0] == user_id]
-        for key in to_remove:
-            del self.command_cooldowns[key]
-
+        self._users.pop(user_id, None)
         logger.info(f"🔄 Reset rate limits for user {user_id}")
 
     def get_global_stats(self) -> Dict:
@@ -237,39 +342,32 @@ class RateLimiter:
             - rate_limited_users: Number of currently limited users
             - total_commands_last_hour: Total command count
             - active_cooldowns: Number of active cooldowns
+            - tracked_users / tracked_guilds / evicted_users: Memory usage
         """
         current_time = time.time()
-
-        active_users = len(
-            [
-                uid
-                for uid, activity in self.user_activity.items()
-                if any(current_time - t <= 3600 for t in activity)
-            ]
-        )
-
-        rate_limited_users = len(
-            [uid for uid in self.user_activity.keys() if self.is_user_rate_limited(uid)]
-        )
-
-        total_commands_hour = sum(
-            sum(1 for t in activity if current_time - t <= 3600)
-            for activity in self.user_activity.values()
-        )
-
-        active_cooldowns = len(
-            [
-                cd
-                for cd in self.command_cooldowns.values()
-                if current_time - cd <= max(self.limits["cooldown_commands"].values())
-            ]
-        )
+        self.sweep(current_time)
+        max_cooldown = max(self.limits["cooldown_commands"].values())
+
+        active_users = 0
+        rate_limited_users = 0
+        active_cooldowns = 0
+        for user in self._users.values():
+            if user.commands_hour.count(current_time) > 0:
+                active_users += 1
+            if user.commands_minute.count(current_time) >= self.limits["commands_per_minute"]:
+                rate_limited_users += 1
+            active_cooldowns += sum(
+                1 for last_used in user.cooldowns.values() if current_time - last_used <= max_cooldown
+            )
 
         return {
             "active_users_last_hour": active_users,
             "rate_limited_users": rate_limited_users,
-            "total_commands_last_hour": total_commands_hour,
+            "total_commands_last_hour": round(self._global_hour.count(current_time)),
             "active_cooldowns": active_cooldowns,
+            "tracked_users": len(self._users),
+            "tracked_guilds": len(self._guilds),
+            "evicted_users": self.evicted_users,
         }
 
 
@@ -293,7 +391,7 @@ def create_rate_limit_check():
 
     async def rate_limit_check(ctx):
         allowed, message = rate_limiter.check_command_rate_limit(
-            ctx.author.id, ctx.command.name
+            ctx.author.id, ctx.command.name, ctx.guild.id if ctx.guild else None
         )
         if not allowed:
             await ctx.send(f"⏰ {message}")
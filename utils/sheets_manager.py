@@ -7,14 +7,14 @@ to avoid duplication and conflicts.
 
 # Import everything from the main sheets directory
 try:
-    from sheets import SheetsManager
+    from sheets import SheetsManager, get_sheets_manager
     from utils.logger import setup_logger
 
     logger = setup_logger("sheets_redirect")
     logger.info("✅ Redirecting to main sheets/ directory")
 
     # Re-export the main SheetsManager
-    __all__ = ["SheetsManager"]
+    __all__ = ["SheetsManager", "get_sheets_manager"]
 
 except ImportError as e:
     from utils.logger import setup_logger
@@ -51,4 +51,7 @@ except ImportError as e:
             return ""
 
         async def sync_data(self, *args, **kwargs):
-            return False
\ No newline at end of file
+            return False
+
+    def get_sheets_manager():
+        return SheetsManager()
\ No newline at end of file
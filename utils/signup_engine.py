@@ -0,0 +1,316 @@
+"""
+Signup state machine for the weekly RoW team rosters.
+
+The join and leave handlers each scanned every team list, removed players
+with ``list.remove``, appended, and saved the whole file - some without
+awaiting the save - so two quick clicks could book a player into two teams
+or silently lose a write. The engine keeps one roster per team as an
+insertion-ordered set (dict keys) plus a player -> team index.
+
+A transition is validated and applied in one synchronous step on the event
+loop, so no other coroutine can observe or interleave with a half-applied
+move and no lock is needed. Each transition is then committed with a single
+awaited write of events.json (same list-shaped document as before); if the
+write fails the transition is rolled back.
+
+Interaction handlers use the fast path instead: apply() changes the rosters
+in memory and returns at once, and a single background writer saves the
+latest rosters, coalescing bursts of clicks into one write and retrying
+failed writes.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Dict, Iterable, List, Optional
+
+from config.constants import EMOJIS, FILES, INTERACTION_CONFIG, TEAM_DISPLAY
+from config.settings import MAX_TEAM_SIZE
+from utils.logger import setup_logger
+from utils.storage import storage
+
+logger = setup_logger("signup_engine")
+
+TEAM_KEYS = ("main_team", "team_2", "team_3")
+
+
+class SignupStatus:
+    """Outcome codes of a signup transition."""
+
+    JOINED = "joined"
+    MOVED = "moved"
+    LEFT = "left"
+    ALREADY_IN_TEAM = "already_in_team"
+    NOT_SIGNED_UP = "not_signed_up"
+    TEAM_FULL = "team_full"
+    INVALID_TEAM = "invalid_team"
+    SAVE_FAILED = "save_failed"
+    # Rejected by EventManager before reaching the engine
+    LOCKED = "locked"
+    BLOCKED = "blocked"
+    NO_PERMISSION = "no_permission"
+
+    CHANGED = (JOINED, MOVED, LEFT)
+
+
+@dataclass(slots=True, frozen=True)
+class SignupResult:
+    """Outcome of one move_user() call."""
+
+    status: str
+    player: Any = None
+    team: Optional[str] = None  # Team the player is in afterwards (or asked for)
+    previous_team: Optional[str] = None
+    detail: str = ""
+
+    @property
+    def changed(self) -> bool:
+        """True if the rosters were changed and saved."""
+        return self.status in SignupStatus.CHANGED
+
+    def message(self) -> str:
+        """User-facing reply for the outcome."""
+        team = TEAM_DISPLAY.get(self.team, self.team)
+        previous = TEAM_DISPLAY.get(self.previous_team, self.previous_team)
+
+        if self.status == SignupStatus.JOINED:
+            return f"{EMOJIS['SUCCESS']} {self.player} joined {team}!"
+        if self.status == SignupStatus.MOVED:
+            return f"{EMOJIS['SUCCESS']} {self.player} joined {team}!\n(Moved from {previous})"
+        if self.status == SignupStatus.LEFT:
+            return f"{EMOJIS['SUCCESS']} {self.player} has left **{previous}**."
+        if self.status == SignupStatus.ALREADY_IN_TEAM:
+            return f"{EMOJIS['SUCCESS']} You're already in {team}!"
+        if self.status == SignupStatus.NOT_SIGNED_UP:
+            return f"{EMOJIS['INFO']} You're not signed up for any team."
+        if self.status == SignupStatus.TEAM_FULL:
+            return f"{EMOJIS['ERROR']} {team} is full ({MAX_TEAM_SIZE}/{MAX_TEAM_SIZE})."
+        if self.status == SignupStatus.INVALID_TEAM:
+            return f"{EMOJIS['ERROR']} Unknown team: {self.team}"
+        if self.status == SignupStatus.LOCKED:
+            if self.team is None:
+                return "🔒 Signups are locked! You cannot leave your team at this time."
+            return "🔒 Signups are currently locked! Teams have been finalized for this week."
+        if self.status == SignupStatus.BLOCKED:
+            return (
+                f"{EMOJIS['BLOCKED']} You are currently blocked from events.\n"
+                f"⏰ Time remaining: {self.detail}"
+            )
+        if self.status == SignupStatus.NO_PERMISSION:
+            return (
+                f"{EMOJIS['ERROR']} You don't have permission to join the Main Team.\n"
+                "🏆 The Main Team role is required for this team."
+            )
+        return f"{EMOJIS['ERROR']} Failed to save your signup. Please try again."
+
+
+class SignupEngine:
+    """
+    Team rosters with O(1) membership, moves and capacity checks.
+
+    Features:
+    - Insertion-ordered set per team (first come, first served order kept)
+    - Player -> team index, so a player can only ever be in one team
+    - Capacity enforced inside the transition
+    - One awaited commit per transition, rolled back if the write fails
+    - Fast path: in-memory apply with a coalescing background writer
+    """
+
+    def __init__(self, capacity: int = MAX_TEAM_SIZE, file: str = FILES["EVENTS"]):
+        self.capacity = capacity
+        self.file = file
+        self._rosters: Dict[str, Dict[Any, None]] = {team: {} for team in TEAM_KEYS}
+        self._team_of: Dict[Any, str] = {}
+        self._dirty = False  # Rosters changed since the last background save
+        self._writer: Optional[asyncio.Task] = None
+
+    # ==========================================
+    # LOADING
+    # ==========================================
+
+    def load(self, events: Optional[Dict[str, Iterable]]):
+        """
+        Replace the rosters from an events.json document.
+
+        A player listed in more than one team is kept in the first one.
+
+        Args:
+            events: Team key -> list of players
+        """
+        self._rosters = {team: {} for team in TEAM_KEYS}
+        self._team_of = {}
+        duplicates = 0
+
+        for team, players in (events or {}).items():
+            roster = self._rosters.setdefault(team, {})
+            if not isinstance(players, list):
+                continue
+            for player in players:
+                if player in self._team_of:
+                    duplicates += 1
+                    continue
+                roster[player] = None
+                self._team_of[player] = team
+
+        if duplicates:
+            logger.warning(f"⚠️ Dropped {duplicates} duplicate signup(s) while loading rosters")
+
+    def snapshot(self) -> Dict[str, List[Any]]:
+        """The rosters as an events.json document (fresh lists)."""
+        return {team: list(roster) for team, roster in self._rosters.items()}
+
+    # ==========================================
+    # READS
+    # ==========================================
+
+    def team_of(self, player) -> Optional[str]:
+        """Team a player is signed up for, or None."""
+        return self._team_of.get(player)
+
+    def members(self, team: str) -> List[Any]:
+        """Players of a team in signup order."""
+        return list(self._rosters.get(team, ()))
+
+    def count(self, team: Optional[str] = None) -> int:
+        """Signups in one team, or across all teams."""
+        if team is None:
+            return len(self._team_of)
+        return len(self._rosters.get(team, ()))
+
+    def is_full(self, team: str) -> bool:
+        """Check if a team has reached capacity."""
+        return self.count(team) >= self.capacity
+
+    @property
+    def teams(self) -> List[str]:
+        return list(self._rosters)
+
+    # ==========================================
+    # TRANSITIONS
+    # ==========================================
+
+    async def move(self, player, team: Optional[str]) -> SignupResult:
+        """
+        Move a player to a team, or out of every team when team is None.
+
+        Args:
+            player: Roster entry (IGN or user ID)
+            team: Target team key, or None to leave
+
+        Returns:
+            SignupResult: Outcome of the transition
+        """
+        result = self._transition(player, team)
+        if not result.changed:
+            return result
+
+        if await self.commit():
+            logger.info(
+                f"📝 {player}: {result.previous_team or '-'} -> {result.team or '-'}"
+            )
+            return result
+
+        # Undo unless a later transition already moved the player again
+        previous_team = result.previous_team
+        if self._team_of.get(player) == result.team:
+            self._place(player, None)
+            # The freed slot may have been taken while the commit was awaited
+            if previous_team is not None and self.is_full(previous_team):
+                previous_team = None
+            self._place(player, previous_team)
+        logger.error(f"❌ Failed to save signup change for {player}")
+        return SignupResult(SignupStatus.SAVE_FAILED, player, team, previous_team)
+
+    def apply(self, player, team: Optional[str]) -> SignupResult:
+        """
+        Fast path: apply a move in memory and save it in the background.
+
+        Must be called from the event loop. The returned result is final
+        for the rosters; the write happens shortly after.
+
+        Args:
+            player: Roster entry (IGN or user ID)
+            team: Target team key, or None to leave
+
+        Returns:
+            SignupResult: Outcome of the transition
+        """
+        result = self._transition(player, team)
+        if result.changed:
+            logger.info(
+                f"📝 {player}: {result.previous_team or '-'} -> {result.team or '-'}"
+            )
+            self._dirty = True
+            if self._writer is None or self._writer.done():
+                self._writer = asyncio.create_task(self._persist())
+        return result
+
+    async def _persist(self):
+        # Each pass saves the latest rosters, so moves made during a write
+        # are picked up by one more pass instead of one write each
+        while self._dirty:
+            self._dirty = False
+            if not await self.commit():
+                self._dirty = True
+                delay = INTERACTION_CONFIG["PERSIST_RETRY_DELAY"]
+                logger.error(f"❌ Background roster save failed, retrying in {delay}s")
+                await asyncio.sleep(delay)
+
+    async def flush(self, timeout: float = 10.0) -> bool:
+        """
+        Wait for pending background saves.
+
+        Args:
+            timeout: Max seconds to wait
+
+        Returns:
+            bool: True if every applied move has been saved
+        """
+        writer = self._writer
+        if writer is not None and not writer.done():
+            try:
+                await asyncio.wait_for(asyncio.shield(writer), timeout)
+            except asyncio.TimeoutError:
+                logger.warning(f"⚠️ Roster save still pending after {timeout}s")
+        return not self._dirty and (self._writer is None or self._writer.done())
+
+    async def clear_team(self, team: str) -> bool:
+        """Remove every player from one team and commit."""
+        if team not in self._rosters:
+            return False
+        for player in self._rosters[team]:
+            del self._team_of[player]
+        self._rosters[team] = {}
+        return await self.commit()
+
+    async def commit(self) -> bool:
+        """Write the current rosters to events.json."""
+        return await storage.save(self.file, self.snapshot(), sync_to_sheets=True)
+
+    def _transition(self, player, team: Optional[str]) -> SignupResult:
+        """Validate and apply a move without yielding to the event loop."""
+        current = self._team_of.get(player)
+
+        if team is None:
+            if current is None:
+                return SignupResult(SignupStatus.NOT_SIGNED_UP, player)
+            self._place(player, None)
+            return SignupResult(SignupStatus.LEFT, player, None, current)
+
+        if team not in self._rosters:
+            return SignupResult(SignupStatus.INVALID_TEAM, player, team, current)
+        if current == team:
+            return SignupResult(SignupStatus.ALREADY_IN_TEAM, player, team, current)
+        if self.is_full(team):
+            return SignupResult(SignupStatus.TEAM_FULL, player, team, current)
+
+        self._place(player, team)
+        status = SignupStatus.MOVED if current else SignupStatus.JOINED
+        return SignupResult(status, player, team, current)
+
+    def _place(self, player, team: Optional[str]):
+        current = self._team_of.pop(player, None)
+        if current is not None:
+            self._rosters[current].pop(player, None)
+        if team is not None:
+            self._rosters.setdefault(team, {})[player] = None
+            self._team_of[player] = team
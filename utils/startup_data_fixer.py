@@ -20,6 +20,7 @@ import json
 import os
 
 from utils.logger import setup_logger
+from utils.state_store import state_store
 
 logger = setup_logger("startup_fixer")
 
@@ -54,7 +55,11 @@ class StartupDataFixer:
             self.ensure_all_files_exist()
             self.fix_events_data_structure()
             self.standardize_user_ids()
+
+            # Flush journaled fixes so the on-disk check sees current data
+            state_store.compact()
             self.clean_corrupted_files()
+            state_store.compact()
 
             if self.fixes_applied:
                 logger.info(
@@ -333,9 +338,9 @@ class StartupDataFixer:
         - Default fallback
         """
         try:
-            if os.path.exists(file_path):
-                with open(file_path, "r", encoding="utf-8") as f:
-                    return json.load(f)
+            data = state_store.get(file_path)
+            if data is not None:
+                return data
         except:
             pass
         return default
@@ -358,10 +363,8 @@ class StartupDataFixer:
         - Pretty printing
         """
         try:
-            os.makedirs(os.path.dirname(file_path), exist_ok=True)
-            with open(file_path, "w", encoding="utf-8") as f:
-                json.dump(data, f, indent=2, ensure_ascii=False)
-            return True
+            # Go through the state store so cached copies never go stale
+            return state_store.replace(file_path, data)
         except Exception as e:
             logger.error(f"Failed to save {file_path}: {e}")
             return False
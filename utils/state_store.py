@@ -0,0 +1,488 @@
+"""
+In-memory state store for the bot's JSON data files.
+
+Every data file (events, blocked users, IGN map, results, audit log, ...)
+is loaded once and kept in memory. Changes are applied in memory and
+recorded as one line in an append-only journal, so a signup or an IGN
+change costs a small append instead of rewriting the whole file. The
+journal is periodically compacted back into the regular JSON files, which
+keep their existing readable layout for backups and manual restores.
+
+Journal lines look like:
+    {"f": "data/ign_map.json", "op": "set", "k": "1234", "v": "PlayerOne", "s": 42}
+
+Every record carries a sequence number ``s``. Compaction notes in a small
+manifest which sequence number each snapshot covers (with a hash of the
+snapshot, so a crash between writing the manifest and the snapshot is
+detected), and recovery skips records a snapshot already contains. This
+keeps replay idempotent even for appends.
+"""
+
+import asyncio
+import copy
+import hashlib
+import json
+import os
+import threading
+from typing import Any, Dict, Optional
+
+from utils.logger import setup_logger
+
+logger = setup_logger("state_store")
+
+_MISSING = object()
+
+
+class StateStore:
+    """
+    Authoritative in-process copy of the data/*.json files.
+
+    Features:
+    - Files loaded once on first access and served from memory
+    - O(1) journal appends for item-level changes
+    - Snapshot compaction into the original JSON files
+    - Crash recovery by replaying the journal on startup
+    """
+
+    _instance: Optional["StateStore"] = None
+
+    def __new__(cls, *args, **kwargs):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(
+        self,
+        journal_path: str = "data/state_journal.jsonl",
+        compact_every: int = 500,
+    ):
+        """
+        Initialize the store and recover any uncompacted journal entries.
+
+        Args:
+            journal_path: Location of the append-only journal
+            compact_every: Journal entries written before snapshots are compacted
+        """
+        if self._initialized:
+            return
+
+        self.journal_path = journal_path
+        self.compact_every = compact_every
+        self._docs: Dict[str, Any] = {}
+        self._dirty: set = set()
+        self._journal = None
+        self._journal_entries = 0
+        self._rotated_path = f"{journal_path}.compacting"
+        self._manifest_path = f"{os.path.splitext(journal_path)[0]}.manifest.json"
+        self._seq = 0
+        # Snapshot manifest as last written, and what each file on disk covers
+        self._manifest: Dict[str, Dict[str, Any]] = {}
+        self._on_disk: Dict[str, Dict[str, Any]] = {}
+        self._lock = threading.RLock()
+        self._compact_lock = threading.Lock()
+        self._compaction_pending = False
+        self._initialized = True
+
+        self._recover()
+
+    # ==========================================
+    # LOADING
+    # ==========================================
+
+    @staticmethod
+    def _key(filepath: str) -> str:
+        return os.path.normpath(filepath)
+
+    @staticmethod
+    def _hash(content: str) -> str:
+        return hashlib.sha256(content.encode("utf-8")).hexdigest()
+
+    def _read_snapshot(self, path: str) -> Any:
+        """Read a snapshot file from disk, returning _MISSING if unavailable."""
+        if not os.path.exists(path):
+            return _MISSING
+        try:
+            with open(path, "r", encoding="utf-8") as f:
+                content = f.read()
+            data = json.loads(content)
+            sha = self._hash(content)
+            self._on_disk[path] = {"seq": self._covered_seq(path, sha), "sha": sha}
+            return data
+        except json.JSONDecodeError as e:
+            logger.error(f"❌ Invalid JSON in {path}: {e}")
+        except Exception as e:
+            logger.error(f"❌ Error loading {path}: {e}")
+        return _MISSING
+
+    def _covered_seq(self, path: str, sha: str) -> int:
+        """
+        Get the last journal sequence number a snapshot on disk contains.
+
+        The manifest is written before the snapshots, so the file matches
+        either the new entry or the one it replaced. A file matching neither
+        (e.g. restored by hand) is treated as covering nothing.
+        """
+        entry = self._manifest.get(path)
+        while entry:
+            if entry["sha"] == sha:
+                return entry["seq"]
+            entry = entry.get("prev")
+        return 0
+
+    def _doc(self, path: str, default: Any = _MISSING) -> Any:
+        """Get the live document for a path, loading it on first access."""
+        if path not in self._docs:
+            data = self._read_snapshot(path)
+            if data is _MISSING:
+                if default is _MISSING:
+                    return _MISSING
+                data = copy.deepcopy(default)
+            self._docs[path] = data
+        return self._docs[path]
+
+    def _load_manifest(self):
+        """Load the snapshot manifest written by the last compaction."""
+        if not os.path.exists(self._manifest_path):
+            return
+        try:
+            with open(self._manifest_path, "r", encoding="utf-8") as f:
+                manifest = json.load(f)
+            self._manifest = manifest.get("files", {})
+            self._seq = manifest.get("seq", 0)
+        except Exception as e:
+            logger.error(f"❌ Failed to load state manifest: {e}")
+
+    def _recover(self):
+        """Replay journal entries left over from an unclean shutdown."""
+        self._load_manifest()
+        replayed = 0
+        for path in (self._rotated_path, self.journal_path):
+            if not os.path.exists(path):
+                continue
+            try:
+                with open(path, "r", encoding="utf-8") as f:
+                    for line in f:
+                        line = line.strip()
+                        if not line:
+                            continue
+                        try:
+                            record = json.loads(line)
+                        except json.JSONDecodeError:
+                            # A torn final line from a crash mid-append
+                            logger.warning("⚠️ Skipping unreadable journal line")
+                            continue
+                        seq = record.get("s", 0)
+                        self._seq = max(self._seq, seq)
+                        self._doc(record["f"])
+                        covered = self._on_disk.get(record["f"], {}).get("seq", 0)
+                        if seq and seq <= covered:
+                            # Already in the snapshot (crash mid-compaction)
+                            continue
+                        self._apply(record)
+                        replayed += 1
+            except Exception as e:
+                logger.error(f"❌ Failed to replay state journal {path}: {e}")
+                return
+
+        if replayed:
+            logger.info(f"🔁 Replayed {replayed} journal entries into memory")
+        if replayed or os.path.exists(self._rotated_path):
+            self.compact()
+
+    # ==========================================
+    # READ API
+    # ==========================================
+
+    def get(self, filepath: str, default: Any = None) -> Any:
+        """
+        Get a private copy of a file's data.
+
+        Args:
+            filepath: Data file path
+            default: Value used if the file doesn't exist
+
+        Returns:
+            Any: Deep copy of the data, safe for the caller to mutate
+        """
+        with self._lock:
+            data = self._doc(self._key(filepath))
+            if data is _MISSING:
+                return default
+            return copy.deepcopy(data)
+
+    def view(self, filepath: str, default: Any = None) -> Any:
+        """
+        Get the live in-memory data for read-only use (no copy).
+
+        Callers must not mutate the result; use the write API instead.
+        """
+        with self._lock:
+            data = self._doc(self._key(filepath))
+            return default if data is _MISSING else data
+
+    def get_item(self, filepath: str, key: str, default: Any = None) -> Any:
+        """Get a copy of one entry from a dict-shaped file."""
+        with self._lock:
+            data = self._doc(self._key(filepath))
+            if not isinstance(data, dict) or key not in data:
+                return default
+            return copy.deepcopy(data[key])
+
+    # ==========================================
+    # WRITE API
+    # ==========================================
+
+    def replace(self, filepath: str, data: Any) -> bool:
+        """Replace a whole file's data."""
+        return self._write({"f": self._key(filepath), "op": "replace", "v": data})
+
+    def set_item(self, filepath: str, key: str, value: Any, default: Any = None) -> bool:
+        """
+        Set one entry in a dict-shaped file.
+
+        Args:
+            filepath: Data file path
+            key: Entry key (stored as a string, like JSON object keys)
+            value: New value for the entry
+            default: Initial data if the file doesn't exist yet (defaults to {})
+        """
+        return self._write(
+            {"f": self._key(filepath), "op": "set", "k": str(key), "v": value},
+            default if default is not None else {},
+        )
+
+    def delete_item(self, filepath: str, key: str) -> bool:
+        """Remove one entry from a dict-shaped file if present."""
+        return self._write({"f": self._key(filepath), "op": "del", "k": str(key)}, {})
+
+    def append_item(
+        self,
+        filepath: str,
+        value: Any,
+        max_items: Optional[int] = None,
+        key: Optional[str] = None,
+    ) -> bool:
+        """
+        Append an entry to a list-shaped file, or to a list inside a dict-shaped one.
+
+        Args:
+            filepath: Data file path
+            value: Entry to append
+            max_items: Keep only the newest N entries
+            key: Append to the list stored under this key instead of the file itself
+        """
+        record = {"f": self._key(filepath), "op": "append", "v": value}
+        if key is not None:
+            record["k"] = str(key)
+        if max_items:
+            record["max"] = max_items
+        return self._write(record, [] if key is None else {})
+
+    def _write(self, record: Dict[str, Any], default: Any = _MISSING) -> bool:
+        """Apply a change in memory and journal it."""
+        try:
+            # Serialize first so an unserializable value never reaches memory
+            line = json.dumps(record, ensure_ascii=False, separators=(",", ":"))
+            with self._lock:
+                self._apply(record, default=default)
+                self._seq += 1
+                self._append_journal(f'{line[:-1]},"s":{self._seq}}}')
+                compaction_due = self._journal_entries >= self.compact_every
+            if compaction_due:
+                self._schedule_compaction()
+            return True
+        except Exception as e:
+            logger.error(f"❌ State store write to {record.get('f')} failed: {e}")
+            return False
+
+    def _apply(self, record: Dict[str, Any], default: Any = _MISSING):
+        """Apply one journal record to the in-memory documents."""
+        path = record["f"]
+        op = record["op"]
+        value = copy.deepcopy(record.get("v"))
+
+        if op == "replace":
+            self._docs[path] = value
+        else:
+            if default is _MISSING:
+                default = [] if op == "append" and "k" not in record else {}
+            doc = self._doc(path, default)
+            if op == "set":
+                doc[record["k"]] = value
+            elif op == "del":
+                doc.pop(record["k"], None)
+            elif op == "append":
+                target = doc.setdefault(record["k"], []) if "k" in record else doc
+                target.append(value)
+                limit = record.get("max")
+                if limit and len(target) > limit:
+                    del target[: len(target) - limit]
+            else:
+                raise ValueError(f"Unknown journal operation: {op}")
+
+        self._dirty.add(path)
+
+    def _append_journal(self, line: str):
+        """Append one compact JSON line to the journal."""
+        if self._journal is None:
+            os.makedirs(os.path.dirname(self.journal_path) or ".", exist_ok=True)
+            self._journal = open(self.journal_path, "a", encoding="utf-8")
+        self._journal.write(line + "\n")
+        self._journal.flush()
+        self._journal_entries += 1
+
+    # ==========================================
+    # COMPACTION
+    # ==========================================
+
+    def _write_snapshot(self, path: str, content: str):
+        """Atomically write one snapshot (temp file, fsync, rename)."""
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        temp_file = f"{path}.tmp"
+        with open(temp_file, "w", encoding="utf-8") as f:
+            f.write(content)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(temp_file, path)
+
+    def compact(self) -> bool:
+        """
+        Write changed files back to disk and truncate the journal.
+
+        Documents are serialized and the journal rotated under the store
+        lock; the slow fsync'd file writes happen after it is released so
+        concurrent writers are not held up. The manifest recording which
+        journal records each snapshot covers is written before the
+        snapshots themselves.
+
+        Returns:
+            bool: True if every snapshot was written
+        """
+        with self._compact_lock:
+            with self._lock:
+                seq = self._seq
+                snapshots = {
+                    path: json.dumps(self._docs[path], indent=2, ensure_ascii=False)
+                    for path in sorted(self._dirty)
+                }
+                self._dirty.clear()
+                self._rotate_journal()
+                manifest = dict(self._manifest)
+                for path, content in snapshots.items():
+                    manifest[path] = {
+                        "seq": seq,
+                        "sha": self._hash(content),
+                        "prev": self._on_disk.get(path),
+                    }
+
+            if snapshots:
+                try:
+                    self._write_snapshot(
+                        self._manifest_path,
+                        json.dumps({"seq": seq, "files": manifest}, ensure_ascii=False),
+                    )
+                    self._manifest = manifest
+                except Exception as e:
+                    logger.error(f"❌ Failed to write state manifest: {e}")
+                    with self._lock:
+                        self._dirty.update(snapshots)
+                    return False
+
+            failed = []
+            for path, content in snapshots.items():
+                try:
+                    self._write_snapshot(path, content)
+                    with self._lock:
+                        self._on_disk[path] = {"seq": seq, "sha": manifest[path]["sha"]}
+                except Exception as e:
+                    logger.error(f"❌ Failed to compact {path}: {e}")
+                    failed.append(path)
+
+            if failed:
+                # Keep the rotated journal so nothing is lost; retry next time
+                with self._lock:
+                    self._dirty.update(failed)
+                return False
+
+            if os.path.exists(self._rotated_path):
+                os.remove(self._rotated_path)
+
+            if snapshots:
+                logger.debug(f"🗜️ Compacted {len(snapshots)} data files")
+            return True
+
+    def _rotate_journal(self):
+        """Move the live journal aside so new writes start a fresh one."""
+        if self._journal is not None:
+            self._journal.close()
+            self._journal = None
+        self._journal_entries = 0
+
+        if not os.path.exists(self.journal_path):
+            return
+        if os.path.exists(self._rotated_path):
+            # A previous compaction failed; keep its entries too
+            with open(self._rotated_path, "a", encoding="utf-8") as dst, open(
+                self.journal_path, "r", encoding="utf-8"
+            ) as src:
+                dst.write(src.read())
+            os.remove(self.journal_path)
+        else:
+            os.replace(self.journal_path, self._rotated_path)
+
+    def _schedule_compaction(self):
+        """Compact off the event loop when one is running, inline otherwise."""
+        if self._compaction_pending:
+            return
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            self.compact()
+            return
+
+        self._compaction_pending = True
+        future = loop.run_in_executor(None, self.compact)
+
+        def _done(_):
+            self._compaction_pending = False
+
+        future.add_done_callback(_done)
+
+    def reload(self):
+        """
+        Drop all cached data so files are re-read from disk.
+
+        Used after files are replaced outside the store (e.g. backup restore).
+        Uncompacted changes are discarded, so call ``compact`` first if they
+        should be kept.
+        """
+        with self._lock:
+            self._docs.clear()
+            self._dirty.clear()
+            self._on_disk.clear()
+            if self._journal is not None:
+                self._journal.close()
+                self._journal = None
+            for path in (self.journal_path, self._rotated_path):
+                if os.path.exists(path):
+                    os.remove(path)
+            self._journal_entries = 0
+
+    def close(self):
+        """Compact everything and close the journal."""
+        if self.compact():
+            logger.info("✅ State store compacted on shutdown")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get store statistics."""
+        with self._lock:
+            return {
+                "loaded_files": len(self._docs),
+                "dirty_files": len(self._dirty),
+                "journal_entries": self._journal_entries,
+            }
+
+
+# Global instance
+state_store = StateStore()
@@ -0,0 +1,309 @@
+"""
+Incrementally maintained aggregate index over player stats and results.
+
+Commands and the dashboard used to recompute totals and win rates by
+walking every player on each request. The index builds those aggregates
+once from the stored data and then applies per-player deltas as results
+and absences are recorded, so reads are O(1) and a match costs
+O(players in match).
+
+If the underlying file is replaced wholesale (reset, backup restore,
+sheets import) the index notices that the stored document changed and
+rebuilds lazily on the next read.
+"""
+
+import threading
+from typing import Any, Dict, Optional
+
+from config.constants import FILES
+from utils.logger import setup_logger
+from utils.models import TEAM_KEYS, PlayerStats, TeamRecord
+from utils.storage import storage
+
+logger = setup_logger("stats_index")
+
+
+def _win_rate(wins: int, losses: int) -> float:
+    total = wins + losses
+    return (wins / total * 100) if total > 0 else 0.0
+
+
+class PlayerStatsIndex:
+    """
+    Aggregate counters over player_stats.json and event_results.json.
+
+    Features:
+    - Per-player totals and win rates served without scanning
+    - Per-team player-game and match win rates
+    - Global counters (players, active players, games, average win rate)
+    - O(1) staleness check against the stored documents
+    """
+
+    _instance: Optional["PlayerStatsIndex"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._lock = threading.RLock()
+        self._players: Dict[str, PlayerStats] = {}
+        self._stats_source = None
+        self._results_source = None
+        self._history_len = 0
+        self._listeners = []
+        self._reset_counters()
+        self._initialized = True
+
+    def _reset_counters(self):
+        self._active_players = 0
+        self._total_wins = 0
+        self._total_losses = 0
+        self._win_rate_sum = 0.0
+        self._team_games: Dict[str, TeamRecord] = {team: TeamRecord() for team in TEAM_KEYS}
+        self._team_matches: Dict[str, TeamRecord] = {team: TeamRecord() for team in TEAM_KEYS}
+        self._match_wins = 0
+        self._match_losses = 0
+
+    # ==========================================
+    # BUILDING
+    # ==========================================
+
+    def add_listener(self, callback):
+        """
+        Register a callback for indexed player changes.
+
+        Called under the index lock as ``callback(user_id, player)`` with the
+        new PlayerStats (None if removed), and as ``callback(None, players)``
+        with every indexed player after a full rebuild.
+        """
+        self._listeners.append(callback)
+
+    def _notify(self, user_id: Optional[str], payload: Any):
+        for callback in self._listeners:
+            try:
+                callback(user_id, payload)
+            except Exception as e:
+                logger.error(f"❌ Stats index listener failed: {e}")
+
+    def refresh(self):
+        """Rebuild now if the stored documents were replaced."""
+        with self._lock:
+            self._ensure_fresh()
+
+    def _ensure_fresh(self):
+        """Rebuild from storage if the stored documents were replaced."""
+        stats_doc = storage.view(FILES["PLAYER_STATS"], {})
+        results_doc = storage.view(FILES["RESULTS"], {})
+        if stats_doc is self._stats_source and results_doc is self._results_source:
+            return
+        self._rebuild(stats_doc, results_doc)
+
+    def _rebuild(self, stats_doc: Any, results_doc: Any):
+        """Full O(players + results) rebuild."""
+        self._players = {}
+        self._reset_counters()
+
+        if isinstance(stats_doc, dict):
+            for user_id, entry in stats_doc.items():
+                if not isinstance(entry, dict):
+                    continue
+                try:
+                    player = PlayerStats.from_dict(entry)
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"⚠️ Skipping invalid stats entry for {user_id}: {e}")
+                    continue
+                self._players[str(user_id)] = player
+                self._apply(player, 1)
+
+        history = results_doc.get("history", []) if isinstance(results_doc, dict) else []
+        if not isinstance(history, list):
+            history = []
+        for entry in history:
+            if isinstance(entry, dict):
+                self._count_match(entry.get("team"), entry.get("result"))
+
+        self._stats_source = stats_doc
+        self._results_source = results_doc
+        self._history_len = len(history)
+        logger.debug(f"📊 Rebuilt stats index: {len(self._players)} players")
+        self._notify(None, self._players)
+
+    def invalidate(self):
+        """Force a rebuild on the next read."""
+        with self._lock:
+            self._stats_source = None
+            self._results_source = None
+
+    # ==========================================
+    # INCREMENTAL UPDATES
+    # ==========================================
+
+    def _apply(self, player: PlayerStats, sign: int):
+        """Add (sign=1) or remove (sign=-1) one player's contribution."""
+        wins, losses = player.total_wins, player.total_losses
+        self._total_wins += sign * wins
+        self._total_losses += sign * losses
+        if wins + losses:
+            self._active_players += sign
+            self._win_rate_sum += sign * _win_rate(wins, losses)
+        for team, record in player.team_results.items():
+            games = self._team_games.setdefault(team, TeamRecord())
+            games.wins += sign * record.wins
+            games.losses += sign * record.losses
+
+    def _count_match(self, team: Optional[str], result: Optional[str]):
+        if result == "win":
+            self._match_wins += 1
+        elif result == "loss":
+            self._match_losses += 1
+        else:
+            return
+        if team:
+            record = self._team_matches.setdefault(team, TeamRecord())
+            if result == "win":
+                record.wins += 1
+            else:
+                record.losses += 1
+
+    def update_player(self, user_id: str):
+        """
+        Re-index one player after their stats entry was written.
+
+        Costs O(1) when the index is current; otherwise the change is
+        picked up by the next rebuild.
+
+        Args:
+            user_id: Discord user ID
+        """
+        with self._lock:
+            stats_doc = storage.view(FILES["PLAYER_STATS"], {})
+            if stats_doc is not self._stats_source:
+                return
+
+            user_id = str(user_id)
+            old = self._players.pop(user_id, None)
+            if old is not None:
+                self._apply(old, -1)
+            new = None
+            entry = stats_doc.get(user_id)
+            if isinstance(entry, dict):
+                try:
+                    new = PlayerStats.from_dict(entry)
+                except (TypeError, ValueError) as e:
+                    logger.warning(f"⚠️ Skipping invalid stats entry for {user_id}: {e}")
+                else:
+                    self._players[user_id] = new
+                    self._apply(new, 1)
+            self._notify(user_id, new)
+
+    def record_match(self, team: str, result: str):
+        """
+        Count a recorded match result.
+
+        Args:
+            team: Team key the result was recorded for
+            result: 'win' or 'loss'
+        """
+        with self._lock:
+            results_doc = storage.view(FILES["RESULTS"], {})
+            history = results_doc.get("history", []) if isinstance(results_doc, dict) else []
+            if (
+                self._results_source is None
+                or not isinstance(history, list)
+                or len(history) != self._history_len + 1
+            ):
+                # Not a single append on top of what we indexed; rebuild later
+                self._results_source = None
+                return
+
+            self._count_match(team, result)
+            self._results_source = results_doc
+            self._history_len = len(history)
+
+    # ==========================================
+    # READ API
+    # ==========================================
+
+    def get_player(self, user_id: str) -> Optional[PlayerStats]:
+        """Get a player's indexed stats (shared, do not mutate)."""
+        with self._lock:
+            self._ensure_fresh()
+            return self._players.get(str(user_id))
+
+    def get_player_summary(self, user_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a player's totals and win rates.
+
+        Returns:
+            dict: Totals, win rate and per-team records, or None if unknown
+        """
+        with self._lock:
+            self._ensure_fresh()
+            player = self._players.get(str(user_id))
+            if player is None:
+                return None
+            wins, losses = player.total_wins, player.total_losses
+            return {
+                "name": player.name,
+                "wins": wins,
+                "losses": losses,
+                "total_games": wins + losses,
+                "win_rate": _win_rate(wins, losses),
+                "absents": player.absents,
+                "blocked": player.blocked,
+                "power_rating": player.power_rating or 0,
+                "teams": {
+                    team: {
+                        "wins": record.wins,
+                        "losses": record.losses,
+                        "win_rate": _win_rate(record.wins, record.losses),
+                    }
+                    for team, record in player.team_results.items()
+                },
+            }
+
+    def get_summary(self) -> Dict[str, Any]:
+        """
+        Get global and per-team aggregates.
+
+        Returns:
+            dict: Player counts, game totals, average win rate, and per-team
+                  player-game and match records
+        """
+        with self._lock:
+            self._ensure_fresh()
+            total_games = self._total_wins + self._total_losses
+            return {
+                "total_players": len(self._players),
+                "active_players": self._active_players,
+                "total_wins": self._total_wins,
+                "total_losses": self._total_losses,
+                "total_games": total_games,
+                "average_win_rate": round(
+                    self._win_rate_sum / self._active_players, 1
+                ) if self._active_players else 0,
+                "match_wins": self._match_wins,
+                "match_losses": self._match_losses,
+                "match_win_rate": round(_win_rate(self._match_wins, self._match_losses), 1),
+                "teams": {team: self._team_summary(team) for team in TEAM_KEYS},
+            }
+
+    def _team_summary(self, team: str) -> Dict[str, Any]:
+        games = self._team_games.get(team, TeamRecord())
+        matches = self._team_matches.get(team, TeamRecord())
+        return {
+            "player_wins": games.wins,
+            "player_losses": games.losses,
+            "match_wins": matches.wins,
+            "match_losses": matches.losses,
+            "match_win_rate": round(_win_rate(matches.wins, matches.losses), 1),
+        }
+
+
+# Global instance
+stats_index = PlayerStatsIndex()
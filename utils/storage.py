@@ -0,0 +1,343 @@
+"""
+Unified async storage API for the bot's JSON data files.
+
+This is the one place cogs and services read and write persistent data.
+It sits on top of the in-memory state store (read-through cache + journal)
+and adds what the older DataManager / IntegratedDataManager / FileOps paths
+each only had part of:
+
+- Per-file asyncio locks, with ``edit()`` holding the lock across a whole
+  read-modify-write so concurrent clicks and scheduler tasks can't lose updates
+- Atomic temp-file + fsync + rename snapshot writes, run off the event loop
+- Write-behind Google Sheets syncing through the coalescing sync queue
+"""
+
+import asyncio
+import copy
+import os
+from contextlib import asynccontextmanager
+from typing import Any, Callable, Dict, Optional
+
+from utils.logger import setup_logger
+from utils.state_store import state_store
+from utils.sync_queue import sync_queue
+
+logger = setup_logger("storage")
+
+_MISSING = object()
+
+# Data file -> SheetsManager method that mirrors it
+SHEETS_SYNC_METHODS = {
+    "events.json": "sync_current_teams",
+    "events_history.json": "sync_events_history",
+    "blocked_users.json": "sync_blocked_users",
+    "player_stats.json": "sync_player_stats",
+    "event_results.json": "sync_results_history",
+    "notification_preferences.json": "sync_notification_preferences",
+    "ign_map.json": "sync_ign_map",
+}
+
+
+class Storage:
+    """
+    Async storage service shared by every cog.
+
+    Features:
+    - Read-through memory cache backed by the journaled state store
+    - Per-file async locks and locked read-modify-write blocks
+    - Item-level writes that journal O(1) changes
+    - Off-loop compaction and write-behind Sheets sync
+    """
+
+    _instance: Optional["Storage"] = None
+
+    def __new__(cls):
+        if cls._instance is None:
+            cls._instance = super().__new__(cls)
+            cls._instance._initialized = False
+        return cls._instance
+
+    def __init__(self):
+        if self._initialized:
+            return
+        self._locks: Dict[str, asyncio.Lock] = {}
+        self._listeners = []
+        self.sheets_manager = None
+        self._initialized = True
+
+    # ==========================================
+    # CHANGE EVENTS
+    # ==========================================
+
+    def add_listener(self, callback: Callable[[str], Any]):
+        """
+        Register a callback run with the file path after every successful write.
+
+        Callbacks run on the writer's thread and must be cheap (flag or
+        counter updates), never I/O.
+        """
+        self._listeners.append(callback)
+
+    def remove_listener(self, callback: Callable[[str], Any]):
+        """Unregister a change callback if it is registered."""
+        try:
+            self._listeners.remove(callback)
+        except ValueError:
+            pass
+
+    def _changed(self, filepath: str):
+        for callback in self._listeners:
+            try:
+                callback(filepath)
+            except Exception as e:
+                logger.error(f"❌ Storage change listener failed: {e}")
+
+    def reloaded(self, filepaths):
+        """
+        Announce data files that were replaced outside the storage service.
+
+        Call after ``state_store.reload()`` (e.g. a backup restore) so
+        listeners drop caches built from the old data.
+        """
+        for filepath in filepaths:
+            self._changed(filepath)
+
+    # ==========================================
+    # LOCKING
+    # ==========================================
+
+    def lock(self, filepath: str) -> asyncio.Lock:
+        """Get the async lock guarding a data file."""
+        key = os.path.normpath(filepath)
+        if key not in self._locks:
+            self._locks[key] = asyncio.Lock()
+        return self._locks[key]
+
+    # ==========================================
+    # WHOLE-FILE ACCESS
+    # ==========================================
+
+    async def load(self, filepath: str, default: Any = None) -> Any:
+        """
+        Load a private copy of a file's data.
+
+        Args:
+            filepath: Data file path
+            default: Value returned if the file doesn't exist
+
+        Returns:
+            Any: Copy of the data, safe to mutate
+        """
+        async with self.lock(filepath):
+            return self.get(filepath, default)
+
+    def get(self, filepath: str, default: Any = None) -> Any:
+        """Synchronous read for code that can't await (returns a copy)."""
+        data = state_store.get(filepath)
+        if data is None:
+            return copy.deepcopy(default)
+        return data
+
+    def view(self, filepath: str, default: Any = None) -> Any:
+        """Live read-only view of a file's data (no copy, do not mutate)."""
+        return state_store.view(filepath, default)
+
+    async def save(self, filepath: str, data: Any, sync_to_sheets: bool = True) -> bool:
+        """
+        Replace a file's data.
+
+        Args:
+            filepath: Data file path
+            data: New data for the file
+            sync_to_sheets: Queue a Google Sheets sync for the file
+
+        Returns:
+            bool: True if the write was recorded
+        """
+        async with self.lock(filepath):
+            return self._save_unlocked(filepath, data, sync_to_sheets)
+
+    def save_now(self, filepath: str, data: Any, sync_to_sheets: bool = True) -> bool:
+        """Synchronous save for legacy callers that can't await."""
+        return self._save_unlocked(filepath, data, sync_to_sheets)
+
+    def _save_unlocked(self, filepath: str, data: Any, sync_to_sheets: bool) -> bool:
+        if not state_store.replace(filepath, data):
+            return False
+        self._changed(filepath)
+        if sync_to_sheets:
+            self.queue_sync(filepath)
+        return True
+
+    @asynccontextmanager
+    async def edit(self, filepath: str, default: Any = None, sync_to_sheets: bool = True):
+        """
+        Locked read-modify-write of a whole file.
+
+        The file lock is held for the whole block and the data is saved when
+        the block exits normally, so no other writer can interleave.
+
+        Example:
+            async with storage.edit(FILES["BLOCKED"], {}) as blocked:
+                blocked[user_id] = info
+        """
+        async with self.lock(filepath):
+            data = self.get(filepath, default)
+            yield data
+            if not self._save_unlocked(filepath, data, sync_to_sheets):
+                raise IOError(f"Failed to save {filepath}")
+
+    # ==========================================
+    # ITEM-LEVEL ACCESS
+    # ==========================================
+
+    async def set_item(
+        self, filepath: str, key: str, value: Any, sync_to_sheets: bool = False
+    ) -> bool:
+        """Set one entry of a dict-shaped file."""
+        async with self.lock(filepath):
+            success = state_store.set_item(filepath, key, value)
+        if success:
+            self._changed(filepath)
+        if success and sync_to_sheets:
+            self.queue_sync(filepath)
+        return success
+
+    async def delete_item(self, filepath: str, key: str, sync_to_sheets: bool = False) -> bool:
+        """Remove one entry of a dict-shaped file."""
+        async with self.lock(filepath):
+            success = state_store.delete_item(filepath, key)
+        if success:
+            self._changed(filepath)
+        if success and sync_to_sheets:
+            self.queue_sync(filepath)
+        return success
+
+    async def update_item(
+        self,
+        filepath: str,
+        key: str,
+        updater: Callable[[Any], Any],
+        default: Any = None,
+        sync_to_sheets: bool = False,
+    ) -> bool:
+        """
+        Locked read-modify-write of one entry of a dict-shaped file.
+
+        Args:
+            filepath: Data file path
+            key: Entry key
+            updater: Called with a copy of the entry (or ``default``); returns the new entry
+            default: Entry used when the key doesn't exist yet
+            sync_to_sheets: Queue a Google Sheets sync for the file
+
+        Returns:
+            bool: True if the entry was saved
+        """
+        async with self.lock(filepath):
+            current = state_store.get_item(filepath, str(key), _MISSING)
+            if current is _MISSING:
+                current = copy.deepcopy(default)
+            success = state_store.set_item(filepath, key, updater(current))
+        if success:
+            self._changed(filepath)
+        if success and sync_to_sheets:
+            self.queue_sync(filepath)
+        return success
+
+    async def append_item(
+        self,
+        filepath: str,
+        value: Any,
+        max_items: Optional[int] = None,
+        key: Optional[str] = None,
+        sync_to_sheets: bool = False,
+    ) -> bool:
+        """
+        Append one entry to a list-shaped file.
+
+        With ``key``, appends to the list stored under that key of a
+        dict-shaped file (e.g. the results ``history``).
+        """
+        async with self.lock(filepath):
+            success = state_store.append_item(
+                filepath, value, max_items=max_items, key=key
+            )
+        if success:
+            self._changed(filepath)
+        if success and sync_to_sheets:
+            self.queue_sync(filepath)
+        return success
+
+    def get_item(self, filepath: str, key: str, default: Any = None) -> Any:
+        """Get a copy of one entry of a dict-shaped file."""
+        return state_store.get_item(filepath, str(key), default)
+
+    # ==========================================
+    # GOOGLE SHEETS
+    # ==========================================
+
+    def attach_sheets(self, sheets_manager):
+        """Set the sheets manager used for write-behind syncs."""
+        self.sheets_manager = sheets_manager
+
+    def queue_sync(self, filepath: str) -> bool:
+        """
+        Queue a Google Sheets sync of a file's current data.
+
+        Returns:
+            bool: True if a sync was queued
+        """
+        method_name = SHEETS_SYNC_METHODS.get(os.path.basename(filepath))
+        manager = self.sheets_manager
+        if not method_name or not manager or not hasattr(manager, method_name):
+            return False
+        try:
+            # While the shared connection is still opening, queue anyway:
+            # the sync runs on the sheets engine behind the connect
+            connecting = getattr(manager, "is_connecting", None)
+            if not manager.is_connected() and not (connecting and connecting()):
+                return False
+        except Exception:
+            return False
+
+        async def _sync(snapshot):
+            return await self._run_sheets_sync(method_name, snapshot)
+
+        return sync_queue.enqueue(filepath, state_store.view(filepath, {}), _sync)
+
+    async def _run_sheets_sync(self, method_name: str, data: Any) -> bool:
+        """Run a sheets sync method on the sheets engine executor."""
+        method = getattr(self.sheets_manager, method_name)
+        engine = getattr(self.sheets_manager, "engine", None)
+        if engine is not None:
+            result = await engine.run(method, data)
+        else:
+            loop = asyncio.get_running_loop()
+            result = await loop.run_in_executor(None, method, data)
+        if result is False:
+            logger.warning(f"⚠️ Sheets sync {method_name} reported failure")
+            return False
+        logger.info(f"🔄 {method_name} synced to Google Sheets")
+        return True
+
+    # ==========================================
+    # MAINTENANCE
+    # ==========================================
+
+    async def compact(self) -> bool:
+        """Compact the journal into the data files off the event loop."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(None, state_store.compact)
+
+    async def close(self):
+        """Wait for in-flight writers, then compact everything to disk."""
+        for lock in list(self._locks.values()):
+            async with lock:
+                pass
+        if await self.compact():
+            logger.info("✅ Storage compacted on shutdown")
+
+
+# Global instance
+storage = Storage()
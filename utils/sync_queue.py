@@ -0,0 +1,258 @@
+"""
+Write-behind queue between the data managers and Google Sheets.
+
+Saving a data file used to push it to Sheets immediately, so a burst of
+signup clicks meant one full worksheet rewrite per click. Saves now only
+enqueue a snapshot keyed by file; later saves replace the pending snapshot
+(latest wins) and a background worker flushes each file once it has been
+quiet for the debounce window, or once the max-staleness deadline is hit.
+"""
+
+import asyncio
+import copy
+import os
+import time
+from collections import deque
+from typing import Any, Awaitable, Callable, Dict, Optional
+
+from config.constants import SHEETS_CONFIG
+from utils.logger import setup_logger
+
+logger = setup_logger("sync_queue")
+
+SyncFunc = Callable[[Any], Awaitable[Any]]
+
+
+class _PendingSync:
+    """Latest snapshot waiting to be flushed for one file."""
+
+    __slots__ = ("data", "sync_func", "first_queued", "last_queued", "coalesced")
+
+    def __init__(self, data: Any, sync_func: SyncFunc, now: float):
+        self.data = data
+        self.sync_func = sync_func
+        self.first_queued = now
+        self.last_queued = now
+        self.coalesced = 0
+
+
+class SheetsSyncQueue:
+    """
+    Coalescing write-behind queue for Sheets syncs.
+
+    Features:
+    - One pending snapshot per file, newer saves replace older ones
+    - Debounce window with a max-staleness deadline during bursts
+    - Queue depth, coalescing and flush latency metrics
+    - Clean flush of everything pending on shutdown
+    """
+
+    def __init__(
+        self,
+        debounce: float = SHEETS_CONFIG.get("SYNC_DEBOUNCE", 5.0),
+        max_staleness: float = SHEETS_CONFIG.get("SYNC_MAX_STALENESS", 30.0),
+    ):
+        """
+        Initialize the queue.
+
+        Args:
+            debounce: Seconds without new saves before a file is flushed
+            max_staleness: Max seconds between the first queued save and its flush
+        """
+        self.debounce = debounce
+        self.max_staleness = max_staleness
+        self._pending: Dict[str, _PendingSync] = {}
+        self._wakeup: Optional[asyncio.Event] = None
+        self._worker: Optional[asyncio.Task] = None
+        self._flushing: Dict[str, asyncio.Task] = {}
+        self._closed = False
+
+        # Metrics
+        self._latencies = deque(maxlen=100)
+        self._stats = {"enqueued": 0, "coalesced": 0, "flushed": 0, "failed": 0}
+
+    @staticmethod
+    def _key(filepath: str) -> str:
+        return os.path.normpath(filepath)
+
+    def enqueue(self, filepath: str, data: Any, sync_func: SyncFunc) -> bool:
+        """
+        Queue a snapshot of ``data`` to be synced later.
+
+        Args:
+            filepath: Data file the snapshot belongs to (coalescing key)
+            data: Data to sync; copied so later in-place edits don't leak in
+            sync_func: Coroutine function that performs the sync with the snapshot
+
+        Returns:
+            bool: False if no event loop is running or the queue is closed
+        """
+        if self._closed:
+            return False
+
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            return False
+
+        key = self._key(filepath)
+        snapshot = copy.deepcopy(data)
+        now = time.monotonic()
+        self._stats["enqueued"] += 1
+
+        entry = self._pending.get(key)
+        if entry is None:
+            self._pending[key] = _PendingSync(snapshot, sync_func, now)
+        else:
+            entry.data = snapshot
+            entry.sync_func = sync_func
+            entry.last_queued = now
+            entry.coalesced += 1
+            self._stats["coalesced"] += 1
+
+        self._ensure_worker()
+        self._wakeup.set()
+        return True
+
+    def _ensure_worker(self):
+        """Start the background worker on first use."""
+        if self._wakeup is None:
+            self._wakeup = asyncio.Event()
+        if self._worker is None or self._worker.done():
+            self._worker = asyncio.create_task(self._run(), name="sheets-sync-queue")
+
+    def _due_at(self, entry: _PendingSync) -> float:
+        return min(
+            entry.last_queued + self.debounce,
+            entry.first_queued + self.max_staleness,
+        )
+
+    async def _run(self):
+        """Flush entries as their debounce or staleness deadline passes."""
+        while not self._closed:
+            self._wakeup.clear()
+            now = time.monotonic()
+
+            for key in [k for k, e in self._pending.items() if self._due_at(e) <= now]:
+                if key not in self._flushing:
+                    self._start_flush(key)
+
+            waiting = [
+                self._due_at(e) for k, e in self._pending.items() if k not in self._flushing
+            ]
+            timeout = max(0.0, min(waiting) - now) if waiting else None
+            try:
+                await asyncio.wait_for(self._wakeup.wait(), timeout)
+            except asyncio.TimeoutError:
+                pass
+
+    def _start_flush(self, key: str):
+        """Flush one file in its own task so slow files don't delay others."""
+        task = asyncio.create_task(self._flush_key(key))
+        self._flushing[key] = task
+
+        def _done(_):
+            self._flushing.pop(key, None)
+            if self._wakeup is not None:
+                self._wakeup.set()
+
+        task.add_done_callback(_done)
+
+    async def _flush_key(self, key: str) -> bool:
+        """Sync the pending snapshot for one file."""
+        entry = self._pending.pop(key, None)
+        if entry is None:
+            return True
+
+        try:
+            result = await entry.sync_func(entry.data)
+            success = result is not False
+        except Exception as e:
+            logger.error(f"❌ Queued sheets sync failed for {os.path.basename(key)}: {e}")
+            success = False
+
+        latency = time.monotonic() - entry.first_queued
+        self._latencies.append(latency)
+        if success:
+            self._stats["flushed"] += 1
+            logger.debug(
+                f"🔄 Flushed {os.path.basename(key)} after {latency:.1f}s "
+                f"({entry.coalesced} saves coalesced)"
+            )
+        else:
+            self._stats["failed"] += 1
+        return success
+
+    async def flush(self, filepath: Optional[str] = None) -> bool:
+        """
+        Flush pending syncs now instead of waiting for their deadline.
+
+        Args:
+            filepath: Only flush this file; flush everything when None
+
+        Returns:
+            bool: True if every flushed sync succeeded
+        """
+        if filepath:
+            keys = [self._key(filepath)]
+        else:
+            keys = list(set(self._pending) | set(self._flushing))
+        results = []
+        for key in keys:
+            in_flight = self._flushing.get(key)
+            if in_flight is not None:
+                results.append(await asyncio.shield(in_flight))
+            if key in self._pending:
+                results.append(await self._flush_key(key))
+        return all(results)
+
+    def get_metrics(self) -> Dict[str, Any]:
+        """
+        Get queue metrics.
+
+        Returns:
+            dict: Queue depth, counters and flush latency statistics
+        """
+        latencies = list(self._latencies)
+        oldest = min((e.first_queued for e in self._pending.values()), default=None)
+        return {
+            "queue_depth": len(self._pending),
+            "in_flight": len(self._flushing),
+            "oldest_pending_seconds": round(time.monotonic() - oldest, 2) if oldest else 0.0,
+            **self._stats,
+            "last_flush_latency": round(latencies[-1], 2) if latencies else None,
+            "avg_flush_latency": round(sum(latencies) / len(latencies), 2) if latencies else None,
+            "max_flush_latency": round(max(latencies), 2) if latencies else None,
+        }
+
+    async def shutdown(self, timeout: float = 30.0):
+        """
+        Stop the worker and flush everything still pending.
+
+        Args:
+            timeout: Max seconds to spend flushing before giving up
+        """
+        self._closed = True
+        if self._worker is not None:
+            self._worker.cancel()
+            try:
+                await self._worker
+            except asyncio.CancelledError:
+                pass
+            self._worker = None
+
+        pending = len(self._pending) + len(self._flushing)
+        if not pending:
+            return
+
+        try:
+            await asyncio.wait_for(self.flush(), timeout)
+            logger.info(f"✅ Flushed {pending} queued sheets syncs on shutdown")
+        except asyncio.TimeoutError:
+            logger.warning(
+                f"⚠️ Sheets sync flush timed out, {len(self._pending)} files not synced"
+            )
+
+
+# Global instance
+sync_queue = SheetsSyncQueue()